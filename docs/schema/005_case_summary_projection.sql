@@ -0,0 +1,51 @@
+-- Schema Extension: 005 - Case Summary Projection
+-- Date: 2026-10-18
+-- Description: Columns and index for projection-only case listing
+--              - current_turn, turns_without_progress, last_activity_at
+--              - milestones_completed (maintained by the repository on every save)
+--              - (user_id, updated_at, case_id) index for keyset pagination
+--
+-- Implementation: PostgreSQLHybridCaseRepository.list_summaries() reads only
+-- these columns, so listing never joins the normalized tables or parses JSONB.
+
+BEGIN;
+
+-- ============================================================================
+-- SUMMARY COLUMNS
+-- ============================================================================
+
+ALTER TABLE cases
+    ADD COLUMN IF NOT EXISTS current_turn INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS turns_without_progress INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS milestones_completed SMALLINT NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS last_activity_at TIMESTAMPTZ;
+
+COMMENT ON COLUMN cases.milestones_completed IS 'Number of completed investigation milestones in progress (0-8)';
+COMMENT ON COLUMN cases.last_activity_at IS 'Last user or agent activity; NULL means updated_at';
+
+-- Backfill existing cases from the progress JSONB
+UPDATE cases SET
+    milestones_completed = (
+        SELECT COUNT(*)
+        FROM jsonb_each(COALESCE(cases.progress, '{}'::jsonb)) AS milestone(name, value)
+        WHERE milestone.name IN (
+            'symptom_verified', 'scope_assessed', 'timeline_established', 'changes_identified',
+            'root_cause_identified', 'solution_proposed', 'solution_applied', 'solution_verified'
+        )
+        AND milestone.value = 'true'::jsonb
+    ),
+    last_activity_at = COALESCE(last_activity_at, updated_at);
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+-- Keyset pagination: WHERE user_id = ? AND (updated_at, case_id) < (?, ?)
+-- ORDER BY updated_at DESC, case_id DESC
+CREATE INDEX IF NOT EXISTS idx_cases_user_updated_keyset
+    ON cases(user_id, updated_at DESC, case_id DESC);
+
+COMMIT;
+
+-- Verification queries
+SELECT COUNT(*) FROM cases WHERE milestones_completed > 0;
@@ -0,0 +1,51 @@
+-- Schema Extension: 006 - Case Event Log
+-- Date: 2026-10-18
+-- Description: Append-only case events with periodic compacted snapshots
+--              - case_events: one row per change made by a turn
+--              - case_snapshots: latest full case per case and the last event it covers
+--
+-- Implementation: PostgreSQLCaseEventStore / EventSourcedCaseRepository.
+-- A turn inserts its events and updates the cases row in one statement, then
+-- upserts the evidence, hypothesis, solution, uploaded file and status
+-- transition rows it touched, all in one transaction; every
+-- CASE_SNAPSHOT_INTERVAL turns the full case is saved and a new snapshot written. Loading a case reads the snapshot plus the events
+-- after last_event_id.
+
+BEGIN;
+
+-- ============================================================================
+-- EVENTS
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS case_events (
+    event_id BIGSERIAL PRIMARY KEY,
+    case_id VARCHAR(17) NOT NULL REFERENCES cases(case_id) ON DELETE CASCADE,
+    event_type VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE case_events IS 'Append-only log of case changes (turn_processed, evidence_added, hypothesis_updated, status_changed, ...)';
+
+-- Tail replay: WHERE case_id = ? AND event_id > ? ORDER BY event_id
+CREATE INDEX IF NOT EXISTS idx_case_events_case_event
+    ON case_events(case_id, event_id);
+
+-- ============================================================================
+-- SNAPSHOTS
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS case_snapshots (
+    case_id VARCHAR(17) PRIMARY KEY REFERENCES cases(case_id) ON DELETE CASCADE,
+    snapshot JSONB NOT NULL,
+    last_event_id BIGINT NOT NULL DEFAULT 0,
+    current_turn INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON COLUMN case_snapshots.last_event_id IS 'Events with a higher event_id are replayed on top of the snapshot';
+
+COMMIT;
+
+-- Verification queries
+SELECT COUNT(*) FROM case_snapshots;
@@ -0,0 +1,91 @@
+-- Schema Extension: 007 - Case Search
+-- Date: 2026-10-18
+-- Description: Stored, indexed full-text and trigram search for cases
+--              - cases.description (stored by the repository on every save)
+--              - cases.evidence_summaries (kept up to date by a trigger on evidence)
+--              - cases.search_vector: generated tsvector, title (A), description (B),
+--                evidence summaries (C), GIN-indexed
+--              - pg_trgm GIN index on cases.title for fuzzy matches
+--
+-- Implementation: PostgreSQLHybridCaseRepository.search_summaries() matches
+-- search_vector @@ websearch_to_tsquery(...) OR title % query, ranks by
+-- ts_rank + similarity and returns summary columns with a ts_headline
+-- highlight in one query. Previously to_tsvector() was computed per row at
+-- query time, which no index could serve.
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ============================================================================
+-- SEARCH COLUMNS
+-- ============================================================================
+
+ALTER TABLE cases
+    ADD COLUMN IF NOT EXISTS description TEXT NOT NULL DEFAULT '',
+    ADD COLUMN IF NOT EXISTS evidence_summaries TEXT NOT NULL DEFAULT '';
+
+COMMENT ON COLUMN cases.evidence_summaries IS 'Evidence summaries of the case, space separated; maintained by trg_evidence_search';
+
+-- Backfill from the evidence table
+UPDATE cases SET evidence_summaries = COALESCE((
+    SELECT string_agg(e.summary, ' ' ORDER BY e.upload_timestamp)
+    FROM evidence e
+    WHERE e.case_id = cases.case_id
+), '');
+
+ALTER TABLE cases
+    ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(description, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(evidence_summaries, '')), 'C')
+    ) STORED;
+
+-- ============================================================================
+-- EVIDENCE SUMMARIES TRIGGER
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION refresh_case_evidence_summaries()
+RETURNS TRIGGER AS $$
+DECLARE
+    affected_case_id VARCHAR(17);
+BEGIN
+    affected_case_id := CASE WHEN TG_OP = 'DELETE' THEN OLD.case_id ELSE NEW.case_id END;
+
+    UPDATE cases SET evidence_summaries = COALESCE((
+        SELECT string_agg(e.summary, ' ' ORDER BY e.upload_timestamp)
+        FROM evidence e
+        WHERE e.case_id = affected_case_id
+    ), '')
+    WHERE case_id = affected_case_id;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_evidence_search ON evidence;
+CREATE TRIGGER trg_evidence_search
+    AFTER INSERT OR DELETE OR UPDATE OF summary ON evidence
+    FOR EACH ROW
+    EXECUTE FUNCTION refresh_case_evidence_summaries();
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+-- WHERE search_vector @@ websearch_to_tsquery('english', ?)
+CREATE INDEX IF NOT EXISTS idx_cases_search_vector
+    ON cases USING GIN (search_vector);
+
+-- WHERE title % ? (similarity above pg_trgm.similarity_threshold)
+CREATE INDEX IF NOT EXISTS idx_cases_title_trgm
+    ON cases USING GIN (title gin_trgm_ops);
+
+COMMIT;
+
+-- Verification queries
+SELECT case_id, ts_rank(search_vector, websearch_to_tsquery('english', 'timeout')) AS rank
+FROM cases
+WHERE search_vector @@ websearch_to_tsquery('english', 'timeout')
+ORDER BY rank DESC
+LIMIT 5;
@@ -25,6 +25,7 @@ from ...models.protection import (
 )
 from ...infrastructure.protection import RequestHasher
 from ...utils.serialization import to_json_compatible
+from .request_body import RequestBody
 
 
 class DeduplicationMiddleware(BaseHTTPMiddleware):
@@ -236,12 +237,13 @@ class DeduplicationMiddleware(BaseHTTPMiddleware):
             if config and config.get("special_handler"):
                 return await config["special_handler"](request, session_id, body)
             
-            # Standard hash generation
+            # Standard hash generation (reuses the JSON parsed by earlier middleware)
             return self.hasher.hash_request(
                 session_id=session_id,
                 endpoint=endpoint,
                 method=request.method,
                 body=body,
+                parsed_body=await RequestBody(request).json(),
                 query_params=dict(request.query_params),
                 headers=dict(request.headers)
             )
@@ -252,19 +254,10 @@ class DeduplicationMiddleware(BaseHTTPMiddleware):
     
     
     async def _get_request_body(self, request: Request) -> Optional[str]:
-        """Get request body for hashing"""
+        """Get request body for hashing (shared read-once cache)"""
         
         try:
-            # Check if body was already read
-            if hasattr(request, '_body'):
-                body = request._body
-            else:
-                body = await request.body()
-                request._body = body  # Cache for later use
-            
-            if body:
-                return body.decode('utf-8')
-        
+            return await RequestBody(request).text()
         except Exception as e:
             self.logger.debug(f"Failed to read request body: {e}")
         
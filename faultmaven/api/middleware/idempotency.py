@@ -122,10 +122,11 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
     async def _cache_response(self, cache_key: str, response: Response, idempotency_key: str):
         """Cache response in Redis with TTL."""
         try:
-            # Read response body
-            body = b""
+            # Read response body (single join instead of re-copying per chunk)
+            chunks = []
             async for chunk in response.body_iterator:
-                body += chunk
+                chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+            body = b"".join(chunks)
                 
             # Prepare cache data
             cache_data = {
@@ -191,7 +192,7 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
     def _get_timestamp(self) -> str:
         """Get ISO timestamp for caching."""
         from datetime import datetime, timezone
-from faultmaven.utils.serialization import to_json_compatible
+        from faultmaven.utils.serialization import to_json_compatible
         return to_json_compatible(datetime.now(timezone.utc))
 
 
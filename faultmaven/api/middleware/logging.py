@@ -6,10 +6,11 @@ using LoggingCoordinator for request-scoped coordination and the enhanced
 logging configuration for structured output.
 
 Enhanced with session context management to provide continuous user/session
-context across requests within the same session.
+context across requests within the same session. The request body is read
+through the shared RequestBody cache (at most once per request, never for
+uploads) and session -> user lookups are cached briefly.
 """
 
-import json
 import time
 from typing import Callable, Optional
 from fastapi import Request, Response
@@ -18,6 +19,8 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from faultmaven.infrastructure.logging.coordinator import LoggingCoordinator
 from faultmaven.infrastructure.logging.config import get_logger
 from faultmaven.container import DIContainer
+from faultmaven.utils.ttl_cache import TTLCache
+from .request_body import RequestBody
 
 
 logger = get_logger(__name__)
@@ -36,9 +39,12 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     - Handles errors gracefully with proper context
     """
     
-    def __init__(self, app):
+    def __init__(self, app, session_cache_size: int = 10000, session_cache_ttl: float = 60.0):
         super().__init__(app)
         self.coordinator = LoggingCoordinator()
+        # session_id -> user_id; a session's user never changes, the TTL only
+        # bounds how long an ended session keeps resolving
+        self._session_users: TTLCache[str] = TTLCache(session_cache_size, session_cache_ttl)
         logger.info("LoggingMiddleware initialized with session context management")
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -232,7 +238,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         Priority:
         1. Header: X-Session-ID (preferred for API clients)
         2. Query parameter: session_id
-        3. Request body: session_id field (using non-consuming method)
+        3. Request body: session_id field (JSON bodies only)
         
         Args:
             request: FastAPI request object
@@ -249,17 +255,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             if session_id := request.query_params.get("session_id"):
                 return session_id
                 
-            # 3. Check request body for POST/PUT/PATCH requests
-            if request.method in ["POST", "PUT", "PATCH"]:
-                try:
-                    # Use request.json() which handles body parsing correctly without consuming the stream
-                    # This is the proper FastAPI way to access request body
-                    data = await request.json()
-                    if isinstance(data, dict) and (session_id := data.get("session_id")):
-                        return session_id
-                except (json.JSONDecodeError, UnicodeDecodeError, ValueError):
-                    # Invalid JSON, encoding, or empty body - continue without session context
-                    pass
+            # 3. Check JSON request body (POST/PUT/PATCH; parsed once and shared)
+            return await RequestBody(request).field("session_id")
                     
         except Exception as e:
             # Log error but don't fail the request
@@ -292,19 +289,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             if legacy_id := request.query_params.get("investigation_id"):
                 return legacy_id
                 
-            # Check request body for POST/PUT/PATCH requests
-            if request.method in ["POST", "PUT", "PATCH"]:
-                try:
-                    # Use request.json() which handles body parsing correctly without consuming the stream
-                    data = await request.json()
-                    if isinstance(data, dict) and (case_id := data.get("case_id")):
-                        return case_id
-                    # Legacy investigation_id support
-                    if isinstance(data, dict) and (legacy_id := data.get("investigation_id")):
-                        return legacy_id
-                except (json.JSONDecodeError, UnicodeDecodeError, ValueError):
-                    # Invalid JSON, encoding, or empty body - continue without case context
-                    pass
+            # Check JSON request body (legacy investigation_id supported)
+            return await RequestBody(request).field("case_id", "investigation_id")
                     
         except Exception as e:
             logger.warning(f"Failed to extract case_id: {e}")
@@ -316,7 +302,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         Look up user_id from session_id using SessionService.
         
         Uses graceful degradation - if session lookup fails, continues
-        without user context rather than failing the request.
+        without user context rather than failing the request. Found users
+        are cached per session for a short TTL.
         
         Args:
             session_id: Session identifier
@@ -324,6 +311,9 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         Returns:
             user_id if found, None otherwise
         """
+        if (user_id := self._session_users.get(session_id)) is not None:
+            return user_id
+        
         try:
             # Get SessionService from a DI container instance.
             # Using DIContainer() allows tests to patch DIContainer.__new__ and inject a mock.
@@ -333,7 +323,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Look up session (non-validating to avoid exceptions)
             session = await session_service.get_session(session_id, validate=False)
             
-            return session.user_id if session else None
+            user_id = session.user_id if session else None
+            if user_id:
+                self._session_users.set(session_id, user_id)
+            return user_id
             
         except Exception as e:
             # Graceful degradation - log warning but continue without user context
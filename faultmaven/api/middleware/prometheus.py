@@ -0,0 +1,59 @@
+"""
+Prometheus Request Metrics Middleware
+
+Records request count, latency and in-flight requests for every HTTP request.
+Requests are labelled by the matched route template (``/api/v1/cases/{case_id}``)
+rather than the raw path, so label cardinality is bounded by the number of
+routes; requests that match no route share the ``unmatched`` label.
+
+Implemented as plain ASGI middleware so it adds no per-request task or body
+buffering on top of the handlers it measures.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from faultmaven.infrastructure.observability.prometheus_metrics import (
+    UNMATCHED_ROUTE,
+    http_request_finished,
+    http_request_started,
+    observe_http_request,
+)
+
+
+class PrometheusMiddleware:
+    """ASGI middleware feeding the faultmaven_http_* metrics"""
+
+    def __init__(self, app: ASGIApp, excluded_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_request_started(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the (shared) scope
+            route = scope.get("route")
+            observe_http_request(
+                method,
+                getattr(route, "path", None) or UNMATCHED_ROUTE,
+                status_code,
+                time.perf_counter() - start,
+            )
+            http_request_finished(method)
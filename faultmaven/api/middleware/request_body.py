@@ -0,0 +1,107 @@
+"""
+Request Body Cache
+
+Purpose: Read a request body at most once per request and share it, together
+with its parsed JSON, across all middlewares.
+
+The cached bytes and parse result live in the ASGI scope state, which every
+middleware's Request object shares. JSON is parsed lazily and only once, and
+never for multipart uploads, non-JSON content types or bodies larger than
+MAX_JSON_BYTES; for those, ``json()`` returns None without reading the body,
+so uploads stream to the endpoint instead of being buffered by middleware.
+"""
+
+import json
+from typing import Any, Optional
+
+from fastapi import Request
+
+# Bodies above this size are never parsed by middleware (uploads, bulk data)
+MAX_JSON_BYTES = 1024 * 1024
+
+_STATE_KEY = "faultmaven_request_body"
+_NOT_PARSED = object()
+
+
+class RequestBody:
+    """Shared, read-once view of the current request's body"""
+
+    __slots__ = ("_request", "_shared")
+
+    def __init__(self, request: Request):
+        self._request = request
+        state = request.scope.setdefault("state", {})
+        shared = state.get(_STATE_KEY)
+        if shared is None:
+            shared = state[_STATE_KEY] = {"body": None, "text": None, "json": _NOT_PARSED}
+        self._shared = shared
+
+    @property
+    def content_type(self) -> str:
+        return self._request.headers.get("content-type", "").lower()
+
+    @property
+    def content_length(self) -> Optional[int]:
+        value = self._request.headers.get("content-length")
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+    @property
+    def is_multipart(self) -> bool:
+        return self.content_type.startswith("multipart/")
+
+    def json_candidate(self) -> bool:
+        """Whether the body may be JSON worth parsing (no body read needed)"""
+        if self._request.method not in ("POST", "PUT", "PATCH"):
+            return False
+        content_type = self.content_type
+        if content_type and "json" not in content_type:
+            return False
+        length = self.content_length
+        return length is None or 0 < length <= MAX_JSON_BYTES
+
+    async def body(self) -> bytes:
+        """Raw body bytes, read from the client only once per request"""
+        body = self._shared["body"]
+        if body is None:
+            body = self._shared["body"] = await self._request.body()
+        return body
+
+    async def text(self) -> Optional[str]:
+        """Body decoded as UTF-8 (cached); None when empty or not decodable"""
+        text = self._shared["text"]
+        if text is None:
+            body = await self.body()
+            if not body:
+                return None
+            try:
+                text = self._shared["text"] = body.decode("utf-8")
+            except UnicodeDecodeError:
+                return None
+        return text
+
+    async def json(self) -> Any:
+        """Parsed JSON body (parsed once); None when absent, skipped or invalid"""
+        parsed = self._shared["json"]
+        if parsed is _NOT_PARSED:
+            parsed = None
+            if self.json_candidate():
+                body = await self.body()
+                if body and len(body) <= MAX_JSON_BYTES:
+                    try:
+                        parsed = json.loads(body)
+                    except (json.JSONDecodeError, UnicodeDecodeError, ValueError):
+                        parsed = None
+            self._shared["json"] = parsed
+        return parsed
+
+    async def field(self, *names: str) -> Optional[Any]:
+        """First truthy top-level field of a JSON object body"""
+        data = await self.json()
+        if isinstance(data, dict):
+            for name in names:
+                if value := data.get(name):
+                    return value
+        return None
@@ -0,0 +1,324 @@
+"""
+Response Cache Middleware
+
+Serves GET requests for selected read endpoints (case detail, case UI, KB
+document listings, job status) from the shared Redis response cache
+(faultmaven.infrastructure.caching.response_cache) and answers conditional
+requests without reaching the service layer:
+
+- Every cacheable response carries ``ETag`` and ``Last-Modified``.
+- ``If-None-Match`` / ``If-Modified-Since`` against a current entry returns
+  304 with no body.
+- Entries are per user: the bearer token is resolved to a user ID (briefly
+  memoized) before any lookup, so a revoked token stops being served within
+  ``auth_cache_ttl`` seconds.
+- Bodies are compressed off the event loop with the best encoding the client
+  accepts; inner middlewares see no Accept-Encoding for these requests, so
+  GZipMiddleware does not compress them a second time.
+
+Implemented as plain ASGI middleware; any Redis failure falls back to
+rendering the response normally.
+"""
+
+import hashlib
+import logging
+import re
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from faultmaven.infrastructure.caching.response_cache import (
+    IDENTITY,
+    ResponseCacheStore,
+    encode_body,
+    get_response_cache,
+    negotiate_encoding,
+    replayed_headers,
+)
+from faultmaven.infrastructure.observability.prometheus_metrics import record_cache_lookup
+from faultmaven.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Route template -> resource whose version invalidates it
+DEFAULT_CACHED_ROUTES: Dict[str, str] = {
+    "/api/v1/cases/{case_id}": "case:{case_id}",
+    "/api/v1/cases/{case_id}/ui": "case:{case_id}",
+    "/api/v1/users/{user_id}/kb/documents": "kb:{user_id}",
+    "/api/v1/knowledge/documents": "knowledge",
+    "/api/v1/jobs/{job_id}": "job:{job_id}",
+}
+
+ANONYMOUS = "anonymous"
+DEFAULT_CACHE_CONTROL = "private, no-cache"
+VARY = "Accept-Encoding, Authorization, Origin"
+
+UserResolver = Callable[[str], Awaitable[Optional[str]]]
+
+
+async def resolve_user_from_token(token: str) -> Optional[str]:
+    """User ID for a bearer token via the container's token manager"""
+    from faultmaven.container import container
+
+    token_manager = container.get_token_manager()
+    if token_manager is None:
+        return None
+    result = await token_manager.validate_token(token)
+    return result.user.user_id if result.is_valid and result.user else None
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving read endpoints from the shared response cache"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Optional[Dict[str, str]] = None,
+        store: Optional[ResponseCacheStore] = None,
+        resolve_user: Optional[UserResolver] = None,
+        auth_cache_ttl: float = 10.0,
+        max_body_bytes: int = 1024 * 1024,
+    ):
+        """
+        Args:
+            app: Next ASGI application
+            routes: Route template -> resource template (DEFAULT_CACHED_ROUTES)
+            store: Response store; defaults to the one configured at startup
+            resolve_user: Coroutine mapping a bearer token to a user ID
+            auth_cache_ttl: Seconds a token -> user resolution is reused
+            max_body_bytes: Larger responses are passed through uncached
+        """
+        self.app = app
+        self._store = store
+        self.resolve_user = resolve_user or resolve_user_from_token
+        self.max_body_bytes = max_body_bytes
+        self._users: TTLCache[str] = TTLCache(maxsize=10000, ttl_seconds=auth_cache_ttl)
+        self._routes: List[Tuple[re.Pattern, str, str]] = []
+        for template, resource in (routes or DEFAULT_CACHED_ROUTES).items():
+            regex, _, _ = compile_path(template)
+            self._routes.append((regex, template, resource))
+        self._literal_paths: Optional[frozenset] = None
+
+    def _match(self, scope: Scope) -> Optional[Tuple[str, str]]:
+        path = scope["path"]
+        if self._literal_paths is None:
+            # Literal routes (/api/v1/cases/health) shadow templated ones
+            app = scope.get("app")
+            routes = getattr(getattr(app, "router", None), "routes", ())
+            self._literal_paths = frozenset(
+                route.path for route in routes if "{" not in getattr(route, "path", "{")
+            )
+        if path in self._literal_paths:
+            return None
+        for regex, template, resource in self._routes:
+            match = regex.match(path)
+            if match:
+                return template, resource.format(**match.groupdict())
+        return None
+
+    async def _user_key(self, headers: Headers) -> str:
+        authorization = headers.get("authorization", "")
+        if not authorization.startswith("Bearer ") or not authorization[7:].strip():
+            return ANONYMOUS
+        token_key = hashlib.blake2b(authorization.encode(), digest_size=16).hexdigest()
+        user_id = self._users.get(token_key)
+        if user_id is None:
+            user_id = await self.resolve_user(authorization[7:].strip()) or ANONYMOUS
+            self._users.set(token_key, user_id)
+        return user_id
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        store = self._store or get_response_cache()
+        matched = self._match(scope) if store is not None else None
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        route, resource = matched
+        headers = Headers(scope=scope)
+        encoding = negotiate_encoding(headers.get("accept-encoding", ""))
+        conditional = "if-none-match" in headers or "if-modified-since" in headers
+        try:
+            user_key = await self._user_key(headers)
+            key = store.entry_key(
+                user_key, route, scope["path"], scope.get("query_string", b""), headers.get("origin", "")
+            )
+            meta, body, version = await store.lookup(key, resource, None if conditional else encoding)
+        except Exception as e:
+            logger.debug(f"Response cache lookup failed, rendering {scope['path']}: {e}")
+            await self.app(scope, receive, send)
+            return
+
+        record_cache_lookup("http_response", meta is not None)
+        if meta is not None:
+            await self._send_hit(store, key, meta, body, encoding, headers, send)
+            return
+        await self._render(store, key, version, encoding, headers, scope, receive, send)
+
+    async def _send_hit(
+        self,
+        store: ResponseCacheStore,
+        key: str,
+        meta: dict,
+        body: Optional[bytes],
+        encoding: str,
+        headers: Headers,
+        send: Send,
+    ) -> None:
+        if _not_modified(headers, meta):
+            await _send_not_modified(meta, send)
+            return
+        if body is None:
+            try:
+                body, encoding = await store.load_body(key, meta, encoding)
+            except Exception as e:
+                logger.debug(f"Response cache body load failed: {e}")
+                body, encoding = b"", IDENTITY
+        elif meta["size"] < store.compress_min_bytes:
+            encoding = IDENTITY
+        await _send_response(meta["status"], meta["headers"], meta, body, encoding, "HIT", send)
+
+    async def _render(
+        self,
+        store: ResponseCacheStore,
+        key: str,
+        version: int,
+        encoding: str,
+        headers: Headers,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        # Inner middlewares must not compress: this middleware encodes
+        inner_scope = dict(scope)
+        inner_scope["headers"] = [(k, v) for k, v in scope["headers"] if k != b"accept-encoding"]
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def capture(message: Message) -> None:
+            nonlocal start, size, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                if not _cacheable_start(message):
+                    passthrough = True
+                    await send(message)
+                return
+            if message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                size += len(chunks[-1])
+                if size > self.max_body_bytes:
+                    passthrough = True
+                    await send(start)
+                    await send({"type": "http.response.body", "body": b"".join(chunks), "more_body": message.get("more_body", False)})
+                    chunks.clear()
+
+        await self.app(inner_scope, receive, capture)
+        if passthrough or start is None:
+            return
+
+        body = b"".join(chunks)
+        response_headers = [(k.decode("latin-1").lower(), v.decode("latin-1")) for k, v in start.get("headers", [])]
+        encoded = body
+        if encoding != IDENTITY and len(body) >= store.compress_min_bytes:
+            encoded = await encode_body(body, encoding)
+        else:
+            encoding = IDENTITY
+
+        try:
+            meta = await store.store(
+                key, start["status"], replayed_headers(response_headers), body, version,
+                variants={encoding: encoded} if encoding != IDENTITY else None,
+            )
+        except Exception as e:
+            logger.debug(f"Response cache store failed: {e}")
+            meta = None
+
+        if meta is None:
+            await _send_response(start["status"], response_headers, None, encoded, encoding, "MISS", send)
+        elif _not_modified(headers, meta):
+            await _send_not_modified(meta, send)
+        else:
+            # This request's own headers (request ID, rate limits) plus validators
+            await _send_response(start["status"], response_headers, meta, encoded, encoding, "MISS", send)
+
+
+def _cacheable_start(message: Message) -> bool:
+    if message["status"] != 200:
+        return False
+    for name, value in message.get("headers", []):
+        name = name.lower()
+        if name in (b"set-cookie", b"content-encoding"):
+            return False
+        if name == b"cache-control" and b"no-store" in value.lower():
+            return False
+    return True
+
+
+def _not_modified(headers: Headers, meta: dict) -> bool:
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison (RFC 9110 13.1.2)
+        etag = meta["etag"].removeprefix("W/")
+        return if_none_match.strip() == "*" or any(
+            candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+        )
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            return parsedate_to_datetime(meta["last_modified"]) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _validator_headers(meta: dict) -> List[Tuple[bytes, bytes]]:
+    return [
+        (b"etag", meta["etag"].encode("latin-1")),
+        (b"last-modified", meta["last_modified"].encode("latin-1")),
+        (b"vary", VARY.encode("latin-1")),
+    ]
+
+
+async def _send_not_modified(meta: dict, send: Send) -> None:
+    headers = _validator_headers(meta)
+    headers.append((b"cache-control", dict(meta["headers"]).get("cache-control", DEFAULT_CACHE_CONTROL).encode("latin-1")))
+    headers.append((b"x-cache", b"HIT"))
+    await send({"type": "http.response.start", "status": 304, "headers": headers})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _send_response(
+    status: int,
+    headers: List[Tuple[str, str]],
+    meta: Optional[dict],
+    body: bytes,
+    encoding: str,
+    cache_status: str,
+    send: Send,
+) -> None:
+    raw = [
+        (name.encode("latin-1"), value.encode("latin-1")) for name, value in headers
+        if name not in ("content-length", "content-encoding", "etag", "last-modified", "vary")
+    ]
+    if meta is not None:
+        raw.extend(_validator_headers(meta))
+        if not any(name == "cache-control" for name, _ in headers):
+            raw.append((b"cache-control", DEFAULT_CACHE_CONTROL.encode("latin-1")))
+    if encoding != IDENTITY:
+        raw.append((b"content-encoding", encoding.encode("latin-1")))
+    raw.append((b"content-length", str(len(body)).encode("latin-1")))
+    raw.append((b"x-cache", cache_status.encode("latin-1")))
+    await send({"type": "http.response.start", "status": status, "headers": raw})
+    await send({"type": "http.response.body", "body": body})
@@ -2,10 +2,12 @@
 
 This middleware provides comprehensive system-wide performance enhancements:
 - Response compression and streaming optimization
-- API endpoint caching with intelligent invalidation
 - Background task optimization and batching
 - Resource cleanup and garbage collection optimization
 - Request/response optimization with adaptive strategies
+
+Response caching for read endpoints lives in the shared, Redis-backed
+ResponseCacheMiddleware (faultmaven.api.middleware.response_cache).
 """
 
 import logging
@@ -16,7 +18,7 @@ import json
 import gc
 from typing import Callable, Dict, Any, Optional, List
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import deque
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -32,7 +34,6 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
     
     Features:
     - Intelligent response compression based on content type and size
-    - API endpoint caching with TTL and intelligent invalidation
     - Background task optimization with batching and prioritization
     - Resource cleanup optimization with adaptive garbage collection
     - Request/response streaming for large payloads
@@ -43,10 +44,8 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
         self,
         app,
         enable_compression: bool = True,
-        enable_caching: bool = True,
         enable_background_optimization: bool = True,
         enable_resource_cleanup: bool = True,
-        cache_ttl_seconds: int = 300,
         compression_threshold: int = 1024,
         gc_threshold_factor: float = 2.0
     ):
@@ -55,10 +54,8 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
         Args:
             app: FastAPI application instance
             enable_compression: Enable intelligent response compression
-            enable_caching: Enable API endpoint caching
             enable_background_optimization: Enable background task optimization
             enable_resource_cleanup: Enable resource cleanup optimization
-            cache_ttl_seconds: Default cache TTL in seconds
             compression_threshold: Minimum response size for compression
             gc_threshold_factor: Factor for adaptive garbage collection
         """
@@ -66,18 +63,11 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
         
         # Configuration
         self.enable_compression = enable_compression
-        self.enable_caching = enable_caching
         self.enable_background_optimization = enable_background_optimization
         self.enable_resource_cleanup = enable_resource_cleanup
-        self.cache_ttl_seconds = cache_ttl_seconds
         self.compression_threshold = compression_threshold
         self.gc_threshold_factor = gc_threshold_factor
         
-        # Response caching
-        self._response_cache = {}
-        self._cache_access_times = {}
-        self._cache_hit_counts = defaultdict(int)
-        
         # Background task optimization
         self._background_task_queue = deque()
         self._task_batch_size = 5
@@ -92,13 +82,10 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
         self._optimization_metrics = {
             "requests_processed": 0,
             "responses_compressed": 0,
-            "cache_hits": 0,
-            "cache_misses": 0,
             "background_tasks_optimized": 0,
             "gc_optimizations": 0,
             "avg_response_time": 0.0,
             "compression_ratio": 0.0,
-            "cache_hit_rate": 0.0,
             "memory_optimizations": 0
         }
         
@@ -114,26 +101,12 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
         self._request_count += 1
         
         try:
-            # Check cache first if enabled
-            if self.enable_caching:
-                cached_response = await self._check_cache(request)
-                if cached_response:
-                    self._optimization_metrics["cache_hits"] += 1
-                    self._update_cache_access(request)
-                    return cached_response
-                else:
-                    self._optimization_metrics["cache_misses"] += 1
-            
             # Process request with optimization
             response = await self._process_request_optimized(request, call_next)
             
             # Apply response optimizations
             optimized_response = await self._optimize_response(request, response)
             
-            # Cache response if applicable
-            if self.enable_caching:
-                await self._cache_response(request, optimized_response)
-            
             # Trigger resource cleanup if needed
             if self.enable_resource_cleanup:
                 await self._optimize_resource_cleanup()
@@ -194,60 +167,6 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
         
         return response
     
-    async def _check_cache(self, request: Request) -> Optional[Response]:
-        """Check if response is cached with intelligent cache management"""
-        cache_key = self._generate_cache_key(request)
-        
-        if cache_key in self._response_cache:
-            cached_data, cached_time, ttl = self._response_cache[cache_key]
-            
-            # Check if cache is still valid
-            if time.time() - cached_time < ttl:
-                # Update access tracking
-                self._cache_access_times[cache_key] = time.time()
-                self._cache_hit_counts[cache_key] += 1
-                
-                # Reconstruct response from cached data
-                return Response(
-                    content=cached_data["content"],
-                    status_code=cached_data["status_code"],
-                    headers=dict(cached_data["headers"]),
-                    media_type=cached_data.get("media_type")
-                )
-            else:
-                # Remove expired cache entry
-                del self._response_cache[cache_key]
-                if cache_key in self._cache_access_times:
-                    del self._cache_access_times[cache_key]
-        
-        return None
-    
-    async def _cache_response(self, request: Request, response: Response):
-        """Cache response with intelligent TTL and size management"""
-        # Skip caching for certain conditions
-        if (response.status_code >= 400 or 
-            not hasattr(response, 'body') or
-            len(self._response_cache) >= 1000):  # Cache size limit
-            return
-        
-        cache_key = self._generate_cache_key(request)
-        
-        # Determine TTL based on endpoint characteristics
-        ttl = self._calculate_cache_ttl(request, response)
-        
-        # Cache response data
-        cached_data = {
-            "content": response.body,
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "media_type": response.media_type
-        }
-        
-        self._response_cache[cache_key] = (cached_data, time.time(), ttl)
-        
-        # Manage cache size with LRU eviction
-        await self._manage_cache_size()
-    
     async def _apply_intelligent_compression(self, request: Request, response: Response) -> Response:
         """Apply intelligent compression based on content analysis"""
         if not hasattr(response, 'body') or len(response.body) < self.compression_threshold:
@@ -270,7 +189,8 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
         try:
             # Compress response body
             original_size = len(response.body)
-            compressed_body = gzip.compress(response.body)
+            # Off the event loop: compressing large bodies blocks for milliseconds
+            compressed_body = await asyncio.to_thread(gzip.compress, response.body)
             compressed_size = len(compressed_body)
             
             # Only apply compression if it provides significant reduction
@@ -408,94 +328,6 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
                 "memory_rss": memory_after,
                 "objects_collected": collected
             })
-        
-        # Clean expired cache entries periodically
-        if self._request_count % 50 == 0:
-            await self._clean_expired_cache()
-    
-    async def _manage_cache_size(self):
-        """Manage cache size with intelligent LRU eviction"""
-        if len(self._response_cache) > 800:  # Start eviction at 80% of limit
-            # Sort by access time and hit count (LRU with frequency consideration)
-            cache_items = []
-            for key, (data, cached_time, ttl) in self._response_cache.items():
-                access_time = self._cache_access_times.get(key, cached_time)
-                hit_count = self._cache_hit_counts.get(key, 1)
-                score = access_time + (hit_count * 3600)  # Boost frequently accessed items
-                cache_items.append((key, score))
-            
-            # Sort by score (lower score = less valuable)
-            cache_items.sort(key=lambda x: x[1])
-            
-            # Remove least valuable 20% of entries
-            remove_count = len(cache_items) // 5
-            for key, _ in cache_items[:remove_count]:
-                if key in self._response_cache:
-                    del self._response_cache[key]
-                if key in self._cache_access_times:
-                    del self._cache_access_times[key]
-                if key in self._cache_hit_counts:
-                    del self._cache_hit_counts[key]
-    
-    async def _clean_expired_cache(self):
-        """Clean expired cache entries"""
-        current_time = time.time()
-        expired_keys = []
-        
-        for key, (data, cached_time, ttl) in self._response_cache.items():
-            if current_time - cached_time > ttl:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            if key in self._response_cache:
-                del self._response_cache[key]
-            if key in self._cache_access_times:
-                del self._cache_access_times[key]
-            if key in self._cache_hit_counts:
-                del self._cache_hit_counts[key]
-    
-    def _generate_cache_key(self, request: Request) -> str:
-        """Generate cache key for request"""
-        import hashlib
-        
-        # Include method, path, and relevant query parameters
-        key_components = [
-            request.method,
-            str(request.url.path),
-            str(sorted(request.query_params.items()))
-        ]
-        
-        # Include authorization if present (for user-specific caching)
-        auth_header = request.headers.get("authorization")
-        if auth_header:
-            key_components.append(hashlib.md5(auth_header.encode()).hexdigest()[:8])
-        
-        cache_string = "|".join(key_components)
-        return hashlib.md5(cache_string.encode()).hexdigest()
-    
-    def _calculate_cache_ttl(self, request: Request, response: Response) -> int:
-        """Calculate intelligent cache TTL based on endpoint characteristics"""
-        path = request.url.path
-        
-        # Different TTLs for different endpoint types
-        if "/health" in path:
-            return 30  # Health endpoints cached for 30 seconds
-        elif "/metrics" in path:
-            return 10  # Metrics cached for 10 seconds
-        elif "/api/v1/knowledge" in path:
-            return 600  # Knowledge queries cached for 10 minutes
-        elif "/api/v1/data" in path:
-            return 300  # Data endpoints cached for 5 minutes
-        elif response.status_code == 200:
-            return self.cache_ttl_seconds  # Default successful response TTL
-        else:
-            return 60  # Error responses cached briefly
-    
-    def _update_cache_access(self, request: Request):
-        """Update cache access tracking"""
-        cache_key = self._generate_cache_key(request)
-        self._cache_access_times[cache_key] = time.time()
-        self._cache_hit_counts[cache_key] += 1
     
     def _update_performance_metrics(self, processing_time: float):
         """Update performance metrics"""
@@ -511,16 +343,6 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
             self._optimization_metrics["avg_response_time"] = (
                 (current_avg * (request_count - 1) + processing_time) / request_count
             )
-        
-        # Update cache hit rate
-        total_cache_requests = (
-            self._optimization_metrics["cache_hits"] + 
-            self._optimization_metrics["cache_misses"]
-        )
-        if total_cache_requests > 0:
-            self._optimization_metrics["cache_hit_rate"] = (
-                self._optimization_metrics["cache_hits"] / total_cache_requests
-            )
     
     def _start_background_optimization(self):
         """Start background optimization tasks"""
@@ -531,9 +353,6 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
                     if self._background_task_queue:
                         await self._process_background_task_batch()
                     
-                    # Clean up resources periodically
-                    await self._clean_expired_cache()
-                    
                     await asyncio.sleep(5)  # Run every 5 seconds
                 except Exception as e:
                     logger.warning(f"Background optimizer error: {e}")
@@ -546,17 +365,6 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
         """Get comprehensive optimization metrics"""
         return {
             **self._optimization_metrics,
-            "cache_status": {
-                "cache_size": len(self._response_cache),
-                "cache_memory_usage": sum(
-                    len(str(data)) for data, _, _ in self._response_cache.values()
-                ),
-                "most_accessed_endpoints": sorted(
-                    self._cache_hit_counts.items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )[:5]
-            },
             "background_tasks": {
                 "queued_tasks": len(self._background_task_queue),
                 "batch_size": self._task_batch_size
@@ -568,10 +376,8 @@ class SystemOptimizationMiddleware(BaseHTTPMiddleware):
             },
             "optimization_config": {
                 "compression_enabled": self.enable_compression,
-                "caching_enabled": self.enable_caching,
                 "background_optimization_enabled": self.enable_background_optimization,
                 "resource_cleanup_enabled": self.enable_resource_cleanup,
-                "compression_threshold": self.compression_threshold,
-                "cache_ttl_seconds": self.cache_ttl_seconds
+                "compression_threshold": self.compression_threshold
             }
         }
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""Upload size limit middleware.
+
+FastAPI parses a multipart body (spooling every file part to disk) before the
+endpoint runs, so a limit checked in the endpoint only applies after the whole
+upload has been received. This middleware enforces MAX_UPLOAD_SIZE_MB on
+multipart requests before parsing: requests whose Content-Length is over the
+limit get a 413 without their body being read, and bodies sent without a
+Content-Length (chunked) are cut off with a 413 as soon as they pass it.
+"""
+
+import json
+import logging
+from typing import Optional
+
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Multipart boundaries, part headers and small form fields on top of the file
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """Reject multipart request bodies larger than ``max_bytes`` with a 413"""
+
+    def __init__(self, app: ASGIApp, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.limit = max_bytes + MULTIPART_OVERHEAD_BYTES
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._is_multipart(scope):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = self._content_length(scope)
+        if content_length is not None and content_length > self.limit:
+            logger.warning(f"Rejected upload to {scope.get('path')}: Content-Length {content_length} over limit")
+            await self._reject(send)
+            return
+
+        received = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.limit:
+                    # Re-raised by FastAPI's body parsing and rendered as a 413
+                    raise HTTPException(status_code=413, detail=self._detail())
+            return message
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except HTTPException as e:
+            if e.status_code != 413 or response_started:
+                raise
+            await self._reject(send)
+
+    @staticmethod
+    def _is_multipart(scope: Scope) -> bool:
+        for name, value in scope.get("headers", []):
+            if name == b"content-type":
+                return value.lower().startswith(b"multipart/")
+        return False
+
+    @staticmethod
+    def _content_length(scope: Scope) -> Optional[int]:
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
+
+    def _detail(self) -> str:
+        return f"Upload too large (max: {self.max_bytes / (1024 * 1024):g}MB)"
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": self._detail()}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -103,6 +103,8 @@ class ProtectionSystem:
                 ml_model_path=self.settings.protection.ml_model_path,
                 ml_training_enabled=self.settings.protection.ml_training_enabled,
                 ml_online_learning=self.settings.protection.ml_online_learning_enabled,
+                ml_scoring_batch_size=self.settings.protection.ml_scoring_batch_size,
+                ml_scoring_max_delay_ms=self.settings.protection.ml_scoring_max_delay_ms,
                 
                 # Reputation system
                 enable_reputation_system=self.settings.protection.reputation_system_enabled,
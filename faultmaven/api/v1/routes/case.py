@@ -16,7 +16,7 @@ Key Endpoints:
 
 from datetime import datetime, timezone
 from faultmaven.utils.serialization import to_json_compatible
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 import asyncio
 import time
 
@@ -53,7 +53,7 @@ from faultmaven.models.api_models import (
     EvidenceDetailsResponse,
 )
 from faultmaven.models.case_ui import CaseUIResponse
-from faultmaven.services.adapters.case_ui_adapter import transform_case_for_ui
+from faultmaven.services.adapters.case_ui_adapter import project_case_for_ui
 from faultmaven.models.interfaces_case import ICaseService
 from faultmaven.models.interfaces_report import IReportStore
 from faultmaven.models.api import (
@@ -79,6 +79,8 @@ from faultmaven.services.domain.session_service import SessionService
 from faultmaven.services.converters import CaseConverter
 from fastapi import Request
 from faultmaven.infrastructure.observability.tracing import trace
+from faultmaven.config.settings import get_settings
+from faultmaven.utils.upload_spool import SpooledUpload, UploadTooLarge, spool_upload
 from faultmaven.exceptions import (
     ValidationException,
     ServiceException,
@@ -156,6 +158,66 @@ async def _store_evidence_in_vector_db(
         )
 
 
+async def _store_spooled_evidence_in_vector_db(
+    case_id: str,
+    data_id: str,
+    chunks: AsyncIterator[str],
+    upload: SpooledUpload,
+    data_type: str,
+    metadata: Dict[str, Any],
+    case_vector_store
+):
+    """
+    Background task: Store a spooled upload in ChromaDB chunk by chunk.
+
+    Same as _store_evidence_in_vector_db, but the upload is read from its
+    spool file in bounded chunks instead of being held in memory. The first
+    chunk is stored under ``data_id`` (for most uploads it is the only one),
+    later chunks as ``{data_id}_part{n}``. The spool file is deleted at the end.
+
+    Args:
+        case_id: Case identifier for collection scoping
+        data_id: Unique evidence identifier
+        chunks: Preprocessed (sanitized) text chunks of the upload
+        upload: The spooled upload (deleted when done)
+        data_type: Evidence data type
+        metadata: Evidence metadata
+        case_vector_store: Case-scoped vector store (InMemory or ChromaDB)
+    """
+    stored = 0
+    try:
+        async for content in chunks:
+            await case_vector_store.add_documents(
+                case_id=case_id,
+                documents=[{
+                    'id': data_id if stored == 0 else f"{data_id}_part{stored}",
+                    'content': content,
+                    'metadata': {
+                        'data_type': data_type,
+                        'upload_timestamp': datetime.now(timezone.utc).isoformat(),
+                        'chunk_index': stored,
+                        **metadata
+                    }
+                }]
+            )
+            stored += 1
+
+        logger.info(
+            f"✅ Evidence {data_id} vectorized successfully for case {case_id} ({stored} chunks)",
+            extra={'case_id': case_id, 'data_id': data_id, 'content_size': upload.size}
+        )
+
+    except Exception as e:
+        # Silent failure, as for _store_evidence_in_vector_db
+        logger.error(
+            f"❌ Failed to vectorize evidence {data_id} for case {case_id} after {stored} chunks: {e}",
+            extra={'case_id': case_id, 'data_id': data_id, 'error': str(e)},
+            exc_info=True
+        )
+    finally:
+        upload.cleanup()
+
+
 # Configurable banned words list - minimal but extensible
 BANNED_GENERIC_WORDS = [
     'new case', 'untitled', 'troubleshooting', 'conversation',
@@ -331,6 +393,7 @@ async def list_cases(
     status: Optional[CaseStatus] = Query(None, description="Filter by status"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
     offset: int = Query(0, ge=0, description="Number of items to skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (keyset pagination; overrides offset)"),
     # Changed default to True - new cases should be visible immediately
     include_empty: bool = Query(True, description="Include cases with current_turn == 0 (newly created)"),
     include_archived: bool = Query(False, description="Include archived/closed cases")
@@ -340,8 +403,9 @@ async def list_cases(
 
     Returns CaseListResponse with:
     - List of CaseSummary objects (with milestone progress)
-    - Total count for pagination
-    - has_more flag
+    - Total count of matching cases (an estimate, flagged by
+      total_is_estimate, for very large result sets)
+    - has_more flag and next_cursor for keyset pagination
 
     Default Filtering Behavior:
     - INCLUDES empty cases (current_turn == 0) - newly created cases are visible
@@ -364,18 +428,18 @@ async def list_cases(
             include_archived=include_archived
         )
 
-        # Get case summaries (already converted by service)
-        case_summaries = await case_service.list_user_cases(current_user.user_id, filters)
-
-        # Build response
-        total_count = len(case_summaries)  # TODO: Get actual total from repository
+        # Filtered and paged in the repository, with an accurate total
+        page = await case_service.list_user_case_page(current_user.user_id, filters, cursor=cursor)
         list_response = CaseListResponse(
-            cases=case_summaries,
-            total_count=total_count,
+            cases=page.summaries,
+            total_count=page.total_count,
             limit=limit,
             offset=offset,
-            has_more=len(case_summaries) == limit
+            has_more=page.next_cursor is not None,
+            next_cursor=page.next_cursor,
+            total_is_estimate=page.total_is_estimate
         )
+        total_count = list_response.total_count
 
         # Set pagination headers
         response.headers["X-Total-Count"] = str(total_count)
@@ -383,6 +447,17 @@ async def list_cases(
 
         return list_response
         
+    except ValidationException as e:
+        error_response = ErrorResponse(
+            schema_version="3.1.0",
+            error=ErrorDetail(code="VALIDATION_ERROR", message=str(e))
+        )
+        return JSONResponse(
+            status_code=400,
+            content=error_response.dict(),
+            headers={"x-correlation-id": correlation_id}
+        )
+
     except ServiceException as e:
         # Service-level errors
         correlation_id = str(uuid.uuid4())
@@ -503,8 +578,8 @@ async def get_case_ui(
                 headers={"x-correlation-id": correlation_id}
             )
 
-        # Transform to UI response based on phase
-        ui_response = transform_case_for_ui(case)
+        # Transform to UI response based on phase (memoized per case version)
+        ui_response = project_case_for_ui(case)
 
         return ui_response
 
@@ -1692,6 +1767,8 @@ async def upload_case_data(
     """
     case_service = check_case_service_available(case_service)
     correlation_id = str(uuid.uuid4())
+    upload = None
+    upload_handed_off = False
 
     try:
         # 1. Verify case exists and user has access
@@ -1708,9 +1785,20 @@ async def upload_case_data(
             # Cases have a session_id field that tracks the associated session
             session_id = f"case_{case_id}_session"  # Generate a session ID from case
 
-        # 3. Read file content
-        content = await file.read()
-        content_str = content.decode("utf-8", errors="ignore")
+        # 3. Spool the upload to disk in chunks (size limit and hash applied while streaming)
+        upload_settings = get_settings().upload
+        try:
+            upload = await spool_upload(
+                file.read,
+                max_bytes=upload_settings.max_upload_size_mb * 1024 * 1024,
+                directory=upload_settings.temp_storage_path
+            )
+        except UploadTooLarge as e:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=str(e),
+                headers={"x-correlation-id": correlation_id}
+            )
 
         # 4. Build context for case association
         context = {
@@ -1721,11 +1809,10 @@ async def upload_case_data(
             context["description"] = description
 
         # 5. Preprocess data (extraction, classification, sanitization)
-        uploaded_data = await data_service.ingest_data(
-            content=content_str,
+        uploaded_data = await data_service.ingest_spooled(
+            upload,
             session_id=session_id,
             file_name=file.filename,
-            file_size=len(content),
             context=context
         )
 
@@ -1742,7 +1829,7 @@ async def upload_case_data(
                 "file_id": uploaded_data.get("data_id"),
                 "filename": file.filename,
                 "data_type": uploaded_data.get("data_type"),
-                "size": uploaded_data.get("file_size", len(content)),
+                "size": uploaded_data.get("file_size", upload.size),
                 "summary": uploaded_data.get("insights", {}).get("brief_summary"),
                 "s3_uri": uploaded_data.get("data_id")  # Content reference
             }] if uploaded_data.get("data_id") else None
@@ -1760,20 +1847,23 @@ async def upload_case_data(
         if case_vector_store and uploaded_data.get("data_id"):
             # Fire-and-forget background task for vector storage
             # Using FastAPI's BackgroundTasks ensures task runs AFTER response is sent
+            # The spool file is read in chunks and deleted by the task
             background_tasks.add_task(
-                _store_evidence_in_vector_db,
+                _store_spooled_evidence_in_vector_db,
                 case_id=case_id,
                 data_id=uploaded_data["data_id"],
-                content=uploaded_data.get("content", ""),
+                chunks=data_service.iter_sanitized_text(upload),
+                upload=upload,
                 data_type=uploaded_data.get("data_type", "unknown"),
                 metadata={
                     'filename': file.filename,
-                    'file_size': len(content),
+                    'file_size': upload.size,
                     'case_id': case_id,
                     'session_id': session_id
                 },
                 case_vector_store=case_vector_store
             )
+            upload_handed_off = True
             logger.debug(f"Background vectorization task scheduled for evidence {uploaded_data['data_id']}")
 
         # 8. Combine preprocessing metadata with agent response
@@ -1783,7 +1873,7 @@ async def upload_case_data(
             data_id=uploaded_data.get("data_id"),
             case_id=case_id,
             filename=file.filename,
-            file_size=len(content),
+            file_size=upload.size,
             data_type=uploaded_data.get("data_type", "unknown"),
             processing_status=ProcessingStatus.COMPLETED,
             uploaded_at=datetime.now(timezone.utc).isoformat(),
@@ -1819,6 +1909,9 @@ async def upload_case_data(
             detail=f"Failed to upload data: {str(e)}",
             headers={"x-correlation-id": correlation_id}
         )
+    finally:
+        if upload is not None and not upload_handed_off:
+            upload.cleanup()
 
 
 @router.delete("/{case_id}/data/{data_id}", status_code=status.HTTP_204_NO_CONTENT, responses={204: {"description": "Data deleted successfully", "headers": {"X-Correlation-ID": {"description": "Request correlation ID", "schema": {"type": "string"}}}}})
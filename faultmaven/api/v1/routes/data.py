@@ -19,10 +19,12 @@ Architecture Pattern:
 API Route (validation + delegation) → Service Layer (business logic) → Core Domain
 """
 
+import json
 import logging
 from typing import Optional, List, Dict, Any
 
-from fastapi import APIRouter, Depends, Body, HTTPException, Response
+from fastapi import APIRouter, Depends, Body, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from faultmaven.models import DataInsightsResponse, UploadedData
 from faultmaven.api.v1.dependencies import get_data_service
@@ -198,14 +200,22 @@ async def get_session_data(
 async def batch_process_session_data(
     session_id: str,
     batch_request: Dict[str, Any] = Body(...),
+    stream: bool = Query(False, description="Stream per-item results as NDJSON"),
     data_service: DataService = Depends(get_data_service)
-) -> Dict[str, Any]:
+):
     """
     Batch process data for a session
 
+    Inline items are ingested concurrently by DataService. With
+    ``stream=true`` the response is NDJSON: one line per item as it
+    finishes, followed by a summary line.
+
     Args:
         session_id: Session identifier
-        batch_request: Request with data_ids to process
+        batch_request: Request with ``items`` ([{content, filename}]) to
+            ingest, or ``data_ids`` of already uploaded data; an optional
+            ``max_concurrency`` is capped at the configured batch concurrency
+        stream: Whether to stream per-item results
         data_service: Injected DataService
 
     Returns:
@@ -214,9 +224,42 @@ async def batch_process_session_data(
     logger.info(f"Batch processing data for session {session_id}")
 
     try:
+        items = batch_request.get("items")
+        if items:
+            data_items = [
+                (item.get("content"), item.get("filename"))
+                for item in items
+                if isinstance(item, dict)
+            ]
+            if len(data_items) != len(items):
+                raise HTTPException(status_code=400, detail="Each item must be an object")
+            max_concurrency = batch_request.get("max_concurrency")
+            if max_concurrency is not None and (
+                isinstance(max_concurrency, bool) or not isinstance(max_concurrency, int) or max_concurrency < 1
+            ):
+                raise HTTPException(status_code=400, detail="max_concurrency must be a positive integer")
+
+            if stream:
+                return StreamingResponse(
+                    _stream_batch_results(data_service, data_items, session_id, max_concurrency),
+                    media_type="application/x-ndjson"
+                )
+
+            results = await data_service.batch_process(
+                data_items, session_id, max_concurrency=max_concurrency
+            )
+            return {
+                "job_id": f"batch_{session_id}_{len(data_items)}",
+                "status": "completed",
+                "processed_count": len(results),
+                "failed_count": len(data_items) - len(results),
+                "session_id": session_id,
+                "results": results
+            }
+
         data_ids = batch_request.get("data_ids", [])
         if not data_ids:
-            raise HTTPException(status_code=400, detail="No data IDs provided")
+            raise HTTPException(status_code=400, detail="No items or data IDs provided")
 
         # Simple batch processing - in a real implementation this might be async
         job_id = f"batch_{session_id}_{len(data_ids)}"
@@ -245,6 +288,38 @@ async def batch_process_session_data(
         raise HTTPException(status_code=500, detail="Batch processing failed")
 
 
+async def _stream_batch_results(
+    data_service: DataService,
+    data_items: List[tuple],
+    session_id: str,
+    max_concurrency: Optional[int]
+):
+    """Yield NDJSON lines for each finished batch item, then a summary"""
+    processed = 0
+    failed = 0
+    try:
+        async for outcome in data_service.batch_process_stream(
+            data_items, session_id, max_concurrency=max_concurrency
+        ):
+            if outcome["status"] == "completed":
+                processed += 1
+            else:
+                failed += 1
+            yield json.dumps(outcome, default=str) + "\n"
+    except Exception as e:
+        logger.error(f"Streaming batch processing failed: {e}")
+        yield json.dumps({"status": "error", "error": "Batch processing failed"}) + "\n"
+        return
+
+    yield json.dumps({
+        "job_id": f"batch_{session_id}_{len(data_items)}",
+        "status": "completed",
+        "processed_count": processed,
+        "failed_count": failed,
+        "session_id": session_id
+    }) + "\n"
+
+
 @router.get("/health")
 @trace("api_data_health")
 async def health_check(
@@ -417,8 +417,7 @@ async def add_member(
             )
 
         # Fetch the added member
-        members = await service.list_organization_members(org_id)
-        member = next((m for m in members if m.user_id == request.user_id), None)
+        member = await service.get_member(org_id, request.user_id)
 
         if not member:
             raise HTTPException(
@@ -511,8 +510,7 @@ async def update_member_role(
             )
 
         # Fetch updated member
-        members = await service.list_organization_members(org_id)
-        member = next((m for m in members if m.user_id == target_user_id), None)
+        member = await service.get_member(org_id, target_user_id)
 
         if not member:
             raise HTTPException(
@@ -27,6 +27,7 @@ Core Design Principles:
 • Observability: Add tracing spans for key operations
 """
 
+from collections import Counter
 from typing import Optional, List
 from datetime import datetime, timezone, timedelta
 from faultmaven.utils.serialization import to_json_compatible
@@ -439,74 +440,28 @@ async def list_sessions(
         List of sessions
     """
     try:
-        # Get sessions from SessionManager and apply filters/pagination
-        all_sessions = await session_service.list_sessions(user_id=user_id)
-        
-        # Apply session type filtering
         filter_type = session_type or usage_type
-        if filter_type:
-            filtered_sessions = []
-            for session in all_sessions:
-                try:
-                    # Check session metadata for session_type or usage_type
-                    session_data = None
-                    if (hasattr(session_service, 'session_manager') and 
-                        hasattr(session_service.session_manager, 'session_store') and
-                        hasattr(session_service.session_manager.session_store, 'get')):
-                        session_data = await session_service.session_manager.session_store.get(session.session_id)
-                    
-                    if session_data:
-                        metadata_type = (session_data.get("session_type") or 
-                                       session_data.get("usage_type") or 
-                                       "troubleshooting")
-                        if metadata_type == filter_type:
-                            filtered_sessions.append(session)
-                    elif filter_type == "troubleshooting":  # Default type
-                        filtered_sessions.append(session)
-                except Exception as e:
-                    logger.warning(f"Failed to get session metadata for {session.session_id}: {e}")
-                    # Include session if we can't determine its type and filter is for default type
-                    if filter_type == "troubleshooting":
-                        filtered_sessions.append(session)
-            all_sessions = filtered_sessions
-        
-        # Apply pagination
-        total = len(all_sessions)
-        paginated_sessions = all_sessions[offset:offset + limit]
-        
-        # Format response
-        sessions_response = []
-        for session in paginated_sessions:
-            # Get session metadata for display
-            session_type_val = "troubleshooting"  # default
-            try:
-                session_data = None
-                if (hasattr(session_service, 'session_manager') and 
-                    hasattr(session_service.session_manager, 'session_store') and
-                    hasattr(session_service.session_manager.session_store, 'get')):
-                    session_data = await session_service.session_manager.session_store.get(session.session_id)
-                
-                if session_data:
-                    session_type_val = (session_data.get("session_type") or 
-                                      session_data.get("usage_type") or 
-                                      "troubleshooting")
-            except Exception as e:
-                logger.warning(f"Failed to get session metadata for display {session.session_id}: {e}")
-            
-            sessions_response.append({
-                "session_id": session.session_id,
-                "user_id": session.user_id,
-                "created_at": _safe_datetime_to_utc_string(session.created_at),
-                "last_activity": _safe_datetime_to_utc_string(session.last_activity),
-                "status": "consulting",
-                "session_type": session_type_val,
-                "usage_type": session_type_val,  # For backward compatibility
-                "data_uploads_count": len(session.data_uploads),
-                "case_history_count": len(session.case_history),
-            })
-        
+
+        # Filtered, sorted and paged by the session store (indexed where the
+        # store supports it), without loading each session
+        summaries, total = await session_service.list_session_page(
+            user_id=user_id, session_type=filter_type, limit=limit, offset=offset
+        )
         return {
-            "sessions": sessions_response,
+            "sessions": [
+                {
+                    "session_id": summary["session_id"],
+                    "user_id": summary["user_id"] or None,
+                    "created_at": summary["created_at"],
+                    "last_activity": summary["last_activity"],
+                    "status": "consulting",
+                    "session_type": summary["session_type"],
+                    "usage_type": summary["session_type"],  # For backward compatibility
+                    "data_uploads_count": summary["data_uploads_count"],
+                    "case_history_count": summary["case_history_count"],
+                }
+                for summary in summaries
+            ],
             "total_count": total,
             "limit": limit,
             "offset": offset,
@@ -569,12 +524,11 @@ async def list_session_cases(
 
                 # Get user's cases (session provides authentication context)
                 # Architecture: Session → User → User's Cases (indirect relationship)
-                user_cases = await case_service.list_user_cases(current_user.user_id, filters)
-                logger.debug(f"Session {session_id} accessing {len(user_cases)} cases for user {current_user.user_id}")
-
-                # No additional filtering needed - session authenticates access to all user's cases
-                total_count = len(user_cases)
-                paginated_cases = user_cases[offset:offset + limit]
+                # Paged by the repository; total counts all matching cases
+                page = await case_service.list_user_case_page(current_user.user_id, filters)
+                paginated_cases = page.summaries
+                total_count = page.total_count
+                logger.debug(f"Session {session_id} accessing {len(paginated_cases)} cases for user {current_user.user_id}")
 
                 # Convert Case entities to API objects (consistent with /api/v1/cases)
                 cases = CaseConverter.entities_to_api_list(paginated_cases)
@@ -725,9 +679,10 @@ async def session_heartbeat(
             logger.error("Session service is not available")
             raise HTTPException(status_code=503, detail="Session service unavailable")
         
-        # Update session activity with specific error handling
+        # Update session activity with specific error handling. record_heartbeat
+        # writes only the activity field and TTL, coalescing rapid heartbeats.
         try:
-            result = await session_service.update_last_activity(session_id)
+            result = await session_service.record_heartbeat(session_id)
         except FileNotFoundError:
             _log_session_not_found_rate_limited(session_id)
             raise HTTPException(
@@ -757,35 +712,10 @@ async def session_heartbeat(
             _log_session_not_found_rate_limited(session_id)
             raise HTTPException(status_code=404, detail="Session not found or expired")
 
-        # Record heartbeat operation in session history (best effort)
-        heartbeat_record = {
-            "action": "heartbeat",
-            "timestamp": to_json_compatible(datetime.now(timezone.utc)),
-            "endpoint": "heartbeat"
-        }
-        
-        try:
-            # Check if session_manager has a real add_case_history method
-            if (hasattr(session_service, 'session_manager') and 
-                hasattr(session_service.session_manager, 'add_case_history')):
-                await session_service.session_manager.add_case_history(session_id, heartbeat_record)
-        except Exception as e:
-            # Log warning but don't fail the heartbeat if case history fails
-            logger.warning(f"Failed to record heartbeat operation for {session_id}: {e}")
-
-        # Get updated session to return current last_activity (best effort)
-        last_activity = to_json_compatible(datetime.now(timezone.utc))  # fallback
-        try:
-            session = await session_service.get_session(session_id, validate=False)
-            if session and session.last_activity:
-                last_activity = _safe_datetime_to_utc_string(session.last_activity)
-        except Exception as e:
-            logger.warning(f"Failed to get updated session info for {session_id}: {e}")
-        
         return {
             "session_id": session_id,
             "status": "consulting",
-            "last_activity": last_activity,
+            "last_activity": _safe_datetime_to_utc_string(result),
             "message": "Session heartbeat updated",
         }
     except HTTPException:
@@ -837,39 +767,21 @@ async def get_session_stats(
         # Re-fetch session to get updated stats
         session = await session_service.get_session(session_id)
 
-        # Calculate statistics for this specific session
-        total_cases = len([
-            h for h in session.case_history
-            if h.get("action") == "query_processed"
-        ])
-
-        # Count data upload operations from case history instead of data_uploads list
-        total_upload_operations = len([
-            h for h in session.case_history
-            if h.get("action") == "data_uploaded"
-        ])
-        
-        # Count heartbeat operations
-        total_heartbeat_operations = len([
-            h for h in session.case_history
-            if h.get("action") == "heartbeat"
-        ])
-        
-        # Count stats request operations
-        total_stats_operations = len([
-            h for h in session.case_history
-            if h.get("action") == "stats_request"
-        ])
-        
+        # Calculate statistics for this specific session in one pass over the history
+        action_counts = Counter(h.get("action") for h in session.case_history)
+        total_cases = action_counts["query_processed"]
+        total_upload_operations = action_counts["data_uploaded"]
+        total_stats_operations = action_counts["stats_request"]
+
+        # Heartbeats are kept in counters, not in case history
+        total_heartbeat_operations = await session_service.get_heartbeat_count(session_id)
+
         # Count all request operations (this is what tests are looking for)
         total_requests = total_cases + total_upload_operations + total_heartbeat_operations + total_stats_operations
-
-        # Debug: log what's actually in the history
-        logger.debug(f"Session {session_id} case history: {len(session.case_history)} total entries")
-        for i, h in enumerate(session.case_history):
-            logger.debug(f"  History {i}: action={h.get('action')}, keys={list(h.keys())}")
-        logger.debug(f"Query operations: {total_cases}, Upload operations: {total_upload_operations}, Heartbeat operations: {total_heartbeat_operations}, Stats operations: {total_stats_operations}")
-        logger.debug(f"Total requests: {total_requests}")
+        logger.debug(
+            f"Session {session_id} operations: {dict(action_counts)}, heartbeats: {total_heartbeat_operations}, "
+            f"total requests: {total_requests}"
+        )
 
         # For backward compatibility, also count unique data uploads
         total_uploads = len(session.data_uploads)
@@ -374,8 +374,7 @@ async def add_team_member(
             )
 
         # Fetch the added member
-        members = await service.list_team_members(team_id)
-        member = next((m for m in members if m.user_id == request.user_id), None)
+        member = await service.get_member(team_id, request.user_id)
 
         if not member:
             raise HTTPException(
@@ -31,6 +31,7 @@ from faultmaven.models.auth import DevUser
 from faultmaven.models.api import ErrorResponse, ErrorDetail
 from faultmaven.api.v1.auth_dependencies import require_authentication
 from faultmaven.infrastructure.observability.tracing import trace
+from faultmaven.infrastructure.caching.response_cache import invalidate_responses
 from faultmaven.utils.serialization import to_json_compatible
 
 
@@ -179,6 +180,7 @@ async def upload_user_kb_document(
                 'metadata': metadata
             }]
         )
+        await invalidate_responses(f"kb:{user_id}")
 
         logger.info(
             f"User KB document stored: {doc_id} for user {user_id} "
@@ -349,6 +351,7 @@ async def delete_user_kb_document(
     try:
         # Delete document
         await user_kb_store.delete_document(user_id=user_id, doc_id=doc_id)
+        await invalidate_responses(f"kb:{user_id}")
 
         logger.info(f"Deleted document {doc_id} from user {user_id} KB")
 
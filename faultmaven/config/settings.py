@@ -62,7 +62,9 @@ class ServerSettings(BaseSettings):
     environment: Environment = Field(default=Environment.DEVELOPMENT, env="ENVIRONMENT")
     debug: bool = Field(default=False, env="DEBUG")
     skip_service_checks: bool = Field(default=False, env="SKIP_SERVICE_CHECKS")
-    
+    # Build every container component at startup instead of on first use
+    eager_container_init: bool = Field(default=False, env="EAGER_CONTAINER_INIT")
+
     # Testing configuration
     pytest_current_test: Optional[str] = Field(default=None, env="PYTEST_CURRENT_TEST")
     
@@ -473,6 +475,15 @@ class DatabaseSettings(BaseSettings):
     redis_db: int = Field(default=0, env="REDIS_DB")
     redis_password: Optional[SecretStr] = Field(default=None, env="REDIS_PASSWORD")
     redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
+
+    # Shared HTTP response cache for read endpoints (stored in Redis)
+    response_cache_enabled: bool = Field(default=True, env="RESPONSE_CACHE_ENABLED")
+    response_cache_ttl: int = Field(default=300, env="RESPONSE_CACHE_TTL", ge=1)
+    response_cache_compress_min_bytes: int = Field(
+        default=1024,
+        env="RESPONSE_CACHE_COMPRESS_MIN_BYTES",
+        description="Cached bodies smaller than this are served uncompressed"
+    )
     
     model_config = {
         "env_file": ".env",
@@ -490,6 +501,7 @@ class DatabaseSettings(BaseSettings):
     # ChromaDB Extended Configuration (merged from EnhancedDatabaseSettings)
     chromadb_auth_token: Optional[SecretStr] = Field(default=None, env="CHROMADB_AUTH_TOKEN")
     chromadb_collection: str = Field(default="faultmaven_kb", env="CHROMADB_COLLECTION")
+    chromadb_max_workers: int = Field(default=8, env="CHROMADB_MAX_WORKERS", ge=1)
     
     # Vector Database Settings
     embedding_model: str = Field(default="BAAI/bge-m3", env="EMBEDDING_MODEL")
@@ -504,6 +516,11 @@ class DatabaseSettings(BaseSettings):
     user_storage_type: str = Field(default="inmemory", env="USER_STORAGE_TYPE")
     case_storage_type: str = Field(default="inmemory", env="CASE_STORAGE_TYPE")
 
+    # Case event log (postgres_hybrid): turns are appended as events and the
+    # full case is saved and snapshotted every CASE_SNAPSHOT_INTERVAL turns
+    case_event_log_enabled: bool = Field(default=True, env="CASE_EVENT_LOG_ENABLED")
+    case_snapshot_interval: int = Field(default=50, env="CASE_SNAPSHOT_INTERVAL", ge=1)
+
     # PostgreSQL - Auth Database (for user data)
     auth_db_host: str = Field(default="postgres.faultmaven.local", env="AUTH_DB_HOST")
     auth_db_port: int = Field(default=30432, env="AUTH_DB_PORT")
@@ -549,6 +566,7 @@ class SessionSettings(BaseSettings):
     cleanup_interval_minutes: int = Field(default=15, env="SESSION_CLEANUP_INTERVAL_MINUTES")
     max_memory_mb: int = Field(default=100, env="SESSION_MAX_MEMORY_MB")
     heartbeat_interval_seconds: int = Field(default=30, env="SESSION_HEARTBEAT_INTERVAL_SECONDS")
+    heartbeat_coalesce_seconds: float = Field(default=10.0, env="SESSION_HEARTBEAT_COALESCE_SECONDS", ge=0)
     max_sessions_per_user: int = Field(default=10, env="MAX_SESSIONS_PER_USER")
     
     @field_validator('heartbeat_interval_seconds')
@@ -604,6 +622,16 @@ class SecuritySettings(BaseSettings):
     rate_limit_enabled: bool = Field(default=True, env="RATE_LIMIT_ENABLED")
     rate_limit_requests_per_minute: int = Field(default=60, env="RATE_LIMIT_REQUESTS_PER_MINUTE")
     rate_limit_burst_size: int = Field(default=10, env="RATE_LIMIT_BURST_SIZE")
+
+    # RBAC permission cache (in-process, then Redis; invalidated on member changes)
+    permission_cache_enabled: bool = Field(default=True, env="PERMISSION_CACHE_ENABLED")
+    permission_cache_local_ttl: float = Field(
+        default=30.0,
+        env="PERMISSION_CACHE_LOCAL_TTL",
+        ge=0,
+        description="Seconds another process may keep serving a membership changed elsewhere"
+    )
+    permission_cache_ttl: int = Field(default=300, env="PERMISSION_CACHE_TTL", ge=1)
     
     model_config = {"env_prefix": "", "extra": "ignore"}
 
@@ -656,6 +684,8 @@ class ProtectionSettings(BaseSettings):
     ml_model_path: str = Field(default="/tmp/faultmaven_ml", env="ML_MODEL_PATH")
     ml_training_enabled: bool = Field(default=True, env="ML_TRAINING_ENABLED")
     ml_online_learning_enabled: bool = Field(default=True, env="ML_ONLINE_LEARNING_ENABLED")
+    ml_scoring_batch_size: int = Field(default=64, env="ML_SCORING_BATCH_SIZE")
+    ml_scoring_max_delay_ms: int = Field(default=50, env="ML_SCORING_MAX_DELAY_MS")
     
     # Circuit Breaker (merged from EnhancedProtectionSettings)
     smart_circuit_breakers_enabled: bool = Field(default=True, env="SMART_CIRCUIT_BREAKERS_ENABLED")
@@ -690,6 +720,8 @@ class ObservabilitySettings(BaseSettings):
     opik_track_users: str = Field(default="", env="OPIK_TRACK_USERS")
     opik_track_sessions: str = Field(default="", env="OPIK_TRACK_SESSIONS")
     opik_track_operations: str = Field(default="", env="OPIK_TRACK_OPERATIONS")
+    opik_sample_rate: float = Field(default=1.0, env="OPIK_SAMPLE_RATE")
+    opik_sample_errors: bool = Field(default=True, env="OPIK_SAMPLE_ERRORS")
     
     # APM Integration (merged from EnhancedObservabilitySettings)
     prometheus_enabled: bool = Field(default=False, env="PROMETHEUS_ENABLED")
@@ -755,6 +787,13 @@ class UploadSettings(BaseSettings):
     )
     upload_timeout_seconds: int = Field(default=300, env="UPLOAD_TIMEOUT_SECONDS")  # 5 minutes
     temp_storage_path: str = Field(default="/tmp/faultmaven", env="TEMP_STORAGE_PATH")
+    batch_max_concurrency: int = Field(
+        default=4,
+        env="UPLOAD_BATCH_MAX_CONCURRENCY",
+        ge=1,
+        le=64,
+        description="Maximum items ingested concurrently by DataService batch processing"
+    )
 
     model_config = {"env_prefix": "", "extra": "ignore"}
 
@@ -772,6 +811,50 @@ class KnowledgeSettings(BaseSettings):
     # Document processing (size limit now in UploadSettings.max_upload_size_mb)
     chunk_size: int = Field(default=1000, env="DOCUMENT_CHUNK_SIZE")
     chunk_overlap: int = Field(default=100, env="DOCUMENT_CHUNK_OVERLAP")
+
+    # Ingestion throughput
+    embedding_batch_size: int = Field(
+        default=32,
+        env="EMBEDDING_BATCH_SIZE",
+        ge=1,
+        description="Maximum texts per embedding model call (ingestion and micro-batches)"
+    )
+    embedding_max_wait_ms: float = Field(
+        default=5.0,
+        env="EMBEDDING_MAX_WAIT_MS",
+        ge=0,
+        description="Maximum time an encode request waits to be coalesced into a micro-batch"
+    )
+    embedding_cache_size: int = Field(
+        default=10000,
+        env="EMBEDDING_CACHE_SIZE",
+        ge=0,
+        description="Embedding vectors kept in the per-process LRU cache (0 disables)"
+    )
+    embedding_model_mode: str = Field(
+        default="process",
+        env="EMBEDDING_MODEL_MODE",
+        description="process (model per worker), preload (loaded in the pre-fork master) "
+                    "or sidecar (served by a local embedding process over a Unix socket)"
+    )
+    embedding_sidecar_socket: str = Field(
+        default="/tmp/faultmaven-embeddings.sock",
+        env="EMBEDDING_SIDECAR_SOCKET",
+        description="Unix socket of the embedding sidecar (EMBEDDING_MODEL_MODE=sidecar)"
+    )
+    embedding_sidecar_timeout_seconds: float = Field(
+        default=30.0,
+        env="EMBEDDING_SIDECAR_TIMEOUT_SECONDS",
+        gt=0,
+        description="Timeout for one embedding sidecar request"
+    )
+    ingestion_max_concurrency: int = Field(
+        default=4,
+        env="INGESTION_MAX_CONCURRENCY",
+        ge=1,
+        le=32,
+        description="Maximum documents processed concurrently by bulk ingestion"
+    )
     
     model_config = {"env_prefix": "", "extra": "ignore"}
 
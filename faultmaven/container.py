@@ -7,7 +7,7 @@ the interface-based dependency injection pattern.
 
 Core Responsibilities:
 - Singleton container with lazy initialization
-- Dependency graph resolution for all services
+- Dependency graph resolution for all services (parallel startup, lazy optional services)
 - Configuration management from environment variables
 - Proper error handling and fallback mechanisms
 
@@ -19,9 +19,12 @@ Key Components:
 """
 
 from typing import List, Optional, Any
+import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from faultmaven.config.settings import FaultMavenSettings, get_settings
+from faultmaven.infrastructure.provider_graph import ProviderGraph
 
 # Import interfaces with graceful fallback for testing environments
 try:
@@ -89,7 +92,14 @@ class DIContainer:
         return cls._instance
     
     async def initialize(self):
-        """Initialize all dependencies with proper error handling (async for proper event loop handling)"""
+        """Initialize all dependencies with proper error handling (async for proper event loop handling)
+
+        Components are registered in a provider graph (see
+        faultmaven.infrastructure.provider_graph). Startup builds the
+        infrastructure, tools and core services, running every component whose
+        dependencies are ready concurrently. Optional feature services are built
+        on first use unless EAGER_CONTAINER_INIT is set.
+        """
         logger = logging.getLogger(__name__)
 
         if self._initialized:
@@ -113,10 +123,19 @@ class DIContainer:
             raise
 
         try:
+            start = time.perf_counter()
+
             # Always try to create infrastructure layer first - even if interfaces not available
             # This allows tests to mock the infrastructure layer creation
             await self._create_infrastructure_layer()
 
+            # Tools and services share one parallel warm-up; the layer hooks
+            # below only build what the warm-up did not reach
+            providers = self._provider_graph()
+            await providers.warm(
+                providers.names(include_lazy=self.settings.server.eager_container_init)
+            )
+
             # Core tools - Domain-specific functionality
             self._create_tools_layer()
 
@@ -125,7 +144,11 @@ class DIContainer:
 
             self._initialized = True
             self._initializing = False
-            logger.info("✅ DI Container initialized successfully")
+            logger.info(
+                f"✅ DI Container initialized successfully in "
+                f"{(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+            logger.debug(f"Container startup profile:\n{providers.format_profile()}")
 
         except Exception as e:
             logger.error(f"❌ DI Container initialization failed: {e}")
@@ -142,7 +165,6 @@ class DIContainer:
                 import traceback
                 logger.error(f"Critical initialization error: {traceback.format_exc()}")
                 self._initialized = False
-    
     def _create_minimal_container(self):
         """Create minimal container for testing environments without dependencies"""
         # Create mock objects for testing
@@ -166,42 +188,241 @@ class DIContainer:
         
         logging.getLogger(__name__).info("Created minimal container for testing")
     
+    def _provider_graph(self) -> ProviderGraph:
+        """Get the provider graph, registering providers on first use"""
+        providers = self.__dict__.get('_providers')
+        if providers is None:
+            if getattr(self, 'settings', None) is None:
+                self.settings = get_settings()
+            providers = self._build_provider_graph()
+            self._providers = providers
+        return providers
+
+    def _build_provider_graph(self) -> ProviderGraph:
+        """Register every container component with the components it depends on"""
+        providers = ProviderGraph()
+        infrastructure = "infrastructure"
+
+        # Infrastructure layer
+        providers.register("sanitizer", self._provide_sanitizer, layer=infrastructure)
+        providers.register("tracer", self._provide_tracer, layer=infrastructure)
+        providers.register(
+            "llm_provider", self._provide_llm_provider,
+            depends_on=["tracer"], layer=infrastructure,
+        )
+        providers.register(
+            "log_processor", self._provide_log_processor,
+            blocking=True, layer=infrastructure,
+        )
+        providers.register(
+            "preprocessing", self._provide_preprocessing,
+            depends_on=["llm_provider"],
+            provides=[
+                "data_classifier", "logs_extractor", "config_extractor", "metrics_extractor",
+                "text_extractor", "source_code_extractor", "visual_extractor", "trace_extractor",
+                "profiling_extractor", "error_report_extractor", "documentation_extractor",
+                "command_output_extractor", "data_sanitizer", "chunking_service",
+                "preprocessing_service",
+            ],
+            layer=infrastructure,
+        )
+        providers.register(
+            "vector_store", self._provide_vector_store,
+            blocking=True, layer=infrastructure,
+        )
+        providers.register(
+            "case_vector_store", self._provide_case_vector_store,
+            blocking=True, layer=infrastructure,
+        )
+        providers.register(
+            "user_kb_vector_store", self._provide_user_kb_vector_store,
+            blocking=True, layer=infrastructure,
+        )
+        providers.register(
+            "redis_client", self._provide_redis_client,
+            warmup=self._validate_redis_client, layer=infrastructure,
+        )
+        providers.register("session_store", self._provide_session_store, layer=infrastructure)
+        providers.register("user_repository", self._provide_user_repository, layer=infrastructure)
+        providers.register("case_repository", self._provide_case_repository, layer=infrastructure)
+        providers.register(
+            "report_store", self._provide_report_store,
+            depends_on=["redis_client", "vector_store"],
+            provides=["report_store", "case_store"],
+            layer=infrastructure,
+        )
+        providers.register(
+            "auth", self._provide_auth,
+            depends_on=["redis_client"],
+            provides=["token_manager", "user_store"],
+            layer=infrastructure,
+        )
+
+        # Tools layer
+        providers.register(
+            "knowledge_ingester", self._provide_knowledge_ingester,
+            blocking=True, layer="tools",
+        )
+        providers.register(
+            "tools", self._provide_tools,
+            depends_on=["knowledge_ingester", "llm_provider", "case_vector_store", "user_kb_vector_store"],
+            provides=["tools", "case_evidence_qa_tool", "user_kb_qa_tool", "global_kb_qa_tool"],
+            layer="tools",
+        )
+
+        # Service layer
+        providers.register(
+            "case_service", self._provide_case_service,
+            depends_on=["case_repository", "session_store", "report_store", "case_vector_store"],
+        )
+        providers.register(
+            "milestone_engine", self._provide_milestone_engine,
+            depends_on=["llm_provider", "case_repository"],
+        )
+        providers.register(
+            "investigation_service", self._provide_investigation_service,
+            depends_on=["milestone_engine", "case_repository"],
+        )
+        providers.register(
+            "organization_service", self._provide_organization_service,
+            depends_on=["redis_client"],
+        )
+        providers.register(
+            "team_service", self._provide_team_service,
+            depends_on=["organization_service"],
+        )
+        providers.register(
+            "session_service", self._provide_session_service,
+            depends_on=["session_store", "case_service"],
+        )
+        providers.register(
+            "data_service", self._provide_data_service,
+            depends_on=["preprocessing", "log_processor", "sanitizer", "tracer", "session_service"],
+            provides=["data_service", "agent_service"],
+        )
+        providers.register(
+            "knowledge_service", self._provide_knowledge_service,
+            depends_on=["knowledge_ingester", "sanitizer", "tracer", "vector_store", "redis_client"],
+        )
+
+        # Optional feature services - built on first use
+        providers.register(
+            "performance_monitoring", self._create_performance_monitoring_services,
+            depends_on=["redis_client", "tracer"],
+            provides=[
+                "metrics_collector", "intelligent_cache", "analytics_dashboard_service",
+                "performance_optimization_service", "sla_monitor", "performance_monitor",
+            ],
+            eager=False,
+        )
+        providers.register(
+            "enhanced_data_processing", self._create_enhanced_data_processing_services,
+            depends_on=["sanitizer", "tracer", "session_service"],
+            provides=[
+                "pattern_learner", "enhanced_data_classifier", "enhanced_log_processor",
+                "enhanced_security_assessment", "enhanced_data_service",
+            ],
+            eager=False,
+        )
+        providers.register(
+            "microservice_foundation", self._create_microservice_foundation_services,
+            depends_on=["session_service", "knowledge_service", "vector_store", "sanitizer", "tracer", "llm_provider"],
+            provides=[
+                "microservice_session_service", "confidence_service", "policy_service",
+                "unified_retrieval_service", "decision_recorder", "gateway_service",
+                "loop_guard_service", "orchestrator_service",
+            ],
+            eager=False,
+        )
+
+        return providers
+
+    def _component(self, attribute: str, default: Any = None) -> Any:
+        """Get a component, building its provider on first access after startup began"""
+        initializing = getattr(self, '_initializing', False)
+        if not self._initialized and not initializing:
+            logging.getLogger(__name__).warning(
+                f"{attribute} requested but container not initialized - this should not happen after startup"
+            )
+            self._schedule_initialization()
+
+        if attribute in self.__dict__:
+            return self.__dict__[attribute]
+        if not self._initialized and not initializing:
+            return default
+
+        providers = self._provider_graph()
+        name = providers.provider_for(attribute)
+        if name is None:
+            return default
+        try:
+            providers.resolve(name)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Lazy initialization of '{name}' failed: {e}")
+        return self.__dict__.get(attribute, default)
+
+    def _schedule_initialization(self):
+        """Start initialization from a synchronous caller (runs in the background when a loop is running)"""
+        pending = self.initialize()
+        if not asyncio.iscoroutine(pending):
+            return
+        try:
+            self._initialization_task = asyncio.get_running_loop().create_task(pending)
+        except RuntimeError:
+            # No running event loop - startup will initialize the container
+            pending.close()
+
+    def get_startup_profile(self) -> List[dict]:
+        """Per-component build timings recorded by the provider graph"""
+        providers = self.__dict__.get('_providers')
+        return providers.profile() if providers is not None else []
+
     async def _create_infrastructure_layer(self):
         """Create infrastructure components with interface implementations using unified settings (async for Redis)"""
         logger = logging.getLogger(__name__)
-        
+
         # Ensure settings are available
         if not hasattr(self, 'settings') or self.settings is None:
             self.settings = get_settings()
-        
+
         # Log current configuration using settings system
         logger.info(f"🔍 Container: Configuration check during infrastructure creation:")
         logger.info(f"🔍 Container: CHAT_PROVIDER = {self.settings.llm.provider}")
         logger.info(f"🔍 Container: LLM_REQUEST_TIMEOUT = {self.settings.llm.request_timeout}")
         logger.info(f"🔍 Container: SKIP_SERVICE_CHECKS = {self.settings.server.skip_service_checks}")
-        
-        # Legacy config removed - now using unified settings system exclusively
-        
-        # Data sanitization for PII protection
+
+        # Independent components (vector stores, Redis, repositories) are built
+        # concurrently; blocking clients are created on worker threads
+        providers = self._provider_graph()
+        await providers.warm(providers.names(layer="infrastructure"))
+
+        logger.debug("Infrastructure layer created with settings-based dependency injection")
+
+    def _provide_sanitizer(self):
+        """Data sanitization for PII protection"""
         from faultmaven.infrastructure.security.redaction import DataSanitizer
-        logger.debug(f"Protection config loaded: enabled={self.settings.protection.protection_enabled}")
+        logging.getLogger(__name__).debug(f"Protection config loaded: enabled={self.settings.protection.protection_enabled}")
         self.sanitizer: ISanitizer = DataSanitizer(settings=self.settings)
-        
-        # Distributed tracing (initialize first to set up environment variables)
+
+    def _provide_tracer(self):
+        """Distributed tracing (initialized before the LLM provider to set up environment variables)"""
         from faultmaven.infrastructure.observability.tracing import OpikTracer
-        logger.debug(f"Observability config loaded: enabled={self.settings.observability.tracing_enabled}")
+        logging.getLogger(__name__).debug(f"Observability config loaded: enabled={self.settings.observability.tracing_enabled}")
         self.tracer: ITracer = OpikTracer(settings=self.settings)
-        
-        # LLM Provider (initialize after Opik tracer to ensure environment is properly set up)
+
+    def _provide_llm_provider(self):
+        """LLM Provider (initialized after Opik tracer to ensure environment is properly set up)"""
         from faultmaven.infrastructure.llm.router import LLMRouter
         # LLMRouter does not accept settings; it reads runtime config internally
         self.llm_provider: ILLMProvider = LLMRouter()
-        
-        # Core processing interfaces (legacy log processor)
+
+    def _provide_log_processor(self):
+        """Core processing interfaces (legacy log processor)"""
         from faultmaven.core.processing.log_analyzer import LogProcessor
         self.log_processor = LogProcessor()
 
-        # New preprocessing pipeline (Phase 1-4) - All 11 data types
+    def _provide_preprocessing(self):
+        """New preprocessing pipeline (Phase 1-4) - All 11 data types"""
         from faultmaven.services.preprocessing.classifier import DataClassifier
         from faultmaven.services.preprocessing.extractors import (
             LogsAndErrorsExtractor,
@@ -264,10 +485,10 @@ class DIContainer:
             chunking_service=self.chunking_service,
             chunk_trigger_tokens=self.settings.preprocessing.chunk_trigger_tokens
         )
-        
-        # ============================================
-        # Vector Store (Configurable Adapter)
-        # ============================================
+
+    def _provide_vector_store(self):
+        """Vector Store (Configurable Adapter)"""
+        logger = logging.getLogger(__name__)
         try:
             vector_storage_type = self.settings.database.vector_storage_type.lower()
 
@@ -292,7 +513,9 @@ class DIContainer:
             from faultmaven.infrastructure.persistence.inmemory_vector_store import InMemoryVectorStore
             self.vector_store = InMemoryVectorStore()
 
-        # Case vector store for Session-Specific RAG (Working Memory)
+    def _provide_case_vector_store(self):
+        """Case vector store for Session-Specific RAG (Working Memory)"""
+        logger = logging.getLogger(__name__)
         from faultmaven.infrastructure.persistence.case_vector_store import CaseVectorStore
         try:
             if not self.settings.server.skip_service_checks:
@@ -306,7 +529,9 @@ class DIContainer:
             logger.warning(f"Case vector store initialization failed: {e}")
             self.case_vector_store = None
 
-        # User KB vector store for persistent user knowledge bases
+    def _provide_user_kb_vector_store(self):
+        """User KB vector store for persistent user knowledge bases"""
+        logger = logging.getLogger(__name__)
         from faultmaven.infrastructure.persistence.user_kb_vector_store import UserKBVectorStore
         try:
             if not self.settings.server.skip_service_checks:
@@ -320,26 +545,56 @@ class DIContainer:
             logger.warning(f"User KB vector store initialization failed: {e}")
             self.user_kb_vector_store = None
 
-        # Redis client for persistence (sessions, cases, KB metadata)
+    def _provide_redis_client(self):
+        """Redis client for persistence (sessions, cases, KB metadata)"""
+        logger = logging.getLogger(__name__)
         try:
             if not self.settings.server.skip_service_checks:
-                from faultmaven.infrastructure.redis_client import create_redis_client, validate_redis_connection
+                from faultmaven.infrastructure.redis_client import create_redis_client
+                from faultmaven.infrastructure.observability.prometheus_metrics import register_redis_pool
                 self.redis_client = create_redis_client()
-
-                # Validate connection in async context (ensures event loop is properly bound)
-                await validate_redis_connection(self.redis_client)
-                logger.info("✅ Redis client initialized and validated for application persistence")
-
+                register_redis_pool("main", self.redis_client)
+                self._configure_response_cache(create_redis_client)
             else:
                 logger.info("Skipping Redis client initialization (SKIP_SERVICE_CHECKS=True)")
                 self.redis_client = None
         except Exception as e:
             logger.warning(f"Redis client initialization failed: {e}")
             self.redis_client = None
-        
-        # ============================================
-        # Session Store (Configurable Adapter)
-        # ============================================
+
+    def _configure_response_cache(self, create_redis_client):
+        """Shared HTTP response cache (separate client: bodies are binary)"""
+        database = self.settings.database
+        if not database.response_cache_enabled:
+            return
+        from faultmaven.infrastructure.caching.response_cache import ResponseCacheStore, configure_response_cache
+        from faultmaven.infrastructure.observability.prometheus_metrics import register_redis_pool
+        binary_client = create_redis_client(decode_responses=False)
+        register_redis_pool("response_cache", binary_client)
+        configure_response_cache(ResponseCacheStore(
+            binary_client,
+            ttl_seconds=database.response_cache_ttl,
+            compress_min_bytes=database.response_cache_compress_min_bytes,
+        ))
+
+    async def _validate_redis_client(self):
+        """Validate the Redis connection in async context (ensures event loop is properly bound)"""
+        if self.redis_client is None:
+            return
+        logger = logging.getLogger(__name__)
+        try:
+            from faultmaven.infrastructure.redis_client import validate_redis_connection
+            await validate_redis_connection(self.redis_client)
+            logger.info("✅ Redis client initialized and validated for application persistence")
+        except Exception as e:
+            logger.warning(f"Redis client initialization failed: {e}")
+            self.redis_client = None
+            from faultmaven.infrastructure.caching.response_cache import configure_response_cache
+            configure_response_cache(None)
+
+    def _provide_session_store(self):
+        """Session Store (Configurable Adapter)"""
+        logger = logging.getLogger(__name__)
         try:
             session_storage_type = self.settings.database.session_storage_type.lower()
 
@@ -371,9 +626,9 @@ class DIContainer:
             from faultmaven.infrastructure.persistence.inmemory_session_store import InMemorySessionStore
             self.session_store = InMemorySessionStore()
 
-        # ============================================
-        # User Repository (Configurable Adapter)
-        # ============================================
+    def _provide_user_repository(self):
+        """User Repository (Configurable Adapter)"""
+        logger = logging.getLogger(__name__)
         try:
             user_storage_type = self.settings.database.user_storage_type.lower()
 
@@ -382,6 +637,7 @@ class DIContainer:
                 from faultmaven.infrastructure.persistence.user_repository import PostgreSQLUserRepository
                 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
                 from sqlalchemy.orm import sessionmaker
+                from faultmaven.infrastructure.observability.prometheus_metrics import register_db_pool
 
                 auth_engine = create_async_engine(
                     self.settings.database.auth_db_url,
@@ -390,6 +646,7 @@ class DIContainer:
                     max_overflow=20
                 )
                 auth_session_factory = sessionmaker(auth_engine, class_=AsyncSession, expire_on_commit=False)
+                register_db_pool("auth", auth_engine)
 
                 self.user_repository = PostgreSQLUserRepository(auth_session_factory())
                 logger.info(f"✅ User repository: PostgreSQL @ {self.settings.database.auth_db_host}:{self.settings.database.auth_db_port}/{self.settings.database.auth_db_name}")
@@ -403,9 +660,9 @@ class DIContainer:
             logger.warning(f"User repository initialization failed: {e}")
             self.user_repository = None
 
-        # ============================================
-        # Case Repository (Configurable Adapter)
-        # ============================================
+    def _provide_case_repository(self):
+        """Case Repository (Configurable Adapter)"""
+        logger = logging.getLogger(__name__)
         try:
             case_storage_type = self.settings.database.case_storage_type.lower()
 
@@ -416,6 +673,7 @@ class DIContainer:
                 from faultmaven.infrastructure.persistence.postgresql_hybrid_case_repository import PostgreSQLHybridCaseRepository
                 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
                 from sqlalchemy.orm import sessionmaker
+                from faultmaven.infrastructure.observability.prometheus_metrics import register_db_pool
 
                 cases_engine = create_async_engine(
                     self.settings.database.cases_db_url,
@@ -424,8 +682,21 @@ class DIContainer:
                     max_overflow=20
                 )
                 cases_session_factory = sessionmaker(cases_engine, class_=AsyncSession, expire_on_commit=False)
+                register_db_pool("cases", cases_engine)
 
                 self.case_repository = PostgreSQLHybridCaseRepository(cases_session_factory())
+                if self.settings.database.case_event_log_enabled:
+                    from faultmaven.infrastructure.persistence.case_event_store import (
+                        EventSourcedCaseRepository,
+                        PostgreSQLCaseEventStore,
+                    )
+
+                    self.case_repository = EventSourcedCaseRepository(
+                        self.case_repository,
+                        PostgreSQLCaseEventStore(self.case_repository.db),
+                        snapshot_interval=self.settings.database.case_snapshot_interval,
+                    )
+                    logger.info(f"Case event log enabled (snapshot every {self.settings.database.case_snapshot_interval} turns)")
                 logger.info(f"✅ Case repository: PostgreSQL Hybrid (10-table schema) @ {self.settings.database.cases_db_host}:{self.settings.database.cases_db_port}/{self.settings.database.cases_db_name}")
 
             elif case_storage_type == "postgres":
@@ -434,6 +705,7 @@ class DIContainer:
                 from faultmaven.infrastructure.persistence.case_repository import PostgreSQLCaseRepository
                 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
                 from sqlalchemy.orm import sessionmaker
+                from faultmaven.infrastructure.observability.prometheus_metrics import register_db_pool
 
                 cases_engine = create_async_engine(
                     self.settings.database.cases_db_url,
@@ -442,6 +714,7 @@ class DIContainer:
                     max_overflow=20
                 )
                 cases_session_factory = sessionmaker(cases_engine, class_=AsyncSession, expire_on_commit=False)
+                register_db_pool("cases", cases_engine)
 
                 self.case_repository = PostgreSQLCaseRepository(cases_session_factory())
                 logger.info(f"✅ Case repository: PostgreSQL (legacy single-table) @ {self.settings.database.cases_db_host}:{self.settings.database.cases_db_port}/{self.settings.database.cases_db_name}")
@@ -455,10 +728,13 @@ class DIContainer:
             logger.warning(f"Case repository initialization failed: {e}")
             self.case_repository = None
 
+    def _provide_report_store(self):
+        """Report store for report persistence (requires vector_store and redis_client)"""
+        logger = logging.getLogger(__name__)
+
         # Legacy case store (deprecated - will be removed)
         self.case_store = None
 
-        # Report store for report persistence (requires vector_store and redis_client)
         try:
             from faultmaven.infrastructure.persistence.redis_report_store import RedisReportStore
             if not self.settings.server.skip_service_checks and self.redis_client and self.vector_store:
@@ -478,7 +754,9 @@ class DIContainer:
             logger.warning(f"Report store initialization failed: {e}")
             self.report_store = None
 
-        # Authentication services initialization
+    def _provide_auth(self):
+        """Authentication services (token manager + user store)"""
+        logger = logging.getLogger(__name__)
         try:
             from faultmaven.infrastructure.auth.token_manager import DevTokenManager
             from faultmaven.infrastructure.auth.user_store import DevUserStore
@@ -500,32 +778,38 @@ class DIContainer:
             self.token_manager = None
             self.user_store = None
 
-        logger.debug("Infrastructure layer created with settings-based dependency injection")
-    
     def _create_tools_layer(self):
         """Create tools using the registry pattern with settings injection"""
+        providers = self._provider_graph()
+        for name in providers.names(layer="tools"):
+            providers.resolve(name)
+
+    def _provide_knowledge_ingester(self):
+        """Knowledge ingester shared by the knowledge base tool and KnowledgeService"""
         logger = logging.getLogger(__name__)
-        from faultmaven.tools.registry import tool_registry
         from faultmaven.core.knowledge.ingestion import KnowledgeIngester
-
-        # Import tools to trigger registration
-        import faultmaven.tools.knowledge_base
-        import faultmaven.tools.web_search
-
-        # Create knowledge ingester for tools that need it
         try:
             if not self.settings.server.skip_service_checks:
-                ingester = KnowledgeIngester(settings=self.settings)
+                self.knowledge_ingester = KnowledgeIngester(settings=self.settings)
             else:
                 logger.debug("KnowledgeIngester skipped (SKIP_SERVICE_CHECKS=True)")
-                ingester = None
+                self.knowledge_ingester = None
         except Exception as e:
             logger.warning(f"KnowledgeIngester creation failed: {e}")
-            ingester = None
+            self.knowledge_ingester = None
+
+    def _provide_tools(self):
+        """Registered tools plus the KB-neutral document Q&A tools"""
+        logger = logging.getLogger(__name__)
+        from faultmaven.tools.registry import tool_registry
+
+        # Import tools to trigger registration
+        import faultmaven.tools.knowledge_base
+        import faultmaven.tools.web_search
 
         # Create all registered tools with settings
         self.tools: List[BaseTool] = tool_registry.create_all_tools(
-            knowledge_ingester=ingester,
+            knowledge_ingester=self.knowledge_ingester,
             settings=self.settings
         )
 
@@ -594,13 +878,24 @@ class DIContainer:
         import logging
         logger = logging.getLogger(__name__)
 
-        # OLD OODA AgentService removed - use InvestigationService instead
-        # from faultmaven.services.agentic.orchestration.agent_service import AgentService
-        from faultmaven.services.domain.data_service import DataService
-        from faultmaven.services.domain.knowledge_service import KnowledgeService
-        from faultmaven.services.domain.session_service import SessionService
-        
-        # Case Service - Case persistence and management (v2.0 milestone-based)
+        providers = self._provider_graph()
+        for name in providers.names(layer="service"):
+            providers.resolve(name)
+
+        # Phase 2: Advanced Intelligence Services
+        self._create_advanced_intelligence_services()
+
+        # Performance monitoring, enhanced data processing (Phase 3) and
+        # microservice foundation (Phase A) services are built on first use
+
+        logger.debug("Service layer created with settings-based dependency injection")
+
+        # Legacy Skills system completely removed - Pure Agentic Framework only
+        logging.getLogger(__name__).info("✅ Legacy Skills system removed - Pure Agentic Framework")
+
+    def _provide_case_service(self):
+        """Case Service - Case persistence and management (v2.0 milestone-based)"""
+        logger = logging.getLogger(__name__)
         try:
             from faultmaven.services.domain.case_service import CaseService
             if hasattr(self, 'case_repository') and self.case_repository:
@@ -625,7 +920,9 @@ class DIContainer:
             # Use cached minimal case service to maintain state across requests
             self.case_service = self._create_minimal_case_service()
 
-        # MilestoneEngine - Core investigation engine (v2.0)
+    def _provide_milestone_engine(self):
+        """MilestoneEngine - Core investigation engine (v2.0)"""
+        logger = logging.getLogger(__name__)
         try:
             from faultmaven.core.investigation.milestone_engine import MilestoneEngine
             if hasattr(self, 'case_repository') and self.case_repository:
@@ -641,7 +938,9 @@ class DIContainer:
             logger.warning(f"MilestoneEngine initialization failed: {e}")
             self.milestone_engine = None
 
-        # InvestigationService - Investigation workflow orchestration (v2.0)
+    def _provide_investigation_service(self):
+        """InvestigationService - Investigation workflow orchestration (v2.0)"""
+        logger = logging.getLogger(__name__)
         try:
             from faultmaven.services.domain.investigation_service import InvestigationService
             if hasattr(self, 'milestone_engine') and self.milestone_engine and hasattr(self, 'case_repository') and self.case_repository:
@@ -657,7 +956,9 @@ class DIContainer:
             logger.warning(f"InvestigationService initialization failed: {e}")
             self.investigation_service = None
 
-        # Organization Service - Enterprise organization management
+    def _provide_organization_service(self):
+        """Organization Service - Enterprise organization management"""
+        logger = logging.getLogger(__name__)
         try:
             from faultmaven.services.domain.organization_service import OrganizationService
             from faultmaven.infrastructure.persistence.organization_repository import PostgreSQLOrganizationRepository
@@ -666,7 +967,8 @@ class DIContainer:
                 self.organization_service = OrganizationService(
                     organization_repository=organization_repository,
                     audit_repository=None,  # TODO: Add audit repository when available
-                    settings=self.settings
+                    settings=self.settings,
+                    permission_resolver=self._create_permission_resolver(organization_repository)
                 )
                 logger.debug("OrganizationService initialized")
             else:
@@ -676,7 +978,24 @@ class DIContainer:
             logger.warning(f"OrganizationService initialization failed: {e}")
             self.organization_service = None
 
-        # Team Service - Team collaboration management
+    def _create_permission_resolver(self, organization_repository):
+        """Cached RBAC resolver shared by the organization and team services"""
+        security = self.settings.security
+        if not security.permission_cache_enabled:
+            return None
+        from faultmaven.infrastructure.caching.permission_cache import PermissionResolver
+        from faultmaven.infrastructure.persistence.team_repository import PostgreSQLTeamRepository
+        return PermissionResolver(
+            organization_repository,
+            team_repository=PostgreSQLTeamRepository(self.db_session),
+            redis_client=getattr(self, 'redis_client', None),
+            local_ttl_seconds=security.permission_cache_local_ttl,
+            ttl_seconds=security.permission_cache_ttl,
+        )
+
+    def _provide_team_service(self):
+        """Team Service - Team collaboration management"""
+        logger = logging.getLogger(__name__)
         try:
             from faultmaven.services.domain.team_service import TeamService
             from faultmaven.infrastructure.persistence.team_repository import PostgreSQLTeamRepository
@@ -686,7 +1005,8 @@ class DIContainer:
                     team_repository=team_repository,
                     organization_repository=self.organization_service.repository,
                     audit_repository=None,  # TODO: Add audit repository when available
-                    settings=self.settings
+                    settings=self.settings,
+                    permission_resolver=self.organization_service.permission_resolver
                 )
                 logger.debug("TeamService initialized")
             else:
@@ -696,7 +1016,9 @@ class DIContainer:
             logger.warning(f"TeamService initialization failed: {e}")
             self.team_service = None
 
-        # Session Service - Session management and validation
+    def _provide_session_service(self):
+        """Session Service - Session management and validation"""
+        from faultmaven.services.domain.session_service import SessionService
         try:
             # If no real session store is available, use minimal in-memory service
             if self.get_session_store() is None:
@@ -712,25 +1034,18 @@ class DIContainer:
         except Exception:
             # Create a minimal session service for testing
             self.session_service = self._create_minimal_session_service()
-            
-        # OLD OODA Agentic Framework Services - REMOVED
-        # self._create_agentic_framework_services()
 
+    def _provide_data_service(self):
+        """Data Service - Data processing and analysis"""
         # OLD OODA Agent Service - REMOVED (use InvestigationService instead)
         # Agent Service was core OODA troubleshooting orchestration
         # Now replaced by MilestoneEngine + InvestigationService for v2.0
-        # from unittest.mock import MagicMock
-        # if (not hasattr(self, 'agent_service') or
-        #     self.agent_service is None or
-        #     isinstance(self.agent_service, MagicMock)):
-        #     self.agent_service = AgentService(...)
         self.agent_service = None  # Explicitly set to None for clean architecture
-        
-        # Data Service - Data processing and analysis
+
         # Create simple storage backend for development
-        from faultmaven.services.domain.data_service import SimpleStorageBackend
+        from faultmaven.services.domain.data_service import DataService, SimpleStorageBackend
         storage_backend = SimpleStorageBackend(settings=self.settings)
-        
+
         self.data_service = DataService(
             data_classifier=self.get_data_classifier(),
             log_processor=self.get_log_processor(),
@@ -741,46 +1056,19 @@ class DIContainer:
             settings=self.settings
         )
 
-        # Knowledge Service - Knowledge base operations
-        # Create knowledge ingester and vector store placeholders
-        from faultmaven.core.knowledge.ingestion import KnowledgeIngester
-        try:
-            if not self.settings.server.skip_service_checks:
-                knowledge_ingester = KnowledgeIngester(settings=self.settings)
-            else:
-                logger.debug("KnowledgeIngester skipped for KnowledgeService (SKIP_SERVICE_CHECKS=True)")
-                knowledge_ingester = None
-        except Exception as e:
-            logger.warning(f"KnowledgeIngester creation failed: {e}")
-            knowledge_ingester = None
-        
+    def _provide_knowledge_service(self):
+        """Knowledge Service - Knowledge base operations"""
+        from faultmaven.services.domain.knowledge_service import KnowledgeService
+
         # Always create KnowledgeService; it can operate without an ingester for API upload path
         self.knowledge_service = KnowledgeService(
-            knowledge_ingester=knowledge_ingester,
+            knowledge_ingester=self.knowledge_ingester,
             sanitizer=self.get_sanitizer(),
             tracer=self.get_tracer(),
             vector_store=self.get_vector_store(),
             redis_client=getattr(self, 'redis_client', None),
             settings=self.settings
         )
-        
-        # Phase 2: Advanced Intelligence Services
-        self._create_advanced_intelligence_services()
-        
-        # Phase 2: Performance Monitoring and Optimization Services
-        self._create_performance_monitoring_services()
-        
-        # Phase 3: Enhanced Data Processing Services
-        self._create_enhanced_data_processing_services()
-        
-        # Phase A: Microservice Foundation Services
-        self._create_microservice_foundation_services()
-            
-        logger.debug("Service layer created with settings-based dependency injection")
-
-        # Legacy Skills system completely removed - Pure Agentic Framework only
-        logging.getLogger(__name__).info("✅ Legacy Skills system removed - Pure Agentic Framework")
-    
     def _create_advanced_intelligence_services(self):
         """Legacy advanced intelligence services removed - replaced by Agentic Framework"""
         # Memory and Planning services replaced by AgentStateManager and BusinessLogicWorkflowEngine
@@ -1139,122 +1427,58 @@ class DIContainer:
     
     def get_agent_service(self):
         """Get the agent service with all dependencies injected"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Agent service requested but container not initialized - this should not happen after startup")
-                self.initialize()
-        return getattr(self, 'agent_service', None)
+        return self._component('agent_service')
     
     def get_data_service(self):
         """Get the data service with all dependencies injected"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Data service requested but container not initialized - this should not happen after startup")
-                self.initialize()
-        return getattr(self, 'data_service', None)
+        return self._component('data_service')
 
     def get_preprocessing_service(self):
         """Get the preprocessing service with all dependencies injected"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Preprocessing service requested but container not initialized")
-                self.initialize()
-        return getattr(self, 'preprocessing_service', None)
+        return self._component('preprocessing_service')
 
     def get_knowledge_service(self):
         """Get the knowledge service with all dependencies injected"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Knowledge service requested but container not initialized - this should not happen after startup")
-                self.initialize()
-        knowledge_service = getattr(self, 'knowledge_service', None)
+        knowledge_service = self._component('knowledge_service')
         if knowledge_service is None:
             return self._create_minimal_knowledge_service()
         return knowledge_service
     
     def get_metrics_collector(self):
         """Get the metrics collector service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Metrics collector requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'metrics_collector', None)
+        return self._component('metrics_collector')
     
     def get_intelligent_cache(self):
         """Get the intelligent cache service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Intelligent cache requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'intelligent_cache', None)
+        return self._component('intelligent_cache')
     
     def get_analytics_dashboard_service(self):
         """Get the analytics dashboard service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Analytics dashboard service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'analytics_dashboard_service', None)
+        return self._component('analytics_dashboard_service')
     
     def get_sla_monitor(self):
         """Get the SLA monitor service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("SLA monitor requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'sla_monitor', None)
+        return self._component('sla_monitor')
     
     def get_performance_monitor(self):
         """Get the performance monitor"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Performance monitor requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'performance_monitor', None)
+        return self._component('performance_monitor')
     
     # Phase 2: Advanced Intelligence Services Getters
     
     def get_memory_service(self):
         """Get the memory service - now provided by AgentStateManager"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Memory service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
         # Memory service functionality is now provided by AgentStateManager
-        return getattr(self, 'agent_state_manager', None)
+        return self._component('agent_state_manager')
     
     def get_planning_service(self):
         """Get the planning service - now provided by BusinessLogicWorkflowEngine"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Planning service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
         # Planning service functionality is now provided by BusinessLogicWorkflowEngine
-        return getattr(self, 'business_logic_workflow_engine', None)
+        return self._component('business_logic_workflow_engine')
     
     def get_enhanced_agent_service(self):
         """Get the enhanced agent service with memory and planning capabilities"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Enhanced agent service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        enhanced_service = getattr(self, 'enhanced_agent_service', None)
+        enhanced_service = self._component('enhanced_agent_service')
         if enhanced_service is None:
             # Fallback to standard agent service
             return self.get_agent_service()
@@ -1262,12 +1486,7 @@ class DIContainer:
     
     def get_orchestration_service(self):
         """Get the orchestration service for multi-step workflows"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Orchestration service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'orchestration_service', None)
+        return self._component('orchestration_service')
     
     
     def _create_minimal_knowledge_service(self):
@@ -1523,15 +1742,9 @@ class DIContainer:
     
     def get_llm_provider(self):
         """Get the LLM provider interface implementation"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("LLM provider requested but container not initialized - this should not happen after startup")
-                self.initialize()
         
         # Ensure we always return a valid implementation, even if initialization failed
-        llm_provider = getattr(self, 'llm_provider', None)
+        llm_provider = self._component('llm_provider')
         if llm_provider is None:
             # Create proper fallback implementation instead of MagicMock
             from faultmaven.models.interfaces import ILLMProvider
@@ -1548,15 +1761,9 @@ class DIContainer:
     
     def get_sanitizer(self):
         """Get the data sanitizer interface implementation"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Data sanitizer requested but container not initialized - this should not happen after startup")
-                self.initialize()
         
         # Ensure we always return a valid implementation, even if initialization failed
-        sanitizer = getattr(self, 'sanitizer', None)
+        sanitizer = self._component('sanitizer')
         if sanitizer is None:
             # Create minimal fallback implementation
             from unittest.mock import MagicMock
@@ -1568,15 +1775,9 @@ class DIContainer:
     
     def get_tracer(self):
         """Get the tracer interface implementation"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Tracer requested but container not initialized - this should not happen after startup")
-                self.initialize()
         
         # Ensure we always return a valid implementation, even if initialization failed
-        tracer = getattr(self, 'tracer', None)
+        tracer = self._component('tracer')
         if tracer is None:
             # Create minimal fallback implementation
             from unittest.mock import MagicMock
@@ -1588,139 +1789,67 @@ class DIContainer:
     
     def get_tools(self):
         """Get list of available tools"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Tools requested but container not initialized - this should not happen after startup")
-                self.initialize()
-        return getattr(self, 'tools', [])
+        return self._component('tools', [])
     
     def get_data_classifier(self):
         """Get the data classifier interface implementation"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Data classifier requested but container not initialized - this should not happen after startup")
-                self.initialize()
-        return getattr(self, 'data_classifier', None)
+        return self._component('data_classifier')
     
     def get_log_processor(self):
         """Get the log processor interface implementation"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Log processor requested but container not initialized - this should not happen after startup")
-                self.initialize()
-        return getattr(self, 'log_processor', None)
+        return self._component('log_processor')
 
     def get_preprocessing_service(self):
         """Get the preprocessing service (new Phase 1 pipeline)"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            if not getattr(self, '_initializing', False):
-                logger.warning("Preprocessing service requested but container not initialized")
-                self.initialize()
-        return getattr(self, 'preprocessing_service', None)
+        return self._component('preprocessing_service')
     
     def get_vector_store(self):
         """Get the vector store interface implementation"""
-        if not self._initialized:
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'vector_store', None)
+        return self._component('vector_store')
     
     def get_knowledge_ingester(self):
         """Get the knowledge ingester interface implementation"""
-        if not self._initialized:
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'knowledge_ingester', None)
+        return self._component('knowledge_ingester')
     
     def get_session_store(self):
         """Get the session store interface implementation"""
-        if not self._initialized:
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'session_store', None)
+        return self._component('session_store')
     
     def get_session_service(self):
         """Get the session service implementation"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            # Only warn if not currently initializing
-            if not getattr(self, '_initializing', False):
-                logger.warning("Session service requested but container not initialized - this should not happen after startup")
-                self.initialize()
-        return getattr(self, 'session_service', None)
+        return self._component('session_service')
     
     def get_case_service(self) -> Optional[ICaseService]:
         """Get the case service implementation (optional feature)"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Case service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'case_service', None)
+        return self._component('case_service')
 
     def get_investigation_service(self):
         """Get the investigation service implementation (v2.0 milestone-based)"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Investigation service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'investigation_service', None)
+        return self._component('investigation_service')
 
     def get_organization_service(self):
         """Get the organization service implementation (optional feature)"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Organization service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'organization_service', None)
+        return self._component('organization_service')
 
     def get_team_service(self):
         """Get the team service implementation (optional feature)"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Team service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'team_service', None)
+        return self._component('team_service')
 
     def get_milestone_engine(self):
         """Get the milestone engine implementation (v2.0 core investigation)"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Milestone engine requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'milestone_engine', None)
+        return self._component('milestone_engine')
 
     def get_case_store(self) -> Optional[ICaseStore]:
         """Get the case store implementation (optional feature)"""
-        if not self._initialized:
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'case_store', None)
+        return self._component('case_store')
 
     def get_report_store(self) -> Optional[IReportStore]:
         """Get the report store implementation (optional feature)"""
-        if not self._initialized:
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'report_store', None)
+        return self._component('report_store')
     
     def get_config(self):
         """Get the configuration manager instance"""
-        if not self._initialized:
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'config', None)
+        return self._component('config')
     
     def _create_minimal_session_service(self):
         """Create a minimal session service for testing environments"""
@@ -2399,21 +2528,11 @@ class DIContainer:
     
     def get_pattern_learner(self):
         """Get the pattern learner service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Pattern learner requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'pattern_learner', None)
+        return self._component('pattern_learner')
     
     def get_enhanced_data_classifier(self):
         """Get the enhanced data classifier service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Enhanced data classifier requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        enhanced_classifier = getattr(self, 'enhanced_data_classifier', None)
+        enhanced_classifier = self._component('enhanced_data_classifier')
         if enhanced_classifier is None:
             # Fallback to standard classifier
             return self.get_data_classifier()
@@ -2421,12 +2540,7 @@ class DIContainer:
     
     def get_enhanced_log_processor(self):
         """Get the enhanced log processor service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Enhanced log processor requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        enhanced_processor = getattr(self, 'enhanced_log_processor', None)
+        enhanced_processor = self._component('enhanced_log_processor')
         if enhanced_processor is None:
             # Fallback to standard processor
             return self.get_log_processor()
@@ -2434,21 +2548,11 @@ class DIContainer:
     
     def get_enhanced_security_assessment(self):
         """Get the enhanced security assessment service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Enhanced security assessment requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'enhanced_security_assessment', None)
+        return self._component('enhanced_security_assessment')
     
     def get_enhanced_data_service(self):
         """Get the enhanced data service with memory integration and pattern learning"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Enhanced data service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        enhanced_service = getattr(self, 'enhanced_data_service', None)
+        enhanced_service = self._component('enhanced_data_service')
         if enhanced_service is None:
             # Fallback to standard data service
             return self.get_data_service()
@@ -2458,30 +2562,15 @@ class DIContainer:
     
     def get_confidence_service(self):
         """Get the global confidence service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Confidence service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'confidence_service', None)
+        return self._component('confidence_service')
     
     def get_decision_recorder(self):
         """Get the decision records & telemetry service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Decision recorder requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'decision_recorder', None)
+        return self._component('decision_recorder')
     
     def get_microservice_session_service(self):
         """Get the microservice session service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Microservice session service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        enhanced_service = getattr(self, 'microservice_session_service', None)
+        enhanced_service = self._component('microservice_session_service')
         if enhanced_service is None:
             # Fallback to standard session service
             return self.get_session_service()
@@ -2489,32 +2578,17 @@ class DIContainer:
     
     def get_policy_service(self):
         """Get the policy/safety service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Policy service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'policy_service', None)
+        return self._component('policy_service')
     
     def get_unified_retrieval_service(self):
         """Get the unified retrieval service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Unified retrieval service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'unified_retrieval_service', None)
+        return self._component('unified_retrieval_service')
     
     # Phase B: Orchestration and Coordination Services Getters
     
     def get_gateway_service(self):
         """Get the gateway processing service"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Gateway service requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'gateway_service', None)
+        return self._component('gateway_service')
     
     def get_loop_guard_service(self):
         """Get the loop guard service (legacy - always returns None)"""
@@ -2526,20 +2600,11 @@ class DIContainer:
     
     def get_redis_client(self):
         """Get the Redis client for job persistence and caching"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            if not getattr(self, '_initializing', False):
-                logger.warning("Redis client requested but container not initialized")
-                self.initialize()
-        return getattr(self, 'redis_client', None)
+        return self._component('redis_client')
     
     def get_job_service(self):
         """Get the job service for async operation management"""
         logger = logging.getLogger(__name__)
-        if not self._initialized:
-            if not getattr(self, '_initializing', False):
-                logger.warning("Job service requested but container not initialized")
-                self.initialize()
         
         # Create job service if not already created
         if not hasattr(self, '_job_service'):
@@ -2561,84 +2626,39 @@ class DIContainer:
     
     def get_business_logic_workflow_engine(self) -> Optional[IBusinessLogicWorkflowEngine]:
         """Get the business logic workflow engine for plan-execute-observe-adapt orchestration"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Business Logic Workflow Engine requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'business_logic_workflow_engine', None)
+        return self._component('business_logic_workflow_engine')
     
     def get_agent_state_manager(self) -> Optional[IAgentStateManager]:
         """Get the agent state manager for persistent memory and execution state management"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Agent State Manager requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'agent_state_manager', None)
+        return self._component('agent_state_manager')
     
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Query Classification Engine requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'query_classification_engine', None)
+        return self._component('query_classification_engine')
     
     def get_tool_skill_broker(self) -> Optional[IToolSkillBroker]:
         """Get the tool skill broker for dynamic orchestration of tools and skills"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Tool Skill Broker requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'tool_skill_broker', None)
+        return self._component('tool_skill_broker')
     
     def get_guardrails_policy_layer(self) -> Optional[IGuardrailsPolicyLayer]:
         """Get the guardrails policy layer for safety, security, and compliance enforcement"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Guardrails Policy Layer requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'guardrails_policy_layer', None)
+        return self._component('guardrails_policy_layer')
     
     def get_response_synthesizer(self) -> Optional[IResponseSynthesizer]:
         """Get the response synthesizer for intelligent response generation and formatting"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Response Synthesizer requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'response_synthesizer', None)
+        return self._component('response_synthesizer')
     
     def get_error_fallback_manager(self) -> Optional[IErrorFallbackManager]:
         """Get the error fallback manager for robust error recovery and graceful degradation"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Error Fallback Manager requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'error_fallback_manager', None)
+        return self._component('error_fallback_manager')
 
     # Authentication Services
 
     def get_token_manager(self):
         """Get the token manager for authentication token operations"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("Token manager requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'token_manager', None)
+        return self._component('token_manager')
 
     def get_user_store(self):
         """Get the user store for user account management"""
-        if not self._initialized:
-            logger = logging.getLogger(__name__)
-            logger.warning("User store requested but container not initialized")
-            if not getattr(self, '_initializing', False):
-                self.initialize()
-        return getattr(self, 'user_store', None)
+        return self._component('user_store')
 
     def health_check(self) -> dict:
         """Check health of all container dependencies"""
@@ -2698,14 +2718,26 @@ class DIContainer:
             "error_fallback_manager": getattr(self, 'error_fallback_manager', None) is not None,
         }
         
+        # Optional services that have not been requested yet are not failures
+        providers = self.__dict__.get('_providers')
+        deferred = [
+            name for name in providers.names(include_lazy=True)
+            if not providers.is_built(name) and providers.error(name) is None
+        ] if providers is not None else []
+        deferred_components = {
+            attr for name in deferred for attr in providers.provides(name)
+        }
+
         all_healthy = all(
             comp if isinstance(comp, bool) else comp > 0
-            for comp in components.values()
+            for name, comp in components.items()
+            if name not in deferred_components
         )
-        
+
         return {
             "status": "healthy" if all_healthy else "degraded",
-            "components": components
+            "components": components,
+            "deferred": deferred
         }
     
     def reset(self):
@@ -2732,6 +2764,14 @@ class DIContainer:
             if hasattr(self, attr):
                 delattr(self, attr)
 
+        # Clear everything built by the provider graph so it is rebuilt on next use
+        providers = self.__dict__.pop('_providers', None)
+        if providers is not None:
+            for name in providers.names(include_lazy=True):
+                if providers.is_built(name):
+                    for attr in providers.provides(name):
+                        self.__dict__.pop(attr, None)
+
 
 # Global container access - always returns the current singleton instance
 class GlobalContainer:
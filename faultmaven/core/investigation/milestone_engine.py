@@ -57,6 +57,7 @@ from faultmaven.models.case import (
     DegradedMode,
     DegradedModeType,
 )
+from faultmaven.models.case_events import CaseChangeTracker
 from faultmaven.models.interfaces import ILLMProvider
 
 
@@ -99,7 +100,7 @@ class MilestoneEngine:
 
         Args:
             llm_provider: LLM provider implementation (ILLMProvider interface)
-            repository: Case repository with save/get methods
+            repository: Case repository (CaseRepository: get/save/append_events)
             trace_enabled: Enable observability tracing
         """
         self.llm_provider = llm_provider
@@ -151,6 +152,9 @@ class MilestoneEngine:
         )
 
         try:
+            # Remember what this turn may change, to persist only the changes
+            tracker = CaseChangeTracker(case)
+
             # Step 1: Generate status-based prompt
             prompt = self._build_prompt(case, user_message, attachments)
 
@@ -206,7 +210,7 @@ class MilestoneEngine:
             # Step 10: Save case
             updated_case.updated_at = datetime.now(timezone.utc)
             updated_case.last_activity_at = datetime.now(timezone.utc)
-            await self.repository.save(updated_case)
+            await self._persist_turn(updated_case, tracker)
 
             logger.info(
                 f"Turn {updated_case.current_turn} processed successfully. "
@@ -234,6 +238,15 @@ class MilestoneEngine:
             )
             raise MilestoneEngineError(f"Turn processing failed: {e}") from e
 
+    async def _persist_turn(self, case: Case, tracker: CaseChangeTracker) -> None:
+        """
+        Persist the turn's changes.
+
+        Repositories with an event log store only the events for this turn;
+        CaseRepository.append_events saves the full case otherwise.
+        """
+        await self.repository.append_events(case, tracker.events(case))
+
     # =========================================================================
     # Prompt Generation
     # =========================================================================
@@ -26,17 +26,13 @@ Core Design Principles:
 • Observability: Add tracing spans for key operations
 """
 
+import asyncio
+import hashlib
 import logging
 import os
 import uuid
 from typing import Any, Dict, List, Optional
 
-import chromadb
-import pandas as pd
-import pypdf
-from chromadb.config import Settings
-from docx import Document
-
 from faultmaven.models import KnowledgeBaseDocument
 from faultmaven.infrastructure.observability.tracing import trace
 from faultmaven.infrastructure.security.redaction import DataSanitizer
@@ -58,6 +54,11 @@ class KnowledgeIngester:
             except Exception:
                 settings = None
         
+        # ChromaDB and the document parsers are imported on first use to keep
+        # them off the application import path
+        import chromadb
+        from chromadb.config import Settings
+
         # Initialize ChromaDB - default to K8s cluster for production-like development
         if settings:
             # Use settings-based configuration
@@ -124,6 +125,16 @@ class KnowledgeIngester:
         else:
             self.logger.debug("Using cached BGE-M3 embedding model")
 
+        # Shared embedding service: batched, off-loop encode calls with an
+        # LRU cache keyed by text hash
+        self.embedding_service = model_cache.get_bge_m3_embedding_service()
+
+        # Bulk ingestion tuning (concurrent documents)
+        knowledge_settings = getattr(settings, "knowledge", None)
+        self.ingestion_max_concurrency = getattr(
+            knowledge_settings, "ingestion_max_concurrency", 4
+        )
+
         # Supported file extensions
         self.supported_extensions = {
             ".txt": self._extract_text_txt,
@@ -145,6 +156,8 @@ class KnowledgeIngester:
         tags: Optional[List[str]] = None,
         source_url: Optional[str] = None,
         document_id: Optional[str] = None,
+        created_at: Optional[str] = None,
+        updated_at: Optional[str] = None,
     ) -> str:
         """
         Ingest a document into the knowledge base (background task)
@@ -156,6 +169,8 @@ class KnowledgeIngester:
             tags: Optional tags for categorization
             source_url: Optional source URL
             document_id: Optional document ID to use (generates new if not provided)
+            created_at: Optional creation timestamp (ISO 8601)
+            updated_at: Optional last-update timestamp (ISO 8601)
 
         Returns:
             Document ID of the ingested document
@@ -175,6 +190,12 @@ class KnowledgeIngester:
             sanitized_content = self.sanitizer.sanitize(content)
 
             # Create document object
+            timestamps = {}
+            if created_at is not None:
+                timestamps["created_at"] = created_at
+            if updated_at is not None:
+                timestamps["updated_at"] = updated_at
+
             document = KnowledgeBaseDocument(
                 document_id=document_id,
                 title=title,
@@ -182,6 +203,7 @@ class KnowledgeIngester:
                 document_type=document_type,
                 tags=tags or [],
                 source_url=source_url,
+                **timestamps,
             )
 
             # Process and store in chunks
@@ -194,6 +216,42 @@ class KnowledgeIngester:
             self.logger.error(f"Failed to ingest document {title}: {e}")
             raise
 
+    async def ingest_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Ingest several documents concurrently
+
+        Text extraction, embedding and ChromaDB writes all run off the event
+        loop, so with several documents in flight one document can be
+        extracted while another is embedded and a third is written.
+
+        Args:
+            documents: Keyword arguments for ``ingest_document``, one dict per document
+            max_concurrency: Documents in flight at once (defaults to settings)
+
+        Returns:
+            One result per input document, in input order, with ``document_id``,
+            ``success`` and ``error`` keys
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.ingestion_max_concurrency)
+
+        async def _ingest_one(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    document_id = await self.ingest_document(**kwargs)
+                    return {"document_id": document_id, "success": True, "error": None}
+                except Exception as e:
+                    return {
+                        "document_id": kwargs.get("document_id"),
+                        "success": False,
+                        "error": str(e),
+                    }
+
+        return list(await asyncio.gather(*(_ingest_one(doc) for doc in documents)))
+
     async def _extract_text(self, file_path: str) -> str:
         """
         Extract text content from file based on its extension
@@ -227,25 +285,31 @@ class KnowledgeIngester:
 
     async def _extract_text_pdf(self, file_path: str) -> str:
         """Extract text from PDF files"""
-        try:
+
+        def _read_pdf() -> str:
+            import pypdf
+
             with open(file_path, "rb") as f:
                 pdf_reader = pypdf.PdfReader(f)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+                return "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
+
+        try:
+            return await asyncio.to_thread(_read_pdf)
         except Exception as e:
             self.logger.error(f"Failed to extract text from PDF {file_path}: {e}")
             raise
 
     async def _extract_text_docx(self, file_path: str) -> str:
         """Extract text from DOCX files"""
-        try:
+
+        def _read_docx() -> str:
+            from docx import Document
+
             doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
+
+        try:
+            return await asyncio.to_thread(_read_docx)
         except Exception as e:
             self.logger.error(f"Failed to extract text from DOCX {file_path}: {e}")
             raise
@@ -253,7 +317,9 @@ class KnowledgeIngester:
     async def _extract_text_csv(self, file_path: str) -> str:
         """Extract text from CSV files"""
         try:
-            df = pd.read_csv(file_path)
+            import pandas as pd
+
+            df = await asyncio.to_thread(pd.read_csv, file_path)
             return df.to_string()
         except Exception as e:
             self.logger.error(f"Failed to extract text from CSV {file_path}: {e}")
@@ -292,19 +358,16 @@ class KnowledgeIngester:
         """
         # Split content into chunks
         chunks = self._split_content(document.content)
+        ids = [f"{document.document_id}_chunk_{i}" for i in range(len(chunks))]
+        content_hashes = [self._hash_chunk(chunk) for chunk in chunks]
 
-        # Generate embeddings for chunks
-        embeddings = []
-        for chunk in chunks:
-            embedding = self.embedding_model.encode(chunk)
-            embeddings.append(embedding.tolist())
+        created_at = document.created_at
+        if not isinstance(created_at, str):
+            created_at = created_at.isoformat()
 
         # Prepare metadata for each chunk
         metadatas = []
-        ids = []
-
         for i, chunk in enumerate(chunks):
-            chunk_id = f"{document.document_id}_chunk_{i}"
             metadata = {
                 "document_id": document.document_id,
                 "title": document.title,
@@ -313,21 +376,96 @@ class KnowledgeIngester:
                 "source_url": document.source_url or "",
                 "chunk_index": i,
                 "total_chunks": len(chunks),
-                "created_at": document.created_at.isoformat(),
+                "created_at": created_at,
+                "content_hash": content_hashes[i],
             }
-
-            ids.append(chunk_id)
             metadatas.append(metadata)
 
-        # Store in ChromaDB
-        self.collection.add(
-            embeddings=embeddings, documents=chunks, metadatas=metadatas, ids=ids
-        )
+        # Incremental re-embedding: only chunks whose hash changed are encoded
+        existing_hashes = await self._get_existing_chunk_hashes(document.document_id)
+        changed = [
+            i for i, chunk_id in enumerate(ids)
+            if existing_hashes.get(chunk_id) != content_hashes[i]
+        ]
+        unchanged = [
+            i for i, chunk_id in enumerate(ids)
+            if existing_hashes.get(chunk_id) == content_hashes[i]
+        ]
+        current_ids = set(ids)
+        stale_ids = [chunk_id for chunk_id in existing_hashes if chunk_id not in current_ids]
+
+        if changed:
+            embeddings = await self._encode_batched([chunks[i] for i in changed])
+            await asyncio.to_thread(
+                self.collection.upsert,
+                embeddings=embeddings,
+                documents=[chunks[i] for i in changed],
+                metadatas=[metadatas[i] for i in changed],
+                ids=[ids[i] for i in changed],
+            )
+
+        if unchanged:
+            # Embeddings are still valid; refresh metadata (title, tags, ...)
+            await asyncio.to_thread(
+                self.collection.update,
+                ids=[ids[i] for i in unchanged],
+                metadatas=[metadatas[i] for i in unchanged],
+            )
+
+        if stale_ids:
+            # Document shrank since the last ingestion
+            await asyncio.to_thread(self.collection.delete, ids=stale_ids)
 
         self.logger.info(
-            f"Stored {len(chunks)} chunks for document {document.document_id}"
+            f"Stored {len(chunks)} chunks for document {document.document_id} "
+            f"({len(changed)} embedded, {len(unchanged)} unchanged, {len(stale_ids)} removed)"
         )
 
+    async def _encode_batched(self, texts: List[str]) -> List[List[float]]:
+        """
+        Encode texts through the shared embedding service
+
+        The service splits the texts into model-sized batches, runs the model
+        off the event loop and skips texts it has already encoded.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per input text
+        """
+        vectors = await self.embedding_service.encode(texts)
+        return [vector.tolist() for vector in vectors]
+
+    async def _get_existing_chunk_hashes(self, document_id: str) -> Dict[str, str]:
+        """
+        Get stored content hashes for a document's chunks
+
+        Args:
+            document_id: Document whose chunks to look up
+
+        Returns:
+            Mapping of chunk ID to content hash (empty if none are stored)
+        """
+        try:
+            results = await asyncio.to_thread(
+                self.collection.get,
+                where={"document_id": document_id},
+                include=["metadatas"],
+            )
+            return {
+                chunk_id: (metadata or {}).get("content_hash")
+                for chunk_id, metadata in zip(results["ids"], results["metadatas"])
+            }
+        except Exception as e:
+            self.logger.debug(f"Could not load existing chunks for {document_id}: {e}")
+            return {}
+
+    @staticmethod
+    def _hash_chunk(chunk: str) -> str:
+        """Content hash used to detect unchanged chunks on re-ingestion"""
+        return hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
     def _split_content(
         self, content: str, chunk_size: int = 1000, overlap: int = 200
     ) -> List[str]:
@@ -389,7 +527,7 @@ class KnowledgeIngester:
         """
         try:
             # Generate query embedding
-            query_embedding = self.embedding_model.encode(query).tolist()
+            query_embedding = (await self.embedding_service.encode_one(query)).tolist()
 
             # Prepare where clause for filtering
             where_clause = None
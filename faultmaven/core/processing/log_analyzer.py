@@ -32,18 +32,22 @@ Core Design Principles:
 • Observability: Add tracing spans for key operations
 """
 
+from __future__ import annotations
+
 import logging
 import re
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from dataclasses import dataclass
 from collections import defaultdict, deque
 
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
+
+if TYPE_CHECKING:
+    # pandas and scikit-learn are imported on first use to keep them off
+    # the application import path
+    import pandas as pd
 
 from faultmaven.models import AgentState, DataInsightsResponse, DataType
 from faultmaven.models.interfaces import ILogProcessor, IMemoryService, ConversationContext
@@ -476,6 +480,8 @@ class EnhancedLogProcessor(ILogProcessor):
             if entry:
                 parsed_entries.append(entry)
         
+        import pandas as pd
+
         return pd.DataFrame(parsed_entries)
     
     def _parse_log_line_with_context(
@@ -930,6 +936,9 @@ class EnhancedLogProcessor(ILogProcessor):
             durations = df["duration_ms"].dropna()
             if len(durations) > 5:
                 try:
+                    from sklearn.ensemble import IsolationForest
+                    from sklearn.preprocessing import StandardScaler
+
                     scaler = StandardScaler()
                     scaled_durations = scaler.fit_transform(
                         durations.values.reshape(-1, 1)
@@ -1239,6 +1248,8 @@ class LogProcessor(ILogProcessor):
             if entry:
                 parsed_entries.append(entry)
 
+        import pandas as pd
+
         return pd.DataFrame(parsed_entries)
 
     def _parse_log_line(self, line: str, line_num: int) -> Optional[Dict[str, Any]]:
@@ -1518,6 +1529,9 @@ class LogProcessor(ILogProcessor):
             if len(durations) > 5:
                 # Use Isolation Forest for outlier detection
                 try:
+                    from sklearn.ensemble import IsolationForest
+                    from sklearn.preprocessing import StandardScaler
+
                     scaler = StandardScaler()
                     scaled_durations = scaler.fit_transform(
                         durations.values.reshape(-1, 1)
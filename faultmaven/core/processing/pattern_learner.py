@@ -41,9 +41,6 @@ import json
 import hashlib
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
-from sklearn.metrics.pairwise import cosine_similarity
 
 from faultmaven.models.interfaces import IMemoryService
 from faultmaven.infrastructure.observability.tracing import trace
@@ -133,7 +130,8 @@ class PatternLearner:
         self._pattern_decay_rate = 0.95
         self._learning_rate = 0.1
         
-        # Text analysis components
+        # Text analysis components (scikit-learn is imported on first use)
+        from sklearn.feature_extraction.text import TfidfVectorizer
         self._vectorizer = TfidfVectorizer(
             max_features=1000,
             stop_words='english',
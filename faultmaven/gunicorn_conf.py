@@ -0,0 +1,59 @@
+"""Gunicorn configuration for multi-worker deployments
+
+Usage:
+    gunicorn -c python:faultmaven.gunicorn_conf faultmaven.main:app
+
+Runs WORKERS uvicorn workers forked from one master process. How the workers
+get the embedding model follows EMBEDDING_MODEL_MODE:
+- process: each worker loads its own copy on startup
+- preload: the master loads the model before forking and freezes the heap
+  (ModelCache.preload_for_fork), so all workers share one copy-on-write copy
+- sidecar: the master starts the embedding sidecar; workers encode through it
+
+In preload and sidecar mode resident memory stays roughly flat as WORKERS grows.
+(uvicorn --workers spawns fresh interpreters rather than forking, so it cannot
+share a preloaded model.)
+"""
+
+import subprocess
+import sys
+
+from faultmaven.config.settings import get_settings
+
+_settings = get_settings()
+_embedding_mode = _settings.knowledge.embedding_model_mode.lower()
+
+bind = f"{_settings.server.host}:{_settings.server.port}"
+workers = _settings.server.workers
+worker_class = "uvicorn.workers.UvicornWorker"
+# The app (and in preload mode, the model) is imported once in the master
+preload_app = True
+
+_sidecar = None
+
+
+def on_starting(server):
+    global _sidecar
+    if _embedding_mode == "sidecar":
+        _sidecar = subprocess.Popen([
+            sys.executable, "-m", "faultmaven.infrastructure.embedding_sidecar",
+            "--socket", _settings.knowledge.embedding_sidecar_socket,
+        ])
+        server.log.info(f"Started embedding sidecar (pid {_sidecar.pid})")
+
+
+def when_ready(server):
+    # Last hook before workers are forked
+    if _embedding_mode == "preload":
+        from faultmaven.infrastructure.model_cache import model_cache
+        summary = model_cache.preload_for_fork()
+        server.log.info(f"Preloaded models for {workers} workers: {summary}")
+
+
+def on_exit(server):
+    if _sidecar is not None and _sidecar.poll() is None:
+        _sidecar.terminate()
+        try:
+            _sidecar.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            _sidecar.kill()
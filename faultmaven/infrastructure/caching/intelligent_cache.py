@@ -39,6 +39,7 @@ import statistics
 
 from faultmaven.infrastructure.base_client import BaseExternalClient
 from faultmaven.infrastructure.observability.metrics_collector import MetricsCollector
+from faultmaven.infrastructure.observability.prometheus_metrics import record_cache_lookup
 
 
 @dataclass
@@ -887,6 +888,7 @@ class IntelligentCache(BaseExternalClient):
         context: Optional[Dict[str, Any]]
     ) -> None:
         """Record cache access for analytics"""
+        record_cache_lookup("intelligent", hit)
         if self._analytics:
             self._analytics.record_access(cache_key, hit, access_time, user_id, context)
         
@@ -0,0 +1,265 @@
+"""
+Cached RBAC permission resolution.
+
+Organization permission checks used to run the ``user_has_org_permission``
+SQL function once per check, several times per request. The resolver instead
+loads a user's role and full permission set in an organization (or their role
+in a team) with one query and answers every later check from two cache levels:
+
+- in-process: resolved memberships, trusted for ``local_ttl_seconds``
+- Redis: shared across processes, each entry stamped with the version of its
+  scope (organization or team) when it was loaded; entries from an older
+  version are ignored
+
+Membership and role changes call ``invalidate_organization`` /
+``invalidate_team``, which drop the local entry and bump the scope version.
+Bumping (rather than deleting the entry) also discards entries written by a
+load that read the database before the change but finished after it. Other
+processes keep answering from their local cache for at most
+``local_ttl_seconds``. Redis errors are logged and fall back to the database;
+they never fail a permission check.
+
+Usage:
+    resolver = PermissionResolver(org_repository, team_repository, redis_client)
+    if await resolver.has_permission(user_id, org_id, "cases.write"):
+        ...
+    visible = await resolver.filter_permitted(user_id, documents, "knowledge_base.read")
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from faultmaven.infrastructure.observability.prometheus_metrics import record_cache_lookup
+from faultmaven.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Scope versions outlive every entry stamped with them
+VERSION_TTL_SECONDS = 7 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class Membership:
+    """A user's role (and, in an organization, permissions) within a scope"""
+
+    scope: str
+    user_id: str
+    role_id: Optional[str]
+    permissions: FrozenSet[str] = frozenset()
+
+    def allows(self, permission: str) -> bool:
+        """Permission format is 'resource.action'; 'resource.manage' grants every action"""
+        resource = permission.split(".", 1)[0]
+        return permission in self.permissions or f"{resource}.manage" in self.permissions
+
+
+# Cached answer for "not a member", distinct from a cache miss
+_NOT_MEMBER = object()
+
+
+def organization_scope(org_id: str) -> str:
+    return f"org:{org_id}"
+
+
+def team_scope(team_id: str) -> str:
+    return f"team:{team_id}"
+
+
+class PermissionResolver:
+    """Organization permissions and team membership, cached in-process and in Redis
+
+    ``organization_repository`` must provide ``get_member_permissions``;
+    ``team_repository`` (optional) must provide ``get_member``.
+    """
+
+    def __init__(
+        self,
+        organization_repository,
+        team_repository=None,
+        redis_client=None,
+        local_ttl_seconds: float = 30.0,
+        ttl_seconds: int = 300,
+        max_entries: int = 10000,
+        namespace: str = "fm:perm",
+    ):
+        self.organization_repository = organization_repository
+        self.team_repository = team_repository
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self._local: TTLCache[Any] = TTLCache(maxsize=max_entries, ttl_seconds=local_ttl_seconds)
+        self._stats = {"lookups": 0, "local_hits": 0, "redis_hits": 0, "loads": 0, "redis_errors": 0}
+        self._lookup_seconds = 0.0
+        self._load_seconds = 0.0
+
+    def entry_key(self, scope: str, user_id: str) -> str:
+        return f"{self.namespace}:{scope}:{user_id}"
+
+    def version_key(self, scope: str) -> str:
+        return f"{self.namespace}:v:{scope}"
+
+    async def organization_membership(self, user_id: str, org_id: str) -> Optional[Membership]:
+        """The user's role and permission set in the organization, None if not a member"""
+        scope = organization_scope(org_id)
+        return await self._resolve(scope, user_id, lambda: self._load_organization(scope, org_id, user_id))
+
+    async def team_membership(self, user_id: str, team_id: str) -> Optional[Membership]:
+        """The user's team role, None if not a member"""
+        scope = team_scope(team_id)
+        return await self._resolve(scope, user_id, lambda: self._load_team(scope, team_id, user_id))
+
+    async def has_permission(self, user_id: str, org_id: str, permission: str) -> bool:
+        membership = await self.organization_membership(user_id, org_id)
+        return membership is not None and membership.allows(permission)
+
+    async def is_team_member(self, user_id: str, team_id: str) -> bool:
+        return await self.team_membership(user_id, team_id) is not None
+
+    async def filter_permitted(
+        self,
+        user_id: str,
+        resources: Iterable[Any],
+        permission: str,
+        org_id_of: Callable[[Any], Optional[str]] = attrgetter("org_id"),
+        owner_of: Optional[Callable[[Any], Optional[str]]] = None,
+    ) -> List[Any]:
+        """Resources the user may access with ``permission``, in their original order
+
+        Each distinct organization is resolved once, so checking a page of
+        resources costs at most one load per organization. Resources the user
+        owns (per ``owner_of``) are always included; resources outside any
+        organization are included only if owned.
+        """
+        resources = list(resources)
+        org_ids = {org_id_of(resource) for resource in resources} - {None}
+        memberships = await asyncio.gather(*(self.organization_membership(user_id, org_id) for org_id in org_ids))
+        allowed = {
+            org_id for org_id, membership in zip(org_ids, memberships)
+            if membership is not None and membership.allows(permission)
+        }
+        return [
+            resource for resource in resources
+            if org_id_of(resource) in allowed or (owner_of is not None and owner_of(resource) == user_id)
+        ]
+
+    async def invalidate_organization(self, org_id: str, user_id: Optional[str] = None) -> None:
+        """Forget cached memberships after a membership or role change in the organization"""
+        await self._invalidate(organization_scope(org_id), user_id)
+
+    async def invalidate_team(self, team_id: str, user_id: Optional[str] = None) -> None:
+        """Forget cached memberships after a team membership change"""
+        await self._invalidate(team_scope(team_id), user_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate and average latency of lookups (and of database loads)"""
+        lookups = self._stats["lookups"]
+        loads = self._stats["loads"]
+        hits = self._stats["local_hits"] + self._stats["redis_hits"]
+        return {
+            **self._stats,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "avg_lookup_ms": 1000 * self._lookup_seconds / lookups if lookups else 0.0,
+            "avg_load_ms": 1000 * self._load_seconds / loads if loads else 0.0,
+            "local_entries": len(self._local),
+        }
+
+    async def _resolve(
+        self, scope: str, user_id: str, load: Callable[[], Awaitable[Optional[Membership]]]
+    ) -> Optional[Membership]:
+        started = time.perf_counter()
+        self._stats["lookups"] += 1
+        try:
+            cached = self._local.get((scope, user_id))
+            if cached is not None:
+                self._stats["local_hits"] += 1
+                record_cache_lookup("permissions", True)
+                return None if cached is _NOT_MEMBER else cached
+
+            cached, version = await self._lookup_shared(scope, user_id)
+            if cached is not None:
+                self._stats["redis_hits"] += 1
+                record_cache_lookup("permissions", True)
+            else:
+                record_cache_lookup("permissions", False)
+                self._stats["loads"] += 1
+                load_started = time.perf_counter()
+                membership = await load()
+                self._load_seconds += time.perf_counter() - load_started
+                cached = membership or _NOT_MEMBER
+                if version is not None:
+                    await self._store_shared(scope, user_id, membership, version)
+            self._local.set((scope, user_id), cached)
+            return None if cached is _NOT_MEMBER else cached
+        finally:
+            self._lookup_seconds += time.perf_counter() - started
+
+    async def _lookup_shared(self, scope: str, user_id: str) -> Tuple[Any, Optional[int]]:
+        """Cached membership (or _NOT_MEMBER) and the scope's current version
+
+        The membership is None on a miss or a stale entry; the version is None
+        when Redis is unavailable (nothing should be stored then).
+        """
+        if self.redis is None:
+            return None, None
+        try:
+            entry, version = await self.redis.mget(self.entry_key(scope, user_id), self.version_key(scope))
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Permission cache lookup failed for {scope}: {e}")
+            return None, None
+        version = int(version or 0)
+        if not entry:
+            return None, version
+        payload = json.loads(entry)
+        if payload["version"] != version:
+            return None, version
+        if payload["role_id"] is None:
+            return _NOT_MEMBER, version
+        return Membership(scope, user_id, payload["role_id"], frozenset(payload["permissions"])), version
+
+    async def _store_shared(self, scope: str, user_id: str, membership: Optional[Membership], version: int) -> None:
+        payload = {
+            "version": version,
+            "role_id": membership.role_id if membership else None,
+            "permissions": sorted(membership.permissions) if membership else [],
+        }
+        try:
+            await self.redis.set(self.entry_key(scope, user_id), json.dumps(payload), ex=self.ttl_seconds)
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Permission cache store failed for {scope}: {e}")
+
+    async def _invalidate(self, scope: str, user_id: Optional[str]) -> None:
+        if user_id is None:
+            self._local.clear()
+        else:
+            self._local.pop((scope, user_id))
+        if self.redis is None:
+            return
+        try:
+            version_key = self.version_key(scope)
+            await self.redis.incr(version_key)
+            await self.redis.expire(version_key, VERSION_TTL_SECONDS)
+        except Exception as e:
+            self._stats["redis_errors"] += 1
+            logger.warning(f"Permission cache invalidation failed for {scope}: {e}")
+
+    async def _load_organization(self, scope: str, org_id: str, user_id: str) -> Optional[Membership]:
+        resolved = await self.organization_repository.get_member_permissions(org_id, user_id)
+        if resolved is None:
+            return None
+        role_id, permissions = resolved
+        return Membership(scope, user_id, role_id, frozenset(permissions))
+
+    async def _load_team(self, scope: str, team_id: str, user_id: str) -> Optional[Membership]:
+        if self.team_repository is None:
+            raise RuntimeError("PermissionResolver has no team repository")
+        member = await self.team_repository.get_member(team_id, user_id)
+        if member is None:
+            return None
+        return Membership(scope, user_id, member.team_role or "member")
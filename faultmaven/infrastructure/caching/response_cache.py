@@ -0,0 +1,267 @@
+"""Shared HTTP Response Cache
+
+Redis-backed cache of rendered responses for read endpoints, shared by all
+replicas. Entries are keyed by user, route template, path, query string and
+Origin (CORS headers are replayed), and belong to the resource they render:
+writers bump the resource's version with invalidate_responses() and every
+entry rendered from an older version is a miss from then on. Entries also
+expire after a TTL.
+
+Resource names:
+- ``case:<case_id>``      case detail and case UI
+- ``job:<job_id>``        job status
+- ``kb:<user_id>``        a user's KB document listing
+- ``knowledge``           global knowledge base documents and ingestion jobs
+
+Each entry is a Redis hash holding the response metadata (status, replayed
+headers, ETag, Last-Modified, resource version) and one field per stored
+content encoding. Compressed variants (zstd, brotli or gzip, whichever the
+client accepts and is installed) are produced in a worker thread and stored
+the first time an encoding is requested.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import time
+from email.utils import formatdate
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from redis.exceptions import WatchError
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+logger = logging.getLogger(__name__)
+
+IDENTITY = "identity"
+
+# Preferred first when the client accepts several
+SUPPORTED_ENCODINGS: Tuple[str, ...] = tuple(
+    encoding for encoding, available in (("zstd", zstandard), ("br", brotli), ("gzip", gzip)) if available
+)
+
+# Response headers describing the representation; everything else (request
+# IDs, rate limit and timing headers) belongs to the request that rendered it
+REPLAYED_HEADERS = frozenset({
+    "content-type", "content-language", "cache-control", "link",
+    "location", "retry-after", "x-total-count",
+})
+# CORS headers depend on the request Origin, which is part of the entry key
+REPLAYED_HEADER_PREFIXES = ("x-job-", "access-control-")
+
+# Version keys must outlive every entry that refers to them
+VERSION_TTL_SECONDS = 7 * 24 * 3600
+
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    """Best supported encoding the client accepts (``identity`` if none)"""
+    if not accept_encoding:
+        return IDENTITY
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for encoding in SUPPORTED_ENCODINGS:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return IDENTITY
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress ``body`` (blocking; call through encode_body on the event loop)"""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    return body
+
+
+async def encode_body(body: bytes, encoding: str) -> bytes:
+    """Compress ``body`` in a worker thread"""
+    if encoding == IDENTITY:
+        return body
+    return await asyncio.to_thread(compress, body, encoding)
+
+
+def make_etag(body: bytes) -> str:
+    # Weak: the same ETag covers every content encoding of the body
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def replayed_headers(headers: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    return [
+        (name, value) for name, value in headers
+        if name in REPLAYED_HEADERS or name.startswith(REPLAYED_HEADER_PREFIXES)
+    ]
+
+
+class ResponseCacheStore:
+    """Response entries and resource versions in Redis
+
+    ``redis_client`` must return bytes (``decode_responses=False``).
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        ttl_seconds: int = 300,
+        compress_min_bytes: int = 1024,
+        namespace: str = "fm:rc",
+    ):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.compress_min_bytes = compress_min_bytes
+        self.namespace = namespace
+
+    def entry_key(
+        self, user_key: str, route: str, path: str, query_string: bytes = b"", origin: str = ""
+    ) -> str:
+        digest = hashlib.blake2b(
+            b"\n".join((path.encode(), query_string, origin.encode())), digest_size=12
+        ).hexdigest()
+        return f"{self.namespace}:{user_key}:{route}:{digest}"
+
+    def version_key(self, resource: str) -> str:
+        return f"{self.namespace}:v:{resource}"
+
+    async def lookup(
+        self, key: str, resource: str, encoding: Optional[str]
+    ) -> Tuple[Optional[dict], Optional[bytes], int]:
+        """Entry metadata, its body in ``encoding`` (if requested and stored),
+        and the resource's current version, in one round trip
+
+        The metadata is None when there is no entry or it was rendered from
+        an older version of the resource.
+        """
+        fields = ["meta", encoding] if encoding else ["meta"]
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hmget(key, fields)
+        pipe.get(self.version_key(resource))
+        values, version = await pipe.execute()
+        version = int(version or 0)
+        if not values[0]:
+            return None, None, version
+        meta = json.loads(values[0])
+        if meta["version"] != version:
+            return None, None, version
+        return meta, values[1] if encoding else None, version
+
+    async def load_body(self, key: str, meta: dict, encoding: str) -> Tuple[bytes, str]:
+        """Body in ``encoding``, compressing and storing the variant on first use
+
+        Returns the body and the encoding actually used, which is identity
+        for small bodies or when the entry has gone away meanwhile.
+        """
+        if meta["size"] < self.compress_min_bytes:
+            encoding = IDENTITY
+        if encoding != IDENTITY:
+            stored = await self.redis.hget(key, encoding)
+            if stored is not None:
+                return stored, encoding
+        async with self.redis.pipeline(transaction=True) as pipe:
+            # WATCH: a variant must never be added to an entry that was
+            # replaced while its predecessor's body was being compressed
+            await pipe.watch(key)
+            identity = await pipe.hget(key, IDENTITY)
+            if identity is None or encoding == IDENTITY:
+                return identity or b"", IDENTITY
+            encoded = await encode_body(identity, encoding)
+            pipe.multi()
+            pipe.hset(key, encoding, encoded)
+            try:
+                await pipe.execute()
+            except WatchError:
+                pass
+        return encoded, encoding
+
+    async def store(
+        self,
+        key: str,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        version: int,
+        variants: Optional[Dict[str, bytes]] = None,
+    ) -> dict:
+        """Store a rendered response; returns its metadata"""
+        meta = {
+            "status": status,
+            "headers": headers,
+            "etag": make_etag(body),
+            "last_modified": formatdate(time.time(), usegmt=True),
+            "version": version,
+            "size": len(body),
+        }
+        fields = {"meta": json.dumps(meta), IDENTITY: body}
+        if len(body) < self.compress_min_bytes:
+            # Small bodies are never compressed: store them under every
+            # encoding so a hit is always a single round trip
+            for encoding in SUPPORTED_ENCODINGS:
+                fields[encoding] = body
+        else:
+            fields.update(variants or {})
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.hset(key, mapping=fields)
+        pipe.expire(key, self.ttl_seconds)
+        await pipe.execute()
+        return meta
+
+    async def invalidate(self, *resources: str) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        for resource in resources:
+            version_key = self.version_key(resource)
+            pipe.incr(version_key)
+            pipe.expire(version_key, VERSION_TTL_SECONDS)
+        await pipe.execute()
+
+
+_store: Optional[ResponseCacheStore] = None
+
+
+def configure_response_cache(store: Optional[ResponseCacheStore]) -> None:
+    global _store
+    _store = store
+
+
+def get_response_cache() -> Optional[ResponseCacheStore]:
+    return _store
+
+
+async def invalidate_responses(*resources: str) -> None:
+    """Invalidate cached responses rendered from the given resources
+
+    Called by writers after a successful write. A no-op when the response
+    cache is not configured; failures are logged, never raised, since entries
+    still expire after the cache TTL.
+    """
+    store = _store
+    if store is None or not resources:
+        return
+    try:
+        await store.invalidate(*resources)
+    except Exception as e:
+        logger.warning(f"Response cache invalidation failed for {resources}: {e}")
@@ -11,6 +11,7 @@ Key Features:
 - Timeout protection to prevent deadlocks
 - Automatic lock release on completion
 - Context manager support for clean usage
+- Waiters block on a release signal (BLPOP) instead of busy-polling
 """
 
 import asyncio
@@ -26,8 +27,21 @@ class ReportLockManager:
 
     Uses Redis SETNX (SET if Not eXists) for atomic lock acquisition
     with automatic expiration to prevent deadlocks.
+
+    Waiters register in a per-case counter and BLPOP a per-case signal
+    list; releasing a lock pushes one token per registered waiter, so
+    every waiter wakes as soon as the lock is released rather than on the
+    next poll tick. A single BLPOP never blocks longer than the lock's
+    remaining TTL (locks that expire without an explicit release are
+    still picked up) or MAX_BLOCK_SECONDS (kept below the Redis client's
+    10s socket timeout); longer waits loop over several BLPOPs.
     """
 
+    # How long an unconsumed release token survives
+    SIGNAL_TTL_SECONDS = 5
+    # Upper bound on one BLPOP, below the client's socket_timeout
+    MAX_BLOCK_SECONDS = 5
+
     def __init__(
         self,
         redis_client: redis.Redis,
@@ -40,7 +54,8 @@ class ReportLockManager:
         Args:
             redis_client: Async Redis client
             lock_timeout_seconds: Lock expiration time (prevents deadlocks)
-            poll_interval_seconds: How often to retry lock acquisition
+            poll_interval_seconds: Retry interval used only when blocking
+                waits are unavailable (e.g. BLPOP not supported)
         """
         self.redis = redis_client
         self.lock_timeout = lock_timeout_seconds
@@ -51,6 +66,50 @@ class ReportLockManager:
         """Generate Redis key for case report generation lock."""
         return f"lock:report_generation:case:{case_id}"
 
+    def _signal_key(self, case_id: str) -> str:
+        """Generate Redis key for the lock release signal list."""
+        return f"lock:report_generation:case:{case_id}:released"
+
+    def _waiters_key(self, case_id: str) -> str:
+        """Generate Redis key counting waiters blocked on the release signal."""
+        return f"lock:report_generation:case:{case_id}:waiters"
+
+    async def _wait_for_release(self, case_id: str, max_wait: float) -> None:
+        """
+        Block until the lock is released, expires, or max_wait elapses.
+
+        Args:
+            case_id: Case identifier
+            max_wait: Upper bound on the wait in seconds
+        """
+        wait = min(max_wait, self.MAX_BLOCK_SECONDS)
+        try:
+            # Don't wait past the holder's TTL: an expired lock sends no signal
+            ttl_ms = await self.redis.pttl(self._lock_key(case_id))
+            if ttl_ms == -2:
+                # Lock already gone - retry acquisition immediately
+                return
+            if ttl_ms is not None and ttl_ms >= 0:
+                wait = min(wait, ttl_ms / 1000.0)
+            if wait <= 0:
+                return
+
+            waiters_key = self._waiters_key(case_id)
+            pipe = self.redis.pipeline()
+            pipe.incr(waiters_key)
+            pipe.expire(waiters_key, self.lock_timeout)
+            await pipe.execute()
+            try:
+                await self.redis.blpop([self._signal_key(case_id)], timeout=wait)
+            finally:
+                await self.redis.decr(waiters_key)
+        except Exception as e:
+            self.logger.debug(
+                f"Blocking wait unavailable for case {case_id} lock, "
+                f"falling back to polling: {e}"
+            )
+            await asyncio.sleep(min(self.poll_interval, wait))
+
     async def acquire_lock(
         self,
         case_id: str,
@@ -90,10 +149,15 @@ class ReportLockManager:
             )
             return False
 
-        # Poll for lock with timeout
-        start_time = asyncio.get_event_loop().time()
-        while (asyncio.get_event_loop().time() - start_time) < wait_timeout:
-            await asyncio.sleep(self.poll_interval)
+        # Wait for release signals until timeout
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        while True:
+            remaining = wait_timeout - (loop.time() - start_time)
+            if remaining <= 0:
+                break
+
+            await self._wait_for_release(case_id, remaining)
 
             acquired = await self.redis.set(
                 lock_key,
@@ -105,7 +169,7 @@ class ReportLockManager:
             if acquired:
                 self.logger.debug(
                     f"Acquired report generation lock for case {case_id} "
-                    f"after {asyncio.get_event_loop().time() - start_time:.2f}s"
+                    f"after {loop.time() - start_time:.2f}s"
                 )
                 return True
 
@@ -129,6 +193,7 @@ class ReportLockManager:
         deleted = await self.redis.delete(lock_key)
 
         if deleted:
+            await self._signal_release(case_id)
             self.logger.debug(
                 f"Released report generation lock for case {case_id}"
             )
@@ -139,6 +204,22 @@ class ReportLockManager:
             )
             return False
 
+    async def _signal_release(self, case_id: str) -> None:
+        """Wake every waiter blocked in _wait_for_release."""
+        signal_key = self._signal_key(case_id)
+        try:
+            waiters = int(await self.redis.get(self._waiters_key(case_id)) or 0)
+            # One token per waiter (at least one for a waiter about to block);
+            # unconsumed tokens expire
+            pipe = self.redis.pipeline()
+            pipe.delete(signal_key)
+            pipe.rpush(signal_key, *["released"] * max(1, waiters))
+            pipe.expire(signal_key, self.SIGNAL_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            # Waiters still pick the lock up when their wait slice ends
+            self.logger.debug(f"Failed to signal lock release for case {case_id}: {e}")
+
     @asynccontextmanager
     async def lock(
         self,
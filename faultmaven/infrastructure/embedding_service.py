@@ -0,0 +1,268 @@
+"""Embedding Service
+
+Purpose: Shared, non-blocking access to the sentence-transformer embedding model.
+
+Several components (semantic LLM cache, knowledge ingestion and search) embed
+text with the same BGE-M3 model. Calling ``model.encode`` directly blocks the
+event loop and re-encodes identical text over and over. This service sits in
+front of the model and is shared process-wide via ``ModelCache``.
+
+Key Features:
+- Request coalescing: concurrent ``encode`` calls are merged into micro-batches
+  bounded by a maximum batch size and a maximum wait time
+- Off-loop execution: the model runs on a worker thread
+- LRU cache from text hash to vector, so repeated texts are never re-encoded
+- In-flight deduplication of identical texts across concurrent callers
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+class EmbeddingService:
+    """Micro-batching, caching front-end for a sentence-transformer model"""
+
+    def __init__(
+        self,
+        model: Any,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        cache_size: int = 10000,
+    ):
+        """
+        Args:
+            model: Object exposing ``encode(texts, batch_size=...)`` (SentenceTransformer)
+            max_batch_size: Maximum texts per model call
+            max_wait_ms: Maximum time a request waits for a batch to fill
+            cache_size: Maximum vectors kept in the LRU cache (0 disables caching)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.model = model
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_ms) / 1000.0
+        self.cache_size = max(0, cache_size)
+
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Serializes model calls; sentence-transformers models are not
+        # guaranteed to be thread-safe and batching already saturates them
+        self._model_lock = threading.Lock()
+
+        # Pending micro-batch: (text_key, text, future)
+        self._queue: List[Tuple[str, str, asyncio.Future]] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        # Running flush tasks, referenced so they are not garbage-collected
+        # mid-flight and can be awaited by close()
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        self._stats = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "batches": 0,
+            "texts_encoded": 0,
+        }
+
+    @staticmethod
+    def _text_key(text: str) -> str:
+        """Stable cache key for a text"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[np.ndarray]:
+        with self._cache_lock:
+            vector = self._cache.get(key)
+            if vector is None:
+                self._stats["cache_misses"] += 1
+                return None
+            self._cache.move_to_end(key)
+            self._stats["cache_hits"] += 1
+            return vector
+
+    def _cache_put(self, key: str, vector: np.ndarray) -> None:
+        if not self.cache_size:
+            return
+        with self._cache_lock:
+            self._cache[key] = vector
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _encode_blocking(self, texts: List[str]) -> List[np.ndarray]:
+        """Run the model on a batch of texts (called on a worker thread)"""
+        with self._model_lock:
+            vectors = self.model.encode(texts, batch_size=self.max_batch_size)
+            self._stats["batches"] += 1
+            self._stats["texts_encoded"] += len(texts)
+        return [np.asarray(vector) for vector in vectors]
+
+    def encode_sync(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Encode texts synchronously, using and filling the cache
+
+        Intended for code paths that cannot await; prefer ``encode``.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per input text, in input order
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        misses: Dict[str, List[int]] = {}
+        miss_texts: List[str] = []
+
+        for i, text in enumerate(texts):
+            key = self._text_key(text)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+            elif key in misses:
+                misses[key].append(i)
+            else:
+                misses[key] = [i]
+                miss_texts.append(text)
+
+        for start in range(0, len(miss_texts), self.max_batch_size):
+            batch = miss_texts[start:start + self.max_batch_size]
+            for text, vector in zip(batch, self._encode_blocking(batch)):
+                key = self._text_key(text)
+                self._cache_put(key, vector)
+                for i in misses[key]:
+                    results[i] = vector
+
+        return results
+
+    async def encode(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Encode texts without blocking the event loop
+
+        Cache misses are queued and coalesced with concurrent requests into
+        micro-batches of at most ``max_batch_size`` texts, flushed when full or
+        after ``max_wait_ms``.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per input text, in input order
+        """
+        loop = asyncio.get_running_loop()
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        waiting: List[Tuple[int, asyncio.Future]] = []
+
+        # Requests left behind by a previous (closed) event loop can never be
+        # delivered; drop them rather than resolving futures on a dead loop
+        if self._queue and self._queue[0][2].get_loop() is not loop:
+            self._queue = [item for item in self._queue if item[2].get_loop() is loop]
+            self._flush_timer = None
+
+        for i, text in enumerate(texts):
+            key = self._text_key(text)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+                continue
+
+            future = self._inflight.get(key)
+            if future is None or future.get_loop() is not loop:
+                future = loop.create_future()
+                self._inflight[key] = future
+                self._queue.append((key, text, future))
+            waiting.append((i, future))
+
+        if self._queue:
+            self._schedule_flush(loop)
+
+        # The future may be shared with other callers: cancelling this one
+        # must not cancel it for them
+        for i, future in waiting:
+            results[i] = await asyncio.shield(future)
+
+        return results
+
+    async def encode_one(self, text: str) -> np.ndarray:
+        """Encode a single text (coalesced with concurrent requests)"""
+        return (await self.encode([text]))[0]
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Flush now if a batch is full, otherwise after max_wait_ms"""
+        if len(self._queue) >= self.max_batch_size or self.max_wait_seconds == 0:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._start_flush(loop)
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.max_wait_seconds, self._start_flush, loop)
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"Embedding flush failed: {task.exception()}")
+
+    async def _flush(self) -> None:
+        """Drain the pending queue in micro-batches"""
+        self._flush_timer = None
+        while self._queue:
+            batch = self._queue[:self.max_batch_size]
+            del self._queue[:self.max_batch_size]
+
+            try:
+                vectors = await asyncio.to_thread(
+                    self._encode_blocking, [text for _, text, _ in batch]
+                )
+            except Exception as e:
+                self.logger.warning(f"Embedding batch of {len(batch)} texts failed: {e}")
+                for key, _, future in batch:
+                    self._inflight.pop(key, None)
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (key, _, future), vector in zip(batch, vectors):
+                self._cache_put(key, vector)
+                self._inflight.pop(key, None)
+                if not future.done():
+                    future.set_result(vector)
+
+    async def close(self) -> None:
+        """Flush the pending requests and wait for running flushes to finish"""
+        loop = asyncio.get_running_loop()
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._queue = [item for item in self._queue if item[2].get_loop() is loop]
+        if self._queue:
+            self._start_flush(loop)
+        tasks = [task for task in self._flush_tasks if task.get_loop() is loop]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def clear_cache(self) -> None:
+        """Drop all cached vectors"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache and batching statistics"""
+        lookups = self._stats["cache_hits"] + self._stats["cache_misses"]
+        return {
+            **self._stats,
+            "cache_entries": len(self._cache),
+            "cache_hit_rate": self._stats["cache_hits"] / lookups if lookups else 0.0,
+            "avg_batch_size": (
+                self._stats["texts_encoded"] / self._stats["batches"]
+                if self._stats["batches"] else 0.0
+            ),
+            "pending": len(self._queue),
+        }
@@ -0,0 +1,261 @@
+"""Embedding Sidecar
+
+Purpose: Serve the BGE-M3 embedding model from a single local process so that
+multi-worker deployments hold one copy of the model instead of one per worker.
+
+With EMBEDDING_MODEL_MODE=sidecar, ``ModelCache`` hands workers a
+``RemoteEmbeddingModel`` that forwards ``encode`` calls over a Unix socket. The
+sidecar runs the requests of all workers through one ``EmbeddingService``, so
+concurrent requests are coalesced into batches and share one vector cache.
+
+Wire protocol: every message is a 4-byte big-endian length followed by a JSON
+header. Requests are ``{"texts": [...]}``. Responses are ``{"count": n,
+"dim": d}`` followed by the n x d float32 matrix, or ``{"error": "..."}``.
+
+Run: python -m faultmaven.infrastructure.embedding_sidecar [--socket PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
+
+import numpy as np
+
+from faultmaven.infrastructure.embedding_service import EmbeddingService
+
+_LENGTH = struct.Struct(">I")
+_CONNECT_RETRY_SECONDS = 0.1
+
+
+def encode_frame(header: Dict[str, Any], payload: bytes = b"") -> bytes:
+    """Serialize one protocol message"""
+    body = json.dumps(header).encode("utf-8")
+    return _LENGTH.pack(len(body)) + body + payload
+
+
+def _matrix_frame(vectors: Sequence[np.ndarray]) -> bytes:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(vectors), -1)
+    count, dim = matrix.shape
+    return encode_frame({"count": count, "dim": dim}, matrix.tobytes())
+
+
+class EmbeddingSidecarServer:
+    """Unix socket server encoding texts for all local workers"""
+
+    def __init__(
+        self,
+        model: Any,
+        socket_path: str,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        cache_size: int = 10000,
+    ):
+        """
+        Args:
+            model: Object exposing ``encode(texts, batch_size=...)`` (SentenceTransformer)
+            socket_path: Filesystem path of the Unix socket
+            max_batch_size: Maximum texts per model call
+            max_wait_ms: Maximum time a request waits for a batch to fill
+            cache_size: Maximum vectors kept in the shared LRU cache
+        """
+        self.logger = logging.getLogger(__name__)
+        self.socket_path = socket_path
+        self.service = EmbeddingService(
+            model,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            cache_size=cache_size,
+        )
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        """Bind the socket, replacing a stale socket file left by a previous run"""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        self.logger.info(f"Embedding sidecar listening on {self.socket_path}")
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # wait_closed() also waits for open worker connections
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.service.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests from one worker connection until it disconnects"""
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    length = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))[0]
+                    request = json.loads(await reader.readexactly(length))
+                except asyncio.IncompleteReadError:
+                    break
+
+                try:
+                    texts = request["texts"]
+                    vectors = await self.service.encode(texts) if texts else []
+                    writer.write(_matrix_frame(vectors) if vectors else encode_frame({"count": 0, "dim": 0}))
+                except Exception as e:
+                    self.logger.warning(f"Embedding sidecar request failed: {e}")
+                    writer.write(encode_frame({"error": str(e)}))
+                await writer.drain()
+        except (ConnectionError, json.JSONDecodeError) as e:
+            self.logger.debug(f"Embedding sidecar connection closed: {e}")
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"socket": self.socket_path, **self.service.get_stats()}
+
+
+class RemoteEmbeddingModel:
+    """SentenceTransformer stand-in that encodes through the embedding sidecar
+
+    Connects lazily and waits up to ``timeout`` seconds for the sidecar to come
+    up, so workers can start while the sidecar is still loading the model.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.logger = logging.getLogger(__name__)
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+
+    def encode(
+        self,
+        texts: Union[str, List[str]],
+        batch_size: int = 32,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Encode texts remotely; mirrors ``SentenceTransformer.encode`` output shape"""
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+
+        with self._lock:
+            reused = self._sock is not None
+            try:
+                matrix = self._request(batch)
+            except ConnectionError:
+                self._close()
+                if not reused:
+                    raise
+                # Sidecar restarted since the last call: reconnect once
+                matrix = self._request(batch)
+            except OSError:
+                self._close()
+                raise
+
+        return matrix[0] if single else matrix
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _request(self, texts: List[str]) -> np.ndarray:
+        sock = self._connect()
+        sock.sendall(encode_frame({"texts": texts}))
+
+        length = _LENGTH.unpack(self._recv_exactly(sock, _LENGTH.size))[0]
+        header = json.loads(self._recv_exactly(sock, length))
+        if "error" in header:
+            raise RuntimeError(f"Embedding sidecar error: {header['error']}")
+
+        count, dim = header["count"], header["dim"]
+        payload = self._recv_exactly(sock, count * dim * 4)
+        return np.frombuffer(payload, dtype=np.float32).reshape(count, dim)
+
+    def _connect(self) -> socket.socket:
+        if self._sock is not None:
+            return self._sock
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+                self._sock = sock
+                return sock
+            except (FileNotFoundError, ConnectionRefusedError):
+                sock.close()
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(_CONNECT_RETRY_SECONDS)
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+    @staticmethod
+    def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+        chunks = []
+        remaining = size
+        while remaining:
+            chunk = sock.recv(min(remaining, 1 << 20))
+            if not chunk:
+                raise ConnectionError("Embedding sidecar closed the connection")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from faultmaven.config.settings import get_settings
+    from faultmaven.infrastructure.model_cache import model_cache
+
+    knowledge = get_settings().knowledge
+    parser = argparse.ArgumentParser(description="FaultMaven embedding sidecar")
+    parser.add_argument("--socket", default=knowledge.embedding_sidecar_socket)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    model = model_cache.get_bge_m3_model(local=True)
+    if model is None:
+        raise SystemExit("BGE-M3 model unavailable - embedding sidecar cannot start")
+
+    server = EmbeddingSidecarServer(
+        model,
+        args.socket,
+        max_batch_size=knowledge.embedding_batch_size,
+        max_wait_ms=knowledge.embedding_max_wait_ms,
+        cache_size=knowledge.embedding_cache_size,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,7 @@ from enum import Enum
 from faultmaven.models.interfaces import IJobService
 from faultmaven.models.api import JobStatus
 from faultmaven.exceptions import ServiceException, ValidationException
+from faultmaven.infrastructure.caching.response_cache import invalidate_responses
 
 logger = logging.getLogger(__name__)
 
@@ -159,6 +160,7 @@ class JobService(IJobService):
                 ttl,
                 json.dumps(job_data)
             )
+            await invalidate_responses(f"job:{job_id}")
             
             logger.info(f"Updated job {job_id} status to {status.value}")
             return True
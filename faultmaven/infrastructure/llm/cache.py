@@ -16,6 +16,7 @@ import numpy as np
 
 from .providers import LLMResponse
 from ..model_cache import model_cache
+from ..observability.prometheus_metrics import record_cache_lookup
 
 
 class SemanticCache:
@@ -28,8 +29,8 @@ class SemanticCache:
         self.embeddings: Dict[str, np.ndarray] = {}
         self.logger = logging.getLogger(__name__)
 
-        # Initialize sentence transformer for semantic similarity using cached model
-        self.encoder = model_cache.get_bge_m3_model()
+        # Shared embedding service (micro-batched, off-loop, LRU-cached BGE-M3)
+        self.encoder = model_cache.get_bge_m3_embedding_service()
         if self.encoder:
             self.logger.debug("✅ Semantic cache initialized with cached BGE-M3")
         else:
@@ -41,11 +42,26 @@ class SemanticCache:
         return hashlib.sha256(content.encode()).hexdigest()
 
     def _compute_embedding(self, text: str) -> Optional[np.ndarray]:
-        """Compute embedding for text"""
+        """Compute embedding for text (served from the embedding cache when possible)"""
         if not self.encoder:
             return None
         try:
-            return self.encoder.encode([text])[0]
+            return self.encoder.encode_sync([text])[0]
+        except Exception as e:
+            self.logger.warning(f"Failed to compute embedding: {e}")
+            return None
+
+    async def embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute the embedding for a prompt without blocking the event loop
+
+        The result can be passed to ``check`` and ``store`` so a prompt is
+        encoded at most once per request.
+        """
+        if not self.encoder:
+            return None
+        try:
+            return await self.encoder.encode_one(text)
         except Exception as e:
             self.logger.warning(f"Failed to compute embedding: {e}")
             return None
@@ -61,8 +77,23 @@ class SemanticCache:
         except Exception:
             return 0.0
 
-    def check(self, prompt: str, model: str) -> Optional[LLMResponse]:
+    def check(
+        self,
+        prompt: str,
+        model: str,
+        prompt_embedding: Optional[np.ndarray] = None,
+    ) -> Optional[LLMResponse]:
         """Check cache for semantically similar response"""
+        response = self._check(prompt, model, prompt_embedding)
+        record_cache_lookup("llm_semantic", response is not None)
+        return response
+
+    def _check(
+        self,
+        prompt: str,
+        model: str,
+        prompt_embedding: Optional[np.ndarray],
+    ) -> Optional[LLMResponse]:
         # Simple hash-based cache if no embeddings
         if not self.encoder:
             cache_key = self._get_cache_key(prompt, model)
@@ -80,7 +111,8 @@ class SemanticCache:
             return None
 
         # Semantic similarity cache
-        prompt_embedding = self._compute_embedding(prompt)
+        if prompt_embedding is None:
+            prompt_embedding = self._compute_embedding(prompt)
         if prompt_embedding is None:
             return None
 
@@ -114,7 +146,13 @@ class SemanticCache:
 
         return None
 
-    def store(self, prompt: str, model: str, response: LLMResponse):
+    def store(
+        self,
+        prompt: str,
+        model: str,
+        response: LLMResponse,
+        prompt_embedding: Optional[np.ndarray] = None,
+    ):
         """Store response in cache"""
         cache_key = self._get_cache_key(prompt, model)
 
@@ -130,7 +168,8 @@ class SemanticCache:
 
         # Store embedding if available
         if self.encoder:
-            prompt_embedding = self._compute_embedding(prompt)
+            if prompt_embedding is None:
+                prompt_embedding = self._compute_embedding(prompt)
             if prompt_embedding is not None:
                 self.embeddings[cache_key] = prompt_embedding
 
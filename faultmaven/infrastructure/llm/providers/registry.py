@@ -8,6 +8,7 @@ a single source of truth for provider management.
 
 import logging
 import os
+import time
 from typing import Dict, List, Optional, Type, Union
 
 try:
@@ -17,6 +18,7 @@ except ImportError:
     pass  # dotenv not available, continue without it
 
 from .base import BaseLLMProvider, ProviderConfig, LLMResponse
+from faultmaven.infrastructure.observability.prometheus_metrics import record_llm_request
 from .fireworks_provider import FireworksProvider
 from .openai_provider import OpenAIProvider
 from .groq_provider import GroqProvider
@@ -426,6 +428,7 @@ class ProviderRegistry:
             if not provider:
                 continue
 
+            started = time.perf_counter()
             try:
                 self.logger.info(f"Trying provider: {provider_name}")
 
@@ -436,6 +439,13 @@ class ProviderRegistry:
                     temperature=temperature,
                     **kwargs
                 )
+                record_llm_request(
+                    provider_name,
+                    response.model or model,
+                    "success",
+                    time.perf_counter() - started,
+                    tokens=response.tokens_used or 0,
+                )
 
                 # Check confidence threshold
                 if response.confidence >= confidence_threshold:
@@ -468,6 +478,7 @@ class ProviderRegistry:
 
             except Exception as e:
                 self.logger.warning(f"❌ Provider {provider_name} failed: {e}")
+                record_llm_request(provider_name, model, "error", time.perf_counter() - started)
                 last_error = e
                 continue
 
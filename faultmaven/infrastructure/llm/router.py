@@ -83,8 +83,12 @@ class LLMRouter(BaseExternalClient, ILLMProvider):
         # Check cache first - always check with the original model parameter
         # The cache will be stored with the effective model used
         cache_model = model  # Use the requested model for cache lookup
+        # Embed once (off the event loop) and reuse for both lookup and store
+        prompt_embedding = await self.cache.embed(sanitized_prompt)
         if cache_model:
-            cached_response = self.cache.check(sanitized_prompt, cache_model)
+            cached_response = self.cache.check(
+                sanitized_prompt, cache_model, prompt_embedding=prompt_embedding
+            )
             if cached_response:
                 self.logger.info("✅ Using cached response")
                 return cached_response
@@ -122,7 +126,10 @@ class LLMRouter(BaseExternalClient, ILLMProvider):
             if response.confidence >= self.confidence_threshold:
                 # Store with the requested model key for consistent cache lookup
                 store_model = model or response.model
-                self.cache.store(sanitized_prompt, store_model, response)
+                self.cache.store(
+                    sanitized_prompt, store_model, response,
+                    prompt_embedding=prompt_embedding,
+                )
             
             return response
             
@@ -0,0 +1,389 @@
+"""
+FaultMaven Asynchronous Logging Pipeline
+
+Moves log I/O off the request path. The root logger gets a single
+non-blocking queue handler; a background writer thread drains the queue and
+writes to the original handlers in batches, flushing each stream once per
+batch instead of once per record.
+
+Request-path cost per record is a sampling check, message interpolation and an
+append to a bounded queue:
+- Sampling and rate limits: high-volume loggers can be sampled
+  (LOG_SAMPLE_RATES) or capped in records per second (LOG_RATE_LIMITS).
+  Only records below WARNING are ever sampled or rate limited.
+- Drop policy: when the queue is full, records below WARNING are dropped;
+  WARNING and above evict the oldest queued record instead. Every drop is
+  counted and the writer reports the totals periodically.
+
+Request context and structlog processors still run in the calling thread,
+since they read contextvars.
+"""
+
+import atexit
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+def parse_logger_values(spec: str) -> Dict[str, float]:
+    """Parse 'logger.name=value,other=value' into {logger name: value}"""
+    values = {}
+    for item in (spec or "").split(","):
+        name, sep, value = item.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            values[name.strip()] = float(value.strip().rstrip("/s"))
+        except ValueError:
+            continue
+    return values
+
+
+class _TokenBucket:
+    __slots__ = ("rate", "tokens", "updated")
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class LogSampler:
+    """Per-logger sampling and rate limiting for records below WARNING
+
+    Settings apply to a logger and its children; the most specific configured
+    name wins (``faultmaven.api`` covers ``faultmaven.api.middleware.logging``).
+    """
+
+    def __init__(self, sample_rates: Optional[Dict[str, float]] = None, rate_limits: Optional[Dict[str, float]] = None):
+        self.sample_rates = dict(sample_rates or {})
+        self.rate_limits = dict(rate_limits or {})
+        self._policies: Dict[str, Tuple[float, Optional[_TokenBucket]]] = {}
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.sampled_out = 0
+        self.rate_limited = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.sample_rates or self.rate_limits)
+
+    @staticmethod
+    def _lookup(name: str, configured: Dict[str, float]) -> Optional[str]:
+        while True:
+            if name in configured:
+                return name
+            if "." not in name:
+                return "root" if "root" in configured else None
+            name = name.rsplit(".", 1)[0]
+
+    def _policy(self, name: str) -> Tuple[float, Optional[_TokenBucket]]:
+        policy = self._policies.get(name)
+        if policy is None:
+            with self._lock:
+                rate_key = self._lookup(name, self.sample_rates)
+                limit_key = self._lookup(name, self.rate_limits)
+                bucket = None
+                if limit_key is not None:
+                    # Loggers under one configured name share its budget
+                    bucket = self._buckets.get(limit_key)
+                    if bucket is None:
+                        bucket = self._buckets[limit_key] = _TokenBucket(self.rate_limits[limit_key])
+                sample_rate = self.sample_rates[rate_key] if rate_key is not None else 1.0
+                policy = self._policies[name] = (sample_rate, bucket)
+        return policy
+
+    def allow(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        sample_rate, bucket = self._policy(record.name)
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            self.sampled_out += 1
+            return False
+        if bucket is not None and not bucket.take():
+            self.rate_limited += 1
+            return False
+        return True
+
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class NonBlockingQueueHandler(logging.Handler):
+    """Enqueues records for the writer thread; never blocks the caller"""
+
+    def __init__(self, pipeline: "AsyncLogPipeline"):
+        super().__init__()
+        self.pipeline = pipeline
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # No handler lock: enqueueing is thread-safe on its own
+        if self.filters and not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.pipeline.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+
+class AsyncLogPipeline:
+    """Bounded log queue drained by a background writer thread
+
+    The queue is a deque (appends need no lock). The writer wakes every
+    ``flush_interval`` seconds, or as soon as a full batch or an ERROR record
+    is queued, and writes everything queued in batches of ``batch_size``.
+    """
+
+    def __init__(
+        self,
+        handlers: List[logging.Handler],
+        queue_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        report_interval: float = 5.0,
+        sampler: Optional[LogSampler] = None,
+    ):
+        """
+        Args:
+            handlers: Handlers that perform the actual output
+            queue_size: Maximum queued records before the drop policy applies
+            batch_size: Maximum records written per flush
+            flush_interval: Maximum seconds a record waits in the queue
+            report_interval: Seconds between reports of dropped records
+            sampler: Optional per-logger sampling and rate limits
+        """
+        self.handlers = list(handlers)
+        self.queue_size = queue_size
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.report_interval = report_interval
+        self.sampler = sampler or LogSampler()
+        self.handler = NonBlockingQueueHandler(self)
+
+        self._queue: Deque[logging.LogRecord] = deque()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._dropped: Dict[str, int] = {}
+        self._dropped_reported = 0
+        self.enqueued = 0
+        self.written = 0
+        self.batches = 0
+
+    # Request path
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.sampler and not self.sampler.allow(record):
+            return
+        record = self._prepare(record)
+        queued = self._queue
+
+        if len(queued) >= self.queue_size:
+            if record.levelno < logging.WARNING:
+                self._count_drop(record.levelname)
+                return
+            # Important records make room by evicting the oldest queued one
+            try:
+                self._count_drop(queued.popleft().levelname)
+            except IndexError:
+                pass
+
+        queued.append(record)
+        self.enqueued += 1
+        if record.levelno >= logging.ERROR or len(queued) % self.batch_size == 0:
+            self._wakeup.set()
+
+    @staticmethod
+    def _prepare(record: logging.LogRecord) -> logging.LogRecord:
+        # Shallow copy so other handlers on the same logger still see the
+        # original record. Resolve the message now: args may be mutated after
+        # the call returns
+        prepared = logging.LogRecord.__new__(logging.LogRecord)
+        prepared.__dict__.update(record.__dict__)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info:
+            prepared.exc_text = record.exc_text or _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            prepared.exc_info = None
+        return prepared
+
+    def _count_drop(self, level: str) -> None:
+        with self._lock:
+            self._dropped[level] = self._dropped.get(level, 0) + 1
+
+    # Writer thread
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="faultmaven-log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write everything still queued, then stop the writer thread"""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._stopping = True
+        self._wakeup.set()
+        thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        last_report = time.monotonic()
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            stopping = self._stopping
+
+            self._drain()
+            if stopping or time.monotonic() - last_report >= self.report_interval:
+                self._report_drops()
+                last_report = time.monotonic()
+            if stopping:
+                return
+
+    def _drain(self) -> None:
+        queued = self._queue
+        while queued:
+            batch = []
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(queued.popleft())
+            except IndexError:
+                pass
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: List[logging.LogRecord]) -> None:
+        for handler in self.handlers:
+            if isinstance(handler, logging.StreamHandler):
+                self._write_stream(handler, batch)
+            else:
+                for record in batch:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+        self.written += len(batch)
+        self.batches += 1
+
+    @staticmethod
+    def _write_stream(handler: logging.StreamHandler, batch: List[logging.LogRecord]) -> None:
+        lines = []
+        for record in batch:
+            if record.levelno < handler.level or not handler.filter(record):
+                continue
+            try:
+                lines.append(handler.format(record) + handler.terminator)
+            except Exception:
+                handler.handleError(record)
+        if not lines:
+            return
+        handler.acquire()
+        try:
+            handler.stream.write("".join(lines))
+            handler.flush()
+        except Exception:
+            handler.handleError(batch[-1])
+        finally:
+            handler.release()
+
+    def _report_drops(self) -> None:
+        with self._lock:
+            total = sum(self._dropped.values())
+            new = total - self._dropped_reported
+            if new <= 0:
+                return
+            self._dropped_reported = total
+            by_level = dict(self._dropped)
+        record = logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0,
+            f"Log queue full: dropped {new} records (total by level: {by_level})", None, None,
+        )
+        self._write([record])
+
+    def _after_fork_in_child(self) -> None:
+        # The writer thread does not survive fork (gunicorn preload_app);
+        # records queued before the fork belong to the parent
+        self._queue = deque()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.start()
+
+    def get_stats(self) -> Dict[str, object]:
+        with self._lock:
+            dropped = dict(self._dropped)
+        return {
+            "queue_depth": len(self._queue),
+            "queue_size": self.queue_size,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": dropped,
+            "sampled_out": self.sampler.sampled_out,
+            "rate_limited": self.sampler.rate_limited,
+            "writer_alive": self._thread is not None and self._thread.is_alive(),
+        }
+
+
+_pipeline: Optional[AsyncLogPipeline] = None
+_WRAPPED_HANDLER_TYPES = (logging.StreamHandler, logging.FileHandler)
+
+
+def install_async_logging(
+    logger: Optional[logging.Logger] = None,
+    queue_size: int = 10000,
+    batch_size: int = 100,
+    flush_interval: float = 0.05,
+    report_interval: float = 5.0,
+    sampler: Optional[LogSampler] = None,
+) -> Optional[AsyncLogPipeline]:
+    """Route a logger's (default: root) stream and file handlers through the pipeline
+
+    Only plain StreamHandler/FileHandler instances are moved behind the queue;
+    other handlers (test log capture, third-party integrations) stay attached
+    and keep receiving records synchronously. Idempotent: later calls return
+    the installed pipeline. Returns None when there is nothing to wrap.
+    """
+    global _pipeline
+    if _pipeline is not None:
+        return _pipeline
+
+    logger = logger or logging.getLogger()
+    handlers = [h for h in logger.handlers if type(h) in _WRAPPED_HANDLER_TYPES]
+    if not handlers:
+        return None
+
+    pipeline = AsyncLogPipeline(handlers, queue_size, batch_size, flush_interval, report_interval, sampler)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(pipeline.handler)
+    pipeline.start()
+
+    atexit.register(pipeline.stop)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=pipeline._after_fork_in_child)
+    _pipeline = pipeline
+    return pipeline
+
+
+def get_async_pipeline() -> Optional[AsyncLogPipeline]:
+    return _pipeline
@@ -11,6 +11,12 @@ from typing import Dict, Any, Optional
 import structlog
 from opentelemetry import trace
 
+from faultmaven.infrastructure.logging.async_pipeline import (
+    LogSampler,
+    install_async_logging,
+    parse_logger_values,
+)
+
 
 class LoggingConfig:
     """
@@ -31,6 +37,13 @@ class LoggingConfig:
     LOG_BUFFER_SIZE: int = int(os.getenv('LOG_BUFFER_SIZE', '100'))
     LOG_FLUSH_INTERVAL: float = float(os.getenv('LOG_FLUSH_INTERVAL', '5'))
     LOG_HUMAN_READABLE: bool = os.getenv('LOG_HUMAN_READABLE', 'false').lower() == 'true'
+    LOG_ASYNC: bool = os.getenv('LOG_ASYNC', 'true').lower() == 'true'
+    LOG_QUEUE_SIZE: int = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+    LOG_FLUSH_LATENCY_MS: float = float(os.getenv('LOG_FLUSH_LATENCY_MS', '50'))
+    LOG_BATCH_SIZE: int = int(os.getenv('LOG_BATCH_SIZE', '100'))
+    LOG_DROP_REPORT_INTERVAL: float = float(os.getenv('LOG_DROP_REPORT_INTERVAL', '5'))
+    LOG_SAMPLE_RATES: str = os.getenv('LOG_SAMPLE_RATES', '')
+    LOG_RATE_LIMITS: str = os.getenv('LOG_RATE_LIMITS', '')
     
     @classmethod
     def get_log_level(cls) -> int:
@@ -68,6 +81,9 @@ class FaultMavenLogger:
         """
         Configure structlog with comprehensive processors.
         
+        Also routes stdlib output through the async logging pipeline
+        (LOG_ASYNC, default on).
+        
         Sets up a processor chain that handles:
         - Log level filtering
         - Logger name and level addition
@@ -84,6 +100,20 @@ class FaultMavenLogger:
             level=self.config.get_log_level(),
         )
         
+        # Move log I/O to a background writer (LOG_BATCH_SIZE records per
+        # flush, drop reports every LOG_DROP_REPORT_INTERVAL seconds)
+        if self.config.LOG_ASYNC:
+            install_async_logging(
+                queue_size=self.config.LOG_QUEUE_SIZE,
+                batch_size=self.config.LOG_BATCH_SIZE,
+                flush_interval=self.config.LOG_FLUSH_LATENCY_MS / 1000,
+                report_interval=self.config.LOG_DROP_REPORT_INTERVAL,
+                sampler=LogSampler(
+                    parse_logger_values(self.config.LOG_SAMPLE_RATES),
+                    parse_logger_values(self.config.LOG_RATE_LIMITS),
+                ),
+            )
+        
         # Build processor list based on configuration
         processors = [
             # Standard processors
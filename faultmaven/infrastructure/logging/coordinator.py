@@ -771,7 +771,10 @@ class LoggingCoordinator:
         Returns:
             Dictionary with logging system health metrics and configuration
         """
+        from faultmaven.infrastructure.logging.async_pipeline import get_async_pipeline
+        
         ctx = request_context.get()
+        pipeline = get_async_pipeline()
         
         return {
             "status": "healthy",
@@ -790,5 +793,9 @@ class LoggingCoordinator:
                 "deduplication": os.getenv('LOG_DEDUPE', 'true'),
                 "buffer_size": os.getenv('LOG_BUFFER_SIZE', '100'),
                 "flush_interval": os.getenv('LOG_FLUSH_INTERVAL', '5'),
-            }
+                "async": os.getenv('LOG_ASYNC', 'true'),
+                "batch_size": os.getenv('LOG_BATCH_SIZE', '100'),
+                "drop_report_interval": os.getenv('LOG_DROP_REPORT_INTERVAL', '5'),
+            },
+            "async_pipeline": pipeline.get_stats() if pipeline else None,
         }
\ No newline at end of file
@@ -11,19 +11,40 @@ Key Features:
 - Lazy loading with error handling
 - Memory-efficient model sharing
 - Thread-safe initialization
+
+Multi-worker deployments select how workers get the embedding model with
+EMBEDDING_MODEL_MODE:
+- process: every worker loads its own copy (default)
+- preload: the pre-fork master loads the model and freezes it with
+  ``preload_for_fork`` so workers share it copy-on-write (faultmaven/gunicorn_conf.py)
+- sidecar: workers encode through a local embedding process over a Unix
+  socket (faultmaven/infrastructure/embedding_sidecar.py)
 """
 
+import gc
+import importlib
+import importlib.util
 import logging
 import threading
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from faultmaven.infrastructure.embedding_service import EmbeddingService
+    from faultmaven.infrastructure.embedding_sidecar import RemoteEmbeddingModel
+
+# sentence-transformers (and torch) are imported on first model load, keeping
+# them off the application import path
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+SentenceTransformer = None
 
-# Import with graceful fallback
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SentenceTransformer = None
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+def _sentence_transformer_class():
+    """Import the SentenceTransformer class on first use"""
+    global SentenceTransformer
+    if SentenceTransformer is None:
+        from sentence_transformers import SentenceTransformer as transformer_class
+        SentenceTransformer = transformer_class
+    return SentenceTransformer
 
 
 class ModelCache:
@@ -48,13 +69,33 @@ class ModelCache:
             self._initialized = True
             self.logger.debug("ModelCache initialized")
     
-    def get_bge_m3_model(self) -> Optional[SentenceTransformer]:
+    def _knowledge_settings(self):
+        try:
+            from faultmaven.config.settings import get_settings
+            return get_settings().knowledge
+        except Exception as e:
+            self.logger.debug(f"Using default embedding settings: {e}")
+            return None
+
+    def embedding_mode(self) -> str:
+        """Configured EMBEDDING_MODEL_MODE: process, preload or sidecar"""
+        knowledge = self._knowledge_settings()
+        return getattr(knowledge, "embedding_model_mode", "process").lower()
+
+    def get_bge_m3_model(self, local: bool = False) -> Optional["SentenceTransformer"]:
         """
         Get cached BGE-M3 model instance.
-        
+
+        Args:
+            local: Load the model in this process even in sidecar mode
+                (used by the sidecar itself)
+
         Returns:
-            SentenceTransformer model or None if unavailable
+            SentenceTransformer model (or its sidecar client) or None if unavailable
         """
+        if not local and self.embedding_mode() == "sidecar":
+            return self._get_sidecar_model()
+
         model_key = "BAAI/bge-m3"
         
         # Return cached model if available
@@ -75,14 +116,107 @@ class ModelCache:
             
             try:
                 self.logger.info(f"Loading BGE-M3 model for first time (this may take a moment)...")
-                model = SentenceTransformer(model_key)
+                model = _sentence_transformer_class()(model_key)
                 self._models[model_key] = model
                 self.logger.info("✅ BGE-M3 model loaded and cached successfully")
                 return model
             except Exception as e:
                 self.logger.error(f"Failed to load BGE-M3 model: {e}")
                 return None
+
+    def _get_sidecar_model(self) -> "RemoteEmbeddingModel":
+        """Client for the embedding sidecar, shared process-wide"""
+        model_key = "BAAI/bge-m3:sidecar"
+        if model_key in self._models:
+            return self._models[model_key]
+
+        with self._lock:
+            if model_key not in self._models:
+                from faultmaven.infrastructure.embedding_sidecar import RemoteEmbeddingModel
+
+                knowledge = self._knowledge_settings()
+                socket_path = getattr(
+                    knowledge, "embedding_sidecar_socket", "/tmp/faultmaven-embeddings.sock"
+                )
+                self._models[model_key] = RemoteEmbeddingModel(
+                    socket_path,
+                    timeout=getattr(knowledge, "embedding_sidecar_timeout_seconds", 30.0),
+                )
+                self.logger.info(f"Using embedding sidecar at {socket_path}")
+            return self._models[model_key]
     
+    def get_bge_m3_embedding_service(self) -> Optional["EmbeddingService"]:
+        """
+        Get the shared embedding service wrapping the cached BGE-M3 model.
+
+        The service coalesces concurrent encode requests into micro-batches,
+        runs the model off the event loop and caches vectors by text hash.
+
+        Returns:
+            EmbeddingService or None if the model is unavailable
+        """
+        service_key = "BAAI/bge-m3:service"
+        if service_key in self._models:
+            return self._models[service_key]
+
+        model = self.get_bge_m3_model()
+        if model is None:
+            return None
+
+        with self._lock:
+            if service_key in self._models:
+                return self._models[service_key]
+
+            from faultmaven.infrastructure.embedding_service import EmbeddingService
+
+            service_kwargs = {}
+            knowledge = self._knowledge_settings()
+            if knowledge is not None:
+                service_kwargs = {
+                    "max_batch_size": knowledge.embedding_batch_size,
+                    "max_wait_ms": knowledge.embedding_max_wait_ms,
+                    "cache_size": knowledge.embedding_cache_size,
+                }
+
+            service = EmbeddingService(model, **service_kwargs)
+            self._models[service_key] = service
+            return service
+
+    def preload_for_fork(self) -> dict:
+        """
+        Load shared models in a pre-fork master process and freeze the heap.
+
+        Call once, right before workers are forked. Workers then find the
+        embedding service already cached and share its pages copy-on-write.
+        ``gc.freeze()`` moves every live object to the permanent generation so
+        the workers' garbage collector never writes to (and thereby copies)
+        the pages holding the model.
+
+        Returns:
+            Summary of what was preloaded
+        """
+        service = self.get_bge_m3_embedding_service()
+
+        # Anomaly detection keeps per-worker (online-learning) estimators, but
+        # the scikit-learn modules behind them can be shared
+        sklearn_loaded = False
+        if importlib.util.find_spec("sklearn") is not None:
+            try:
+                importlib.import_module("faultmaven.infrastructure.protection.anomaly_detector")
+                sklearn_loaded = True
+            except Exception as e:
+                self.logger.warning(f"Failed to preload anomaly detection modules: {e}")
+
+        gc.collect()
+        gc.freeze()
+        summary = {
+            "embedding_service": service is not None,
+            "sklearn": sklearn_loaded,
+            "frozen_objects": gc.get_freeze_count(),
+        }
+        self.logger.info(f"Models preloaded for fork: {summary}")
+        return summary
+
     def clear_cache(self):
         """Clear all cached models (useful for testing)"""
         with self._lock:
@@ -93,7 +227,12 @@ class ModelCache:
         """Get information about cached models"""
         return {
             "cached_models": list(self._models.keys()),
+            "embedding_service": (
+                self._models["BAAI/bge-m3:service"].get_stats()
+                if "BAAI/bge-m3:service" in self._models else None
+            ),
             "cache_size": len(self._models),
+            "embedding_mode": self.embedding_mode(),
             "sentence_transformers_available": SENTENCE_TRANSFORMERS_AVAILABLE
         }
 
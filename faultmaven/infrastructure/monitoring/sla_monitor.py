@@ -889,10 +889,17 @@ Please investigate and resolve this issue promptly.
                 # Return mock values for demonstration
                 return self._get_mock_metric_value(sla)
             
-            # Get service performance data
-            service_data = await self._metrics_collector.get_service_performance_summary(
-                sla.service, sla.measurement_window_minutes
-            )
+            if sla.metric_type in ("response_time", "throughput"):
+                # Read straight from the pre-aggregated window statistics
+                operations = self._metrics_collector.get_operation_statistics(
+                    sla.service, sla.measurement_window_minutes
+                )
+                service_data = {"operation_statistics": operations}
+            else:
+                # Get service performance data
+                service_data = await self._metrics_collector.get_service_performance_summary(
+                    sla.service, sla.measurement_window_minutes
+                )
             
             if sla.metric_type == "response_time":
                 # Get average response time
@@ -0,0 +1,270 @@
+"""Pre-aggregated Metric Store
+
+Purpose: Constant-cost recording and O(buckets) summaries for the metrics
+collector.
+
+Samples are never kept individually. Each (service, operation) series holds
+rolling time buckets; a bucket keeps a count, sum, sum of squares, min, max
+and a mergeable quantile sketch. A summary over a time window merges the
+buckets that fall inside it, so polling cost depends on the window length,
+not on the number of samples recorded.
+
+Key Features:
+- DDSketch quantiles: relative-error guarantee, mergeable across buckets
+- Striped locks: recording only contends with series in the same shard
+- Bounded memory: buckets older than the retention period are dropped
+"""
+
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class QuantileSketch:
+    """Relative-error quantile sketch (DDSketch)
+
+    Values are counted in logarithmic buckets of ratio
+    gamma = (1 + a) / (1 - a), so every quantile estimate lies within relative
+    accuracy ``a`` of a true sample value. Sketches with the same accuracy
+    merge by adding bucket counts.
+    """
+
+    __slots__ = ("relative_accuracy", "_gamma", "_log_gamma", "_positive", "_negative", "_zero_count", "count")
+
+    # Values closer to zero than this are counted as zero
+    MIN_INDEXABLE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        if value > self.MIN_INDEXABLE:
+            index = self._index(value)
+            self._positive[index] = self._positive.get(index, 0) + 1
+        elif value < -self.MIN_INDEXABLE:
+            index = self._index(-value)
+            self._negative[index] = self._negative.get(index, 0) + 1
+        else:
+            self._zero_count += 1
+        self.count += 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other._positive.items():
+            self._positive[index] = self._positive.get(index, 0) + count
+        for index, count in other._negative.items():
+            self._negative[index] = self._negative.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0 <= q <= 1); None when empty"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+
+        seen = 0
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self._positive))
+
+
+class MetricAggregate:
+    """Counters and quantile sketch for the samples of one bucket or window"""
+
+    __slots__ = ("count", "total", "sum_squares", "minimum", "maximum", "sketch")
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.count = 0
+        self.total = 0.0
+        self.sum_squares = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.sum_squares += value * value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.sketch.add(value)
+
+    def merge(self, other: "MetricAggregate") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.sum_squares += other.sum_squares
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Quantile estimate clamped to the exact min/max"""
+        estimate = self.sketch.quantile(q)
+        if estimate is None:
+            return 0.0
+        return min(max(estimate, self.minimum), self.maximum)
+
+    def std_dev(self) -> float:
+        """Sample standard deviation"""
+        if self.count < 2:
+            return 0.0
+        variance = (self.sum_squares - self.total * self.total / self.count) / (self.count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def summary(self) -> Dict[str, float]:
+        """count/avg/min/max/median, plus std_dev/p95/p99 for two or more samples"""
+        stats = {
+            "count": self.count,
+            "avg": self.mean,
+            "min": self.minimum,
+            "max": self.maximum,
+            "median": self.quantile(0.5),
+        }
+        if self.count > 1:
+            stats["std_dev"] = self.std_dev()
+            stats["p95"] = self.quantile(0.95)
+            stats["p99"] = self.quantile(0.99)
+        return stats
+
+
+class _Series:
+    __slots__ = ("buckets", "newest")
+
+    def __init__(self):
+        self.buckets: Dict[int, MetricAggregate] = {}
+        self.newest = -1
+
+
+class TimeBucketedMetricStore:
+    """Rolling time-bucketed aggregates per (service, operation)"""
+
+    def __init__(
+        self,
+        bucket_seconds: float = 10.0,
+        retention_seconds: float = 3600.0,
+        relative_accuracy: float = 0.01,
+        shards: int = 16,
+    ):
+        """
+        Args:
+            bucket_seconds: Width of one time bucket
+            retention_seconds: How long buckets are kept (longest queryable window)
+            relative_accuracy: Quantile sketch accuracy (0.01 = within 1%)
+            shards: Number of striped locks guarding the series
+        """
+        self.bucket_seconds = bucket_seconds
+        self.retention_buckets = max(1, math.ceil(retention_seconds / bucket_seconds))
+        self.relative_accuracy = relative_accuracy
+        self._locks = [threading.Lock() for _ in range(max(1, shards))]
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._operations: Dict[str, Dict[str, None]] = {}
+
+    def _lock_for(self, key: Tuple[str, str]) -> threading.Lock:
+        return self._locks[hash(key) % len(self._locks)]
+
+    def record(self, service: str, operation: str, value: float, timestamp: Optional[float] = None) -> None:
+        """Add one sample (timestamp in epoch seconds, default now)"""
+        bucket_id = int((time.time() if timestamp is None else timestamp) // self.bucket_seconds)
+        key = (service, operation)
+
+        with self._lock_for(key):
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+                self._operations.setdefault(service, {})[operation] = None
+
+            aggregate = series.buckets.get(bucket_id)
+            if aggregate is None:
+                series.newest = max(series.newest, bucket_id)
+                oldest_kept = series.newest - self.retention_buckets + 1
+                if bucket_id < oldest_kept:
+                    return
+                # Runs once per new bucket, not per sample
+                for expired in [b for b in series.buckets if b < oldest_kept]:
+                    del series.buckets[expired]
+                aggregate = series.buckets[bucket_id] = MetricAggregate(self.relative_accuracy)
+            aggregate.add(value)
+
+    def aggregate(
+        self,
+        service: str,
+        operation: str,
+        window_seconds: float,
+        now: Optional[float] = None,
+    ) -> Optional[MetricAggregate]:
+        """Merge the buckets of one series within the window; None if empty"""
+        key = (service, operation)
+        series = self._series.get(key)
+        if series is None:
+            return None
+
+        current = int((time.time() if now is None else now) // self.bucket_seconds)
+        first = current - max(1, math.ceil(window_seconds / self.bucket_seconds)) + 1
+        merged = MetricAggregate(self.relative_accuracy)
+        with self._lock_for(key):
+            for bucket_id, bucket in series.buckets.items():
+                if first <= bucket_id <= current:
+                    merged.merge(bucket)
+        return merged if merged.count else None
+
+    def summarize(
+        self,
+        service: str,
+        window_seconds: float,
+        now: Optional[float] = None,
+    ) -> Dict[str, MetricAggregate]:
+        """Window aggregates for every operation of a service"""
+        results = {}
+        for operation in list(self._operations.get(service, ())):
+            aggregate = self.aggregate(service, operation, window_seconds, now)
+            if aggregate is not None:
+                results[operation] = aggregate
+        return results
+
+    def __len__(self) -> int:
+        """Number of (service, operation) series"""
+        return len(self._series)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._series
+
+    def services(self) -> List[str]:
+        return list(self._operations)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "series": len(self._series),
+            "buckets": sum(len(series.buckets) for series in list(self._series.values())),
+        }
@@ -35,21 +35,10 @@ import json
 import statistics
 
 from faultmaven.infrastructure.base_client import BaseExternalClient
+from faultmaven.infrastructure.observability.metric_store import TimeBucketedMetricStore
 from faultmaven.models.interfaces import ITracer
 
 
-@dataclass
-class MetricData:
-    """Individual metric data point"""
-    timestamp: datetime
-    service: str
-    operation: str
-    value: float
-    unit: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    tags: Dict[str, str] = field(default_factory=dict)
-
-
 @dataclass
 class PerformanceSnapshot:
     """Performance snapshot for a specific time window"""
@@ -90,15 +79,19 @@ class MetricsCollector(BaseExternalClient):
         tracer: Optional[ITracer] = None,
         buffer_size: int = 10000,
         flush_interval: int = 60,
-        analytics_window: int = 300  # 5 minutes
+        analytics_window: int = 300,  # 5 minutes
+        bucket_seconds: float = 10.0,
+        retention_seconds: float = 3600.0
     ):
         """Initialize the metrics collector
         
         Args:
             tracer: Optional tracer for observability integration
-            buffer_size: Maximum number of metrics to buffer
+            buffer_size: Maximum number of (service, operation) series tracked
             flush_interval: Interval in seconds to flush metrics
             analytics_window: Time window in seconds for analytics calculations
+            bucket_seconds: Width of the pre-aggregation time buckets
+            retention_seconds: How long aggregates are kept (longest summary window)
         """
         super().__init__(
             client_name="MetricsCollector",
@@ -113,16 +106,17 @@ class MetricsCollector(BaseExternalClient):
         self._flush_interval = flush_interval
         self._analytics_window = analytics_window
         
-        # Thread-safe metric storage
-        self._metrics_buffer: deque = deque(maxlen=buffer_size)
-        self._buffer_lock = threading.RLock()
+        # Pre-aggregated metric storage: rolling time buckets with quantile
+        # sketches per (service, operation); samples are not kept individually
+        self._metric_store = TimeBucketedMetricStore(
+            bucket_seconds=bucket_seconds,
+            retention_seconds=retention_seconds
+        )
         
         # Service performance profiles
         self._service_profiles: Dict[str, ServicePerformanceProfile] = {}
         self._profile_lock = threading.RLock()
         
-        # Real-time analytics data
-        self._analytics_data: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
         self._analytics_lock = threading.RLock()
         
         # Performance thresholds and SLAs
@@ -206,28 +200,18 @@ class MetricsCollector(BaseExternalClient):
             operation: Operation being measured (e.g., "context_retrieval")
             value: Metric value (typically timing in milliseconds)
             unit: Unit of measurement
-            metadata: Additional metadata
-            tags: Tags for metric categorization
+            metadata: Additional metadata (not retained by the aggregated store)
+            tags: Tags for metric categorization (not retained by the aggregated store)
         """
         try:
-            metric = MetricData(
-                timestamp=datetime.now(timezone.utc),
-                service=service,
-                operation=operation,
-                value=value,
-                unit=unit,
-                metadata=metadata or {},
-                tags=tags or {}
-            )
-            
-            with self._buffer_lock:
-                self._metrics_buffer.append(metric)
-            
-            # Update real-time analytics
-            self._update_real_time_analytics(metric)
+            # Bound the number of series, not the number of samples
+            if len(self._metric_store) >= self._buffer_size and (service, operation) not in self._metric_store:
+                return
+
+            self._metric_store.record(service, operation, value)
             
             # Check for performance threshold violations
-            self._check_performance_thresholds(metric)
+            self._check_performance_thresholds(service, operation, value)
             
         except Exception as e:
             self.logger.error(f"Failed to record metric: {e}")
@@ -464,6 +448,28 @@ class MetricsCollector(BaseExternalClient):
         except Exception as e:
             self.logger.error(f"Failed to record workflow metrics: {e}")
     
+    def get_operation_statistics(
+        self,
+        service: str,
+        time_window_minutes: int = 60
+    ) -> Dict[str, Dict[str, float]]:
+        """Per-operation statistics for a time window, without alerts or recommendations
+        
+        Cheap enough to poll: merges at most one pre-aggregated bucket per
+        bucket interval in the window.
+        
+        Args:
+            service: Service name
+            time_window_minutes: Time window for analysis
+            
+        Returns:
+            operation -> {count, avg, min, max, median[, std_dev, p95, p99]}
+        """
+        return {
+            operation: aggregate.summary()
+            for operation, aggregate in self._metric_store.summarize(service, time_window_minutes * 60).items()
+        }
+    
     async def get_service_performance_summary(
         self,
         service: str,
@@ -479,17 +485,10 @@ class MetricsCollector(BaseExternalClient):
             Performance summary with metrics, trends, and recommendations
         """
         try:
-            cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=time_window_minutes)
-            
-            # Filter metrics for service and time window
-            relevant_metrics = []
-            with self._buffer_lock:
-                relevant_metrics = [
-                    m for m in self._metrics_buffer
-                    if m.service == service and m.timestamp >= cutoff_time
-                ]
+            # Merge the pre-aggregated buckets inside the window
+            window_aggregates = self._metric_store.summarize(service, time_window_minutes * 60)
             
-            if not relevant_metrics:
+            if not window_aggregates:
                 return {
                     "service": service,
                     "time_window_minutes": time_window_minutes,
@@ -497,40 +496,17 @@ class MetricsCollector(BaseExternalClient):
                     "message": "No metrics available for the specified time window"
                 }
             
-            # Group metrics by operation
-            operations = defaultdict(list)
-            for metric in relevant_metrics:
-                operations[metric.operation].append(metric.value)
-            
-            # Calculate statistics for each operation
+            # Calculate statistics for each operation (quantiles from sketches)
             operation_stats = {}
             alerts = []
             recommendations = []
             
-            for operation, values in operations.items():
-                if not values:
-                    continue
-                
-                stats = {
-                    "count": len(values),
-                    "avg": statistics.mean(values),
-                    "min": min(values),
-                    "max": max(values),
-                    "median": statistics.median(values)
-                }
-                
-                if len(values) > 1:
-                    stats["std_dev"] = statistics.stdev(values)
-                    
-                    # Calculate percentiles
-                    sorted_values = sorted(values)
-                    stats["p95"] = sorted_values[int(0.95 * len(sorted_values))]
-                    stats["p99"] = sorted_values[int(0.99 * len(sorted_values))]
-                
+            for operation, aggregate in window_aggregates.items():
+                stats = aggregate.summary()
                 operation_stats[operation] = stats
                 
                 # Check against thresholds
-                thresholds = self._performance_thresholds.get(service, {}).get(operation)
+                thresholds = self._performance_thresholds.get(service, {}).get(operation) or {}
                 if thresholds and stats["avg"] > thresholds["warning"]:
                     severity = "critical" if stats["avg"] > thresholds["critical"] else "warning"
                     alerts.append({
@@ -710,59 +686,37 @@ class MetricsCollector(BaseExternalClient):
                 "recommendations": []
             }
     
-    def _update_real_time_analytics(self, metric: MetricData) -> None:
-        """Update real-time analytics with new metric"""
-        try:
-            with self._analytics_lock:
-                key = f"{metric.service}.{metric.operation}"
-                self._analytics_data[key].append({
-                    "timestamp": metric.timestamp,
-                    "value": metric.value,
-                    "metadata": metric.metadata
-                })
-                
-                # Update service-level aggregates
-                service_key = f"{metric.service}.aggregate"
-                self._analytics_data[service_key].append({
-                    "timestamp": metric.timestamp,
-                    "operation": metric.operation,
-                    "value": metric.value
-                })
-                
-        except Exception as e:
-            self.logger.error(f"Failed to update real-time analytics: {e}")
-    
-    def _check_performance_thresholds(self, metric: MetricData) -> None:
+    def _check_performance_thresholds(self, service: str, operation: str, value: float) -> None:
         """Check metric against performance thresholds and generate alerts"""
         try:
-            thresholds = self._performance_thresholds.get(metric.service, {}).get(metric.operation)
+            thresholds = self._performance_thresholds.get(service, {}).get(operation)
             if not thresholds:
                 return
             
-            alert_key = f"{metric.service}.{metric.operation}"
+            alert_key = f"{service}.{operation}"
             
-            if metric.value > thresholds.get("critical", float('inf')):
-                alert = f"CRITICAL: {metric.service} {metric.operation} ({metric.value:.1f}ms) exceeds critical threshold"
+            if value > thresholds.get("critical", float('inf')):
+                alert = f"CRITICAL: {service} {operation} ({value:.1f}ms) exceeds critical threshold"
                 self._active_alerts.add(alert_key)
                 self._alert_history.append({
-                    "timestamp": metric.timestamp.isoformat(),
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
                     "severity": "critical",
-                    "service": metric.service,
-                    "operation": metric.operation,
-                    "value": metric.value,
+                    "service": service,
+                    "operation": operation,
+                    "value": value,
                     "threshold": thresholds["critical"],
                     "message": alert
                 })
                 
-            elif metric.value > thresholds.get("warning", float('inf')):
-                alert = f"WARNING: {metric.service} {metric.operation} ({metric.value:.1f}ms) exceeds warning threshold"
+            elif value > thresholds.get("warning", float('inf')):
+                alert = f"WARNING: {service} {operation} ({value:.1f}ms) exceeds warning threshold"
                 if alert_key not in self._active_alerts:  # Don't downgrade existing critical alerts
                     self._alert_history.append({
-                        "timestamp": metric.timestamp.isoformat(),
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
                         "severity": "warning", 
-                        "service": metric.service,
-                        "operation": metric.operation,
-                        "value": metric.value,
+                        "service": service,
+                        "operation": operation,
+                        "value": value,
                         "threshold": thresholds["warning"],
                         "message": alert
                     })
@@ -950,11 +904,10 @@ class MetricsCollector(BaseExternalClient):
                 await asyncio.sleep(self._flush_interval)
                 
                 # In a real implementation, this would flush to persistent storage
-                with self._buffer_lock:
-                    buffer_size = len(self._metrics_buffer)
-                    if buffer_size > 0:
-                        self.logger.debug(f"Flushing {buffer_size} metrics to storage")
-                        # Metrics would be persisted here
+                store_stats = self._metric_store.stats()
+                if store_stats["buckets"] > 0:
+                    self.logger.debug(f"Flushing {store_stats['buckets']} metric buckets to storage")
+                    # Metrics would be persisted here
                 
             except Exception as e:
                 self.logger.error(f"Error in periodic flush: {e}")
@@ -965,12 +918,8 @@ class MetricsCollector(BaseExternalClient):
             try:
                 await asyncio.sleep(30)  # Process every 30 seconds
                 
-                # Process real-time analytics
-                with self._analytics_lock:
-                    for key, data in self._analytics_data.items():
-                        if len(data) > 10:  # Sufficient data for analysis
-                            # Perform analytics calculations
-                            pass
+                # Real-time analytics are maintained by the metric store
+                # as samples are recorded
                 
             except Exception as e:
                 self.logger.error(f"Error in analytics processor: {e}")
@@ -995,19 +944,19 @@ class MetricsCollector(BaseExternalClient):
         metrics_health = {
             **base_health,
             "service": "metrics_collector",
-            "buffer_size": len(self._metrics_buffer),
+            "buffer_size": len(self._metric_store),
             "max_buffer_size": self._buffer_size,
             "service_profiles": len(self._service_profiles),
             "active_alerts": len(self._active_alerts),
             "background_processing": self._background_tasks_running,
-            "analytics_data_points": sum(len(data) for data in self._analytics_data.values()),
+            "analytics_data_points": self._metric_store.stats()["buckets"],
             "cache_stats": dict(self._cache_stats)
         }
         
         # Determine status
-        if len(self._metrics_buffer) > self._buffer_size * 0.9:
+        if len(self._metric_store) > self._buffer_size * 0.9:
             metrics_health["status"] = "degraded"
-            metrics_health["warning"] = "Metrics buffer near capacity"
+            metrics_health["warning"] = "Metric series near capacity"
         elif not self._background_tasks_running:
             metrics_health["status"] = "degraded" 
             metrics_health["warning"] = "Background processing not running"
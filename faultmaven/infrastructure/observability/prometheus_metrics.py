@@ -0,0 +1,233 @@
+"""Prometheus Metrics
+
+Purpose: Application-wide Prometheus/OpenMetrics instruments, exposed by the
+app-level ``/metrics`` endpoint.
+
+Subsystems report through the small ``record_*``/``observe_*`` helpers below,
+which are no-ops when prometheus-client is not installed. Label values are
+bounded: HTTP requests are labelled by route template (``/api/v1/cases/{case_id}``),
+never by raw path, and other labels come from fixed sets (provider, model,
+cache name, data type).
+
+Metrics:
+- faultmaven_http_requests_total / _request_duration_seconds / _requests_in_progress
+- faultmaven_llm_requests_total / _request_duration_seconds / _tokens_total
+- faultmaven_cache_requests_total (hit/miss per cache)
+- faultmaven_preprocessing_documents_total / _bytes_total / _duration_seconds
+- faultmaven_db_pool_connections / faultmaven_redis_pool_connections
+  (read from the registered pools at scrape time)
+"""
+
+import logging
+import weakref
+from typing import Any, Dict, Tuple
+
+try:
+    from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+    from prometheus_client.core import GaugeMetricFamily
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = "unmatched"
+
+if PROMETHEUS_AVAILABLE:
+    HTTP_REQUESTS = Counter(
+        "faultmaven_http_requests_total",
+        "HTTP requests by route template and status code",
+        ["method", "route", "status"],
+    )
+    HTTP_REQUEST_DURATION = Histogram(
+        "faultmaven_http_request_duration_seconds",
+        "HTTP request latency by route template",
+        ["method", "route"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+    )
+    HTTP_REQUESTS_IN_PROGRESS = Gauge(
+        "faultmaven_http_requests_in_progress",
+        "HTTP requests currently being served",
+        ["method"],
+    )
+
+    LLM_REQUEST_COUNTER = Counter(
+        "faultmaven_llm_requests_total",
+        "Total number of LLM requests",
+        ["provider", "model", "status"],
+    )
+    LLM_REQUEST_DURATION = Histogram(
+        "faultmaven_llm_request_duration_seconds",
+        "LLM request duration in seconds",
+        ["provider", "model"],
+        buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0),
+    )
+    LLM_TOKENS = Counter(
+        "faultmaven_llm_tokens_total",
+        "Tokens used by LLM requests",
+        ["provider", "model"],
+    )
+
+    CACHE_REQUESTS = Counter(
+        "faultmaven_cache_requests_total",
+        "Cache lookups by cache and result (hit/miss)",
+        ["cache", "result"],
+    )
+
+    PREPROCESSING_DOCUMENTS = Counter(
+        "faultmaven_preprocessing_documents_total",
+        "Documents run through the preprocessing pipeline",
+        ["data_type", "strategy"],
+    )
+    PREPROCESSING_BYTES = Counter(
+        "faultmaven_preprocessing_bytes_total",
+        "Raw bytes run through the preprocessing pipeline",
+        ["data_type"],
+    )
+    PREPROCESSING_DURATION = Histogram(
+        "faultmaven_preprocessing_duration_seconds",
+        "Preprocessing pipeline duration per document",
+        ["data_type"],
+        buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+    )
+
+# Label children are resolved once per label combination; prometheus-client's
+# labels() takes a lock and builds a tuple on every call
+_children: Dict[Tuple[Any, ...], Any] = {}
+
+
+def _child(metric: Any, *labels: str) -> Any:
+    key = (id(metric),) + labels
+    child = _children.get(key)
+    if child is None:
+        child = _children[key] = metric.labels(*labels)
+    return child
+
+
+def observe_http_request(method: str, route: str, status: int, duration: float) -> None:
+    """Record one served HTTP request (route is the matched route template)"""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    _child(HTTP_REQUESTS, method, route, str(status)).inc()
+    _child(HTTP_REQUEST_DURATION, method, route).observe(duration)
+
+
+def http_request_started(method: str) -> None:
+    if PROMETHEUS_AVAILABLE:
+        _child(HTTP_REQUESTS_IN_PROGRESS, method).inc()
+
+
+def http_request_finished(method: str) -> None:
+    if PROMETHEUS_AVAILABLE:
+        _child(HTTP_REQUESTS_IN_PROGRESS, method).dec()
+
+
+def record_llm_request(provider: str, model: str, status: str, duration: float, tokens: int = 0) -> None:
+    """Record one LLM provider call"""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    model = model or "default"
+    _child(LLM_REQUEST_COUNTER, provider, model, status).inc()
+    _child(LLM_REQUEST_DURATION, provider, model).observe(duration)
+    if tokens:
+        _child(LLM_TOKENS, provider, model).inc(tokens)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Record a cache lookup; hit rate = hit / (hit + miss)"""
+    if PROMETHEUS_AVAILABLE:
+        _child(CACHE_REQUESTS, cache, "hit" if hit else "miss").inc()
+
+
+def record_preprocessing(data_type: str, strategy: str, size_bytes: int, duration: float) -> None:
+    """Record one document run through the preprocessing pipeline"""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    _child(PREPROCESSING_DOCUMENTS, data_type, strategy).inc()
+    _child(PREPROCESSING_BYTES, data_type).inc(size_bytes)
+    _child(PREPROCESSING_DURATION, data_type).observe(duration)
+
+
+# Connection pools sampled at scrape time; weak references so that metrics
+# never keep an engine or client alive
+_db_pools: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+_redis_pools: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+
+
+def register_db_pool(name: str, engine: Any) -> None:
+    """Expose a SQLAlchemy (async) engine's connection pool usage"""
+    try:
+        _db_pools[name] = getattr(engine, "sync_engine", engine)
+    except TypeError:
+        logger.debug(f"Cannot register DB pool {name} for metrics")
+
+
+def register_redis_pool(name: str, client: Any) -> None:
+    """Expose a redis client's connection pool usage"""
+    pool = getattr(client, "connection_pool", None)
+    if pool is None:
+        return
+    try:
+        _redis_pools[name] = pool
+    except TypeError:
+        logger.debug(f"Cannot register Redis pool {name} for metrics")
+
+
+class ConnectionPoolCollector:
+    """Reads DB and Redis pool usage when Prometheus scrapes"""
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        db = GaugeMetricFamily(
+            "faultmaven_db_pool_connections",
+            "Database connection pool usage (in_use, idle, capacity)",
+            labels=["pool", "state"],
+        )
+        for name, engine in list(_db_pools.items()):
+            pool = engine.pool
+            try:
+                in_use = pool.checkedout()
+                idle = pool.checkedin()
+                capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+            except AttributeError:
+                continue
+            db.add_metric([name, "in_use"], in_use)
+            db.add_metric([name, "idle"], idle)
+            db.add_metric([name, "capacity"], capacity)
+        yield db
+
+        redis = GaugeMetricFamily(
+            "faultmaven_redis_pool_connections",
+            "Redis connection pool usage (in_use, idle, capacity)",
+            labels=["pool", "state"],
+        )
+        for name, pool in list(_redis_pools.items()):
+            redis.add_metric([name, "in_use"], len(getattr(pool, "_in_use_connections", ())))
+            redis.add_metric([name, "idle"], len(getattr(pool, "_available_connections", ())))
+            capacity = getattr(pool, "max_connections", None)
+            if capacity:
+                redis.add_metric([name, "capacity"], capacity)
+        yield redis
+
+
+if PROMETHEUS_AVAILABLE:
+    REGISTRY.register(ConnectionPoolCollector())
+
+
+def render_metrics(accept: str = "") -> Tuple[bytes, str]:
+    """Serialize the default registry (OpenMetrics when the scraper asks for it)
+
+    Returns:
+        (body, content type)
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return b"# prometheus-client not installed\n", "text/plain; charset=utf-8"
+
+    if "application/openmetrics-text" in accept:
+        from prometheus_client.openmetrics.exposition import CONTENT_TYPE_LATEST, generate_latest
+    else:
+        from prometheus_client.exposition import CONTENT_TYPE_LATEST, generate_latest
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
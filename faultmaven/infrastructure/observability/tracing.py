@@ -30,9 +30,11 @@ import asyncio
 import functools
 import logging
 import os
+import random
 import time
+import zlib
 from contextlib import contextmanager
-from typing import Callable, Optional, Any, Dict
+from typing import Callable, Optional, Any, Dict, FrozenSet
 from faultmaven.models.interfaces import ITracer
 from faultmaven.infrastructure.base_client import BaseExternalClient
 
@@ -75,17 +77,11 @@ if PROMETHEUS_AVAILABLE:
     # Active sessions gauge
     ACTIVE_SESSIONS = Gauge("faultmaven_active_sessions", "Number of active sessions")
 
-    # LLM request metrics
-    LLM_REQUEST_COUNTER = Counter(
-        "faultmaven_llm_requests_total",
-        "Total number of LLM requests",
-        ["provider", "model", "status"],
-    )
-
-    LLM_REQUEST_DURATION = Histogram(
-        "faultmaven_llm_request_duration_seconds",
-        "LLM request duration in seconds",
-        ["provider", "model"],
+    # LLM request metrics (recorded by the provider registry, re-exported here)
+    from faultmaven.infrastructure.observability.prometheus_metrics import (
+        LLM_REQUEST_COUNTER,
+        LLM_REQUEST_DURATION,
+        _child,
     )
 
     # Generic function metrics
@@ -96,6 +92,150 @@ if PROMETHEUS_AVAILABLE:
     )
 
 
+def _split_targets(value: str) -> FrozenSet[str]:
+    return frozenset(item.strip() for item in (value or "").split(",") if item.strip())
+
+
+class TraceConfig:
+    """Trace targeting and sampling compiled from ObservabilitySettings
+
+    Built once per settings instance (see get_trace_config), so deciding
+    whether to trace a call is a few set lookups. Supports:
+    - Global disable: OPIK_TRACK_DISABLE=true
+    - Target users: OPIK_TRACK_USERS=user1,user2,user3
+    - Target sessions: OPIK_TRACK_SESSIONS=session1,session2
+    - Target operations: OPIK_TRACK_OPERATIONS=llm_query,knowledge_search
+    - Head-based sampling: OPIK_SAMPLE_RATE=0.1 (decided per request, so a
+      request's spans are kept or dropped together); failed calls are
+      traced regardless of sampling unless OPIK_SAMPLE_ERRORS=false
+    """
+
+    __slots__ = ("disabled", "users", "sessions", "operations", "sample_rate", "trace_errors", "span_tags")
+
+    def __init__(
+        self,
+        disabled: bool = False,
+        users: FrozenSet[str] = frozenset(),
+        sessions: FrozenSet[str] = frozenset(),
+        operations: FrozenSet[str] = frozenset(),
+        sample_rate: float = 1.0,
+        trace_errors: bool = True,
+        span_tags: Optional[Dict[str, str]] = None,
+    ):
+        self.disabled = disabled
+        self.users = users
+        self.sessions = sessions
+        self.operations = operations
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.trace_errors = trace_errors
+        self.span_tags = span_tags or {}
+
+    @classmethod
+    def from_settings(cls, settings) -> "TraceConfig":
+        # Without settings, default to enabled
+        if settings is None:
+            return cls()
+        observability = settings.observability
+        span_tags = {}
+        if observability.opik_use_local:
+            # Add local Opik headers if using local instance
+            span_tags = {
+                "opik_local_host": observability.opik_local_host,
+                "opik_local_url": observability.opik_local_url,
+            }
+        return cls(
+            disabled=observability.opik_track_disable,
+            users=_split_targets(observability.opik_track_users),
+            sessions=_split_targets(observability.opik_track_sessions),
+            operations=_split_targets(observability.opik_track_operations),
+            sample_rate=getattr(observability, "opik_sample_rate", 1.0),
+            trace_errors=getattr(observability, "opik_sample_errors", True),
+            span_tags=span_tags,
+        )
+
+    def should_trace(self, operation: str) -> bool:
+        """Apply the disable switch and user/session/operation targeting"""
+        if self.disabled:
+            return False
+        if self.operations and operation not in self.operations:
+            return False
+        if self.users or self.sessions:
+            context = _current_request_context()
+            if self.users and (not context or context.user_id not in self.users):
+                return False
+            if self.sessions and (not context or context.session_id not in self.sessions):
+                return False
+        return True
+
+    def sampled(self) -> bool:
+        """Head-based sampling decision for the current request"""
+        if self.sample_rate >= 1.0:
+            return True
+        if self.sample_rate <= 0.0:
+            return False
+        context = _current_request_context()
+        if context is not None and context.correlation_id:
+            # Same decision for every span of the request
+            bucket = zlib.crc32(context.correlation_id.encode("utf-8")) / 0xFFFFFFFF
+            return bucket < self.sample_rate
+        return random.random() < self.sample_rate
+
+
+_request_context_var = None
+_get_settings = None
+# id(settings) -> (settings, compiled config); holding the settings object
+# keeps its id from being reused while the entry exists
+_trace_configs: Dict[int, tuple] = {}
+_MAX_TRACE_CONFIGS = 8
+
+
+def _current_request_context():
+    global _request_context_var
+    if _request_context_var is None:
+        try:
+            from faultmaven.infrastructure.logging.coordinator import request_context
+        except Exception:
+            return None
+        _request_context_var = request_context
+    return _request_context_var.get()
+
+
+def _current_settings():
+    global _get_settings
+    try:
+        if _get_settings is None:
+            from faultmaven.config.settings import get_settings
+            _get_settings = get_settings
+        return _get_settings()
+    except Exception:
+        return None
+
+
+def get_trace_config(settings=None) -> TraceConfig:
+    """Compiled trace configuration for settings (default: the global settings)
+
+    Rebuilt only when a different settings instance is passed or the global
+    settings are replaced (reset_settings); call reset_trace_config after
+    mutating a settings object in place.
+    """
+    if settings is None:
+        settings = _current_settings()
+    entry = _trace_configs.get(id(settings))
+    if entry is not None and entry[0] is settings:
+        return entry[1]
+
+    config = TraceConfig.from_settings(settings)
+    if len(_trace_configs) >= _MAX_TRACE_CONFIGS:
+        _trace_configs.clear()
+    _trace_configs[id(settings)] = (settings, config)
+    return config
+
+
+def reset_trace_config() -> None:
+    """Drop compiled trace configurations (after changing settings in place)"""
+    _trace_configs.clear()
+
+
 class OpikTracer(BaseExternalClient, ITracer):
     """Opik-based tracer implementing ITracer interface
     
@@ -296,46 +436,7 @@ class OpikTracer(BaseExternalClient, ITracer):
         Returns:
             True if tracing should be enabled, False otherwise
         """
-        # Global disable check
-        if self.settings.observability.opik_track_disable:
-            return False
-        
-        # Get current request context for targeted tracing
-        try:
-            from faultmaven.infrastructure.logging.coordinator import request_context
-            context = request_context.get()
-        except:
-            context = None
-        
-        # Check for targeted user tracing
-        target_users = self.settings.observability.opik_track_users.strip()
-        if target_users:
-            target_user_list = [u.strip() for u in target_users.split(",") if u.strip()]
-            if target_user_list:
-                if not context or not context.user_id:
-                    return False  # No user context, but targeting specific users
-                if context.user_id not in target_user_list:
-                    return False  # User not in target list
-        
-        # Check for targeted session tracing
-        target_sessions = self.settings.observability.opik_track_sessions.strip()
-        if target_sessions:
-            target_session_list = [s.strip() for s in target_sessions.split(",") if s.strip()]
-            if target_session_list:
-                if not context or not context.session_id:
-                    return False  # No session context, but targeting specific sessions
-                if context.session_id not in target_session_list:
-                    return False  # Session not in target list
-        
-        # Check for targeted operation tracing
-        target_operations = self.settings.observability.opik_track_operations.strip()
-        if target_operations:
-            target_op_list = [op.strip() for op in target_operations.split(",") if op.strip()]
-            if target_op_list:
-                if operation not in target_op_list:
-                    return False  # Operation not in target list
-        
-        return True  # Default to enabled if no restrictions apply
+        return get_trace_config(self.settings).should_trace(operation)
     
     def _record_fallback_metrics(self, operation: str, start_time: float, status: str):
         """
@@ -497,6 +598,8 @@ def trace(name: str, tags: Optional[dict] = None, settings=None):
     Decorator to trace function calls with external service protection.
     
     Uses simplified external call patterns for span creation with fallback.
+    Targeting and sampling come from the compiled TraceConfig, so calls that
+    are not traced only pay for a set lookup and the duration metric.
 
     Args:
         name: Name for the trace span
@@ -506,150 +609,98 @@ def trace(name: str, tags: Optional[dict] = None, settings=None):
     Returns:
         Decorated function
     """
+    quiet = 'heartbeat' in name.lower() or 'update_last_activity' in name.lower()
+
+    def start_span(config: "TraceConfig", start_time: float) -> Optional[dict]:
+        if not OPIK_AVAILABLE:
+            return None
+        span_tags = dict(tags or {})
+        span_tags.update(config.span_tags)
+        # Reduce logging noise for heartbeat operations
+        if not quiet:
+            logging.debug(f"Opik span started: {name}")
+        return {"name": name, "tags": span_tags, "start_time": start_time}
+
+    def finish_span(span: Optional[dict], duration: float) -> None:
+        if span and not quiet:
+            logging.debug(f"Opik span completed: {name} ({duration:.3f}s)")
 
     def decorator(func: Callable) -> Callable:
         if asyncio.iscoroutinefunction(func):
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                # Get settings if not provided
-                trace_settings = settings
-                if trace_settings is None:
-                    try:
-                        from faultmaven.config.settings import get_settings
-                        trace_settings = get_settings()
-                    except:
-                        trace_settings = None
-
-                start_time = time.time()
+                config = get_trace_config(settings)
+                start = time.perf_counter()
 
-                # Runtime check for tracing disable/targeting
-                if not _should_trace_operation(name, trace_settings):
-                    logging.debug(f"Tracing disabled for async function: {name}")
+                # Fast path: not targeted or not sampled
+                if not (config.should_trace(name) and config.sampled()):
                     try:
                         result = await func(*args, **kwargs)
-                        duration = time.time() - start_time
-                        _record_metrics(name, duration, "success_no_trace")
-                        return result
                     except Exception as e:
-                        duration = time.time() - start_time
-                        _record_metrics(name, duration, "error_no_trace")
+                        duration = time.perf_counter() - start
+                        if config.trace_errors and config.should_trace(name):
+                            # Errors are always traced, sampled or not
+                            finish_span(start_span(config, time.time() - duration), duration)
+                            _record_metrics(name, duration, "error")
+                            logging.error(f"Function {name} failed after {duration:.3f}s: {e}")
+                        else:
+                            _record_metrics(name, duration, "error_no_trace")
                         raise
+                    _record_metrics(name, time.perf_counter() - start, "success_no_trace")
+                    return result
 
-                # Create span if Opik is available
-                span = None
-                if OPIK_AVAILABLE:
-                    try:
-                        # Add local Opik headers if using local instance
-                        span_tags = tags or {}
-                        if trace_settings and trace_settings.observability.opik_use_local:
-                            span_tags.update({
-                                "opik_local_host": trace_settings.observability.opik_local_host,
-                                "opik_local_url": trace_settings.observability.opik_local_url
-                            })
-
-                        # Simple span tracking for local Opik instance with protection
-                        def create_simple_span():
-                            return {"name": name, "tags": span_tags, "start_time": start_time}
-
-                        span = create_simple_span()
-                        # Reduce logging noise for heartbeat operations
-                        if not ('heartbeat' in name.lower() or 'update_last_activity' in name.lower()):
-                            logging.debug(f"Opik span started: {name}")
-                    except Exception as e:
-                        logging.warning(f"Failed to create Opik span: {e}")
-
+                span = start_span(config, time.time())
                 try:
-                    # Execute the async function
                     result = await func(*args, **kwargs)
-
-                    # Record success metrics
-                    duration = time.time() - start_time
-                    _record_metrics(name, duration, "success")
-
-                    return result
-
                 except Exception as e:
-                    # Record error metrics
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start
                     _record_metrics(name, duration, "error")
+                    # Log error
+                    logging.error(f"Function {name} failed after {duration:.3f}s: {e}")
+                    finish_span(span, duration)
                     raise
+                duration = time.perf_counter() - start
+                _record_metrics(name, duration, "success")
+                finish_span(span, duration)
+                return result
             return async_wrapper
         else:
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                # Get settings if not provided
-                trace_settings = settings
-                if trace_settings is None:
-                    try:
-                        from faultmaven.config.settings import get_settings
-                        trace_settings = get_settings()
-                    except:
-                        trace_settings = None
-
-                start_time = time.time()
+                config = get_trace_config(settings)
+                start = time.perf_counter()
 
-                # Runtime check for tracing disable/targeting
-                if not _should_trace_operation(name, trace_settings):
-                    logging.debug(f"Tracing disabled for function: {name}")
+                # Fast path: not targeted or not sampled
+                if not (config.should_trace(name) and config.sampled()):
                     try:
                         result = func(*args, **kwargs)
-                        duration = time.time() - start_time
-                        _record_metrics(name, duration, "success_no_trace")
-                        return result
                     except Exception as e:
-                        duration = time.time() - start_time
-                        _record_metrics(name, duration, "error_no_trace")
+                        duration = time.perf_counter() - start
+                        if config.trace_errors and config.should_trace(name):
+                            # Errors are always traced, sampled or not
+                            finish_span(start_span(config, time.time() - duration), duration)
+                            _record_metrics(name, duration, "error")
+                            logging.error(f"Function {name} failed after {duration:.3f}s: {e}")
+                        else:
+                            _record_metrics(name, duration, "error_no_trace")
                         raise
+                    _record_metrics(name, time.perf_counter() - start, "success_no_trace")
+                    return result
 
-                # Create span if Opik is available
-                span = None
-                if OPIK_AVAILABLE:
-                    try:
-                        # Add local Opik headers if using local instance
-                        span_tags = tags or {}
-                        if trace_settings and trace_settings.observability.opik_use_local:
-                            span_tags.update({
-                                "opik_local_host": trace_settings.observability.opik_local_host,
-                                "opik_local_url": trace_settings.observability.opik_local_url
-                            })
-
-                        # Simple span tracking for local Opik instance with protection
-                        def create_simple_span():
-                            return {"name": name, "tags": span_tags, "start_time": start_time}
-
-                        span = create_simple_span()
-                        # Reduce logging noise for heartbeat operations
-                        if not ('heartbeat' in name.lower() or 'update_last_activity' in name.lower()):
-                            logging.debug(f"Opik span started: {name}")
-                    except Exception as e:
-                        logging.warning(f"Failed to create Opik span: {e}")
-
+                span = start_span(config, time.time())
                 try:
-                    # Execute the function
                     result = func(*args, **kwargs)
-
-                    # Record success metrics
-                    duration = time.time() - start_time
-                    _record_metrics(name, duration, "success")
-
-                    return result
-
                 except Exception as e:
-                    # Record error metrics
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start
                     _record_metrics(name, duration, "error")
-
                     # Log error
                     logging.error(f"Function {name} failed after {duration:.3f}s: {e}")
+                    finish_span(span, duration)
                     raise
-
-                finally:
-                    # Finalize span logging
-                    if span and OPIK_AVAILABLE:
-                        duration = time.time() - start_time
-                        # Reduce logging noise for heartbeat operations
-                        if not ('heartbeat' in span.get('name', '').lower() or 'update_last_activity' in span.get('name', '').lower()):
-                            logging.debug(f"Opik span completed: {span.get('name', 'unknown')} ({duration:.3f}s)")
+                duration = time.perf_counter() - start
+                _record_metrics(name, duration, "success")
+                finish_span(span, duration)
+                return result
 
             return wrapper
 
@@ -660,6 +711,10 @@ def _record_metrics(function_name: str, duration: float, status: str):
     """
     Record metrics for function calls
 
+    LLM calls are measured per provider and model by the provider registry
+    (faultmaven_llm_* metrics), so traced ``llm_*`` functions are recorded as
+    generic functions rather than parsing a provider out of the function name.
+
     Args:
         function_name: Name of the function
         duration: Duration in seconds
@@ -669,42 +724,17 @@ def _record_metrics(function_name: str, duration: float, status: str):
         return
 
     try:
-        # Determine metric type based on function name
-        if function_name.startswith("llm_"):
-            # LLM metrics
-            provider = (
-                function_name.split("_")[1] if "_" in function_name else "unknown"
-            )
-            model = (
-                function_name.split("_")[2]
-                if len(function_name.split("_")) > 2
-                else "unknown"
-            )
-
-            LLM_REQUEST_COUNTER.labels(
-                provider=provider, model=model, status=status
-            ).inc()
-
-            LLM_REQUEST_DURATION.labels(provider=provider, model=model).observe(
-                duration
-            )
-
-        elif function_name.startswith("api_"):
+        if function_name.startswith("api_"):
             # API metrics
-            endpoint = function_name.replace("api_", "")
+            endpoint = function_name[4:]
             method = "POST"  # Default, could be extracted from function name
 
-            REQUEST_COUNTER.labels(
-                endpoint=endpoint, method=method, status=status
-            ).inc()
-
-            REQUEST_DURATION.labels(endpoint=endpoint, method=method).observe(duration)
+            _child(REQUEST_COUNTER, endpoint, method, status).inc()
+            _child(REQUEST_DURATION, endpoint, method).observe(duration)
 
         else:
             # Generic function metrics
-            GENERIC_FUNCTION_DURATION.labels(
-                function_name=function_name, status=status
-            ).observe(duration)
+            _child(GENERIC_FUNCTION_DURATION, function_name, status).observe(duration)
 
     except Exception as e:
         logging.warning(f"Failed to record metrics: {e}")
@@ -722,14 +752,8 @@ def create_span(name: str, tags: Optional[dict] = None, settings=None):
     Returns:
         Span context manager
     """
-    # Get settings if not provided
-    if settings is None:
-        try:
-            from faultmaven.config.settings import get_settings
-            settings = get_settings()
-        except:
-            settings = None
-    
+    config = get_trace_config(settings)
+
     class DummySpan:
         def __enter__(self):
             return self
@@ -737,8 +761,7 @@ def create_span(name: str, tags: Optional[dict] = None, settings=None):
             pass
     
     # Runtime check for tracing disable/targeting
-    if not _should_trace_operation(name, settings):
-        logging.debug(f"Tracing disabled for span: {name}")
+    if not (config.should_trace(name) and config.sampled()):
         return DummySpan()
     
     if not OPIK_AVAILABLE:
@@ -757,12 +780,8 @@ def create_span(name: str, tags: Optional[dict] = None, settings=None):
             def __exit__(self, exc_type, exc_val, exc_tb):
                 pass
         
-        span_tags = tags or {}
-        if settings and settings.observability.opik_use_local:
-            span_tags.update({
-                "opik_local_host": settings.observability.opik_local_host,
-                "opik_local_url": settings.observability.opik_local_url
-            })
+        span_tags = dict(tags or {})
+        span_tags.update(config.span_tags)
         
         return ProtectedSpan(name, span_tags)
         
@@ -801,55 +820,7 @@ def _should_trace_operation(operation_name: str, settings=None) -> bool:
     Returns:
         True if tracing should be enabled, False otherwise
     """
-    # Get settings if not provided
-    if settings is None:
-        try:
-            from faultmaven.config.settings import get_settings
-            settings = get_settings()
-        except:
-            # If settings can't be loaded, default to enabled
-            return True
-    
-    # Global disable check
-    if settings.observability.opik_track_disable:
-        return False
-    
-    # Get current request context for targeted tracing
-    try:
-        from faultmaven.infrastructure.logging.coordinator import request_context
-        context = request_context.get()
-    except:
-        context = None
-    
-    # Check for targeted user tracing
-    target_users = settings.observability.opik_track_users.strip()
-    if target_users:
-        target_user_list = [u.strip() for u in target_users.split(",") if u.strip()]
-        if target_user_list:
-            if not context or not context.user_id:
-                return False  # No user context, but targeting specific users
-            if context.user_id not in target_user_list:
-                return False  # User not in target list
-    
-    # Check for targeted session tracing
-    target_sessions = settings.observability.opik_track_sessions.strip()
-    if target_sessions:
-        target_session_list = [s.strip() for s in target_sessions.split(",") if s.strip()]
-        if target_session_list:
-            if not context or not context.session_id:
-                return False  # No session context, but targeting specific sessions
-            if context.session_id not in target_session_list:
-                return False  # Session not in target list
-    
-    # Check for targeted operation tracing
-    target_operations = settings.observability.opik_track_operations.strip()
-    if target_operations:
-        target_op_list = [op.strip() for op in target_operations.split(",") if op.strip()]
-        if target_op_list:
-            if operation_name not in target_op_list:
-                return False  # Operation not in target list
-    
-    return True  # Default to enabled if no restrictions apply
+    return get_trace_config(settings).should_trace(operation_name)
 
 
 def record_exception(exception: Exception, tags: Optional[dict] = None):
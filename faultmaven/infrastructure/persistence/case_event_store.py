@@ -0,0 +1,398 @@
+"""Case event store and event-sourced case repository.
+
+Saving a case rewrites the whole aggregate, so the cost of persisting a turn
+grew with the age of the case. ``EventSourcedCaseRepository`` wraps a case
+repository and persists a turn as one append of its ``CaseEvent`` objects
+(see ``faultmaven.models.case_events``); every ``snapshot_interval`` turns it
+saves the full case instead, which writes a compacted snapshot. Loading a
+case reads the snapshot and replays the events appended after it.
+
+Implementations:
+- InMemoryCaseEventStore: events and snapshots held as JSON text
+- PostgreSQLCaseEventStore: case_events / case_snapshots tables
+  (docs/schema/006_case_event_log.sql)
+
+Usage:
+    repository = EventSourcedCaseRepository(
+        PostgreSQLHybridCaseRepository(session),
+        PostgreSQLCaseEventStore(session),
+        snapshot_interval=50,
+    )
+    await repository.append_events(case, tracker.events(case))
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from faultmaven.infrastructure.persistence.case_repository import (
+    CaseRepository,
+    CaseSearchPage,
+    CaseSummaryPage,
+    RepositoryException,
+)
+from faultmaven.models.case import Case, CaseStatus
+from faultmaven.models.case_events import (
+    APPENDED_LISTS,
+    CaseChangeTracker,
+    CaseEvent,
+    CaseEventType,
+    encode_case_json,
+    replay_case_events,
+    snapshot_case,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CaseEventStore(ABC):
+    """Append-only case events plus the latest snapshot of each case"""
+
+    @abstractmethod
+    async def append(self, case: Case, events: List[CaseEvent]) -> None:
+        """Append one turn's events (``case`` is the state after them)"""
+        pass
+
+    @abstractmethod
+    async def save_snapshot(self, case: Case) -> None:
+        """Store the full case; later loads replay only events appended after it"""
+        pass
+
+    @abstractmethod
+    async def load(self, case_id: str) -> Optional[Tuple[Dict[str, Any], List[CaseEvent]]]:
+        """Latest snapshot and the events after it, oldest first; None without a snapshot"""
+        pass
+
+    @abstractmethod
+    async def delete(self, case_id: str) -> None:
+        pass
+
+
+class InMemoryCaseEventStore(CaseEventStore):
+    """Events and snapshots kept as JSON text, as a database stores them"""
+
+    def __init__(self):
+        self._events: Dict[str, List[str]] = defaultdict(list)
+        self._snapshots: Dict[str, str] = {}
+
+    async def append(self, case: Case, events: List[CaseEvent]) -> None:
+        self._events[case.case_id].extend(encode_case_json(event.to_dict()) for event in events)
+
+    async def save_snapshot(self, case: Case) -> None:
+        self._snapshots[case.case_id] = encode_case_json(snapshot_case(case))
+        # Events up to the snapshot are compacted away
+        self._events.pop(case.case_id, None)
+
+    async def load(self, case_id: str) -> Optional[Tuple[Dict[str, Any], List[CaseEvent]]]:
+        snapshot = self._snapshots.get(case_id)
+        if snapshot is None:
+            return None
+        events = [CaseEvent.from_dict(json.loads(event)) for event in self._events.get(case_id, [])]
+        return json.loads(snapshot), events
+
+    async def delete(self, case_id: str) -> None:
+        self._events.pop(case_id, None)
+        self._snapshots.pop(case_id, None)
+
+
+class PostgreSQLCaseEventStore(CaseEventStore):
+    """case_events / case_snapshots tables next to the hybrid case schema
+
+    Appending a turn inserts the events and updates what the wrapped
+    PostgreSQLHybridCaseRepository reads for listing, search and analytics,
+    in one transaction: the summary columns of the ``cases`` row, the
+    title, description and document columns the turn changed, and the
+    evidence, hypothesis, solution, uploaded file and status transition rows
+    it added or updated. Events are kept after compaction; the snapshot
+    records the last event it covers.
+    """
+
+    # cases columns a FIELDS_UPDATED event can change, and whether they are JSONB
+    FIELD_COLUMNS = {
+        "title": False,
+        "description": False,
+        "consulting": True,
+        "problem_verification": True,
+        "working_conclusion": True,
+        "root_cause_conclusion": True,
+        "path_selection": True,
+        "degraded_mode": True,
+        "escalation_state": True,
+        "documentation": True,
+        "progress": True,
+    }
+
+    def __init__(self, db_session):
+        self.db = db_session
+
+    async def append(self, case: Case, events: List[CaseEvent]) -> None:
+        from sqlalchemy import text
+        from faultmaven.infrastructure.persistence.postgresql_hybrid_case_repository import (
+            PostgreSQLHybridCaseRepository,
+        )
+
+        changed = [
+            column for event in events if event.event_type == CaseEventType.FIELDS_UPDATED
+            for column in event.payload["fields"] if column in self.FIELD_COLUMNS
+        ]
+        changed = list(dict.fromkeys(changed))
+        changed_sql = "".join(
+            f"{column} = CAST(:{column} AS jsonb),\n" if self.FIELD_COLUMNS[column] else f"{column} = :{column},\n"
+            for column in changed
+        )
+        query = text(f"""
+            WITH appended AS (
+                INSERT INTO case_events (case_id, event_type, payload, created_at)
+                SELECT :case_id, e.event ->> 'event_type', e.event -> 'payload', (e.event ->> 'created_at')::timestamptz
+                FROM jsonb_array_elements(CAST(:events AS jsonb)) WITH ORDINALITY AS e(event, position)
+                ORDER BY e.position
+                RETURNING 1
+            )
+            UPDATE cases SET
+                {changed_sql}status = :status,
+                current_turn = :current_turn,
+                turns_without_progress = :turns_without_progress,
+                milestones_completed = :milestones_completed,
+                updated_at = :updated_at,
+                last_activity_at = :last_activity_at
+            WHERE case_id = :case_id
+        """)
+        columns = PostgreSQLHybridCaseRepository._case_columns(case)
+        rows = PostgreSQLHybridCaseRepository(self.db)
+        updated_hypotheses = {
+            event.payload["hypothesis"]["hypothesis_id"] for event in events
+            if event.event_type == CaseEventType.HYPOTHESIS_UPDATED
+        }
+        try:
+            await self.db.execute(query, {
+                "case_id": case.case_id,
+                "events": encode_case_json([event.to_dict() for event in events]),
+                "status": case.status.value,
+                "current_turn": case.current_turn,
+                "turns_without_progress": case.turns_without_progress,
+                "milestones_completed": len(case.progress.completed_milestones),
+                "updated_at": case.updated_at,
+                "last_activity_at": case.last_activity_at,
+                **{column: columns[column] for column in changed},
+            })
+            evidence = _appended(case, events, "evidence")
+            if evidence:
+                await rows._upsert_evidence(case.case_id, evidence, prune=False)
+            if updated_hypotheses:
+                await rows._upsert_hypotheses(
+                    case.case_id,
+                    {hid: case.hypotheses[hid] for hid in updated_hypotheses if hid in case.hypotheses},
+                    prune=False,
+                )
+            solutions = _appended(case, events, "solutions")
+            if solutions:
+                await rows._upsert_solutions(case.case_id, solutions, prune=False)
+            uploaded_files = _appended(case, events, "uploaded_files")
+            if uploaded_files:
+                await rows._upsert_uploaded_files(case.case_id, uploaded_files, prune=False)
+            transitions = sum(
+                len(event.payload.get("transitions", ())) for event in events
+                if event.event_type == CaseEventType.STATUS_CHANGED
+            )
+            if transitions:
+                await rows._append_status_transitions(case.case_id, case.status_history[-transitions:])
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise RepositoryException(f"Failed to append events for case {case.case_id}: {e}") from e
+
+    async def save_snapshot(self, case: Case) -> None:
+        from sqlalchemy import text
+
+        query = text("""
+            INSERT INTO case_snapshots (case_id, snapshot, last_event_id, current_turn, created_at)
+            VALUES (
+                :case_id, CAST(:snapshot AS jsonb),
+                (SELECT COALESCE(MAX(event_id), 0) FROM case_events WHERE case_id = :case_id),
+                :current_turn, NOW()
+            )
+            ON CONFLICT (case_id) DO UPDATE SET
+                snapshot = EXCLUDED.snapshot,
+                last_event_id = EXCLUDED.last_event_id,
+                current_turn = EXCLUDED.current_turn,
+                created_at = EXCLUDED.created_at
+        """)
+        try:
+            await self.db.execute(query, {
+                "case_id": case.case_id,
+                "snapshot": encode_case_json(snapshot_case(case)),
+                "current_turn": case.current_turn,
+            })
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise RepositoryException(f"Failed to snapshot case {case.case_id}: {e}") from e
+
+    async def load(self, case_id: str) -> Optional[Tuple[Dict[str, Any], List[CaseEvent]]]:
+        from sqlalchemy import text
+
+        query = text("""
+            SELECT
+                s.snapshot,
+                COALESCE((
+                    SELECT jsonb_agg(jsonb_build_object(
+                        'event_type', e.event_type,
+                        'payload', e.payload,
+                        'created_at', e.created_at
+                    ) ORDER BY e.event_id)
+                    FROM case_events e
+                    WHERE e.case_id = s.case_id AND e.event_id > s.last_event_id
+                ), '[]'::jsonb) AS events
+            FROM case_snapshots s
+            WHERE s.case_id = :case_id
+        """)
+        try:
+            result = await self.db.execute(query, {"case_id": case_id})
+            row = result.fetchone()
+        except Exception as e:
+            raise RepositoryException(f"Failed to load events for case {case_id}: {e}") from e
+        if not row:
+            return None
+        snapshot = json.loads(row.snapshot) if isinstance(row.snapshot, str) else row.snapshot
+        events = json.loads(row.events) if isinstance(row.events, str) else row.events
+        return snapshot, [CaseEvent.from_dict(event) for event in events]
+
+    async def delete(self, case_id: str) -> None:
+        from sqlalchemy import text
+
+        try:
+            await self.db.execute(text("DELETE FROM case_snapshots WHERE case_id = :case_id"), {"case_id": case_id})
+            await self.db.execute(text("DELETE FROM case_events WHERE case_id = :case_id"), {"case_id": case_id})
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise RepositoryException(f"Failed to delete events for case {case_id}: {e}") from e
+
+
+def _appended(case: Case, events: List[CaseEvent], name: str) -> List[Any]:
+    """Items the events appended to the case list ``name`` (append-only, so its tail)"""
+    count = sum(event.event_type == APPENDED_LISTS[name] for event in events)
+    return getattr(case, name)[-count:] if count else []
+
+
+class EventSourcedCaseRepository(CaseRepository):
+    """Case repository that persists turns as events and loads snapshot + tail
+
+    ``save`` writes the full case to the wrapped repository and snapshots
+    it. ``append_events`` appends a turn's events, falling back to ``save``
+    every ``snapshot_interval`` turns and for cases that have no snapshot yet
+    (created before the event log was enabled). Listing, search and the
+    other queries go to the wrapped repository: PostgreSQLCaseEventStore
+    updates its tables with every append. InMemoryCaseEventStore does not,
+    so with it those queries see cases as of their last full save.
+
+    Once a case has a snapshot ``get`` no longer reads the wrapped
+    repository, so ``add_message`` and ``update_activity_timestamp`` append
+    the change as events as well as writing it through.
+    """
+
+    def __init__(self, base: CaseRepository, event_store: CaseEventStore, snapshot_interval: int = 50):
+        self.base = base
+        self.event_store = event_store
+        self.snapshot_interval = max(1, snapshot_interval)
+        # Cases known to have a snapshot, so the first append needs no lookup
+        self._snapshotted: Set[str] = set()
+
+    async def save(self, case: Case) -> Case:
+        saved = await self.base.save(case)
+        await self.event_store.save_snapshot(saved)
+        self._snapshotted.add(saved.case_id)
+        return saved
+
+    async def append_events(self, case: Case, events: List[CaseEvent]) -> Case:
+        """Persist one turn's changes to ``case``"""
+        if case.case_id not in self._snapshotted or case.current_turn % self.snapshot_interval == 0:
+            return await self.save(case)
+        await self.event_store.append(case, events)
+        return case
+
+    async def get(self, case_id: str) -> Optional[Case]:
+        loaded = await self.event_store.load(case_id)
+        if loaded is None:
+            return await self.base.get(case_id)
+        snapshot, events = loaded
+        self._snapshotted.add(case_id)
+        return replay_case_events(snapshot, events)
+
+    async def list(
+        self,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        status: Optional[CaseStatus] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> tuple[List[Case], int]:
+        return await self.base.list(user_id, organization_id, status, limit, offset)
+
+    async def list_summaries(self, *args, **kwargs) -> CaseSummaryPage:
+        return await self.base.list_summaries(*args, **kwargs)
+
+    async def delete(self, case_id: str) -> bool:
+        deleted = await self.base.delete(case_id)
+        await self.event_store.delete(case_id)
+        self._snapshotted.discard(case_id)
+        return deleted
+
+    async def search(self, *args, **kwargs) -> tuple[List[Case], int]:
+        return await self.base.search(*args, **kwargs)
+
+    async def search_summaries(self, *args, **kwargs) -> CaseSearchPage:
+        return await self.base.search_summaries(*args, **kwargs)
+
+    async def add_message(self, case_id: str, message_dict: dict) -> bool:
+        if not await self.base.add_message(case_id, message_dict):
+            return False
+
+        def add(case: Case) -> None:
+            case.messages.append(message_dict)
+            case.message_count += 1
+            case.last_activity_at = datetime.now(timezone.utc)
+        await self._append_change(case_id, add)
+        return True
+
+    async def get_messages(self, *args, **kwargs) -> List[dict]:
+        return await self.base.get_messages(*args, **kwargs)
+
+    async def update_activity_timestamp(self, case_id: str) -> bool:
+        if not await self.base.update_activity_timestamp(case_id):
+            return False
+
+        def touch(case: Case) -> None:
+            case.last_activity_at = datetime.now(timezone.utc)
+        await self._append_change(case_id, touch)
+        return True
+
+    async def get_analytics(self, case_id: str) -> Dict[str, Any]:
+        return await self.base.get_analytics(case_id)
+
+    async def cleanup_expired(self, max_age_days: int = 90, batch_size: int = 100) -> int:
+        return await self.base.cleanup_expired(max_age_days, batch_size)
+
+    async def begin_transaction(self):
+        return await self.base.begin_transaction()
+
+    async def _append_change(self, case_id: str, change: Callable[[Case], None]) -> None:
+        """Append the events for a change written to the wrapped repository only"""
+        loaded = await self.event_store.load(case_id)
+        if loaded is None:
+            return  # get() reads the wrapped repository
+        case = replay_case_events(*loaded)
+        tracker = CaseChangeTracker(case)
+        change(case)
+        await self.event_store.append(case, tracker.events(case))
+
+    def __getattr__(self, name: str) -> Any:
+        # Repository-specific extras (share_case, get_case_participants, ...).
+        # They keep state outside the case aggregate (case_participants), so
+        # get() does not need events for them.
+        if name == "base":
+            raise AttributeError(name)
+        return getattr(self.base, name)
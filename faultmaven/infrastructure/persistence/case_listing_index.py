@@ -0,0 +1,223 @@
+"""In-memory case listing index.
+
+Secondary indexes for InMemoryCaseRepository, maintained on write so listing
+does not scan and sort every stored case:
+- Per scope (all cases, each user, each organization) the case keys sorted
+  by updated_at and by last_activity_at, for newest-first pages and keyset
+  cursors
+- Case IDs per status
+
+Entries are immutable snapshots of the indexed fields taken when a case is
+saved (copy-on-write: a save replaces the snapshot). Queries filter on the
+snapshots, never on the stored case objects, so later in-place edits of an
+unsaved case cannot corrupt the index.
+
+Usage:
+    index = CaseListingIndex()
+    index.add(case)
+    for entry in index.newest_first("updated_at", user_id="user-1"):
+        ...
+"""
+
+import bisect
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from faultmaven.models.case import Case, CaseStatus
+
+
+ORDERINGS = ("updated_at", "last_activity_at")
+
+# (ordering timestamp, case_id), ascending
+_Key = Tuple[datetime, str]
+
+
+@dataclass(frozen=True)
+class IndexedCase:
+    """Indexed fields of a case as of its last save"""
+
+    case_id: str
+    user_id: str
+    organization_id: str
+    status: CaseStatus
+    current_turn: int
+    updated_at: datetime
+    last_activity_at: datetime
+
+    @classmethod
+    def from_case(cls, case: Case) -> "IndexedCase":
+        return cls(
+            case_id=case.case_id,
+            user_id=case.user_id,
+            organization_id=case.organization_id,
+            status=case.status,
+            current_turn=case.current_turn,
+            updated_at=case.updated_at,
+            last_activity_at=case.last_activity_at,
+        )
+
+    def key(self, ordering: str) -> _Key:
+        return getattr(self, ordering), self.case_id
+
+    def matches(
+        self,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        status: Optional[CaseStatus] = None,
+        include_empty: bool = True,
+        include_archived: bool = True
+    ) -> bool:
+        return (
+            (not user_id or self.user_id == user_id)
+            and (not organization_id or self.organization_id == organization_id)
+            and (status is None or self.status == status)
+            and (include_empty or self.current_turn > 0)
+            and (include_archived or self.status != CaseStatus.CLOSED)
+        )
+
+
+class CaseListingIndex:
+    """Scope orderings and status sets over IndexedCase snapshots.
+
+    Thread-safe. Adding a case costs O(log n) comparisons plus a list
+    insertion per scope and ordering; paging costs O(log n + scanned).
+    """
+
+    # Keys read per lock acquisition while paging
+    SCAN_CHUNK = 256
+
+    def __init__(self):
+        self._entries: Dict[str, IndexedCase] = {}
+        # (ordering, scope) -> sorted keys; scope is ("all",), ("user", id) or ("org", id)
+        self._ordered: Dict[Tuple[str, tuple], List[_Key]] = defaultdict(list)
+        self._by_status: Dict[CaseStatus, Set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, case_id: str) -> Optional[IndexedCase]:
+        return self._entries.get(case_id)
+
+    def add(self, case: Case) -> None:
+        """Index ``case``, replacing its previous snapshot"""
+        entry = IndexedCase.from_case(case)
+        with self._lock:
+            if self._entries.get(case.case_id) == entry:
+                return
+            self._remove(case.case_id)
+            self._entries[entry.case_id] = entry
+            for ordering in ORDERINGS:
+                for scope in self._scopes(entry):
+                    bisect.insort(self._ordered[(ordering, scope)], entry.key(ordering))
+            self._by_status[entry.status].add(entry.case_id)
+
+    def remove(self, case_id: str) -> None:
+        with self._lock:
+            self._remove(case_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._ordered.clear()
+            self._by_status.clear()
+
+    def newest_first(
+        self,
+        ordering: str,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        before: Optional[_Key] = None
+    ) -> Iterator[IndexedCase]:
+        """Entries of the narrowest scope, newest first, strictly before ``before``
+
+        The scope is the user's cases when user_id is given, else the
+        organization's, else all cases; callers filter the rest with
+        IndexedCase.matches. Keys are read in chunks under the lock, so a
+        page costs what it scans, not the size of the scope.
+        """
+        scope = (ordering, self._scope(user_id, organization_id))
+        while True:
+            with self._lock:
+                keys = self._ordered.get(scope, [])
+                end = bisect.bisect_left(keys, before) if before is not None else len(keys)
+                chunk = keys[max(end - self.SCAN_CHUNK, 0):end]
+                entries = [self._entries[case_id] for _, case_id in chunk]
+            if not chunk:
+                return
+            yield from reversed(entries)
+            before = chunk[0]
+
+    def count(
+        self,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        status: Optional[CaseStatus] = None,
+        include_empty: bool = True,
+        include_archived: bool = True
+    ) -> int:
+        """Number of cases matching the filters
+
+        O(1) when the filters are just a scope (or just a status); otherwise
+        checks the smaller of the scope and the status set.
+        """
+        with self._lock:
+            scope_keys = self._ordered.get((ORDERINGS[0], self._scope(user_id, organization_id)), [])
+            status_ids = self._by_status.get(status, set()) if status is not None else None
+            only_scope = (not user_id or not organization_id) and include_empty and include_archived
+            if only_scope and status_ids is None:
+                return len(scope_keys)
+            if only_scope and not user_id and not organization_id:
+                return len(status_ids)
+
+            if status_ids is not None and len(status_ids) < len(scope_keys):
+                candidates = list(status_ids)
+            else:
+                candidates = [case_id for _, case_id in scope_keys]
+            entries = [self._entries[case_id] for case_id in candidates]
+        return sum(
+            entry.matches(user_id, organization_id, status, include_empty, include_archived)
+            for entry in entries
+        )
+
+    def scope_case_ids(self, user_id: Optional[str] = None, organization_id: Optional[str] = None) -> List[str]:
+        """Case IDs of the narrowest scope for the filters (unordered use)"""
+        with self._lock:
+            keys = self._ordered.get((ORDERINGS[0], self._scope(user_id, organization_id)), [])
+            return [case_id for _, case_id in keys]
+
+    def status_case_ids(self, status: CaseStatus) -> List[str]:
+        with self._lock:
+            return list(self._by_status.get(status, ()))
+
+    @staticmethod
+    def _scope(user_id: Optional[str], organization_id: Optional[str]) -> tuple:
+        if user_id:
+            return ("user", user_id)
+        if organization_id:
+            return ("org", organization_id)
+        return ("all",)
+
+    @staticmethod
+    def _scopes(entry: IndexedCase) -> Tuple[tuple, ...]:
+        return ("all",), ("user", entry.user_id), ("org", entry.organization_id)
+
+    def _remove(self, case_id: str) -> None:
+        entry = self._entries.pop(case_id, None)
+        if entry is None:
+            return
+        for ordering in ORDERINGS:
+            key = entry.key(ordering)
+            for scope in self._scopes(entry):
+                keys = self._ordered.get((ordering, scope))
+                if not keys:
+                    continue
+                position = bisect.bisect_left(keys, key)
+                if position < len(keys) and keys[position] == key:
+                    del keys[position]
+                if not keys:
+                    del self._ordered[(ordering, scope)]
+        self._by_status[entry.status].discard(case_id)
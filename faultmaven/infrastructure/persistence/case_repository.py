@@ -4,30 +4,95 @@ This module provides the repository pattern for Case domain model persistence.
 It abstracts database operations and provides clean interfaces for the service layer.
 """
 
+import base64
+import heapq
 import json
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 from faultmaven.models.case import (
     Case,
     CaseStatus,
-    InvestigationProgress,
-    TurnProgress,
-    UploadedFile,
-    Evidence,
-    Hypothesis,
-    Solution,
-    ConsultingData,
-    ProblemVerification,
-    WorkingConclusion,
-    RootCauseConclusion,
-    DegradedMode,
-    EscalationState,
-    DocumentationData,
-    PathSelection,
-    CaseStatusTransition,
+    hydrate_case_columns,
 )
+from faultmaven.models.api_models import CaseSummary, CaseSummaryPage
+from faultmaven.models.case_events import CaseEvent
+from faultmaven.infrastructure.persistence.case_listing_index import CaseListingIndex
+from faultmaven.infrastructure.persistence.case_search_index import CaseSearchIndex
+
+
+# ============================================================
+# Case Listing
+# ============================================================
+
+@dataclass
+class CaseSearchPage:
+    """Case search results as summaries, best match first."""
+
+    summaries: List[CaseSummary]  # highlight set where the backend provides one
+    total_count: int
+
+
+def encode_case_cursor(updated_at: datetime, case_id: str) -> str:
+    """Keyset cursor pointing just after the given case."""
+    raw = json.dumps([updated_at.isoformat(), case_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_case_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor from encode_case_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        updated_at, case_id = json.loads(raw)
+        return datetime.fromisoformat(updated_at), str(case_id)
+    except Exception as e:
+        raise ValueError(f"Invalid case cursor: {cursor!r}") from e
+
+
+def paginate_case_summaries(
+    cases: List[Case],
+    include_empty: bool = True,
+    include_archived: bool = True,
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None
+) -> CaseSummaryPage:
+    """
+    Filter, order and page already-loaded cases.
+
+    Used by repositories without a dedicated summary query. Ordering and
+    cursor semantics match PostgreSQLHybridCaseRepository.list_summaries.
+    """
+    if not include_empty:
+        cases = [c for c in cases if c.current_turn > 0]
+    if not include_archived:
+        cases = [c for c in cases if c.status != CaseStatus.CLOSED]
+    cases = sorted(cases, key=lambda c: (c.updated_at, c.case_id), reverse=True)
+    total_count = len(cases)
+
+    if cursor:
+        position = decode_case_cursor(cursor)
+        cases = [c for c in cases if (c.updated_at, c.case_id) < position]
+        offset = 0
+
+    page = cases[offset:offset + limit]
+    next_cursor = None
+    if len(cases) > offset + limit and page:
+        next_cursor = encode_case_cursor(page[-1].updated_at, page[-1].case_id)
+
+    return CaseSummaryPage(
+        summaries=[CaseSummary.from_case(case) for case in page],
+        total_count=total_count,
+        next_cursor=next_cursor
+    )
 
 
 # ============================================================
@@ -59,6 +124,25 @@ class CaseRepository(ABC):
         """
         pass
 
+    async def append_events(self, case: Case, events: List[CaseEvent]) -> Case:
+        """
+        Persist one investigation turn's changes to a case.
+
+        Default implementation saves the full case; event-log repositories
+        append the turn's events instead.
+
+        Args:
+            case: Case after the turn
+            events: The turn's changes (CaseChangeTracker.events)
+
+        Returns:
+            Saved case
+
+        Raises:
+            RepositoryException: If saving fails
+        """
+        return await self.save(case)
+
     @abstractmethod
     async def get(self, case_id: str) -> Optional[Case]:
         """
@@ -102,6 +186,61 @@ class CaseRepository(ABC):
         """
         pass
 
+    async def list_summaries(
+        self,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        status: Optional[CaseStatus] = None,
+        include_empty: bool = True,
+        include_archived: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> CaseSummaryPage:
+        """
+        List case summaries for list views.
+
+        Ordered by updated_at descending (case_id breaks ties). Pass a page's
+        next_cursor as ``cursor`` for keyset pagination; ``offset`` is
+        ignored when a cursor is given. total_count covers every case
+        matching the filters, not just this page.
+
+        Default implementation loads full cases through list(); backends
+        should override it with a projection query.
+
+        Args:
+            user_id: Filter by user
+            organization_id: Filter by organization
+            status: Filter by status
+            include_empty: Include cases with current_turn == 0
+            include_archived: Include closed cases
+            limit: Maximum results
+            offset: Pagination offset
+            cursor: Keyset cursor from a previous page
+
+        Returns:
+            CaseSummaryPage
+
+        Raises:
+            ValueError: If the cursor is malformed
+            RepositoryException: If query fails
+        """
+        cases, _ = await self.list(
+            user_id=user_id,
+            organization_id=organization_id,
+            status=status,
+            limit=2 ** 31 - 1,
+            offset=0
+        )
+        return paginate_case_summaries(
+            cases,
+            include_empty=include_empty,
+            include_archived=include_archived,
+            limit=limit,
+            offset=offset,
+            cursor=cursor
+        )
+
     @abstractmethod
     async def delete(self, case_id: str) -> bool:
         """
@@ -143,6 +282,47 @@ class CaseRepository(ABC):
         """
         pass
 
+    async def search_summaries(
+        self,
+        query: str,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        status: Optional[CaseStatus] = None,
+        limit: int = 20
+    ) -> CaseSearchPage:
+        """
+        Search cases by text query, returning ranked summaries.
+
+        Default implementation loads full cases through search() and has no
+        highlights; backends should override it with an indexed query.
+
+        Args:
+            query: Search query
+            user_id: Filter by user
+            organization_id: Filter by organization
+            status: Filter by status
+            limit: Maximum results
+
+        Returns:
+            CaseSearchPage
+
+        Raises:
+            RepositoryException: If search fails
+        """
+        cases, total_count = await self.search(
+            query,
+            user_id=user_id,
+            organization_id=organization_id,
+            limit=limit if status is None else 2 ** 31 - 1
+        )
+        if status is not None:
+            cases = [c for c in cases if c.status == status]
+            total_count = len(cases)
+        return CaseSearchPage(
+            summaries=[CaseSummary.from_case(case) for case in cases[:limit]],
+            total_count=total_count
+        )
+
     @abstractmethod
     async def add_message(self, case_id: str, message_dict: dict) -> bool:
         """
@@ -274,23 +454,36 @@ class InMemoryCaseRepository(CaseRepository):
     """
     In-memory case repository for testing and development.
 
-    Data stored in dictionary, not persistent across restarts.
+    Data stored in dictionary, not persistent across restarts. Saved cases
+    are stored as-is (no copies); listing is served by a CaseListingIndex
+    (user, organization and status indexes, updated_at / last_activity_at
+    ordering) and search by a CaseSearchIndex, both maintained on write.
     """
 
     def __init__(self):
         """Initialize empty in-memory store."""
         self._cases: Dict[str, Case] = {}
+        self._listing_index = CaseListingIndex()
+        self._search_index = CaseSearchIndex()
 
     async def save(self, case: Case) -> Case:
         """Save case to memory."""
         # Update timestamp
         case.updated_at = datetime.now(case.updated_at.tzinfo)
 
-        # Store (deep copy to simulate persistence)
         self._cases[case.case_id] = case
+        self._index(case)
 
         return case
 
+    def _index(self, case: Case) -> None:
+        self._listing_index.add(case)
+        self._search_index.add(case)
+
+    def _unindex(self, case_id: str) -> None:
+        self._listing_index.remove(case_id)
+        self._search_index.remove(case_id)
+
     async def get(self, case_id: str) -> Optional[Case]:
         """Get case from memory."""
         return self._cases.get(case_id)
@@ -303,33 +496,60 @@ class InMemoryCaseRepository(CaseRepository):
         limit: int = 50,
         offset: int = 0
     ) -> tuple[List[Case], int]:
-        """List cases with filters."""
-        # Filter cases
-        filtered = list(self._cases.values())
-
-        if user_id:
-            filtered = [c for c in filtered if c.user_id == user_id]
-
-        if organization_id:
-            filtered = [c for c in filtered if c.organization_id == organization_id]
-
-        if status:
-            filtered = [c for c in filtered if c.status == status]
-
-        # Sort by last_activity_at descending
-        filtered.sort(key=lambda c: c.last_activity_at, reverse=True)
-
-        total_count = len(filtered)
-
-        # Paginate
-        paginated = filtered[offset:offset + limit]
+        """List cases with filters, most recent activity first."""
+        entries = (
+            entry
+            for entry in self._listing_index.newest_first("last_activity_at", user_id, organization_id)
+            if entry.matches(user_id, organization_id, status)
+        )
+        page = islice(entries, offset, offset + limit)
+        return (
+            [self._cases[entry.case_id] for entry in page],
+            self._listing_index.count(user_id, organization_id, status)
+        )
 
-        return paginated, total_count
+    async def list_summaries(
+        self,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        status: Optional[CaseStatus] = None,
+        include_empty: bool = True,
+        include_archived: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> CaseSummaryPage:
+        """List case summaries from the listing index (see CaseRepository.list_summaries)."""
+        before = None
+        if cursor:
+            before = decode_case_cursor(cursor)
+            offset = 0
+
+        entries = (
+            entry
+            for entry in self._listing_index.newest_first("updated_at", user_id, organization_id, before)
+            if entry.matches(user_id, organization_id, status, include_empty, include_archived)
+        )
+        # One extra entry tells whether there is a next page
+        page = list(islice(entries, offset, offset + limit + 1))
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_case_cursor(page[-1].updated_at, page[-1].case_id)
+
+        return CaseSummaryPage(
+            summaries=[CaseSummary.from_case(self._cases[entry.case_id]) for entry in page],
+            total_count=self._listing_index.count(
+                user_id, organization_id, status, include_empty, include_archived
+            ),
+            next_cursor=next_cursor
+        )
 
     async def delete(self, case_id: str) -> bool:
         """Delete case from memory."""
         if case_id in self._cases:
             del self._cases[case_id]
+            self._unindex(case_id)
             return True
         return False
 
@@ -340,43 +560,49 @@ class InMemoryCaseRepository(CaseRepository):
         organization_id: Optional[str] = None,
         limit: int = 20
     ) -> tuple[List[Case], int]:
-        """Search cases by text query (simple substring match)."""
-        query_lower = query.lower()
-
-        # Filter cases
-        filtered = []
-        for case in self._cases.values():
-            # Search in title and description
-            if (query_lower in case.title.lower() or
-                query_lower in case.description.lower()):
-
-                # Apply user filter
-                if user_id and case.user_id != user_id:
-                    continue
-
-                # Apply org filter
-                if organization_id and case.organization_id != organization_id:
-                    continue
-
-                filtered.append(case)
-
-        # Sort by relevance (simple: contains in title > contains in description)
-        def relevance_score(case: Case) -> int:
-            score = 0
-            if query_lower in case.title.lower():
-                score += 100
-            if query_lower in case.description.lower():
-                score += 10
-            return score
-
-        filtered.sort(key=relevance_score, reverse=True)
-
-        total_count = len(filtered)
+        """Search cases by text query (inverted index)."""
+        return self._ranked_matches(query, user_id, organization_id, None, limit)
 
-        # Limit results
-        limited = filtered[:limit]
-
-        return limited, total_count
+    async def search_summaries(
+        self,
+        query: str,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        status: Optional[CaseStatus] = None,
+        limit: int = 20
+    ) -> CaseSearchPage:
+        """Search cases by text query, returning ranked summaries with highlights."""
+        ranked, total_count = self._ranked_matches(query, user_id, organization_id, status, limit)
+        summaries = []
+        for case in ranked:
+            summary = CaseSummary.from_case(case)
+            summary.highlight = self._search_index.highlight(case.case_id, query)
+            summaries.append(summary)
+        return CaseSearchPage(summaries=summaries, total_count=total_count)
+
+    def _ranked_matches(
+        self,
+        query: str,
+        user_id: Optional[str],
+        organization_id: Optional[str],
+        status: Optional[CaseStatus],
+        limit: int
+    ) -> tuple[List[Case], int]:
+        """Filtered index matches: the best ``limit`` (rank, then updated_at) and the total."""
+        # A user's / organization's cases bound the postings the index walks
+        within = None
+        if user_id or organization_id:
+            within = set(self._listing_index.scope_case_ids(user_id, organization_id))
+        ranks = self._search_index.search(query, within)
+
+        matches = []
+        for case_id, rank in ranks.items():
+            entry = self._listing_index.get(case_id)
+            if entry is not None and entry.matches(user_id, organization_id, status):
+                matches.append((rank, entry.updated_at, entry.case_id))
+
+        best = heapq.nlargest(limit, matches)
+        return [self._cases[case_id] for _, _, case_id in best], len(matches)
 
     async def add_message(self, case_id: str, message_dict: dict) -> bool:
         """Add message to case in memory."""
@@ -389,6 +615,7 @@ class InMemoryCaseRepository(CaseRepository):
         case.messages.append(message_dict)
         case.message_count += 1
         case.last_activity_at = datetime.now(timezone.utc)
+        self._listing_index.add(case)
         return True
 
     async def get_messages(
@@ -413,6 +640,7 @@ class InMemoryCaseRepository(CaseRepository):
             return False
 
         case.last_activity_at = datetime.now(timezone.utc)
+        self._listing_index.add(case)
         return True
 
     async def get_analytics(self, case_id: str) -> Dict[str, Any]:
@@ -455,10 +683,11 @@ class InMemoryCaseRepository(CaseRepository):
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_age_days)
         deleted_count = 0
 
-        # Collect case IDs to delete (avoid modifying dict during iteration)
+        # Collect case IDs to delete (only closed cases can expire)
         to_delete = []
-        for case_id, case in self._cases.items():
-            if case.status == CaseStatus.CLOSED and case.closed_at and case.closed_at < cutoff_date:
+        for case_id in self._listing_index.status_case_ids(CaseStatus.CLOSED):
+            case = self._cases[case_id]
+            if case.closed_at and case.closed_at < cutoff_date:
                 to_delete.append(case_id)
                 if len(to_delete) >= batch_size:
                     break
@@ -466,6 +695,7 @@ class InMemoryCaseRepository(CaseRepository):
         # Delete collected cases
         for case_id in to_delete:
             del self._cases[case_id]
+            self._unindex(case_id)
             deleted_count += 1
 
         return deleted_count
@@ -473,6 +703,8 @@ class InMemoryCaseRepository(CaseRepository):
     def clear(self):
         """Clear all cases (testing utility)."""
         self._cases.clear()
+        self._listing_index.clear()
+        self._search_index.clear()
 
 
 # ============================================================
@@ -880,81 +1112,50 @@ class PostgreSQLCaseRepository(CaseRepository):
         return result.rowcount
 
     def _row_to_case(self, row) -> Case:
-        """Convert database row to Case domain model."""
-        # Parse JSON fields (required fields)
-        progress = InvestigationProgress(**json.loads(row.progress))
-        status_history = [CaseStatusTransition(**t) for t in json.loads(row.status_history)]
-        turn_history = [TurnProgress(**t) for t in json.loads(row.turn_history)]
-        uploaded_files = (
-            [UploadedFile(**f) for f in json.loads(row.uploaded_files)]
-            if row.uploaded_files
-            else []
-        )
-        evidence = [Evidence(**e) for e in json.loads(row.evidence)]
-        hypotheses = {k: Hypothesis(**v) for k, v in json.loads(row.hypotheses).items()}
-        solutions = [Solution(**s) for s in json.loads(row.solutions)]
-
-        # Fields with default_factory - handle NULL from database (old data or manual edits)
-        # These should never be NULL, but database may have NULL from:
-        # 1. Old migrations before field was added
-        # 2. Manual database modifications
-        # 3. Database schema defaults not matching Pydantic defaults
-        consulting = (
-            ConsultingData(**json.loads(row.consulting))
-            if row.consulting
-            else ConsultingData()  # Use Pydantic default
-        )
-        documentation = (
-            DocumentationData(**json.loads(row.documentation))
-            if row.documentation
-            else DocumentationData()  # Use Pydantic default
-        )
+        """Convert database row to Case domain model.
 
-        # Optional fields (explicitly nullable in model)
-        path_selection = PathSelection(**json.loads(row.path_selection)) if row.path_selection else None
-        problem_verification = ProblemVerification(**json.loads(row.problem_verification)) if row.problem_verification else None
-        working_conclusion = WorkingConclusion(**json.loads(row.working_conclusion)) if row.working_conclusion else None
-        root_cause_conclusion = RootCauseConclusion(**json.loads(row.root_cause_conclusion)) if row.root_cause_conclusion else None
-        degraded_mode = DegradedMode(**json.loads(row.degraded_mode)) if row.degraded_mode else None
-        escalation_state = EscalationState(**json.loads(row.escalation_state)) if row.escalation_state else None
-
-        # Parse messages field (list of dicts)
-        messages = json.loads(row.messages) if row.messages else []
-
-        # Reconstruct Case
-        return Case(
-            case_id=row.case_id,
-            user_id=row.user_id,
-            organization_id=row.organization_id,
-            title=row.title,
-            description=row.description,
-            status=CaseStatus(row.status),
-            status_history=status_history,
-            closure_reason=row.closure_reason,
-            progress=progress,
-            current_turn=row.current_turn,
-            turns_without_progress=row.turns_without_progress,
-            turn_history=turn_history,
-            path_selection=path_selection,
-            investigation_strategy=row.investigation_strategy,
-            consulting=consulting,
-            problem_verification=problem_verification,
-            uploaded_files=uploaded_files,
-            evidence=evidence,
-            hypotheses=hypotheses,
-            solutions=solutions,
-            working_conclusion=working_conclusion,
-            root_cause_conclusion=root_cause_conclusion,
-            degraded_mode=degraded_mode,
-            escalation_state=escalation_state,
-            documentation=documentation,
-            messages=messages,  # CRITICAL: Add messages field
-            message_count=row.message_count,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            last_activity_at=row.last_activity_at,
-            resolved_at=row.resolved_at,
-            closed_at=row.closed_at,
+        Rows were validated when they were saved, so the case is hydrated on
+        the trusted path: the JSON columns are parsed once by pydantic-core
+        and history ordering is not re-checked. NULL JSON columns (old rows,
+        manual edits) fall back to the model defaults.
+        """
+        return hydrate_case_columns(
+            fields={
+                "case_id": row.case_id,
+                "user_id": row.user_id,
+                "organization_id": row.organization_id,
+                "title": row.title,
+                "description": row.description,
+                "status": row.status,
+                "closure_reason": row.closure_reason,
+                "current_turn": row.current_turn,
+                "turns_without_progress": row.turns_without_progress,
+                "investigation_strategy": row.investigation_strategy,
+                "message_count": row.message_count,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+                "last_activity_at": row.last_activity_at,
+                "resolved_at": row.resolved_at,
+                "closed_at": row.closed_at,
+            },
+            json_columns={
+                "progress": row.progress,
+                "status_history": row.status_history,
+                "turn_history": row.turn_history,
+                "uploaded_files": row.uploaded_files,
+                "evidence": row.evidence,
+                "hypotheses": row.hypotheses,
+                "solutions": row.solutions,
+                "consulting": row.consulting,
+                "documentation": row.documentation,
+                "path_selection": row.path_selection,
+                "problem_verification": row.problem_verification,
+                "working_conclusion": row.working_conclusion,
+                "root_cause_conclusion": row.root_cause_conclusion,
+                "degraded_mode": row.degraded_mode,
+                "escalation_state": row.escalation_state,
+                "messages": row.messages,
+            },
         )
 
 
@@ -0,0 +1,216 @@
+"""In-memory case search index.
+
+The dev/test counterpart of the PostgreSQL case search
+(docs/schema/007_case_search.sql): a token inverted index over the title
+(weight A), description (B) and evidence summaries (C), plus a trigram index
+over titles for fuzzy matches. It is maintained on write, so a query only
+touches the postings of its own terms instead of scanning every case.
+
+Matching follows the database:
+- A case matches when it contains every query term, after stop-word removal
+  and light stemming
+- Otherwise its title matches when it is trigram-similar to the query
+  (pg_trgm's default threshold, 0.3). Fuzzy matches are only looked up when
+  no case contains every term (typically a typo), which keeps common queries
+  off the large trigram postings
+- Ranks add the field weights of the matched terms (ts_rank's default
+  weights) and the title similarity
+
+Usage:
+    index = CaseSearchIndex()
+    index.add(case)
+    matches = index.search("connection timeouts")  # {case_id: rank}
+    index.highlight(case_id, "connection timeouts")
+"""
+
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from faultmaven.models.case import Case
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "in", "is", "it",
+    "of", "on", "or", "that", "the", "this", "to", "was", "were", "will", "with",
+})
+
+# ts_rank's default weights for A (title), B (description), C (evidence)
+FIELD_WEIGHTS = (("title", 1.0), ("description", 0.4), ("evidence", 0.2))
+SIMILARITY_THRESHOLD = 0.3
+HIGHLIGHT_WORDS = 20
+HIGHLIGHT_CONTEXT = 5
+START_SEL, STOP_SEL = "<mark>", "</mark>"
+
+
+def stem(token: str) -> str:
+    """Light suffix stripping so "timeouts" and "timeout" match"""
+    for suffix in ("ing", "ed", "s"):
+        if token.endswith(suffix) and not token.endswith("ss") and len(token) - len(suffix) >= 3:
+            return token[:-len(suffix)]
+    return token
+
+
+def search_terms(text: str) -> List[str]:
+    """Stemmed, lower-cased tokens of ``text`` without stop words"""
+    return [stem(token) for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """pg_trgm trigrams: per word, padded with two leading and one trailing space"""
+    grams = set()
+    for word in TOKEN_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+@dataclass
+class _Document:
+    """Indexed text of one case"""
+
+    fields: Tuple[str, str, str]  # title, description, evidence summaries
+    term_weights: Dict[str, float] = field(default_factory=dict)
+    title_trigrams: FrozenSet[str] = frozenset()
+
+
+class CaseSearchIndex:
+    """Inverted index over case titles, descriptions and evidence summaries.
+
+    Thread-safe; ``add`` re-indexes a case only when its indexed text changed.
+    """
+
+    def __init__(self):
+        self._documents: Dict[str, _Document] = {}
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._trigram_postings: Dict[str, Set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, case: Case) -> None:
+        """Index ``case``, replacing what was indexed for it before"""
+        fields = (case.title, case.description, " ".join(ev.summary for ev in case.evidence))
+        with self._lock:
+            current = self._documents.get(case.case_id)
+            if current is not None and current.fields == fields:
+                return
+            self._remove(case.case_id)
+
+            term_weights: Dict[str, float] = defaultdict(float)
+            for text, (_, weight) in zip(fields, FIELD_WEIGHTS):
+                for term in search_terms(text):
+                    term_weights[term] += weight
+            document = _Document(fields, dict(term_weights), trigrams(case.title))
+            self._documents[case.case_id] = document
+
+            for term, weight in document.term_weights.items():
+                self._postings[term][case.case_id] = weight
+            for gram in document.title_trigrams:
+                self._trigram_postings[gram].add(case.case_id)
+
+    def remove(self, case_id: str) -> None:
+        with self._lock:
+            self._remove(case_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            self._postings.clear()
+            self._trigram_postings.clear()
+
+    def search(self, query: str, within: Optional[Set[str]] = None) -> Dict[str, float]:
+        """Matching case IDs and their ranks (unordered)
+
+        ``within`` restricts the matches to those case IDs (e.g. a user's
+        cases); when it is smaller than the rarest term's postings only its
+        cases are checked. The fuzzy fallback then applies within it too.
+        """
+        terms = set(search_terms(query))
+        with self._lock:
+            matches = self._term_matches(terms, within) if terms else {}
+            if not matches:
+                matches = self._fuzzy_matches(trigrams(query))
+                if within is not None:
+                    matches = {case_id: rank for case_id, rank in matches.items() if case_id in within}
+        return matches
+
+    def highlight(self, case_id: str, query: str) -> Optional[str]:
+        """Fragment of the first field containing a query term, terms wrapped in <mark>
+
+        Falls back to the title for fuzzy matches.
+        """
+        document = self._documents.get(case_id)
+        if document is None:
+            return None
+        terms = set(search_terms(query))
+        for text in document.fields:
+            words = text.split()
+            positions = [i for i, word in enumerate(words) if _word_matches(word, terms)]
+            if not positions:
+                continue
+            start = max(positions[0] - HIGHLIGHT_CONTEXT, 0)
+            window = words[start:start + HIGHLIGHT_WORDS]
+            return " ".join(
+                f"{START_SEL}{word}{STOP_SEL}" if _word_matches(word, terms) else word
+                for word in window
+            )
+        return document.fields[0]
+
+    def _term_matches(self, terms: Set[str], within: Optional[Set[str]] = None) -> Dict[str, float]:
+        postings = [self._postings.get(term) for term in terms]
+        if not all(postings):
+            return {}
+        # Intersect starting from the rarest term, or from the candidates when fewer
+        postings.sort(key=len)
+        if within is not None and len(within) < len(postings[0]):
+            candidates = within
+        else:
+            candidates = postings[0].keys() if within is None else postings[0].keys() & within
+        return {
+            case_id: sum(posting[case_id] for posting in postings)
+            for case_id in candidates
+            if all(case_id in posting for posting in postings)
+        }
+
+    def _fuzzy_matches(self, query_grams: FrozenSet[str]) -> Dict[str, float]:
+        if not query_grams:
+            return {}
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self._trigram_postings.get(gram, ()))
+        matches = {}
+        for case_id, count in shared.items():
+            title_grams = self._documents[case_id].title_trigrams
+            similarity = count / (len(query_grams) + len(title_grams) - count)
+            if similarity >= SIMILARITY_THRESHOLD:
+                matches[case_id] = similarity
+        return matches
+
+    def _remove(self, case_id: str) -> None:
+        document = self._documents.pop(case_id, None)
+        if document is None:
+            return
+        for term in document.term_weights:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.pop(case_id, None)
+                if not posting:
+                    del self._postings[term]
+        for gram in document.title_trigrams:
+            posting = self._trigram_postings.get(gram)
+            if posting is not None:
+                posting.discard(case_id)
+                if not posting:
+                    del self._trigram_postings[gram]
+
+
+def _word_matches(word: str, terms: Set[str]) -> bool:
+    return any(
+        token not in STOP_WORDS and stem(token) in terms
+        for token in TOKEN_PATTERN.findall(word.lower())
+    )
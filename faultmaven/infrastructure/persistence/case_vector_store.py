@@ -19,16 +19,18 @@ Example flow:
 4. Case closes → CaseService.close_case() → deletes `case_abc123` collection
 """
 
-from typing import List, Dict, Optional, Any
+from typing import TYPE_CHECKING, List, Dict, Optional, Any
 from datetime import datetime, timezone, timedelta
 import time
-import chromadb
-from chromadb.config import Settings
 from urllib.parse import urlparse
 import logging
 
 from faultmaven.config.settings import get_settings
 from faultmaven.infrastructure.base_client import BaseExternalClient
+from faultmaven.infrastructure.persistence.chromadb_executor import ChromaDBExecutor
+
+if TYPE_CHECKING:
+    import chromadb
 
 
 logger = logging.getLogger(__name__)
@@ -56,6 +58,10 @@ class CaseVectorStore(BaseExternalClient):
             circuit_breaker_timeout=60
         )
 
+        # Imported here to keep the ChromaDB client off the application import path
+        import chromadb
+        from chromadb.config import Settings
+
         # Get ChromaDB configuration from unified settings
         settings = get_settings()
         chromadb_url = settings.database.chromadb_url
@@ -85,6 +91,7 @@ class CaseVectorStore(BaseExternalClient):
                 port=port,
                 settings=Settings(**settings_kwargs) if settings_kwargs else Settings()
             )
+            self.chroma = ChromaDBExecutor(self.client)
             self.logger.info("CaseVectorStore initialized (lifecycle-based cleanup)")
         except Exception as e:
             self.logger.error(f"Failed to initialize ChromaDB client: {e}")
@@ -94,9 +101,20 @@ class CaseVectorStore(BaseExternalClient):
         """Get collection name for a case"""
         return f"{self.COLLECTION_PREFIX}{case_id}"
 
-    def _get_or_create_collection(self, case_id: str) -> chromadb.Collection:
+    def _collection_metadata(self, case_id: str) -> Dict[str, Any]:
+        """Metadata stored on a case collection when it is first created"""
+        # Store case metadata (no TTL - lifecycle-based cleanup)
+        return {
+            "case_id": case_id,
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }
+
+    def _get_or_create_collection(self, case_id: str) -> "chromadb.Collection":
         """
-        Get or create ChromaDB collection for a case.
+        Get or create ChromaDB collection for a case (blocking).
+
+        Collection handles are cached by the access layer, so only the first
+        call per case reaches ChromaDB.
 
         Args:
             case_id: Case identifier
@@ -106,16 +124,10 @@ class CaseVectorStore(BaseExternalClient):
         """
         collection_name = self._get_collection_name(case_id)
 
-        # Store case metadata (no TTL - lifecycle-based cleanup)
-        metadata = {
-            "case_id": case_id,
-            "created_at": datetime.now(timezone.utc).isoformat()
-        }
-
         try:
-            collection = self.client.get_or_create_collection(
-                name=collection_name,
-                metadata=metadata
+            collection = self.chroma.get_or_create_collection_sync(
+                collection_name,
+                self._collection_metadata(case_id)
             )
             self.logger.debug(f"Collection ready: {collection_name}")
             return collection
@@ -139,8 +151,6 @@ class CaseVectorStore(BaseExternalClient):
                 - metadata: Optional metadata dict
         """
         async def _add_wrapper():
-            collection = self._get_or_create_collection(case_id)
-
             ids = [doc['id'] for doc in documents]
             contents = [doc['content'] for doc in documents]
             metadatas = [doc.get('metadata', {}) for doc in documents]
@@ -158,10 +168,14 @@ class CaseVectorStore(BaseExternalClient):
                         sanitized[k] = str(v)
                 sanitized_metadatas.append(sanitized)
 
-            collection.add(
-                ids=ids,
-                documents=contents,
-                metadatas=sanitized_metadatas
+            await self.chroma.run_with_collection(
+                self._get_collection_name(case_id),
+                lambda collection: collection.add(
+                    ids=ids,
+                    documents=contents,
+                    metadatas=sanitized_metadatas
+                ),
+                metadata=self._collection_metadata(case_id)
             )
 
             self.logger.info(
@@ -201,29 +215,16 @@ class CaseVectorStore(BaseExternalClient):
                 - score: Similarity score (0.0-1.0)
         """
         async def _search_wrapper():
-            collection = self._get_or_create_collection(case_id)
-
-            query_params = {
-                "query_texts": [query],
-                "n_results": k,
-                "include": ["documents", "metadatas", "distances"]
-            }
-
-            if where:
-                query_params["where"] = where
-
-            results = collection.query(**query_params)
+            results = await self.chroma.query(
+                self._get_collection_name(case_id),
+                query_texts=[query],
+                n_results=k,
+                where=where,
+                metadata=self._collection_metadata(case_id)
+            )
 
             # Format results
-            formatted_results = []
-            if results['ids'] and results['ids'][0]:
-                for i in range(len(results['ids'][0])):
-                    formatted_results.append({
-                        'id': results['ids'][0][i],
-                        'content': results['documents'][0][i],
-                        'metadata': results['metadatas'][0][i] if results['metadatas'][0] else {},
-                        'score': 1.0 - results['distances'][0][i]  # Convert distance to similarity
-                    })
+            formatted_results = self.chroma.split_query_results(results, 1)[0]
 
             self.logger.debug(
                 f"Case {case_id} search returned {len(formatted_results)} results",
@@ -254,7 +255,7 @@ class CaseVectorStore(BaseExternalClient):
             collection_name = self._get_collection_name(case_id)
 
             try:
-                self.client.delete_collection(name=collection_name)
+                await self.chroma.delete_collection(collection_name)
                 self.logger.info(
                     f"Deleted case collection: {collection_name}",
                     extra={"case_id": case_id, "collection": collection_name}
@@ -289,7 +290,7 @@ class CaseVectorStore(BaseExternalClient):
 
             try:
                 # List all case collections
-                collections = self.client.list_collections()
+                collections = await self.chroma.list_collections()
 
                 # Create set of expected collection names for active cases
                 expected_collections = {
@@ -305,7 +306,7 @@ class CaseVectorStore(BaseExternalClient):
                     # If collection is not for an active case, it's orphaned
                     if collection.name not in expected_collections:
                         try:
-                            self.client.delete_collection(name=collection.name)
+                            await self.chroma.delete_collection(collection.name)
                             deleted_count += 1
 
                             # Extract case_id from collection name
@@ -360,8 +361,9 @@ class CaseVectorStore(BaseExternalClient):
             collection_name = self._get_collection_name(case_id)
 
             try:
-                collection = self.client.get_collection(name=collection_name)
-                count = collection.count()
+                count = await self.chroma.run(
+                    lambda: self.client.get_collection(name=collection_name).count()
+                )
                 self.logger.debug(f"Case {case_id} has {count} documents")
                 return count
             except Exception:
@@ -0,0 +1,218 @@
+"""
+Non-blocking ChromaDB access layer.
+
+The chromadb client API is synchronous: every ``collection.query`` /
+``collection.add`` is a blocking HTTP round trip. Calling it directly from an
+``async def`` stalls the whole event loop for the duration of the call.
+
+ChromaDBExecutor is shared by the vector stores (CaseVectorStore,
+UserKBVectorStore, ChromaDBVectorStore) and:
+- Runs client calls on a bounded, process-wide thread pool
+  (``CHROMADB_MAX_WORKERS``), so vector traffic cannot exhaust the default
+  executor used by the rest of the application
+- Caches collection handles instead of issuing ``get_or_create_collection``
+  before every operation; a handle is dropped when an operation on it fails
+  (e.g. the collection was deleted by another replica) so the next retry
+  re-resolves it. Collections are per case and per user, so the cache keeps
+  only the ``max_collections`` most recently used handles
+- Supports multi-query search: several query texts in one ``query`` call
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_lock = threading.Lock()
+
+
+def get_chromadb_thread_pool() -> ThreadPoolExecutor:
+    """Get the process-wide bounded thread pool for ChromaDB calls"""
+    global _thread_pool
+    if _thread_pool is None:
+        with _thread_pool_lock:
+            if _thread_pool is None:
+                max_workers = 8
+                try:
+                    from faultmaven.config.settings import get_settings
+                    max_workers = get_settings().database.chromadb_max_workers
+                except Exception:
+                    pass
+                _thread_pool = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="chromadb"
+                )
+    return _thread_pool
+
+
+class ChromaDBExecutor:
+    """Runs blocking ChromaDB client calls off the event loop"""
+
+    def __init__(
+        self,
+        client: Any,
+        executor: Optional[ThreadPoolExecutor] = None,
+        max_collections: int = 256,
+    ):
+        """
+        Args:
+            client: chromadb client (HttpClient / PersistentClient)
+            executor: Optional thread pool (defaults to the shared ChromaDB pool)
+            max_collections: Collection handles kept, least recently used dropped first
+        """
+        self.client = client
+        self._executor = executor
+        self.max_collections = max_collections
+        self._collections: "OrderedDict[str, Any]" = OrderedDict()
+        self._collections_lock = threading.Lock()
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking callable on the ChromaDB thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor or get_chromadb_thread_pool(),
+            functools.partial(func, *args, **kwargs),
+        )
+
+    def get_or_create_collection_sync(
+        self, name: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Get a collection handle, creating the collection on first use (blocking)"""
+        collection = self._cached(name)
+        if collection is not None:
+            return collection
+
+        collection = self.client.get_or_create_collection(name=name, metadata=metadata)
+        with self._collections_lock:
+            self._collections[name] = collection
+            self._collections.move_to_end(name)
+            while len(self._collections) > self.max_collections:
+                self._collections.popitem(last=False)
+        logger.debug(f"Collection handle cached: {name}")
+        return collection
+
+    async def get_or_create_collection(
+        self, name: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Get a collection handle without blocking the event loop"""
+        collection = self._cached(name)
+        if collection is not None:
+            return collection
+        return await self.run(self.get_or_create_collection_sync, name, metadata)
+
+    def _cached(self, name: str) -> Optional[Any]:
+        """Cached handle for a collection, marked as most recently used"""
+        with self._collections_lock:
+            collection = self._collections.get(name)
+            if collection is not None:
+                self._collections.move_to_end(name)
+            return collection
+
+    async def run_with_collection(
+        self,
+        name: str,
+        operation: Callable[[Any], T],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> T:
+        """
+        Resolve a collection and run ``operation(collection)`` on the thread pool.
+
+        The cached handle is invalidated if the operation fails so that a
+        retry re-resolves the collection.
+
+        Args:
+            name: Collection name
+            operation: Blocking callable receiving the collection handle
+            metadata: Collection metadata used if the collection must be created
+
+        Returns:
+            Result of ``operation``
+        """
+        def _call() -> T:
+            return operation(self.get_or_create_collection_sync(name, metadata))
+
+        try:
+            return await self.run(_call)
+        except Exception:
+            self.invalidate(name)
+            raise
+
+    async def query(
+        self,
+        name: str,
+        query_texts: List[str],
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query a collection with one or more query texts in a single call.
+
+        Returns:
+            Raw chromadb result with one inner list per query text
+        """
+        query_params: Dict[str, Any] = {
+            "query_texts": query_texts,
+            "n_results": n_results,
+            "include": include or ["documents", "metadatas", "distances"],
+        }
+        if where:
+            query_params["where"] = where
+
+        return await self.run_with_collection(
+            name, lambda collection: collection.query(**query_params), metadata
+        )
+
+    async def delete_collection(self, name: str) -> None:
+        """Delete a collection and drop its cached handle"""
+        self.invalidate(name)
+        await self.run(self.client.delete_collection, name=name)
+
+    async def list_collections(self) -> List[Any]:
+        """List collections without blocking the event loop"""
+        return await self.run(self.client.list_collections)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one cached collection handle, or all of them"""
+        with self._collections_lock:
+            if name is None:
+                self._collections.clear()
+            else:
+                self._collections.pop(name, None)
+
+    @staticmethod
+    def split_query_results(results: Dict[str, Any], query_count: int) -> List[List[Dict[str, Any]]]:
+        """
+        Split a multi-query chromadb result into per-query hit lists.
+
+        Returns:
+            One list per query, each with ``id``, ``content``, ``metadata``
+            and ``score`` (1 - distance) dicts
+        """
+        per_query: List[List[Dict[str, Any]]] = []
+        ids = results.get("ids") or []
+        documents = results.get("documents") or []
+        metadatas = results.get("metadatas") or []
+        distances = results.get("distances") or []
+
+        for q in range(query_count):
+            hits = []
+            query_ids = ids[q] if q < len(ids) and ids[q] else []
+            for i, doc_id in enumerate(query_ids):
+                query_metadatas = metadatas[q] if q < len(metadatas) and metadatas[q] else []
+                hits.append({
+                    "id": doc_id,
+                    "content": documents[q][i],
+                    "metadata": (query_metadatas[i] if i < len(query_metadatas) else None) or {},
+                    "score": 1.0 - distances[q][i],  # Convert distance to similarity
+                })
+            per_query.append(hits)
+        return per_query
@@ -12,6 +12,7 @@ import chromadb
 from chromadb.config import Settings
 from faultmaven.models.interfaces import IVectorStore
 from faultmaven.infrastructure.base_client import BaseExternalClient
+from faultmaven.infrastructure.persistence.chromadb_executor import ChromaDBExecutor
 from faultmaven.config.settings import get_settings
 import logging
 
@@ -64,6 +65,9 @@ class ChromaDBVectorStore(BaseExternalClient, IVectorStore):
             if hasattr(self, 'logger'):
                 self.logger.error(f"Failed to initialize ChromaDB HTTP client: {e}")
             raise
+
+        # Blocking client calls run on the shared bounded ChromaDB thread pool
+        self.chroma = ChromaDBExecutor(self.client)
         
         # Get or create collection
         # Use collection name from settings via dependency injection
@@ -125,7 +129,8 @@ class ChromaDBVectorStore(BaseExternalClient, IVectorStore):
                                 continue
                     metadatas.append(sanitized)
             
-            self.collection.add(
+            await self.chroma.run(
+                self.collection.add,
                 ids=ids,
                 documents=contents,
                 metadatas=metadatas
@@ -163,7 +168,8 @@ class ChromaDBVectorStore(BaseExternalClient, IVectorStore):
             List of similar documents with scores
         """
         async def _search_wrapper():
-            results = self.collection.query(
+            results = await self.chroma.run(
+                self.collection.query,
                 query_texts=[query],
                 n_results=k,
                 include=["documents", "metadatas", "distances"]
@@ -219,7 +225,7 @@ class ChromaDBVectorStore(BaseExternalClient, IVectorStore):
             if where:
                 query_params["where"] = where
 
-            results = self.collection.query(**query_params)
+            results = await self.chroma.run(self.collection.query, **query_params)
 
             self.logger.debug(
                 f"Embedding query returned {len(results.get('ids', [[]])[0])} results",
@@ -239,7 +245,7 @@ class ChromaDBVectorStore(BaseExternalClient, IVectorStore):
     async def delete_documents(self, ids: List[str]) -> None:
         """Delete documents by IDs"""
         async def _delete_wrapper():
-            self.collection.delete(ids=ids)
+            await self.chroma.run(self.collection.delete, ids=ids)
             self.logger.info(f"Deleted {len(ids)} documents from vector store")
         
         await self.call_external(
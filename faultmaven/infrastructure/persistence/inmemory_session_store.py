@@ -5,10 +5,11 @@ This module provides a RAM-based session store for development and testing.
 Data is stored in Python dictionaries and lost on application restart.
 """
 
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 import asyncio
 from faultmaven.models.interfaces import ISessionStore
+from faultmaven.infrastructure.persistence.session_index import paginate_session_summaries, summarize_session
 
 
 class InMemorySessionStore(ISessionStore):
@@ -120,6 +121,34 @@ class InMemorySessionStore(ISessionStore):
             self._ttls[key] = datetime.now(timezone.utc) + timedelta(seconds=ttl)
             return True
 
+    async def list_page(
+        self,
+        user_id: Optional[str] = None,
+        session_type: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        List session summaries, newest activity first.
+
+        Args:
+            user_id: Only sessions of this user (all users if None)
+            session_type: Only sessions of this type (all types if None)
+            limit: Maximum summaries to return
+            offset: Summaries to skip
+
+        Returns:
+            Tuple of (summaries, total matching sessions)
+        """
+        async with self._lock:
+            now = datetime.now(timezone.utc)
+            summaries = [
+                summarize_session(value)
+                for key, value in self._sessions.items()
+                if value.get('session_id') and not (key in self._ttls and now > self._ttls[key])
+            ]
+        return paginate_session_summaries(summaries, user_id, session_type, limit, offset)
+
     async def find_by_user_and_client(self, user_id: str, client_id: str) -> Optional[str]:
         """
         Find session ID by user_id and client_id combination.
@@ -4,7 +4,7 @@ Implements IOrganizationRepository for organization and member management.
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
@@ -272,6 +272,55 @@ class PostgreSQLOrganizationRepository(IOrganizationRepository):
             for row in rows
         ]
 
+    async def get_member(self, org_id: str, user_id: str) -> Optional[OrganizationMember]:
+        """Get a single organization member."""
+        query = text("""
+            SELECT user_id, org_id, role_id, joined_at, last_active_at
+            FROM organization_members
+            WHERE org_id = :org_id AND user_id = :user_id
+        """)
+
+        result = await self.db.execute(query, {"org_id": org_id, "user_id": user_id})
+        row = result.fetchone()
+
+        if not row:
+            return None
+
+        return OrganizationMember(
+            user_id=row.user_id,
+            org_id=row.org_id,
+            role_id=row.role_id,
+            joined_at=row.joined_at,
+            last_active_at=row.last_active_at
+        )
+
+    async def get_member_permissions(
+        self,
+        org_id: str,
+        user_id: str
+    ) -> Optional[Tuple[str, List[str]]]:
+        """Get user's role and every permission it grants in organization.
+
+        One query for what user_has_org_permission checks one permission at
+        a time. Permissions are returned as 'resource.action'.
+        """
+        query = text("""
+            SELECT om.role_id, p.resource, p.action
+            FROM organization_members om
+            LEFT JOIN role_permissions rp ON rp.role_id = om.role_id
+            LEFT JOIN permissions p ON p.permission_id = rp.permission_id
+            WHERE om.org_id = :org_id AND om.user_id = :user_id
+        """)
+
+        result = await self.db.execute(query, {"org_id": org_id, "user_id": user_id})
+        rows = result.fetchall()
+
+        if not rows:
+            return None
+
+        permissions = [f"{row.resource}.{row.action}" for row in rows if row.resource]
+        return rows[0].role_id, permissions
+
     async def get_member_role(self, org_id: str, user_id: str) -> Optional[str]:
         """Get user's role in organization."""
         query = text("""
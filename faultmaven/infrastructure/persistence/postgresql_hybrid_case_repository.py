@@ -26,25 +26,24 @@ from uuid import uuid4
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from faultmaven.infrastructure.persistence.case_repository import CaseRepository
+from faultmaven.infrastructure.persistence.case_repository import (
+    CaseRepository,
+    CaseSearchPage,
+    CaseSummaryPage,
+    decode_case_cursor,
+    encode_case_cursor,
+)
+from faultmaven.models.api_models import CaseSummary
 from faultmaven.models.case import (
     Case,
     CaseStatus,
-    InvestigationProgress,
-    TurnProgress,
     UploadedFile,
     Evidence,
     Hypothesis,
     Solution,
-    ConsultingData,
-    ProblemVerification,
-    WorkingConclusion,
-    RootCauseConclusion,
-    DegradedMode,
-    EscalationState,
-    DocumentationData,
-    PathSelection,
     CaseStatusTransition,
+    STUCK_TURNS_WITHOUT_PROGRESS,
+    hydrate_case_columns,
 )
 
 
@@ -59,10 +58,16 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
     Performance Characteristics:
     - Case load: ~10ms (single query + JOINs)
     - Evidence filtering: ~5ms (indexed queries on normalized table)
-    - Search: ~15ms (full-text search on preprocessed_content)
+    - Search: single ranked query on the GIN-indexed search_vector + pg_trgm (migration 007)
     - Hypothesis tracking: ~3ms (status index lookup)
     """
 
+    # Summary totals above this are planner estimates instead of exact counts
+    SUMMARY_COUNT_CAP = 10000
+
+    # ts_headline options for search highlights
+    SEARCH_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=20, MinWords=5"
+
     def __init__(self, db_session: AsyncSession):
         """
         Initialize repository with SQLAlchemy async session.
@@ -140,8 +145,16 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             Case if found, None otherwise
         """
         try:
-            # Main query with LEFT JOINs for normalized tables
-            query = text("""
+            cases = await self._load_cases("c.case_id = :case_id", {"case_id": case_id})
+            return cases[0] if cases else None
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to get case {case_id}: {e}") from e
+
+    async def _load_cases(self, where_sql: str, params: Dict[str, Any]) -> List[Case]:
+        """Load full cases matching ``where_sql`` (over ``cases c``) in one query."""
+        # Main query with LEFT JOINs for normalized tables
+        query = text(f"""
                 SELECT
                     c.*,
 
@@ -218,21 +231,12 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 LEFT JOIN hypotheses h ON c.case_id = h.case_id
                 LEFT JOIN solutions s ON c.case_id = s.case_id
                 LEFT JOIN uploaded_files f ON c.case_id = f.case_id
-                WHERE c.case_id = :case_id
+                WHERE {where_sql}
                 GROUP BY c.case_id
             """)
 
-            result = await self.db.execute(query, {"case_id": case_id})
-            row = result.fetchone()
-
-            if not row:
-                return None
-
-            # Reconstruct Case domain object
-            return await self._row_to_case(row)
-
-        except Exception as e:
-            raise RepositoryException(f"Failed to get case {case_id}: {e}") from e
+        result = await self.db.execute(query, params)
+        return [await self._row_to_case(row) for row in result.fetchall()]
 
     async def list(
         self,
@@ -305,6 +309,116 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
         except Exception as e:
             raise RepositoryException(f"Failed to list cases: {e}") from e
 
+    async def list_summaries(
+        self,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        status: Optional[CaseStatus] = None,
+        include_empty: bool = True,
+        include_archived: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> CaseSummaryPage:
+        """
+        List case summaries from the cases table alone.
+
+        Reads only the columns CaseSummary needs (milestones_completed is
+        maintained on save), applies every filter in SQL and pages with a
+        keyset on (updated_at, case_id) when a cursor is given, served by
+        idx_cases_user_updated_keyset (migration 005).
+
+        The total is exact up to SUMMARY_COUNT_CAP matching cases; beyond
+        that it is the planner's row estimate and total_is_estimate is set.
+
+        Raises:
+            ValueError: If the cursor is malformed
+            RepositoryException: If query fails
+        """
+        where_clauses = []
+        params: Dict[str, Any] = {}
+
+        if user_id:
+            where_clauses.append("user_id = :user_id")
+            params["user_id"] = user_id
+
+        if organization_id:
+            where_clauses.append("org_id = :organization_id")
+            params["organization_id"] = organization_id
+
+        if status:
+            where_clauses.append("status = :status")
+            params["status"] = status.value
+
+        if not include_empty:
+            where_clauses.append("current_turn > 0")
+
+        if not include_archived:
+            where_clauses.append("status <> 'closed'")
+
+        filter_sql = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+
+        page_clauses = list(where_clauses)
+        page_params = dict(params, limit=limit + 1, offset=offset)
+        if cursor:
+            cursor_updated_at, cursor_case_id = decode_case_cursor(cursor)
+            page_clauses.append("(updated_at, case_id) < (:cursor_updated_at, :cursor_case_id)")
+            page_params.update(cursor_updated_at=cursor_updated_at, cursor_case_id=cursor_case_id, offset=0)
+        page_sql = "WHERE " + " AND ".join(page_clauses) if page_clauses else ""
+
+        try:
+            result = await self.db.execute(text(f"""
+                SELECT case_id, user_id, org_id, title, status, created_at, updated_at,
+                       last_activity_at, current_turn, turns_without_progress,
+                       milestones_completed
+                FROM cases
+                {page_sql}
+                ORDER BY updated_at DESC, case_id DESC
+                LIMIT :limit OFFSET :offset
+            """), page_params)
+            rows = result.fetchall()
+
+            total_count, total_is_estimate = await self._count_cases(filter_sql, params)
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to list case summaries: {e}") from e
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_case_cursor(rows[-1].updated_at, rows[-1].case_id)
+
+        return CaseSummaryPage(
+            summaries=[self._row_to_summary(row) for row in rows],
+            total_count=total_count,
+            next_cursor=next_cursor,
+            total_is_estimate=total_is_estimate
+        )
+
+    async def _count_cases(self, where_sql: str, params: Dict[str, Any]) -> tuple[int, bool]:
+        """Count matching cases, stopping at SUMMARY_COUNT_CAP (then estimate)."""
+        count_query = text(f"""
+            SELECT COUNT(*) FROM (
+                SELECT 1 FROM cases {where_sql} LIMIT :count_cap
+            ) capped
+        """)
+        result = await self.db.execute(count_query, dict(params, count_cap=self.SUMMARY_COUNT_CAP + 1))
+        count = result.scalar() or 0
+        if count <= self.SUMMARY_COUNT_CAP:
+            return count, False
+
+        try:
+            plan_result = await self.db.execute(
+                text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM cases {where_sql}"), params
+            )
+            plan = plan_result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = int(plan[0]["Plan"]["Plan Rows"])
+        except Exception:
+            estimate = 0
+        return max(estimate, count), True
+
     async def delete(self, case_id: str) -> bool:
         """
         Delete case by ID (cascades to normalized tables via FK constraints).
@@ -461,14 +575,10 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
         limit: int = 20
     ) -> tuple[List[Case], int]:
         """
-        Search cases using PostgreSQL full-text search.
-
-        Searches:
-        - cases.title
-        - cases.consulting->>'initial_description'
-        - evidence.preprocessed_content (via JOIN)
+        Search cases, returning full cases in rank order.
 
-        Performance: ~15ms (GIN indexes on tsvector columns)
+        Runs the search_summaries() query, then loads the matching cases in
+        one batched query (no per-hit get()).
 
         Args:
             query: Search query
@@ -479,47 +589,105 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
         Returns:
             Tuple of (cases, total_count)
         """
+        page = await self.search_summaries(query, user_id=user_id, organization_id=organization_id, limit=limit)
+        if not page.summaries:
+            return [], page.total_count
+
+        case_ids = [summary.case_id for summary in page.summaries]
         try:
-            # Build WHERE clause
-            where_clauses = ["(to_tsvector('english', c.title || ' ' || COALESCE(c.consulting->>'initial_description', '')) @@ plainto_tsquery('english', :query) OR e.preprocessed_content_fts @@ plainto_tsquery('english', :query))"]
-            params = {"query": query, "limit": limit}
+            loaded = await self._load_cases("c.case_id = ANY(:case_ids)", {"case_ids": case_ids})
+        except Exception as e:
+            raise RepositoryException(f"Failed to search cases: {e}") from e
 
-            if user_id:
-                where_clauses.append("c.user_id = :user_id")
-                params["user_id"] = user_id
+        by_id = {case.case_id: case for case in loaded}
+        return [by_id[case_id] for case_id in case_ids if case_id in by_id], page.total_count
 
-            if organization_id:
-                where_clauses.append("c.organization_id = :organization_id")
-                params["organization_id"] = organization_id
+    async def search_summaries(
+        self,
+        query: str,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        status: Optional[CaseStatus] = None,
+        limit: int = 20
+    ) -> CaseSearchPage:
+        """
+        Search cases using the stored search_vector and pg_trgm (migration 007).
+
+        A case matches when its search_vector (title A, description B,
+        evidence summaries C; GIN-indexed) matches the query, or its title is
+        trigram-similar to it (GIN trigram index). Ranked by ts_rank plus
+        title similarity. One query returns the summary columns, the total
+        match count and a ts_headline highlight, computed for the returned
+        page only.
 
-            where_sql = "WHERE " + " AND ".join(where_clauses)
+        Args:
+            query: Search query (websearch syntax: quotes, OR, -term)
+            user_id: Filter by user
+            organization_id: Filter by organization
+            status: Filter by status
+            limit: Maximum results
 
-            # Search query with relevance ranking
-            search_query = text(f"""
-                SELECT DISTINCT c.case_id,
-                    ts_rank(to_tsvector('english', c.title), plainto_tsquery('english', :query)) as rank
+        Returns:
+            CaseSearchPage
+        """
+        where_clauses = [
+            "(c.search_vector @@ websearch_to_tsquery('english', :query) OR c.title % :query)"
+        ]
+        params: Dict[str, Any] = {"query": query, "limit": limit, "headline_options": self.SEARCH_HEADLINE_OPTIONS}
+
+        if user_id:
+            where_clauses.append("c.user_id = :user_id")
+            params["user_id"] = user_id
+
+        if organization_id:
+            where_clauses.append("c.org_id = :organization_id")
+            params["organization_id"] = organization_id
+
+        if status:
+            where_clauses.append("c.status = :status")
+            params["status"] = status.value
+
+        search_query = text(f"""
+            WITH matches AS (
+                SELECT c.case_id, c.user_id, c.org_id, c.title, c.status, c.created_at, c.updated_at,
+                       c.last_activity_at, c.current_turn, c.turns_without_progress,
+                       c.milestones_completed, c.description, c.evidence_summaries,
+                       ts_rank(c.search_vector, websearch_to_tsquery('english', :query))
+                           + similarity(c.title, :query) AS rank,
+                       COUNT(*) OVER () AS total_count
                 FROM cases c
-                LEFT JOIN evidence e ON c.case_id = e.case_id
-                {where_sql}
+                WHERE {" AND ".join(where_clauses)}
                 ORDER BY rank DESC, c.updated_at DESC
                 LIMIT :limit
-            """)
+            )
+            SELECT m.*,
+                   ts_headline(
+                       'english',
+                       m.title || ' ' || m.description || ' ' || m.evidence_summaries,
+                       websearch_to_tsquery('english', :query),
+                       :headline_options
+                   ) AS highlight
+            FROM matches m
+            ORDER BY m.rank DESC, m.updated_at DESC
+        """)
 
+        try:
             result = await self.db.execute(search_query, params)
-            case_ids = [row[0] for row in result.fetchall()]
-
-            # Fetch full cases
-            cases = []
-            for case_id in case_ids:
-                case = await self.get(case_id)
-                if case:
-                    cases.append(case)
-
-            return cases, len(cases)
-
+            rows = result.fetchall()
         except Exception as e:
             raise RepositoryException(f"Failed to search cases: {e}") from e
 
+        summaries = []
+        for row in rows:
+            summary = self._row_to_summary(row)
+            summary.highlight = row.highlight
+            summaries.append(summary)
+
+        return CaseSearchPage(
+            summaries=summaries,
+            total_count=rows[0].total_count if rows else 0
+        )
+
     # ========================================================================
     # Message Operations (Normalized Table)
     # ========================================================================
@@ -723,15 +891,22 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
     # ========================================================================
 
     async def _upsert_case_record(self, case: Case) -> None:
-        """Upsert main cases table (JSONB columns for flexible data)."""
+        """Upsert main cases table (JSONB columns for flexible data).
+
+        The summary columns (current_turn, turns_without_progress,
+        milestones_completed, last_activity_at) are kept in step with the
+        case so list views never need to parse JSONB.
+        """
         query = text("""
             INSERT INTO cases (
-                case_id, user_id, title, status, created_at, updated_at,
+                case_id, user_id, title, description, status, created_at, updated_at,
+                last_activity_at, current_turn, turns_without_progress, milestones_completed,
                 consulting, problem_verification, working_conclusion,
                 root_cause_conclusion, path_selection, degraded_mode,
                 escalation_state, documentation, progress, metadata
             ) VALUES (
-                :case_id, :user_id, :title, :status, :created_at, :updated_at,
+                :case_id, :user_id, :title, :description, :status, :created_at, :updated_at,
+                :last_activity_at, :current_turn, :turns_without_progress, :milestones_completed,
                 :consulting::jsonb, :problem_verification::jsonb, :working_conclusion::jsonb,
                 :root_cause_conclusion::jsonb, :path_selection::jsonb, :degraded_mode::jsonb,
                 :escalation_state::jsonb, :documentation::jsonb, :progress::jsonb, :metadata::jsonb
@@ -739,8 +914,13 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             ON CONFLICT (case_id) DO UPDATE SET
                 user_id = EXCLUDED.user_id,
                 title = EXCLUDED.title,
+                description = EXCLUDED.description,
                 status = EXCLUDED.status,
                 updated_at = EXCLUDED.updated_at,
+                last_activity_at = EXCLUDED.last_activity_at,
+                current_turn = EXCLUDED.current_turn,
+                turns_without_progress = EXCLUDED.turns_without_progress,
+                milestones_completed = EXCLUDED.milestones_completed,
                 consulting = EXCLUDED.consulting,
                 problem_verification = EXCLUDED.problem_verification,
                 working_conclusion = EXCLUDED.working_conclusion,
@@ -753,30 +933,40 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 metadata = EXCLUDED.metadata
         """)
 
-        await self.db.execute(query, {
+        await self.db.execute(query, self._case_columns(case))
+
+    @staticmethod
+    def _case_columns(case: Case) -> Dict[str, Any]:
+        """Values of a case's ``cases`` row, keyed by column"""
+        return {
             "case_id": case.case_id,
             "user_id": case.user_id,
             "title": case.title,
+            "description": case.description,
             "status": case.status.value,
             "created_at": case.created_at,
             "updated_at": case.updated_at,
-            "consulting": json.dumps(case.consulting.model_dump()),
-            "problem_verification": json.dumps(case.problem_verification.model_dump()) if case.problem_verification else None,
-            "working_conclusion": json.dumps(case.working_conclusion.model_dump()) if case.working_conclusion else None,
-            "root_cause_conclusion": json.dumps(case.root_cause_conclusion.model_dump()) if case.root_cause_conclusion else None,
-            "path_selection": json.dumps(case.path_selection.model_dump()) if case.path_selection else None,
-            "degraded_mode": json.dumps(case.degraded_mode.model_dump()) if case.degraded_mode else None,
-            "escalation_state": json.dumps(case.escalation_state.model_dump()) if case.escalation_state else None,
-            "documentation": json.dumps(case.documentation.model_dump()),
-            "progress": json.dumps(case.progress.model_dump()),
+            "last_activity_at": case.last_activity_at,
+            "current_turn": case.current_turn,
+            "turns_without_progress": case.turns_without_progress,
+            "milestones_completed": len(case.progress.completed_milestones),
+            "consulting": json.dumps(case.consulting.model_dump(mode="json")),
+            "problem_verification": json.dumps(case.problem_verification.model_dump(mode="json")) if case.problem_verification else None,
+            "working_conclusion": json.dumps(case.working_conclusion.model_dump(mode="json")) if case.working_conclusion else None,
+            "root_cause_conclusion": json.dumps(case.root_cause_conclusion.model_dump(mode="json")) if case.root_cause_conclusion else None,
+            "path_selection": json.dumps(case.path_selection.model_dump(mode="json")) if case.path_selection else None,
+            "degraded_mode": json.dumps(case.degraded_mode.model_dump(mode="json")) if case.degraded_mode else None,
+            "escalation_state": json.dumps(case.escalation_state.model_dump(mode="json")) if case.escalation_state else None,
+            "documentation": json.dumps(case.documentation.model_dump(mode="json")),
+            "progress": json.dumps(case.progress.model_dump(mode="json")),
             "metadata": json.dumps({})  # Reserved for future use
-        })
+        }
 
-    async def _upsert_evidence(self, case_id: str, evidence_list: List[Evidence]) -> None:
-        """Upsert evidence records (normalized table)."""
+    async def _upsert_evidence(self, case_id: str, evidence_list: List[Evidence], prune: bool = True) -> None:
+        """Upsert evidence records (normalized table); prune deletes the case's other evidence."""
         # Delete existing evidence not in current list
         current_ids = [e.evidence_id for e in evidence_list]
-        if current_ids:
+        if prune and current_ids:
             delete_query = text("""
                 DELETE FROM evidence
                 WHERE case_id = :case_id
@@ -815,11 +1005,11 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 "metadata": json.dumps({})  # Reserved
             })
 
-    async def _upsert_hypotheses(self, case_id: str, hypotheses_dict: Dict[str, Hypothesis]) -> None:
-        """Upsert hypotheses records (normalized table)."""
+    async def _upsert_hypotheses(self, case_id: str, hypotheses_dict: Dict[str, Hypothesis], prune: bool = True) -> None:
+        """Upsert hypotheses records (normalized table); prune deletes the case's other hypotheses."""
         # Delete existing hypotheses not in current dict
         current_ids = list(hypotheses_dict.keys())
-        if current_ids:
+        if prune and current_ids:
             delete_query = text("""
                 DELETE FROM hypotheses
                 WHERE case_id = :case_id
@@ -864,11 +1054,11 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 "metadata": json.dumps({})
             })
 
-    async def _upsert_solutions(self, case_id: str, solutions_list: List[Solution]) -> None:
-        """Upsert solutions records (normalized table)."""
+    async def _upsert_solutions(self, case_id: str, solutions_list: List[Solution], prune: bool = True) -> None:
+        """Upsert solutions records (normalized table); prune deletes the case's other solutions."""
         # Delete existing solutions not in current list
         current_ids = [s.solution_id for s in solutions_list if hasattr(s, 'solution_id')]
-        if current_ids:
+        if prune and current_ids:
             delete_query = text("""
                 DELETE FROM solutions
                 WHERE case_id = :case_id
@@ -919,11 +1109,14 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 "metadata": json.dumps({})
             })
 
-    async def _upsert_uploaded_files(self, case_id: str, files_list: List[UploadedFile]) -> None:
-        """Upsert uploaded_files records (normalized table) - matches UploadedFile Pydantic model."""
+    async def _upsert_uploaded_files(self, case_id: str, files_list: List[UploadedFile], prune: bool = True) -> None:
+        """Upsert uploaded_files records (normalized table) - matches UploadedFile Pydantic model.
+
+        prune deletes the case's other files.
+        """
         # Delete existing files not in current list
         current_ids = [f.file_id for f in files_list]
-        if current_ids:
+        if prune and current_ids:
             delete_query = text("""
                 DELETE FROM uploaded_files
                 WHERE case_id = :case_id
@@ -989,6 +1182,26 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 "metadata": json.dumps({})
             })
 
+    @staticmethod
+    def _row_to_summary(row) -> CaseSummary:
+        """Build a CaseSummary from a list_summaries() row."""
+        status = CaseStatus(row.status)
+        return CaseSummary(
+            case_id=row.case_id,
+            title=row.title,
+            status=status,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            last_activity_at=row.last_activity_at or row.updated_at,
+            user_id=row.user_id,
+            organization_id=row.org_id or "",
+            current_turn=row.current_turn,
+            milestones_completed=row.milestones_completed,
+            # Same rules as Case.is_stuck / Case.is_terminal
+            is_stuck=row.turns_without_progress >= STUCK_TURNS_WITHOUT_PROGRESS,
+            is_terminal=status.is_terminal
+        )
+
     async def _row_to_case(self, row) -> Case:
         """
         Reconstruct Case domain object from database row.
@@ -999,71 +1212,50 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
         Returns:
             Case domain object
         """
-        # Parse JSONB columns
-        consulting = ConsultingData(**json.loads(row.consulting)) if row.consulting else ConsultingData()
-        problem_verification = ProblemVerification(**json.loads(row.problem_verification)) if row.problem_verification else None
-        working_conclusion = WorkingConclusion(**json.loads(row.working_conclusion)) if row.working_conclusion else None
-        root_cause_conclusion = RootCauseConclusion(**json.loads(row.root_cause_conclusion)) if row.root_cause_conclusion else None
-        path_selection = PathSelection(**json.loads(row.path_selection)) if row.path_selection else None
-        degraded_mode = DegradedMode(**json.loads(row.degraded_mode)) if row.degraded_mode else None
-        escalation_state = EscalationState(**json.loads(row.escalation_state)) if row.escalation_state else None
-        documentation = DocumentationData(**json.loads(row.documentation)) if row.documentation else DocumentationData()
-        progress = InvestigationProgress(**json.loads(row.progress)) if row.progress else InvestigationProgress()
-
-        # Parse normalized table data (aggregated as JSON)
-        evidence_list = [Evidence(**e) for e in json.loads(row.evidence_data)] if row.evidence_data != '[]' else []
-        hypotheses_dict = {h['hypothesis_id']: Hypothesis(**h) for h in json.loads(row.hypotheses_data)} if row.hypotheses_data != '[]' else {}
-        solutions_list = [Solution(**s) for s in json.loads(row.solutions_data)] if row.solutions_data != '[]' else []
-        uploaded_files = [UploadedFile(**f) for f in json.loads(row.uploaded_files_data)] if row.uploaded_files_data != '[]' else []
-
-        # Reconstruct Case
-        return Case(
-            case_id=row.case_id,
-            user_id=row.user_id,
-            organization_id=row.organization_id if hasattr(row, 'organization_id') else None,
-            title=row.title,
-            description=None,  # Not stored in hybrid schema
-            status=CaseStatus(row.status),
-            status_history=[],  # Load separately if needed
-            closure_reason=None,
-
-            # Progress
-            progress=progress,
-            current_turn=0,  # Not stored in hybrid schema
-            turns_without_progress=0,
-            turn_history=[],
-
-            # Path and strategy
-            path_selection=path_selection,
-            investigation_strategy=None,  # Not stored
-
-            # Problem context
-            consulting=consulting,
-            problem_verification=problem_verification,
-
-            # Investigation data (from normalized tables)
-            uploaded_files=uploaded_files,
-            evidence=evidence_list,
-            hypotheses=hypotheses_dict,
-            solutions=solutions_list,
-
-            # Conclusions
-            working_conclusion=working_conclusion,
-            root_cause_conclusion=root_cause_conclusion,
-
-            # Special states
-            degraded_mode=degraded_mode,
-            escalation_state=escalation_state,
-
-            # Documentation
-            documentation=documentation,
-
-            # Timestamps
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            last_activity_at=row.last_activity_at if hasattr(row, 'last_activity_at') else row.updated_at,
-            resolved_at=row.resolved_at if hasattr(row, 'resolved_at') else None,
-            closed_at=row.closed_at if hasattr(row, 'closed_at') else None,
+        # Hypotheses are aggregated as a list; the model keys them by ID
+        hypotheses = row.hypotheses_data
+        if hypotheses and hypotheses != '[]':
+            if isinstance(hypotheses, str):
+                hypotheses = json.loads(hypotheses)
+            hypotheses = {h['hypothesis_id']: h for h in hypotheses}
+        else:
+            hypotheses = None
+
+        # Trusted hydration: JSONB text is spliced and parsed once by
+        # pydantic-core. Status and turn history are not loaded here, and
+        # investigation_strategy is not stored, so they keep the model
+        # defaults (as does description on rows from before migration 007).
+        return hydrate_case_columns(
+            fields={
+                "case_id": row.case_id,
+                "user_id": row.user_id,
+                "organization_id": getattr(row, 'organization_id', None),
+                "title": row.title,
+                "description": getattr(row, 'description', None),
+                "status": row.status,
+                "current_turn": getattr(row, 'current_turn', 0),  # Migration 005
+                "turns_without_progress": getattr(row, 'turns_without_progress', 0),
+                "hypotheses": hypotheses,
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+                "last_activity_at": getattr(row, 'last_activity_at', None) or row.updated_at,
+                "resolved_at": getattr(row, 'resolved_at', None),
+                "closed_at": getattr(row, 'closed_at', None),
+            },
+            json_columns={
+                "consulting": row.consulting,
+                "problem_verification": row.problem_verification,
+                "working_conclusion": row.working_conclusion,
+                "root_cause_conclusion": row.root_cause_conclusion,
+                "path_selection": row.path_selection,
+                "degraded_mode": row.degraded_mode,
+                "escalation_state": row.escalation_state,
+                "documentation": row.documentation,
+                "progress": row.progress,
+                "evidence": row.evidence_data,
+                "solutions": row.solutions_data,
+                "uploaded_files": row.uploaded_files_data,
+            },
         )
 
 
@@ -167,6 +167,86 @@ class RedisReportStore(IReportStore):
             self.logger.error(f"Failed to save report: {e}", exc_info=True)
             raise ServiceException(f"Report storage failed: {str(e)}")
 
+    async def save_reports(self, reports: List[CaseReport]) -> bool:
+        """
+        Save a batch of reports with one round trip per backend.
+
+        Same steps as save_report, but batched:
+        - One HMGET per case for the current report ids being superseded
+        - One ChromaDB add for all report contents
+        - One Redis pipeline for metadata and index updates
+
+        Args:
+            reports: CaseReport objects with full content
+
+        Returns:
+            True if saved successfully
+
+        Raises:
+            ServiceException: If storage operation fails
+        """
+        if not reports:
+            return True
+
+        try:
+            self.logger.info(
+                f"Saving {len(reports)} reports",
+                extra={"report_ids": [r.report_id for r in reports]}
+            )
+
+            # 1. Resolve previous current versions (one HMGET per case)
+            types_by_case: Dict[str, List[str]] = {}
+            for report in reports:
+                types_by_case.setdefault(report.case_id, []).append(report.report_type.value)
+
+            old_report_ids = []
+            for case_id, type_values in types_by_case.items():
+                current_key = f"case:{case_id}:reports:current"
+                values = await self.redis.hmget(current_key, type_values)
+                for old_report_id in values or []:
+                    if old_report_id:
+                        old_report_ids.append(
+                            old_report_id.decode() if isinstance(old_report_id, bytes) else old_report_id
+                        )
+
+            # 2. Store all content in ChromaDB
+            await self.vector_store.add_documents(
+                [self._content_document(report) for report in reports]
+            )
+
+            # 3-4. Metadata and indexes in a single pipeline
+            pipe = self.redis.pipeline()
+            for old_report_id in old_report_ids:
+                pipe.hset(f"report:{old_report_id}:metadata", "is_current", "false")
+
+            for report in reports:
+                case_id = report.case_id
+                report_id = report.report_id
+                pipe.hset(
+                    f"report:{report_id}:metadata",
+                    mapping=self._serialize_report_metadata(report)
+                )
+                timestamp_score = parse_utc_timestamp(report.generated_at).timestamp()
+                pipe.zadd(f"case:{case_id}:reports", {report_id: timestamp_score})
+                pipe.zadd(
+                    f"case:{case_id}:reports:{report.report_type.value}",
+                    {report_id: -report.version}
+                )
+                pipe.hset(f"case:{case_id}:reports:current", report.report_type.value, report_id)
+
+            await pipe.execute()
+
+            # 5. Auto-index runbooks
+            for report in reports:
+                if report.report_type == ReportType.RUNBOOK and self.runbook_kb:
+                    await self._index_runbook(report)
+
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to save reports: {e}", exc_info=True)
+            raise ServiceException(f"Report storage failed: {str(e)}")
+
     async def get_report(self, report_id: str) -> Optional[CaseReport]:
         """
         Retrieve report by ID with full content.
@@ -456,7 +536,11 @@ class RedisReportStore(IReportStore):
 
     async def _store_content_in_chromadb(self, report: CaseReport) -> None:
         """Store report content in ChromaDB."""
-        documents = [{
+        await self.vector_store.add_documents([self._content_document(report)])
+
+    def _content_document(self, report: CaseReport) -> Dict[str, Any]:
+        """Build the ChromaDB document holding a report's content."""
+        return {
             "id": report.report_id,
             "content": report.content,
             "metadata": {
@@ -467,9 +551,7 @@ class RedisReportStore(IReportStore):
                 "generated_at": report.generated_at,
                 "version": report.version,
             }
-        }]
-
-        await self.vector_store.add_documents(documents)
+        }
 
     async def _retrieve_content_from_chromadb(
         self,
@@ -90,8 +90,8 @@ class RedisSessionManager:
         return await self.session_store.extend_ttl(session_id)
 
     async def update_last_activity(self, session_id: str) -> bool:
-        """Update last activity timestamp"""
-        return await self.update_session(session_id, {})  # This updates last_activity automatically
+        """Update last activity timestamp and TTL without rewriting the session"""
+        return await self.session_store.touch(session_id, to_json_compatible(datetime.now(timezone.utc)))
 
     async def list_sessions(self, user_id: Optional[str] = None) -> List[SessionContext]:
         """List sessions, optionally filtered by user_id"""
@@ -5,7 +5,8 @@ This module provides a Redis-based session store that implements
 the ISessionStore interface for consistent session management.
 """
 
-from typing import Dict, Optional, List, Any, Union
+from collections import OrderedDict
+from typing import Dict, Optional, List, Any, Tuple, Union
 import json
 import uuid
 from datetime import datetime, timezone
@@ -13,9 +14,200 @@ from faultmaven.models import parse_utc_timestamp
 from faultmaven.models.interfaces import ISessionStore
 from faultmaven.models.common import SessionContext
 from faultmaven.infrastructure.redis_client import create_redis_client
+from faultmaven.infrastructure.persistence.session_index import activity_score, session_type_of, summarize_session
 from faultmaven.utils.serialization import to_json_compatible
 
 
+# Session summaries live in a small hash next to each session document
+# (session_summary:<id>) and are indexed in sorted sets scored by last
+# activity: all sessions, all sessions of a type, and the same per user.
+# INDEX_KEYS defines the index key names for the scripts below; ARGV[1] is the
+# index key prefix. Every index key a script writes is passed in KEYS: the
+# caller passes the keys it expects, and a script that finds the session
+# indexed under other keys writes nothing and returns {'retry', user_id,
+# session_type} so the caller can pass the right ones.
+INDEX_KEYS = """
+local function index_keys(prefix, user_id, session_type)
+    local keys = {prefix .. 'all', prefix .. 'all:type:' .. session_type}
+    if user_id and user_id ~= '' then
+        table.insert(keys, prefix .. 'user:' .. user_id)
+        table.insert(keys, prefix .. 'user:' .. user_id .. ':type:' .. session_type)
+    end
+    return keys
+end
+
+local function declared(first, expected)
+    if #KEYS - first + 1 ~= #expected then
+        return false
+    end
+    for i, key in ipairs(expected) do
+        if KEYS[first + i - 1] ~= key then
+            return false
+        end
+    end
+    return true
+end
+
+local function retry(indexed)
+    if indexed[2] then
+        return {'retry', indexed[1] or '', indexed[2]}
+    end
+    return {'retry'}
+end
+"""
+
+# Write a session's summary and index it. An older last_activity than the one
+# already recorded (by touch) does not move the session back. Returns the
+# number of indexes the session was newly added to.
+# KEYS: summary, index keys of the summary being written, then the index keys
+# the session is currently under that are not among them.
+# ARGV: index prefix, session id, ttl, score, index ttl, field/value pairs...
+INDEX_SCRIPT = INDEX_KEYS + """
+local previous = redis.call('HMGET', KEYS[1], 'user_id', 'session_type')
+local fields = {}
+for i = 6, #ARGV, 2 do
+    fields[ARGV[i]] = ARGV[i + 1]
+end
+local current_keys = index_keys(ARGV[1], fields['user_id'], fields['session_type'])
+local expected = {unpack(current_keys)}
+local moved = previous[2] and ((previous[1] or '') ~= fields['user_id'] or previous[2] ~= fields['session_type'])
+if moved then
+    local current_set = {}
+    for _, index in ipairs(current_keys) do
+        current_set[index] = true
+    end
+    for _, index in ipairs(index_keys(ARGV[1], previous[1], previous[2])) do
+        if not current_set[index] then
+            table.insert(expected, index)
+        end
+    end
+end
+if not declared(2, expected) then
+    return retry(previous)
+end
+
+local score = tonumber(ARGV[4])
+local recorded = redis.call('HGET', KEYS[1], 'last_activity')
+local recorded_score = tonumber(redis.call('ZSCORE', KEYS[2], ARGV[2]))
+redis.call('HSET', KEYS[1], unpack(ARGV, 6))
+if recorded and recorded_score and recorded_score > score then
+    redis.call('HSET', KEYS[1], 'last_activity', recorded)
+    score = recorded_score
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+if moved then
+    for i = #current_keys + 2, #KEYS do
+        redis.call('ZREM', KEYS[i], ARGV[2])
+    end
+end
+local added = 0
+for _, index in ipairs(current_keys) do
+    added = added + redis.call('ZADD', index, score, ARGV[2])
+    redis.call('EXPIRE', index, ARGV[5])
+end
+return added
+"""
+
+# Refresh the session TTL and record activity in one round trip, without
+# reading or rewriting the session document. get() reads the recorded
+# last_activity back over the document's. KEYS: session, summary, index keys.
+# ARGV: index prefix, session id, last_activity, ttl, heartbeats, score, index ttl
+TOUCH_SCRIPT = INDEX_KEYS + """
+local indexed = redis.call('HMGET', KEYS[2], 'user_id', 'session_type')
+local expected = {}
+if indexed[2] then
+    expected = index_keys(ARGV[1], indexed[1], indexed[2])
+end
+if not declared(3, expected) then
+    return retry(indexed)
+end
+if redis.call('EXPIRE', KEYS[1], ARGV[4]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[2], 'last_activity', ARGV[3])
+if tonumber(ARGV[5]) > 0 then
+    redis.call('HINCRBY', KEYS[2], 'heartbeats', ARGV[5])
+end
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+for i = 3, #KEYS do
+    redis.call('ZADD', KEYS[i], 'XX', ARGV[6], ARGV[2])
+    redis.call('EXPIRE', KEYS[i], ARGV[7])
+end
+return 1
+"""
+
+# Remove a session from its indexes. KEYS: summary, index keys.
+# ARGV: index prefix, session id
+UNINDEX_SCRIPT = INDEX_KEYS + """
+local indexed = redis.call('HMGET', KEYS[1], 'user_id', 'session_type')
+local expected = {}
+if indexed[2] then
+    expected = index_keys(ARGV[1], indexed[1], indexed[2])
+end
+if not declared(2, expected) then
+    return retry(indexed)
+end
+for i = 2, #KEYS do
+    redis.call('ZREM', KEYS[i], ARGV[2])
+end
+return redis.call('DEL', KEYS[1])
+"""
+
+# Members of each index not active since ARGV[1], oldest first, at most
+# ARGV[2] per index. KEYS: indexes. ARGV: stale cutoff score, limit
+STALE_MEMBERS_SCRIPT = """
+local stale = {}
+for i, index in ipairs(KEYS) do
+    stale[i] = redis.call('ZRANGEBYSCORE', index, '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+end
+return stale
+"""
+
+# Drop index members whose session has expired. Sessions usually expire by
+# TTL without being deleted, so their members are pruned when the index next
+# gains a session and when it is listed.
+# KEYS: index, session key of each member. ARGV: member session ids
+PRUNE_SCRIPT = """
+local removed = 0
+for i, session_id in ipairs(ARGV) do
+    if redis.call('EXISTS', KEYS[i + 1]) == 0 then
+        removed = removed + redis.call('ZREM', KEYS[1], session_id)
+    end
+end
+return removed
+"""
+
+# One page of an index, newest activity first, with its total. Up to ARGV[6]
+# of the members not active since ARGV[1] are checked and dropped if their
+# session has expired, so the total counts live sessions once pruning has
+# caught up. A member whose summary has expired before its session
+# (extend_ttl() refreshes only the session) is returned as just its id, to be
+# re-summarized by the caller.
+# The session and summary keys are built from the ARGV prefixes rather than
+# passed in KEYS: which members to check and return is only known once the
+# index has been read inside the script, and reading it first would take a
+# second round trip and race with writes.
+# KEYS: index. ARGV: stale cutoff score, offset, limit, session prefix,
+# summary prefix, prune limit
+LIST_SCRIPT = """
+for _, session_id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[6])) do
+    if redis.call('EXISTS', ARGV[4] .. session_id) == 0 then
+        redis.call('ZREM', KEYS[1], session_id)
+    end
+end
+local offset = tonumber(ARGV[2])
+local ids = redis.call('ZREVRANGE', KEYS[1], offset, offset + tonumber(ARGV[3]) - 1)
+local rows = {}
+for i, session_id in ipairs(ids) do
+    rows[i] = redis.call('HGETALL', ARGV[5] .. session_id)
+    if #rows[i] == 0 then
+        rows[i] = {'session_id', session_id}
+    end
+end
+return {redis.call('ZCARD', KEYS[1]), rows}
+"""
+
+
 class RedisSessionStore(ISessionStore):
     """Redis implementation of the ISessionStore interface"""
     
@@ -24,7 +216,15 @@ class RedisSessionStore(ISessionStore):
         self.redis_client = None
         self.default_ttl = 1800  # 30 minutes default
         self.prefix = "session:"
+        self.summary_prefix = "session_summary:"
+        self.index_prefix = "session_index:"
+        self.index_ttl = 7 * 24 * 3600  # Sliding; refreshed whenever a session is written
         self._connection_healthy = None  # None = not yet initialized
+        # (user_id, session_type) each session was last seen indexed under, so
+        # touch() and delete() can pass its index keys without a lookup
+        self._index_identities: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self.max_index_identities = 10000
+        self.prune_batch_size = 100  # Expired members checked per index per prune
 
     async def _ensure_client(self):
         """Ensure Redis client is initialized in async context"""
@@ -59,9 +259,12 @@ class RedisSessionStore(ISessionStore):
             
             if data:
                 try:
-                    return json.loads(data)
+                    session_data = json.loads(data)
                 except json.JSONDecodeError:
                     return None
+                if isinstance(session_data, dict) and session_data.get('session_id'):
+                    await self._apply_recorded_activity(key, session_data)
+                return session_data
             return None
         except Exception as e:
             import logging
@@ -101,6 +304,8 @@ class RedisSessionStore(ISessionStore):
             ttl = ttl if ttl is not None else self.default_ttl
 
             await self.redis_client.set(full_key, serialized, ex=ttl)
+            if isinstance(value, dict) and value.get('session_id'):
+                await self._index_session(key, value, ttl)
         except Exception as e:
             import logging
             logger = logging.getLogger(__name__)
@@ -120,6 +325,10 @@ class RedisSessionStore(ISessionStore):
         """
         await self._ensure_client()
         full_key = f"{self.prefix}{key}"
+        await self._eval_indexed(
+            UNINDEX_SCRIPT, [f"{self.summary_prefix}{key}"], [self.index_prefix, key], key
+        )
+        self._index_identities.pop(key, None)
         result = await self.redis_client.delete(full_key)
         return result > 0
     
@@ -153,6 +362,245 @@ class RedisSessionStore(ISessionStore):
         ttl = ttl if ttl is not None else self.default_ttl
         return await self.redis_client.expire(full_key, ttl)
     
+    async def touch(self, key: str, last_activity: str, ttl: Optional[int] = None, heartbeats: int = 0) -> bool:
+        """
+        Record session activity and refresh TTL without rewriting the session.
+
+        Args:
+            key: Session key to touch
+            last_activity: Activity timestamp (ISO format)
+            ttl: New TTL in seconds
+            heartbeats: Number of heartbeats to add to the session counter
+
+        Returns:
+            True if touched, False if not found
+        """
+        await self._ensure_client()
+        if not self._connection_healthy or not self.redis_client:
+            raise ConnectionError("Redis connection not available")
+
+        try:
+            ttl = ttl if ttl is not None else self.default_ttl
+            result = await self._eval_indexed(
+                TOUCH_SCRIPT,
+                [f"{self.prefix}{key}", f"{self.summary_prefix}{key}"],
+                [
+                    self.index_prefix,
+                    key,
+                    last_activity,
+                    ttl,
+                    heartbeats,
+                    activity_score(last_activity),
+                    self.index_ttl,
+                ],
+                key,
+            )
+            return bool(result)
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Redis touch operation failed for key {key}: {e}")
+            self._connection_healthy = False
+            raise ConnectionError(f"Redis operation failed: {e}")
+
+    async def get_activity(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the activity recorded by touch().
+
+        Args:
+            key: Session key
+
+        Returns:
+            Dict with last_activity and heartbeats, None if never touched
+        """
+        await self._ensure_client()
+        data = await self.redis_client.hgetall(f"{self.summary_prefix}{key}")
+        if not data:
+            return None
+        data = self._decode_hash(data.items())
+        return {
+            'last_activity': data.get('last_activity'),
+            'heartbeats': int(data.get('heartbeats', 0)),
+        }
+
+    async def list_page(
+        self,
+        user_id: Optional[str] = None,
+        session_type: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        List session summaries from the write-time index in one round trip.
+
+        Args:
+            user_id: Only sessions of this user (all users if None)
+            session_type: Only sessions of this type (all types if None)
+            limit: Maximum summaries to return
+            offset: Summaries to skip
+
+        Returns:
+            Tuple of (summaries newest activity first, total matching sessions)
+        """
+        await self._ensure_client()
+        if not self._connection_healthy or not self.redis_client:
+            raise ConnectionError("Redis connection not available")
+
+        try:
+            stale_cutoff = datetime.now(timezone.utc).timestamp() - self.default_ttl
+            total, rows = await self.redis_client.eval(
+                LIST_SCRIPT,
+                1,
+                self._index_key(user_id, session_type),
+                stale_cutoff,
+                offset,
+                limit,
+                self.prefix,
+                self.summary_prefix,
+                self.prune_batch_size,
+            )
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Redis list_page operation failed for user {user_id}, type {session_type}: {e}")
+            self._connection_healthy = False
+            raise ConnectionError(f"Redis operation failed: {e}")
+
+        total = int(total)
+        summaries = []
+        for row in rows:
+            summary = self._decode_hash(zip(row[::2], row[1::2]))
+            if len(summary) == 1:
+                summary = await self._resummarize(summary['session_id'])
+                if summary is None:
+                    total -= 1
+                    continue
+            for field in ('data_uploads_count', 'case_history_count', 'heartbeats'):
+                summary[field] = int(summary.get(field, 0))
+            summaries.append(summary)
+        return summaries, total
+
+    async def _resummarize(self, key: str) -> Optional[Dict[str, Any]]:
+        """Rebuild and re-index a summary from the session document"""
+        session_data = await self.get(key)
+        if not session_data:
+            return None
+        ttl = await self.redis_client.ttl(f"{self.prefix}{key}")
+        await self._index_session(key, session_data, ttl if ttl and ttl > 0 else self.default_ttl)
+        return summarize_session(session_data)
+
+    async def _index_session(self, key: str, session_data: Dict[str, Any], ttl: int) -> None:
+        """Write the session's listing summary and add it to its indexes"""
+        summary = summarize_session(session_data)
+        fields = [item for pair in summary.items() for item in pair]
+        current = self._index_key_names((summary['user_id'], summary['session_type']))
+        added = await self._eval_indexed(
+            INDEX_SCRIPT,
+            [f"{self.summary_prefix}{key}", *current],
+            [
+                self.index_prefix,
+                key,
+                ttl,
+                activity_score(summary['last_activity']),
+                self.index_ttl,
+                *fields,
+            ],
+            key,
+            exclude=current,
+        )
+        self._remember_identity(key, (summary['user_id'], summary['session_type']))
+        if added:
+            # A new member: prune at least as many expired ones so indexes that
+            # keep being refreshed (all, all:type:*) do not grow without bound
+            await self._prune_indexes(current)
+
+    async def _prune_indexes(self, index_keys: Tuple[str, ...]) -> int:
+        """Remove up to prune_batch_size expired sessions from each index"""
+        stale_cutoff = datetime.now(timezone.utc).timestamp() - self.default_ttl
+        stale = await self.redis_client.eval(
+            STALE_MEMBERS_SCRIPT, len(index_keys), *index_keys, stale_cutoff, self.prune_batch_size
+        )
+        removed = 0
+        for index_key, members in zip(index_keys, stale):
+            session_ids = [self._decode(member) for member in members]
+            if session_ids:
+                removed += await self.redis_client.eval(
+                    PRUNE_SCRIPT,
+                    1 + len(session_ids),
+                    index_key,
+                    *(f"{self.prefix}{session_id}" for session_id in session_ids),
+                    *session_ids,
+                )
+        return removed
+
+    async def _apply_recorded_activity(self, key: str, session_data: Dict[str, Any]) -> None:
+        """Overlay the last_activity recorded by touch() when it is newer than the document's"""
+        self._remember_identity(key, (session_data.get('user_id') or '', session_type_of(session_data)))
+        recorded = await self.redis_client.hget(f"{self.summary_prefix}{key}", 'last_activity')
+        if isinstance(recorded, bytes):
+            recorded = recorded.decode('utf-8')
+        if isinstance(recorded, str) and activity_score(recorded) > activity_score(session_data.get('last_activity')):
+            session_data['last_activity'] = recorded
+
+    async def _eval_indexed(
+        self,
+        script: str,
+        keys: List[str],
+        args: List[Any],
+        session_id: str,
+        exclude: Tuple[str, ...] = (),
+    ) -> Any:
+        """Run an index script, passing the index keys the session is under
+
+        The keys come from the identity last seen for the session. When the
+        script reports the session indexed under another identity it wrote
+        nothing; the call is repeated once with that identity's keys.
+        """
+        identity = self._index_identities.get(session_id)
+        for _ in range(2):
+            index_keys = [k for k in self._index_key_names(identity) if k not in exclude]
+            result = await self.redis_client.eval(script, len(keys) + len(index_keys), *keys, *index_keys, *args)
+            if not (isinstance(result, list) and result and self._decode(result[0]) == 'retry'):
+                return result
+            identity = (self._decode(result[1]), self._decode(result[2])) if len(result) == 3 else None
+            if identity is not None:
+                self._remember_identity(session_id, identity)
+        raise ConnectionError(f"Session {session_id} was re-indexed concurrently")
+
+    def _remember_identity(self, session_id: str, identity: Tuple[str, str]) -> None:
+        self._index_identities[session_id] = identity
+        self._index_identities.move_to_end(session_id)
+        while len(self._index_identities) > self.max_index_identities:
+            self._index_identities.popitem(last=False)
+
+    def _index_key_names(self, identity: Optional[Tuple[str, str]]) -> Tuple[str, ...]:
+        """Index keys of a (user_id, session_type) identity, as index_keys() in INDEX_KEYS"""
+        if identity is None:
+            return ()
+        user_id, session_type = identity
+        keys = [self._index_key(None, None), self._index_key(None, session_type)]
+        if user_id:
+            keys += [self._index_key(user_id, None), self._index_key(user_id, session_type)]
+        return tuple(keys)
+
+    def _index_key(self, user_id: Optional[str], session_type: Optional[str]) -> str:
+        """Index key matching index_keys() in INDEX_KEYS"""
+        index_key = f"{self.index_prefix}user:{user_id}" if user_id else f"{self.index_prefix}all"
+        if session_type:
+            index_key += f":type:{session_type}"
+        return index_key
+
+    @staticmethod
+    def _decode(value: Any) -> Any:
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    @staticmethod
+    def _decode_hash(items) -> Dict[str, Any]:
+        return {
+            (k.decode('utf-8') if isinstance(k, bytes) else k): (v.decode('utf-8') if isinstance(v, bytes) else v)
+            for k, v in items
+        }
+
     async def find_by_user_and_client(self, user_id: str, client_id: str) -> Optional[str]:
         """
         Find session ID by user_id and client_id combination.
@@ -309,8 +757,8 @@ class RedisSessionStore(ISessionStore):
         return await self.extend_ttl(session_id)
 
     async def update_last_activity(self, session_id: str) -> bool:
-        """Update last activity timestamp"""
-        return await self.update_session(session_id, {})  # This updates last_activity automatically
+        """Update last activity timestamp and TTL without rewriting the session"""
+        return await self.touch(session_id, to_json_compatible(datetime.now(timezone.utc)))
 
     async def list_sessions(self, user_id: Optional[str] = None) -> List[SessionContext]:
         """List sessions, optionally filtered by user_id"""
@@ -0,0 +1,80 @@
+"""
+Session listing summaries.
+
+Session stores index a small summary of every session (type and display
+fields) when the session is written, so a page of sessions can be listed
+without loading each session document. This module holds the summary shape
+shared by the stores and the in-memory pagination they fall back to.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from faultmaven.models import parse_utc_timestamp
+from faultmaven.utils.serialization import to_json_compatible
+
+
+DEFAULT_SESSION_TYPE = "troubleshooting"
+
+
+def session_type_of(session_data: Dict[str, Any]) -> str:
+    """Session type from session data, its metadata, or the default"""
+    metadata = session_data.get("metadata") or {}
+    return (
+        session_data.get("session_type")
+        or session_data.get("usage_type")
+        or metadata.get("session_type")
+        or metadata.get("usage_type")
+        or DEFAULT_SESSION_TYPE
+    )
+
+
+def summarize_session(session_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Listing summary of a session document
+
+    Timestamps are ISO strings; counts are ints.
+    """
+    return {
+        "session_id": session_data["session_id"],
+        "user_id": session_data.get("user_id") or "",
+        "session_type": session_type_of(session_data),
+        "created_at": to_json_compatible(session_data.get("created_at")) or "",
+        "last_activity": to_json_compatible(session_data.get("last_activity")) or "",
+        "data_uploads_count": len(session_data.get("data_uploads") or []),
+        "case_history_count": len(session_data.get("case_history") or []),
+    }
+
+
+def activity_score(last_activity: Any) -> float:
+    """Sort key for a last_activity value (epoch seconds, 0 if unknown)"""
+    if not last_activity:
+        return 0.0
+    if isinstance(last_activity, datetime):
+        moment = last_activity if last_activity.tzinfo else last_activity.replace(tzinfo=timezone.utc)
+    else:
+        try:
+            moment = parse_utc_timestamp(last_activity)
+        except (TypeError, ValueError):
+            return 0.0
+    return moment.timestamp()
+
+
+def paginate_session_summaries(
+    summaries: List[Dict[str, Any]],
+    user_id: Optional[str] = None,
+    session_type: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Filter, sort by last activity (newest first) and page summaries
+
+    Returns:
+        Tuple of (page of summaries, total matching summaries)
+    """
+    matching = [
+        summary for summary in summaries
+        if (not user_id or summary["user_id"] == user_id)
+        and (not session_type or summary["session_type"] == session_type)
+    ]
+    matching.sort(key=lambda summary: (activity_score(summary["last_activity"]), summary["session_id"]), reverse=True)
+    return matching[offset:offset + limit], len(matching)
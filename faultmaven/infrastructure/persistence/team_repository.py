@@ -248,3 +248,24 @@ class PostgreSQLTeamRepository(ITeamRepository):
         row = result.fetchone()
 
         return bool(row[0]) if row else False
+
+    async def get_member(self, team_id: str, user_id: str) -> Optional[TeamMember]:
+        """Get a single team member."""
+        query = text("""
+            SELECT user_id, team_id, team_role, joined_at
+            FROM team_members
+            WHERE team_id = :team_id AND user_id = :user_id
+        """)
+
+        result = await self.db.execute(query, {"team_id": team_id, "user_id": user_id})
+        row = result.fetchone()
+
+        if not row:
+            return None
+
+        return TeamMember(
+            user_id=row.user_id,
+            team_id=row.team_id,
+            team_role=row.team_role,
+            joined_at=row.joined_at
+        )
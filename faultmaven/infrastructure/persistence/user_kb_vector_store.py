@@ -19,15 +19,17 @@ Example flow:
 4. User deletes old runbook → delete_document(user_id, doc_id)
 """
 
-from typing import List, Dict, Optional, Any
+from typing import TYPE_CHECKING, List, Dict, Optional, Any
 from datetime import datetime, timezone
-import chromadb
-from chromadb.config import Settings
 from urllib.parse import urlparse
 import logging
 
 from faultmaven.config.settings import get_settings
 from faultmaven.infrastructure.base_client import BaseExternalClient
+from faultmaven.infrastructure.persistence.chromadb_executor import ChromaDBExecutor
+
+if TYPE_CHECKING:
+    import chromadb
 
 
 logger = logging.getLogger(__name__)
@@ -55,6 +57,10 @@ class UserKBVectorStore(BaseExternalClient):
             circuit_breaker_timeout=60
         )
 
+        # Imported here to keep the ChromaDB client off the application import path
+        import chromadb
+        from chromadb.config import Settings
+
         # Get ChromaDB configuration from unified settings
         settings = get_settings()
         chromadb_url = settings.database.chromadb_url
@@ -84,6 +90,7 @@ class UserKBVectorStore(BaseExternalClient):
                 port=port,
                 settings=Settings(**settings_kwargs) if settings_kwargs else Settings()
             )
+            self.chroma = ChromaDBExecutor(self.client)
             self.logger.info("UserKBVectorStore initialized (permanent storage)")
         except Exception as e:
             self.logger.error(f"Failed to initialize ChromaDB client: {e}")
@@ -93,9 +100,21 @@ class UserKBVectorStore(BaseExternalClient):
         """Get collection name for a user"""
         return f"{self.COLLECTION_PREFIX}{user_id}"
 
-    def _get_or_create_collection(self, user_id: str) -> chromadb.Collection:
+    def _collection_metadata(self, user_id: str) -> Dict[str, Any]:
+        """Metadata stored on a user KB collection when it is first created"""
+        # Store user metadata (permanent - no TTL)
+        return {
+            "user_id": user_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "type": "user_knowledge_base"
+        }
+
+    def _get_or_create_collection(self, user_id: str) -> "chromadb.Collection":
         """
-        Get or create ChromaDB collection for a user.
+        Get or create ChromaDB collection for a user (blocking).
+
+        Collection handles are cached by the access layer, so only the first
+        call per user reaches ChromaDB.
 
         Args:
             user_id: User identifier
@@ -105,17 +124,10 @@ class UserKBVectorStore(BaseExternalClient):
         """
         collection_name = self._get_collection_name(user_id)
 
-        # Store user metadata (permanent - no TTL)
-        metadata = {
-            "user_id": user_id,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "type": "user_knowledge_base"
-        }
-
         try:
-            collection = self.client.get_or_create_collection(
-                name=collection_name,
-                metadata=metadata
+            collection = self.chroma.get_or_create_collection_sync(
+                collection_name,
+                self._collection_metadata(user_id)
             )
             self.logger.debug(f"Collection ready: {collection_name}")
             return collection
@@ -139,8 +151,6 @@ class UserKBVectorStore(BaseExternalClient):
                 - metadata: Optional metadata dict (title, category, tags, etc.)
         """
         async def _add_wrapper():
-            collection = self._get_or_create_collection(user_id)
-
             ids = [doc['id'] for doc in documents]
             contents = [doc['content'] for doc in documents]
             metadatas = [doc.get('metadata', {}) for doc in documents]
@@ -158,10 +168,14 @@ class UserKBVectorStore(BaseExternalClient):
                         sanitized[k] = str(v)
                 sanitized_metadatas.append(sanitized)
 
-            collection.add(
-                ids=ids,
-                documents=contents,
-                metadatas=sanitized_metadatas
+            await self.chroma.run_with_collection(
+                self._get_collection_name(user_id),
+                lambda collection: collection.add(
+                    ids=ids,
+                    documents=contents,
+                    metadatas=sanitized_metadatas
+                ),
+                metadata=self._collection_metadata(user_id)
             )
 
             self.logger.info(
@@ -201,29 +215,16 @@ class UserKBVectorStore(BaseExternalClient):
                 - score: Similarity score (0.0-1.0)
         """
         async def _search_wrapper():
-            collection = self._get_or_create_collection(user_id)
-
-            query_params = {
-                "query_texts": [query],
-                "n_results": k,
-                "include": ["documents", "metadatas", "distances"]
-            }
-
-            if where:
-                query_params["where"] = where
-
-            results = collection.query(**query_params)
+            results = await self.chroma.query(
+                self._get_collection_name(user_id),
+                query_texts=[query],
+                n_results=k,
+                where=where,
+                metadata=self._collection_metadata(user_id)
+            )
 
             # Format results
-            formatted_results = []
-            if results['ids'] and results['ids'][0]:
-                for i in range(len(results['ids'][0])):
-                    formatted_results.append({
-                        'id': results['ids'][0][i],
-                        'content': results['documents'][0][i],
-                        'metadata': results['metadatas'][0][i] if results['metadatas'][0] else {},
-                        'score': 1.0 - results['distances'][0][i]  # Convert distance to similarity
-                    })
+            formatted_results = self.chroma.split_query_results(results, 1)[0]
 
             self.logger.debug(
                 f"User {user_id} KB search returned {len(formatted_results)} results",
@@ -261,11 +262,11 @@ class UserKBVectorStore(BaseExternalClient):
                 - created_at: Upload timestamp
         """
         async def _list_wrapper():
-            collection = self._get_or_create_collection(user_id)
-
             # Get all documents (ChromaDB doesn't support direct pagination)
-            results = collection.get(
-                include=["metadatas"]
+            results = await self.chroma.run_with_collection(
+                self._get_collection_name(user_id),
+                lambda collection: collection.get(include=["metadatas"]),
+                metadata=self._collection_metadata(user_id)
             )
 
             documents = []
@@ -308,10 +309,12 @@ class UserKBVectorStore(BaseExternalClient):
             doc_id: Document ID to delete
         """
         async def _delete_wrapper():
-            collection = self._get_or_create_collection(user_id)
-
             try:
-                collection.delete(ids=[doc_id])
+                await self.chroma.run_with_collection(
+                    self._get_collection_name(user_id),
+                    lambda collection: collection.delete(ids=[doc_id]),
+                    metadata=self._collection_metadata(user_id)
+                )
                 self.logger.info(
                     f"Deleted document {doc_id} from user {user_id} KB",
                     extra={"user_id": user_id, "doc_id": doc_id}
@@ -341,7 +344,7 @@ class UserKBVectorStore(BaseExternalClient):
             collection_name = self._get_collection_name(user_id)
 
             try:
-                self.client.delete_collection(name=collection_name)
+                await self.chroma.delete_collection(collection_name)
                 self.logger.info(
                     f"Deleted user KB collection: {collection_name}",
                     extra={"user_id": user_id, "collection": collection_name}
@@ -369,8 +372,11 @@ class UserKBVectorStore(BaseExternalClient):
             Number of documents
         """
         async def _count_wrapper():
-            collection = self._get_or_create_collection(user_id)
-            return collection.count()
+            return await self.chroma.run_with_collection(
+                self._get_collection_name(user_id),
+                lambda collection: collection.count(),
+                metadata=self._collection_metadata(user_id)
+            )
 
         return await self.call_external(
             operation_name="get_document_count",
@@ -7,6 +7,7 @@ import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone, timedelta
 from collections import deque
+from dataclasses import dataclass, field
 import json
 import os
 
@@ -27,6 +28,28 @@ from faultmaven.models.behavioral import (
 )
 
 
+# Model input features, in vector order
+FEATURE_NAMES = [
+    'response_time', 'payload_size', 'avg_interval', 'interval_stddev',
+    'request_frequency', 'error_rate', 'endpoint_diversity'
+]
+
+
+@dataclass(frozen=True)
+class ModelSet:
+    """Fitted models and the statistics scored against them
+
+    Replaced as a whole after each training run, so scoring always uses a
+    consistent set even while a new one is being fitted.
+    """
+    isolation_forest: Any = None
+    scaler: Any = None
+    clustering_model: Any = None
+    pca_model: Any = None
+    feature_stats: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    adaptive_thresholds: Dict[str, float] = field(default_factory=dict)
+
+
 class ModelFeedback:
     """Feedback for model improvement"""
     def __init__(self, prediction_id: str, actual_outcome: str, confidence: float):
@@ -63,7 +86,8 @@ class AnomalyDetectionSystem:
     
     Features:
     - Multiple detection algorithms (Isolation Forest, Statistical, Clustering)
-    - Online learning capabilities
+    - Vectorized batch scoring (one model call per batch of vectors)
+    - Online learning, with training off the event loop
     - Explainable detection results
     - Adaptive thresholds
     - Model persistence and loading
@@ -77,11 +101,8 @@ class AnomalyDetectionSystem:
         # Ensure model directory exists
         os.makedirs(self.model_path, exist_ok=True)
         
-        # Model components
-        self.isolation_forest = None
-        self.scaler = None
-        self.clustering_model = None
-        self.pca_model = None
+        # Model components; untrained until the first training run
+        self.models = ModelSet()
         
         # Training data buffer for online learning
         self.training_buffer = deque(maxlen=10000)
@@ -93,9 +114,9 @@ class AnomalyDetectionSystem:
         self.retrain_interval = timedelta(hours=24)
         self.last_training = None
         
-        # Feature statistics for normalization
-        self.feature_stats = {}
-        self.adaptive_thresholds = {}
+        # Background training state
+        self._training = False
+        self._retrain_task: Optional[asyncio.Task] = None
         
         # Model performance tracking
         self.model_metrics = {
@@ -106,18 +127,44 @@ class AnomalyDetectionSystem:
             "model_accuracy": 0.0
         }
         
-        # Initialize models
+        # Load previously trained models
         if SKLEARN_AVAILABLE:
-            self._initialize_ml_models()
             self._load_models()
         else:
             self.logger.warning("ML models not available, using statistical fallback")
         
         self.logger.info("AnomalyDetectionSystem initialized")
 
+    @property
+    def isolation_forest(self):
+        return self.models.isolation_forest
+
+    @property
+    def scaler(self):
+        return self.models.scaler
+
+    @property
+    def clustering_model(self):
+        return self.models.clustering_model
+
+    @property
+    def pca_model(self):
+        return self.models.pca_model
+
+    @property
+    def feature_stats(self) -> Dict[str, Dict[str, float]]:
+        return self.models.feature_stats
+
+    @property
+    def adaptive_thresholds(self) -> Dict[str, float]:
+        return self.models.adaptive_thresholds
+
     async def detect_anomalies(self, behavior_vector: BehaviorVector) -> AnomalyResult:
         """
-        Detect anomalies in behavior vector using multiple methods
+        Detect anomalies in a single behavior vector using multiple methods
+        
+        Scores inline. The request path goes through AnomalyScoringQueue,
+        which scores vectors in batches in a worker thread instead.
         
         Args:
             behavior_vector: Behavioral features to analyze
@@ -125,73 +172,66 @@ class AnomalyDetectionSystem:
         Returns:
             AnomalyResult with detection details
         """
-        try:
-            # Extract features
-            features = behavior_vector.features
-            feature_array = self._vectorize_features(features)
-            
-            # Perform detection with multiple methods
-            isolation_score = await self._isolation_forest_detection(feature_array)
-            statistical_score = await self._statistical_detection(features)
-            pattern_score = await self._pattern_detection(features)
-            
-            # Combine scores
-            overall_score = (isolation_score + statistical_score + pattern_score) / 3.0
-            
-            # Determine anomaly types
-            anomaly_types = []
-            if isolation_score > self.anomaly_threshold:
-                anomaly_types.append(AnomalyType.STATISTICAL_OUTLIER)
-            if statistical_score > self.anomaly_threshold:
-                anomaly_types.append(AnomalyType.FREQUENCY_ANOMALY)
-            if pattern_score > self.anomaly_threshold:
-                anomaly_types.append(AnomalyType.PATTERN_ANOMALY)
-            
-            # Generate explanation
-            explanation = self._generate_explanation(features, overall_score)
-            
-            # Create result
-            result = AnomalyResult(
-                session_id=behavior_vector.extraction_timestamp.isoformat(),  # Use timestamp as temp ID
-                overall_score=overall_score,
-                anomaly_types=anomaly_types,
-                pattern_anomalies={"overall": overall_score},
-                feature_contributions=self._calculate_feature_contributions(features),
-                detection_timestamp=datetime.now(timezone.utc),
-                model_version="2.0",
-                model_confidence=behavior_vector.confidence,
-                detection_method="ensemble",
-                explanation=explanation.explanation_text,
-                recommended_actions=self._get_recommended_actions(overall_score, anomaly_types)
-            )
+        return self.score_batch([behavior_vector])[0]
+
+    def score_batch(
+        self, behavior_vectors: List[BehaviorVector], session_ids: Optional[List[str]] = None
+    ) -> List[AnomalyResult]:
+        """
+        Score behavior vectors with one scaler and Isolation Forest call per batch
+        
+        Blocking; run it in a worker thread when called on behalf of requests.
+        
+        Args:
+            behavior_vectors: Behavioral features to analyze
+            session_ids: Session of each vector (defaults to its extraction timestamp)
+            
+        Returns:
+            One AnomalyResult per vector, in order
+        """
+        if not behavior_vectors:
+            return []
+        
+        # One consistent model set for the whole batch
+        models = self.models
+        X = np.array([self._vectorize_features(vector.features) for vector in behavior_vectors])
+        isolation_scores = self._isolation_forest_scores(models, X)
+        
+        results = []
+        timestamp = datetime.now(timezone.utc)
+        for i, vector in enumerate(behavior_vectors):
+            session_id = session_ids[i] if session_ids else vector.extraction_timestamp.isoformat()
+            try:
+                result = self._build_result(models, vector, session_id, float(isolation_scores[i]))
+            except Exception as e:
+                self.logger.error(f"Error in anomaly detection: {e}")
+                results.append(self._error_result(session_id))
+                continue
+            results.append(result)
             
             # Update metrics
             self.model_metrics["total_predictions"] += 1
-            if overall_score > self.anomaly_threshold:
+            if result.overall_score > self.anomaly_threshold:
                 self.model_metrics["anomalies_detected"] += 1
             
             # Add to training buffer for online learning
             if self.enable_online_learning:
-                await self._add_training_sample(feature_array, overall_score)
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error in anomaly detection: {e}")
-            return AnomalyResult(
-                session_id="error",
-                overall_score=0.0,
-                anomaly_types=[],
-                detection_timestamp=datetime.now(timezone.utc),
-                model_version="2.0",
-                model_confidence=0.0,
-                detection_method="error_fallback"
-            )
+                self.training_buffer.append({
+                    'features': X[i],
+                    'anomaly_score': result.overall_score,
+                    'timestamp': timestamp
+                })
+        
+        return results
 
     async def train_models(self, historical_data: List[Dict[str, Any]]):
         """
         Train models on historical behavioral data
         
+        Fitting runs in a worker thread. The new model set replaces the
+        current one in a single assignment when complete, so scoring carries
+        on with the old models meanwhile and never sees a partial set.
+        
         Args:
             historical_data: List of behavior records with features and labels
         """
@@ -204,48 +244,21 @@ class AnomalyDetectionSystem:
                 self.logger.warning(f"Insufficient training data: {len(historical_data)} < {self.min_training_samples}")
                 return
             
-            self.logger.info(f"Training anomaly detection models on {len(historical_data)} samples")
-            
-            # Prepare training data
-            X = []
-            for record in historical_data:
-                features = record.get('features', {})
-                feature_vector = self._vectorize_features(features)
-                X.append(feature_vector)
-            
-            X = np.array(X)
-            
-            # Train scaler
-            self.scaler = StandardScaler()
-            X_scaled = self.scaler.fit_transform(X)
-            
-            # Train Isolation Forest
-            self.isolation_forest = IsolationForest(
-                contamination=0.1,  # Expect 10% anomalies
-                random_state=42,
-                n_estimators=100
-            )
-            self.isolation_forest.fit(X_scaled)
-            
-            # Train clustering model for pattern detection
-            self.clustering_model = DBSCAN(eps=0.5, min_samples=5)
-            cluster_labels = self.clustering_model.fit_predict(X_scaled)
-            
-            # Train PCA for dimensionality reduction
-            self.pca_model = PCA(n_components=min(10, X.shape[1]))
-            self.pca_model.fit(X_scaled)
-            
-            # Update feature statistics
-            self._update_feature_stats(historical_data)
-            
-            # Update adaptive thresholds
-            self._update_adaptive_thresholds(X_scaled)
-            
-            # Save models
-            await self._save_models()
+            if self._training:
+                self.logger.debug("Model training already in progress")
+                return
             
-            self.last_training = datetime.now(timezone.utc)
-            self.logger.info("Model training completed successfully")
+            self._training = True
+            try:
+                self.logger.info(f"Training anomaly detection models on {len(historical_data)} samples")
+                self.models = await asyncio.to_thread(self._fit_models, historical_data)
+                self.last_training = datetime.now(timezone.utc)
+                
+                # Save models
+                await self._save_models()
+                self.logger.info("Model training completed successfully")
+            finally:
+                self._training = False
             
         except Exception as e:
             self.logger.error(f"Error training models: {e}")
@@ -254,6 +267,9 @@ class AnomalyDetectionSystem:
         """
         Update models with feedback for online learning
         
+        Retraining, when due, is started in the background; this call never
+        waits for it.
+        
         Args:
             feedback: Feedback on model predictions
         """
@@ -276,7 +292,7 @@ class AnomalyDetectionSystem:
             
             # Trigger retraining if needed
             if await self._should_retrain():
-                await self._retrain_with_feedback()
+                self._retrain_task = asyncio.create_task(self._retrain_with_feedback())
                 
         except Exception as e:
             self.logger.error(f"Error in online learning update: {e}")
@@ -302,39 +318,80 @@ class AnomalyDetectionSystem:
             self.logger.error(f"Error generating explanation: {e}")
             return AnomalyExplanation({}, {})
 
-    async def _isolation_forest_detection(self, feature_array: np.ndarray) -> float:
-        """Detect anomalies using Isolation Forest"""
-        if not SKLEARN_AVAILABLE or self.isolation_forest is None:
-            return 0.0
+    def _build_result(self, models: ModelSet, behavior_vector: BehaviorVector,
+                      session_id: str, isolation_score: float) -> AnomalyResult:
+        """Combine the detection methods into one result for a vector"""
+        features = behavior_vector.features
+        statistical_score = self._statistical_score(features, models.feature_stats)
+        pattern_score = self._pattern_score(features)
+        
+        # Combine scores
+        overall_score = (isolation_score + statistical_score + pattern_score) / 3.0
+        
+        # Determine anomaly types
+        anomaly_types = []
+        if isolation_score > self.anomaly_threshold:
+            anomaly_types.append(AnomalyType.STATISTICAL_OUTLIER)
+        if statistical_score > self.anomaly_threshold:
+            anomaly_types.append(AnomalyType.FREQUENCY_ANOMALY)
+        if pattern_score > self.anomaly_threshold:
+            anomaly_types.append(AnomalyType.PATTERN_ANOMALY)
+        
+        # Generate explanation
+        explanation = self._generate_explanation(features, overall_score, models.adaptive_thresholds)
+        
+        return AnomalyResult(
+            session_id=session_id,
+            overall_score=overall_score,
+            anomaly_types=anomaly_types,
+            pattern_anomalies={"overall": overall_score},
+            feature_contributions=self._calculate_feature_contributions(features, models.feature_stats),
+            detection_timestamp=datetime.now(timezone.utc),
+            ml_model_version="2.0",
+            ml_model_confidence=behavior_vector.confidence,
+            detection_method="ensemble",
+            explanation=explanation.explanation_text,
+            recommended_actions=self._get_recommended_actions(overall_score, anomaly_types)
+        )
+
+    @staticmethod
+    def _error_result(session_id: str) -> AnomalyResult:
+        return AnomalyResult(
+            session_id=session_id,
+            overall_score=0.0,
+            anomaly_types=[],
+            detection_timestamp=datetime.now(timezone.utc),
+            ml_model_version="2.0",
+            ml_model_confidence=0.0,
+            detection_method="error_fallback"
+        )
+
+    def _isolation_forest_scores(self, models: ModelSet, X: np.ndarray) -> np.ndarray:
+        """Isolation Forest anomaly scores (0-1) for a batch of feature rows"""
+        if not SKLEARN_AVAILABLE or models.isolation_forest is None:
+            return np.zeros(len(X))
         
         try:
             # Scale features
-            if self.scaler:
-                feature_scaled = self.scaler.transform([feature_array])
-            else:
-                feature_scaled = [feature_array]
-            
-            # Get anomaly score
-            anomaly_score = self.isolation_forest.decision_function(feature_scaled)[0]
+            X_scaled = models.scaler.transform(X) if models.scaler is not None else X
             
             # Convert to 0-1 range (negative scores indicate anomalies)
-            normalized_score = max(0.0, -anomaly_score)
-            return min(normalized_score, 1.0)
+            return np.clip(-models.isolation_forest.decision_function(X_scaled), 0.0, 1.0)
             
         except Exception as e:
             self.logger.error(f"Error in isolation forest detection: {e}")
-            return 0.0
+            return np.zeros(len(X))
 
-    async def _statistical_detection(self, features: Dict[str, float]) -> float:
+    def _statistical_score(self, features: Dict[str, float], feature_stats: Dict[str, Dict[str, float]]) -> float:
         """Statistical anomaly detection using feature statistics"""
         try:
-            if not self.feature_stats:
+            if not feature_stats:
                 return 0.0
             
             anomaly_scores = []
             
             for feature_name, value in features.items():
-                stats = self.feature_stats.get(feature_name, {})
+                stats = feature_stats.get(feature_name, {})
                 mean = stats.get('mean', 0.0)
                 std = stats.get('std', 1.0)
                 
@@ -346,14 +403,14 @@ class AnomalyDetectionSystem:
                     anomaly_scores.append(anomaly_score)
             
             if anomaly_scores:
-                return np.mean(anomaly_scores)
+                return float(np.mean(anomaly_scores))
             return 0.0
             
         except Exception as e:
             self.logger.error(f"Error in statistical detection: {e}")
             return 0.0
 
-    async def _pattern_detection(self, features: Dict[str, float]) -> float:
+    def _pattern_score(self, features: Dict[str, float]) -> float:
         """Pattern-based anomaly detection"""
         try:
             # Simple pattern-based rules
@@ -389,14 +446,8 @@ class AnomalyDetectionSystem:
 
     def _vectorize_features(self, features: Dict[str, float]) -> np.ndarray:
         """Convert feature dictionary to numpy array"""
-        # Define expected features in consistent order
-        expected_features = [
-            'response_time', 'payload_size', 'avg_interval', 'interval_stddev',
-            'request_frequency', 'error_rate', 'endpoint_diversity'
-        ]
-        
         vector = []
-        for feature in expected_features:
+        for feature in FEATURE_NAMES:
             value = features.get(feature, 0.0)
             # Handle potential None values
             if value is None:
@@ -405,9 +456,10 @@ class AnomalyDetectionSystem:
         
         return np.array(vector)
 
-    def _generate_explanation(self, features: Dict[str, float], anomaly_score: float) -> AnomalyExplanation:
+    def _generate_explanation(self, features: Dict[str, float], anomaly_score: float,
+                              thresholds: Optional[Dict[str, float]] = None) -> AnomalyExplanation:
         """Generate human-readable explanation for anomaly"""
-        explanation = AnomalyExplanation(features, self.adaptive_thresholds)
+        explanation = AnomalyExplanation(features, self.adaptive_thresholds if thresholds is None else thresholds)
         
         if anomaly_score > 0.7:
             explanation.explanation_text = "High anomaly score indicates significant deviation from normal behavior"
@@ -420,12 +472,15 @@ class AnomalyDetectionSystem:
         
         return explanation
 
-    def _calculate_feature_contributions(self, features: Dict[str, float]) -> Dict[str, float]:
+    def _calculate_feature_contributions(self, features: Dict[str, float],
+                                         feature_stats: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, float]:
         """Calculate how much each feature contributes to anomaly detection"""
+        if feature_stats is None:
+            feature_stats = self.feature_stats
         contributions = {}
         
         for feature_name, value in features.items():
-            stats = self.feature_stats.get(feature_name, {})
+            stats = feature_stats.get(feature_name, {})
             mean = stats.get('mean', 0.0)
             std = stats.get('std', 1.0)
             
@@ -461,54 +516,42 @@ class AnomalyDetectionSystem:
         
         return actions
 
-    async def _add_training_sample(self, feature_array: np.ndarray, anomaly_score: float):
-        """Add sample to training buffer for online learning"""
-        sample = {
-            'features': feature_array,
-            'anomaly_score': anomaly_score,
-            'timestamp': datetime.now(timezone.utc)
-        }
-        self.training_buffer.append(sample)
-
     async def _should_retrain(self) -> bool:
         """Determine if models should be retrained"""
+        # Never run two trainings at once
+        if self._training or (self._retrain_task is not None and not self._retrain_task.done()):
+            return False
+        
         # Retrain if enough time has passed
         if self.last_training and datetime.now(timezone.utc) - self.last_training < self.retrain_interval:
             return False
         
+        # Nothing to train on yet
+        if len(self.training_buffer) < self.min_training_samples:
+            return False
+        
         # Retrain if accuracy has dropped significantly
         if self.model_metrics["model_accuracy"] < 0.7:
             return True
         
         # Retrain if we have enough new training data
-        if len(self.training_buffer) >= self.min_training_samples:
-            return True
-        
-        return False
+        return True
 
     async def _retrain_with_feedback(self):
         """Retrain models incorporating feedback"""
         try:
-            if len(self.training_buffer) < self.min_training_samples:
+            # Snapshot: scoring keeps appending while the models are fitted
+            samples = list(self.training_buffer)
+            if len(samples) < self.min_training_samples:
                 return
             
             self.logger.info("Retraining models with feedback")
             
             # Prepare training data from buffer
-            historical_data = []
-            for sample in self.training_buffer:
-                features_dict = {}
-                feature_array = sample['features']
-                expected_features = [
-                    'response_time', 'payload_size', 'avg_interval', 'interval_stddev',
-                    'request_frequency', 'error_rate', 'endpoint_diversity'
-                ]
-                
-                for i, feature_name in enumerate(expected_features):
-                    if i < len(feature_array):
-                        features_dict[feature_name] = feature_array[i]
-                
-                historical_data.append({'features': features_dict})
+            historical_data = [
+                {'features': dict(zip(FEATURE_NAMES, sample['features']))}
+                for sample in samples
+            ]
             
             # Retrain
             await self.train_models(historical_data)
@@ -516,20 +559,42 @@ class AnomalyDetectionSystem:
         except Exception as e:
             self.logger.error(f"Error in retraining: {e}")
 
-    def _initialize_ml_models(self):
-        """Initialize ML models with default parameters"""
-        if not SKLEARN_AVAILABLE:
-            return
+    def _fit_models(self, historical_data: List[Dict[str, Any]]) -> ModelSet:
+        """Fit a complete model set (blocking; runs in a worker thread)"""
+        X = np.array([self._vectorize_features(record.get('features', {})) for record in historical_data])
         
-        self.isolation_forest = IsolationForest(
-            contamination=0.1,
+        # Train scaler
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+        
+        # Train Isolation Forest
+        isolation_forest = IsolationForest(
+            contamination=0.1,  # Expect 10% anomalies
             random_state=42,
             n_estimators=100
         )
-        self.scaler = StandardScaler()
+        isolation_forest.fit(X_scaled)
+        
+        # Train clustering model for pattern detection
+        clustering_model = DBSCAN(eps=0.5, min_samples=5)
+        clustering_model.fit(X_scaled)
+        
+        # Train PCA for dimensionality reduction
+        pca_model = PCA(n_components=min(10, X.shape[1]))
+        pca_model.fit(X_scaled)
+        
+        return ModelSet(
+            isolation_forest=isolation_forest,
+            scaler=scaler,
+            clustering_model=clustering_model,
+            pca_model=pca_model,
+            feature_stats=self._compute_feature_stats(historical_data),
+            adaptive_thresholds=self._compute_adaptive_thresholds(X_scaled)
+        )
 
-    def _update_feature_stats(self, historical_data: List[Dict[str, Any]]):
-        """Update feature statistics for normalization"""
+    @staticmethod
+    def _compute_feature_stats(historical_data: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+        """Feature statistics for normalization"""
         feature_values = {}
         
         for record in historical_data:
@@ -540,55 +605,58 @@ class AnomalyDetectionSystem:
                 feature_values[feature_name].append(value)
         
         # Calculate statistics
+        feature_stats = {}
         for feature_name, values in feature_values.items():
             if values:
-                self.feature_stats[feature_name] = {
-                    'mean': np.mean(values),
-                    'std': np.std(values),
-                    'min': np.min(values),
-                    'max': np.max(values)
+                feature_stats[feature_name] = {
+                    'mean': float(np.mean(values)),
+                    'std': float(np.std(values)),
+                    'min': float(np.min(values)),
+                    'max': float(np.max(values))
                 }
+        return feature_stats
 
-    def _update_adaptive_thresholds(self, X_scaled: np.ndarray):
-        """Update adaptive thresholds based on training data"""
+    @staticmethod
+    def _compute_adaptive_thresholds(X_scaled: np.ndarray) -> Dict[str, float]:
+        """Adaptive thresholds based on training data"""
         if X_scaled.size == 0:
-            return
+            return {}
         
         # Calculate thresholds as 95th percentile of each feature
-        for i, feature_name in enumerate(['response_time', 'payload_size', 'avg_interval', 
-                                        'interval_stddev', 'request_frequency', 'error_rate', 
-                                        'endpoint_diversity']):
-            if i < X_scaled.shape[1]:
-                feature_values = X_scaled[:, i]
-                threshold = np.percentile(feature_values, 95)
-                self.adaptive_thresholds[feature_name] = threshold
+        return {
+            feature_name: float(np.percentile(X_scaled[:, i], 95))
+            for i, feature_name in enumerate(FEATURE_NAMES)
+            if i < X_scaled.shape[1]
+        }
 
     async def _save_models(self):
         """Save trained models to disk"""
         if not SKLEARN_AVAILABLE:
             return
         
+        models = self.models
+        payload = {
+            'isolation_forest': models.isolation_forest,
+            'scaler': models.scaler,
+            'clustering_model': models.clustering_model,
+            'pca_model': models.pca_model,
+            'feature_stats': models.feature_stats,
+            'adaptive_thresholds': models.adaptive_thresholds,
+            'model_metrics': dict(self.model_metrics),
+            'last_training': self.last_training
+        }
         try:
-            models = {
-                'isolation_forest': self.isolation_forest,
-                'scaler': self.scaler,
-                'clustering_model': self.clustering_model,
-                'pca_model': self.pca_model,
-                'feature_stats': self.feature_stats,
-                'adaptive_thresholds': self.adaptive_thresholds,
-                'model_metrics': self.model_metrics,
-                'last_training': self.last_training
-            }
-            
-            model_file = os.path.join(self.model_path, 'anomaly_models.pkl')
-            with open(model_file, 'wb') as f:
-                pickle.dump(models, f)
-            
-            self.logger.info(f"Models saved to {model_file}")
-            
+            await asyncio.to_thread(self._write_models, payload)
         except Exception as e:
             self.logger.error(f"Error saving models: {e}")
 
+    def _write_models(self, payload: Dict[str, Any]):
+        model_file = os.path.join(self.model_path, 'anomaly_models.pkl')
+        with open(model_file, 'wb') as f:
+            pickle.dump(payload, f)
+        
+        self.logger.info(f"Models saved to {model_file}")
+
     def _load_models(self):
         """Load trained models from disk"""
         if not SKLEARN_AVAILABLE:
@@ -600,12 +668,21 @@ class AnomalyDetectionSystem:
                 with open(model_file, 'rb') as f:
                     models = pickle.load(f)
                 
-                self.isolation_forest = models.get('isolation_forest')
-                self.scaler = models.get('scaler')
-                self.clustering_model = models.get('clustering_model')
-                self.pca_model = models.get('pca_model')
-                self.feature_stats = models.get('feature_stats', {})
-                self.adaptive_thresholds = models.get('adaptive_thresholds', {})
+                isolation_forest = models.get('isolation_forest')
+                scaler = models.get('scaler')
+                # Older files may hold models that were never fitted
+                if not hasattr(isolation_forest, 'estimators_') or (
+                        scaler is not None and not hasattr(scaler, 'mean_')):
+                    isolation_forest, scaler = None, None
+                
+                self.models = ModelSet(
+                    isolation_forest=isolation_forest,
+                    scaler=scaler,
+                    clustering_model=models.get('clustering_model'),
+                    pca_model=models.get('pca_model'),
+                    feature_stats=models.get('feature_stats', {}),
+                    adaptive_thresholds=models.get('adaptive_thresholds', {})
+                )
                 self.model_metrics = models.get('model_metrics', self.model_metrics)
                 self.last_training = models.get('last_training')
                 
@@ -621,10 +698,11 @@ class AnomalyDetectionSystem:
         return {
             "ml_available": SKLEARN_AVAILABLE,
             "models_trained": self.isolation_forest is not None,
+            "training_in_progress": self._training,
             "last_training": self.last_training.isoformat() if self.last_training else None,
             "training_samples": len(self.training_buffer),
             "feedback_samples": len(self.feedback_buffer),
             "metrics": self.model_metrics.copy(),
             "feature_stats_available": bool(self.feature_stats),
             "adaptive_thresholds_count": len(self.adaptive_thresholds)
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,173 @@
+"""
+Micro-batched Anomaly Scoring
+
+Moves ML anomaly scoring off the request path. A request submits its
+session's latest behavior vector and reads the most recent verdict for that
+session; both are dictionary operations. A background worker thread scores
+the submitted vectors in batches through AnomalyDetectionSystem.score_batch,
+so the scaler and Isolation Forest run once per batch instead of once per
+request.
+
+A verdict therefore applies from the session's next request on, not to the
+request that produced its vector.
+
+- Coalescing: only the newest pending vector of a session is scored, and a
+  vector that already has a current verdict is not scored again.
+- Bounded: when ``max_pending`` sessions are waiting, vectors from further
+  sessions are dropped (and counted) until the worker catches up.
+- Verdicts older than ``verdict_ttl`` seconds are ignored and pruned.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from faultmaven.models.behavioral import AnomalyResult, BehaviorVector
+
+from .anomaly_detector import AnomalyDetectionSystem
+
+logger = logging.getLogger(__name__)
+
+
+class AnomalyScoringQueue:
+    """Per-session behavior vectors scored in batches by a worker thread
+
+    The worker wakes every ``max_delay`` seconds, or as soon as a full batch
+    is pending, and scores everything pending in batches of ``batch_size``.
+    """
+
+    def __init__(
+        self,
+        detector: AnomalyDetectionSystem,
+        batch_size: int = 64,
+        max_delay: float = 0.05,
+        max_pending: int = 10000,
+        verdict_ttl: float = 300.0,
+    ):
+        """
+        Args:
+            detector: Anomaly detection system providing score_batch()
+            batch_size: Maximum vectors scored per model call
+            max_delay: Maximum seconds a vector waits before it is scored
+            max_pending: Maximum sessions waiting to be scored
+            verdict_ttl: Seconds a verdict stays applicable
+        """
+        self.detector = detector
+        self.batch_size = max(1, batch_size)
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.verdict_ttl = verdict_ttl
+
+        self._pending: Dict[str, BehaviorVector] = {}
+        # session -> (verdict, monotonic time scored, vector it was scored from)
+        self._verdicts: Dict[str, Tuple[AnomalyResult, float, BehaviorVector]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self.submitted = 0
+        self.dropped = 0
+        self.scored = 0
+        self.batches = 0
+        self.failed_batches = 0
+
+    # Request path
+
+    def submit(self, session_id: str, behavior_vector: BehaviorVector) -> bool:
+        """Queue a session's latest vector for scoring; False if dropped"""
+        entry = self._verdicts.get(session_id)
+        if entry is not None and entry[2] is behavior_vector and time.monotonic() - entry[1] <= self.verdict_ttl:
+            return True
+        with self._lock:
+            pending = self._pending
+            if session_id not in pending and len(pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            pending[session_id] = behavior_vector
+            self.submitted += 1
+            full = len(pending) >= self.batch_size
+        if full:
+            self._wakeup.set()
+        return True
+
+    def verdict(self, session_id: str) -> Optional[AnomalyResult]:
+        """Most recent verdict for the session, unless it has expired"""
+        entry = self._verdicts.get(session_id)
+        if entry is None or time.monotonic() - entry[1] > self.verdict_ttl:
+            return None
+        return entry[0]
+
+    def prune(self) -> int:
+        """Drop expired verdicts; returns how many were removed"""
+        cutoff = time.monotonic() - self.verdict_ttl
+        expired = [session_id for session_id, (_, scored_at, _) in list(self._verdicts.items()) if scored_at < cutoff]
+        for session_id in expired:
+            self._verdicts.pop(session_id, None)
+        return len(expired)
+
+    # Worker thread
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="faultmaven-anomaly-scorer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Score everything still pending, then stop the worker thread"""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._stopping = True
+        self._wakeup.set()
+        thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.max_delay)
+            self._wakeup.clear()
+            stopping = self._stopping
+
+            self.drain()
+            if stopping:
+                return
+
+    def drain(self) -> None:
+        """Score all pending vectors (worker thread; callable directly in tests)"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+
+        items = list(pending.items())
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            session_ids = [session_id for session_id, _ in batch]
+            try:
+                results = self.detector.score_batch([vector for _, vector in batch], session_ids)
+            except Exception as e:
+                self.failed_batches += 1
+                logger.error(f"Anomaly scoring batch failed: {e}")
+                continue
+
+            scored_at = time.monotonic()
+            for (session_id, vector), result in zip(batch, results):
+                self._verdicts[session_id] = (result, scored_at, vector)
+            self.scored += len(batch)
+            self.batches += 1
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "pending": len(self._pending),
+            "verdicts": len(self._verdicts),
+            "batch_size": self.batch_size,
+            "submitted": self.submitted,
+            "scored": self.scored,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "dropped": self.dropped,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
@@ -16,6 +16,7 @@ from faultmaven.models.protection import SystemMetrics
 
 from .behavioral_analyzer import BehavioralAnalyzer
 from .anomaly_detector import AnomalyDetectionSystem, ModelFeedback
+from .anomaly_scoring import AnomalyScoringQueue
 from .reputation_engine import ReputationEngine
 from .smart_circuit_breaker import SmartCircuitBreaker, CircuitConfig, Request, Response
 
@@ -33,6 +34,8 @@ class ProtectionConfig:
     ml_model_path: str = "/tmp/faultmaven_ml_models"
     ml_training_enabled: bool = True
     ml_online_learning: bool = True
+    ml_scoring_batch_size: int = 64  # vectors per model call
+    ml_scoring_max_delay_ms: int = 50  # max wait before a vector is scored
     
     # Reputation system
     enable_reputation_system: bool = True
@@ -69,6 +72,7 @@ class ProtectionCoordinator:
         # Initialize components
         self.behavioral_analyzer = None
         self.anomaly_detector = None
+        self.anomaly_scorer: Optional[AnomalyScoringQueue] = None
         self.reputation_engine = None
         self.circuit_breakers: Dict[str, SmartCircuitBreaker] = {}
         
@@ -110,6 +114,12 @@ class ProtectionCoordinator:
                     model_path=self.config.ml_model_path,
                     enable_online_learning=self.config.ml_online_learning
                 )
+                self.anomaly_scorer = AnomalyScoringQueue(
+                    self.anomaly_detector,
+                    batch_size=self.config.ml_scoring_batch_size,
+                    max_delay=self.config.ml_scoring_max_delay_ms / 1000.0
+                )
+                self.anomaly_scorer.start()
                 self.logger.info("ML anomaly detector initialized")
             
             # Initialize reputation engine
@@ -160,16 +170,18 @@ class ProtectionCoordinator:
                     client_profile.behavior_profile.last_updated = datetime.now(timezone.utc)
                     client_profile.behavior_profile.current_risk_level = behavior_score.risk_level
             
-            # ML anomaly detection
+            # ML anomaly detection: the latest behavior vector is scored in the
+            # background; the session's most recent verdict applies meanwhile
             anomaly_results = []
-            if (self.anomaly_detector and client_profile.behavior_profile and 
+            if (self.anomaly_scorer and client_profile.behavior_profile and 
                 client_profile.behavior_profile.behavior_vectors):
                 
                 # Use latest behavior vector for anomaly detection
                 latest_vector = client_profile.behavior_profile.behavior_vectors[-1]
-                anomaly_result = await self.anomaly_detector.detect_anomalies(latest_vector)
+                self.anomaly_scorer.submit(session_id, latest_vector)
+                anomaly_result = self.anomaly_scorer.verdict(session_id)
                 
-                if anomaly_result.overall_score > 0.3:  # Significant anomaly
+                if anomaly_result is not None and anomaly_result.overall_score > 0.3:  # Significant anomaly
                     anomaly_results.append(anomaly_result)
                     self.protection_statistics["anomalies_detected"] += 1
             
@@ -352,6 +364,8 @@ class ProtectionCoordinator:
             
             if self.anomaly_detector:
                 status["components"]["anomaly_detector"] = await self.anomaly_detector.get_model_status()
+                if self.anomaly_scorer:
+                    status["components"]["anomaly_detector"]["scoring"] = self.anomaly_scorer.get_stats()
             
             if self.reputation_engine:
                 status["components"]["reputation_engine"] = {
@@ -386,6 +400,10 @@ class ProtectionCoordinator:
             if self._cleanup_task and not self._cleanup_task.done():
                 await asyncio.wait_for(self._cleanup_task, timeout=10.0)
             
+            # Score what is still pending, then stop the scoring thread
+            if self.anomaly_scorer:
+                await asyncio.to_thread(self.anomaly_scorer.stop)
+            
             # Save ML models if available
             if self.anomaly_detector:
                 await self.anomaly_detector._save_models()
@@ -731,6 +749,10 @@ class ProtectionCoordinator:
                 # Cleanup client profile cache
                 await self._cleanup_client_profiles()
                 
+                # Drop expired anomaly verdicts
+                if self.anomaly_scorer:
+                    self.anomaly_scorer.prune()
+                
                 self.logger.debug("Intelligent protection cleanup completed")
                 
                 await asyncio.sleep(self.config.cleanup_interval)
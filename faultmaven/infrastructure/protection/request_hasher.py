@@ -88,7 +88,8 @@ class RequestHasher:
         method: str = "POST",
         body: Optional[str] = None,
         query_params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        parsed_body: Any = None
     ) -> str:
         """
         Generate a secure hash for request deduplication
@@ -100,6 +101,7 @@ class RequestHasher:
             body: Request body (JSON string or raw)
             query_params: Query parameters
             headers: Request headers
+            parsed_body: Body already parsed as JSON (skips parsing ``body`` again)
             
         Returns:
             Hex-encoded SHA-256 hash
@@ -107,7 +109,12 @@ class RequestHasher:
         try:
             # Normalize all components
             normalized_endpoint = self._normalize_endpoint(endpoint)
-            normalized_body = self._normalize_body(body)
+            if isinstance(parsed_body, (dict, list)):
+                normalized_body = json.dumps(
+                    self._normalize_json_object(parsed_body), sort_keys=True, separators=(',', ':')
+                )
+            else:
+                normalized_body = self._normalize_body(body)
             normalized_params = self._normalize_params(query_params)
             normalized_headers = self._normalize_headers(headers)
             
@@ -0,0 +1,319 @@
+"""Provider Graph
+
+Purpose: Declarative, lazily-resolved dependency graph for the DI container
+
+Each component the container owns is registered as a provider: a builder
+function plus the names of the providers it depends on. Providers are built
+either on first use (``resolve``, called from the container's ``get_*``
+methods) or warmed ahead of time (``warm``), where every provider whose
+dependencies are satisfied is built concurrently with ``asyncio.gather``.
+
+Key Features:
+- Build-once semantics with per-provider locks (safe across threads);
+  a failed build is retried on a later resolve, with exponential backoff
+- Dependency-ordered warm-up in parallel "waves"
+- Blocking builders (network clients, heavy imports) run on worker threads
+- Optional async warm-up step per provider (e.g. validating a connection)
+- Startup profile: per-provider build time, wave and outcome
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Provider:
+    """A component builder and its dependencies"""
+    name: str
+    build: Callable[[], Any]
+    depends_on: Tuple[str, ...] = ()
+    provides: Tuple[str, ...] = ()
+    warmup: Optional[Callable[[], Awaitable[None]]] = None
+    blocking: bool = False
+    eager: bool = True
+    layer: str = "service"
+
+
+@dataclass
+class ProviderTiming:
+    """Startup profile entry for one provider"""
+    name: str
+    layer: str
+    duration_ms: float
+    status: str
+    wave: Optional[int] = None
+    lazy: bool = False
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "component": self.name,
+            "layer": self.layer,
+            "duration_ms": round(self.duration_ms, 2),
+            "status": self.status,
+            "wave": self.wave,
+            "lazy": self.lazy,
+            "error": self.error,
+        }
+
+
+class ProviderGraph:
+    """Registry of providers with lazy resolution and parallel warm-up"""
+
+    def __init__(self, retry_backoff: float = 1.0, max_retry_backoff: float = 60.0):
+        self._providers: Dict[str, Provider] = {}
+        self._built: Dict[str, bool] = {}
+        self._errors: Dict[str, BaseException] = {}
+        self._failures: Dict[str, int] = {}
+        self._retry_at: Dict[str, float] = {}
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self._locks: Dict[str, threading.Lock] = {}
+        self._timings: Dict[str, ProviderTiming] = {}
+        self._attribute_index: Dict[str, str] = {}
+
+    def register(
+        self,
+        name: str,
+        build: Callable[[], Any],
+        depends_on: Iterable[str] = (),
+        provides: Iterable[str] = (),
+        warmup: Optional[Callable[[], Awaitable[None]]] = None,
+        blocking: bool = False,
+        eager: bool = True,
+        layer: str = "service",
+    ) -> None:
+        """
+        Register a provider
+
+        Args:
+            name: Provider name
+            build: Synchronous builder (sets the components it provides)
+            depends_on: Providers that must be built first
+            provides: Component attribute names set by the builder
+                (defaults to the provider name)
+            warmup: Optional coroutine function awaited after the build
+                during ``warm`` (skipped for lazily resolved providers)
+            blocking: Run the builder on a worker thread during ``warm``
+            eager: Include the provider in ``warm``; otherwise it is only
+                built on first use
+            layer: Layer label reported in the startup profile
+        """
+        provides = tuple(provides) or (name,)
+        self._providers[name] = Provider(
+            name=name,
+            build=build,
+            depends_on=tuple(depends_on),
+            provides=provides,
+            warmup=warmup,
+            blocking=blocking,
+            eager=eager,
+            layer=layer,
+        )
+        self._built[name] = False
+        self._locks[name] = threading.Lock()
+        for attribute in provides:
+            self._attribute_index[attribute] = name
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._providers
+
+    def provider_for(self, attribute: str) -> Optional[str]:
+        """Name of the provider that sets a component attribute"""
+        return self._attribute_index.get(attribute)
+
+    def provides(self, name: str) -> Tuple[str, ...]:
+        """Component attribute names set by a provider"""
+        return self._providers[name].provides
+
+    def is_built(self, name: str) -> bool:
+        """Whether a provider has been built successfully"""
+        return self._built.get(name, False)
+
+    def error(self, name: str) -> Optional[BaseException]:
+        """The error of the provider's last failed build, None if it has not failed"""
+        return self._errors.get(name)
+
+    def resolve(self, name: str, _wave: Optional[int] = None) -> None:
+        """
+        Build a provider and its dependencies if not built yet (blocking)
+
+        A provider whose build failed is built again by a later call, once
+        its backoff (doubling with each consecutive failure) has passed;
+        calls before that re-raise the last error without building.
+
+        Raises:
+            KeyError: If the provider is unknown
+            Exception: Whatever the builder raised
+        """
+        provider = self._providers[name]
+        if self._built[name]:
+            return
+
+        for dependency in provider.depends_on:
+            self.resolve(dependency)
+
+        with self._locks[name]:
+            if self._built[name]:
+                return
+
+            if name in self._errors and time.monotonic() < self._retry_at[name]:
+                raise self._errors[name]
+
+            start = time.perf_counter()
+            try:
+                provider.build()
+            except Exception as e:
+                self._errors[name] = e
+                self._failures[name] = self._failures.get(name, 0) + 1
+                backoff = self.retry_backoff * 2 ** (self._failures[name] - 1)
+                self._retry_at[name] = time.monotonic() + min(backoff, self.max_retry_backoff)
+                self._record(provider, start, "failed", _wave, error=e)
+                raise
+
+            self._built[name] = True
+            self._errors.pop(name, None)
+            self._failures.pop(name, None)
+            self._retry_at.pop(name, None)
+            self._record(provider, start, "ok", _wave)
+
+    def _record(
+        self,
+        provider: Provider,
+        start: float,
+        status: str,
+        wave: Optional[int],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        timing = ProviderTiming(
+            name=provider.name,
+            layer=provider.layer,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            status=status,
+            wave=wave,
+            lazy=wave is None,
+            error=str(error) if error else None,
+        )
+        self._timings[provider.name] = timing
+        log = logger.warning if error else logger.debug
+        log(f"Provider '{provider.name}' {status} in {timing.duration_ms:.1f}ms")
+
+    def names(self, layer: Optional[str] = None, include_lazy: bool = False) -> List[str]:
+        """Registered provider names, optionally filtered by layer"""
+        return [
+            name for name, provider in self._providers.items()
+            if (layer is None or provider.layer == layer)
+            and (include_lazy or provider.eager)
+        ]
+
+    def waves(self, names: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """
+        Group providers into dependency waves
+
+        Every provider in a wave depends only on providers in earlier waves
+        (or already built ones), so a wave can be built concurrently.
+
+        Args:
+            names: Providers to include with their dependencies
+                (defaults to all eager providers)
+
+        Raises:
+            ValueError: If the dependencies contain a cycle or unknown name
+        """
+        if names is None:
+            names = self.names()
+
+        pending: Dict[str, Provider] = {}
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in pending or self._built.get(name):
+                continue
+            if name not in self._providers:
+                raise ValueError(f"Unknown provider: {name}")
+            pending[name] = self._providers[name]
+            stack.extend(pending[name].depends_on)
+
+        waves: List[List[str]] = []
+        done = {n for n, built in self._built.items() if built}
+        while pending:
+            ready = sorted(
+                n for n, p in pending.items()
+                if all(d in done for d in p.depends_on)
+            )
+            if not ready:
+                raise ValueError(f"Dependency cycle among providers: {sorted(pending)}")
+            waves.append(ready)
+            done.update(ready)
+            for n in ready:
+                del pending[n]
+        return waves
+
+    async def warm(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Build providers wave by wave, concurrently within each wave
+
+        Args:
+            names: Providers to build with their dependencies
+                (defaults to all eager providers)
+
+        Raises:
+            Exception: The first builder/warm-up failure, after its wave
+                has finished
+        """
+        for index, wave in enumerate(self.waves(names)):
+            results = await asyncio.gather(
+                *(self._warm_one(name, index) for name in wave),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+    async def _warm_one(self, name: str, wave: int) -> None:
+        provider = self._providers[name]
+        if provider.blocking:
+            await asyncio.to_thread(self.resolve, name, wave)
+        else:
+            self.resolve(name, wave)
+
+        if provider.warmup is not None and name not in self._errors:
+            start = time.perf_counter()
+            await provider.warmup()
+            timing = self._timings.get(name)
+            if timing is not None:
+                timing.duration_ms += (time.perf_counter() - start) * 1000
+
+    def reset(self) -> None:
+        """Forget built state and timings so providers can be rebuilt"""
+        for name in self._providers:
+            self._built[name] = False
+        self._errors.clear()
+        self._failures.clear()
+        self._retry_at.clear()
+        self._timings.clear()
+
+    def profile(self) -> List[Dict[str, Any]]:
+        """Startup profile: one entry per built provider, slowest first"""
+        return [
+            timing.to_dict()
+            for timing in sorted(self._timings.values(), key=lambda t: -t.duration_ms)
+        ]
+
+    def format_profile(self) -> str:
+        """Human-readable startup profile table"""
+        lines = [f"{'component':<32} {'layer':<15} {'wave':>4} {'ms':>9}  status"]
+        for entry in self.profile():
+            wave = "lazy" if entry["lazy"] else str(entry["wave"])
+            lines.append(
+                f"{entry['component']:<32} {entry['layer']:<15} {wave:>4} "
+                f"{entry['duration_ms']:>9.1f}  {entry['status']}"
+            )
+        return "\n".join(lines)
@@ -41,6 +41,9 @@ class RedisClientFactory:
         # Priority: explicit parameters > environment variables > defaults
         config = RedisClientFactory._build_config(redis_url, host, port, password)
         
+        # Binary payloads (cached response bodies) need decode_responses=False
+        decode_responses = kwargs.pop('decode_responses', True)
+
         # Add connection pool settings for better performance
         pool_kwargs = {
             'max_connections': kwargs.pop('max_connections', 20),
@@ -56,7 +59,7 @@ class RedisClientFactory:
                 # Use URL-based connection (includes auth)
                 client = redis.from_url(
                     config['url'],
-                    decode_responses=True,
+                    decode_responses=decode_responses,
                     **pool_kwargs,
                     **kwargs
                 )
@@ -67,7 +70,7 @@ class RedisClientFactory:
                     host=config['host'],
                     port=config['port'],
                     password=config['password'],
-                    decode_responses=True,
+                    decode_responses=decode_responses,
                     **pool_kwargs,
                     **kwargs
                 )
@@ -29,7 +29,7 @@ Core Design Principles:
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 import requests
 import json
 from faultmaven.models.interfaces import ISanitizer
@@ -148,6 +148,8 @@ class DataSanitizer(BaseExternalClient, ISanitizer):
             (r"\b[0-9a-zA-Z/+]{40}\b", "[AWS_SECRET_KEY_REDACTED]")
         ]
         
+        self._compiled_replacements = None
+
         # Keep original custom_patterns for backwards compatibility but not used
         self.custom_patterns = []
 
@@ -208,8 +210,7 @@ class DataSanitizer(BaseExternalClient, ISanitizer):
         sanitized_text = text
 
         # Apply pattern replacements in priority order
-        for pattern_str, replacement in self.pattern_replacements:
-            pattern = re.compile(pattern_str, re.IGNORECASE | re.DOTALL)
+        for pattern, replacement in self._get_compiled_replacements():
             sanitized_text = pattern.sub(replacement, sanitized_text)
 
         # Apply K8s Presidio PII detection if available
@@ -218,6 +219,22 @@ class DataSanitizer(BaseExternalClient, ISanitizer):
 
         return sanitized_text
     
+    def _get_compiled_replacements(self) -> List[Tuple[Pattern[str], str]]:
+        """
+        Get pattern_replacements as compiled regexes
+
+        Compiled once and reused across calls (and across items of a batch);
+        recompiled only if pattern_replacements is changed.
+        """
+        source = tuple(self.pattern_replacements)
+        if self._compiled_replacements is None or self._compiled_replacements[0] != source:
+            compiled = [
+                (re.compile(pattern_str, re.IGNORECASE | re.DOTALL), replacement)
+                for pattern_str, replacement in source
+            ]
+            self._compiled_replacements = (source, compiled)
+        return self._compiled_replacements[1]
+
     def _sanitize_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Sanitize dictionary data recursively
@@ -435,8 +452,7 @@ class DataSanitizer(BaseExternalClient, ISanitizer):
             return False
 
         # Check custom patterns
-        for pattern_str, _ in self.pattern_replacements:
-            pattern = re.compile(pattern_str, re.IGNORECASE | re.DOTALL)
+        for pattern, _ in self._get_compiled_replacements():
             if pattern.search(text):
                 return True
 
@@ -34,6 +34,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Now import everything else
+import asyncio
 import logging
 import os
 import sys
@@ -43,7 +44,7 @@ from faultmaven.utils.serialization import to_json_compatible
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
@@ -134,6 +135,18 @@ async def lifespan(app: FastAPI):
         logger.error(f"Configuration initialization failed: {e}")
         raise
 
+    # Pre-load expensive ML models during startup (not per-request). Loading
+    # runs on a worker thread so it overlaps with DI container initialization.
+    logger.info("Pre-loading ML models...")
+    model_preload = None
+    try:
+        from .infrastructure.model_cache import model_cache
+        model_preload = asyncio.create_task(
+            asyncio.to_thread(model_cache.get_bge_m3_embedding_service)
+        )
+    except Exception as e:
+        logger.warning(f"Failed to pre-load ML models: {e}")
+
     # Initialize the DI container first (before any services that depend on it)
     logger.info("Initializing DI container...")
     try:
@@ -152,13 +165,11 @@ async def lifespan(app: FastAPI):
     # SessionManager replaced by services.session.SessionService via DI container
     # Access via: container.get_session_service()
 
-    # Pre-load expensive ML models during startup (not per-request)
-    logger.info("Pre-loading ML models...")
+    embedding_service = None
     try:
-        from .infrastructure.model_cache import model_cache
-        bge_model = model_cache.get_bge_m3_model()
-        if bge_model:
-            logger.info("✅ BGE-M3 model pre-loaded successfully")
+        embedding_service = await model_preload if model_preload else None
+        if embedding_service:
+            logger.info("✅ BGE-M3 model and embedding service pre-loaded successfully")
         else:
             logger.warning("⚠️ BGE-M3 model not available")
     except Exception as e:
@@ -267,6 +278,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error during session cleanup: {e}")
 
+    # Finish embedding batches still in flight
+    if embedding_service:
+        try:
+            await embedding_service.close()
+        except Exception as e:
+            logger.warning(f"Error closing embedding service: {e}")
+
     # Cleanup Phase 2 monitoring components
     try:
         from .infrastructure.monitoring.apm_integration import apm_integration
@@ -315,6 +333,13 @@ def setup_middleware():
         logger.info("Starting middleware registration...")
         logger.info(f"Initial middleware stack: {[type(m).__name__ for m in app.user_middleware]}")
 
+    # 0. Upload size limit (enforced before multipart bodies are parsed)
+    from .api.middleware.upload_limit import UploadSizeLimitMiddleware
+    app.add_middleware(
+        UploadSizeLimitMiddleware,
+        max_bytes=settings.upload.max_upload_size_mb * 1024 * 1024,
+    )
+
     # 1. CORS middleware (first - handles preflight requests)
     app.add_middleware(
         CORSMiddleware,
@@ -459,10 +484,8 @@ def setup_middleware():
         app.add_middleware(
             SystemOptimizationMiddleware,
             enable_compression=True,
-            enable_caching=True,
             enable_background_optimization=True,
             enable_resource_cleanup=True,
-            cache_ttl_seconds=300,
             compression_threshold=1024
         )
     else:
@@ -471,6 +494,13 @@ def setup_middleware():
     if logging_enabled:
         logger.info(f"After SystemOptimizationMiddleware: {[type(m).__name__ for m in app.user_middleware]}")
 
+    # 6b. Shared response cache for read endpoints (Redis; inactive until the container configures it)
+    if settings.database.response_cache_enabled and not settings.server.skip_service_checks:
+        from .api.middleware.response_cache import ResponseCacheMiddleware
+        app.add_middleware(ResponseCacheMiddleware)
+        if logging_enabled:
+            logger.info("✅ Response cache middleware added")
+
     # 7. Opik tracing middleware (if available) - skip in test environments
     if OPIK_AVAILABLE and OPIK_MIDDLEWARE_AVAILABLE and not settings.server.skip_service_checks and not _is_test_environment():
         if logging_enabled:
@@ -503,6 +533,10 @@ def setup_middleware():
         except Exception as e:
             logger.warning(f"Failed to add contract probe middleware: {e}")
 
+    # 9. Prometheus request metrics (added last so it is outermost and times the whole stack)
+    from .api.middleware.prometheus import PrometheusMiddleware
+    app.add_middleware(PrometheusMiddleware)
+
     if logging_enabled:
         logger.info(f"Final middleware stack: {[type(m).__name__ for m in app.user_middleware]}")
 
@@ -871,6 +905,7 @@ async def health_check_dependencies():
                 "total_response_time_ms": total_time_ms,
                 "container_initialized": getattr(container, '_initialized', False),
                 "container_initializing": getattr(container, '_initializing', False),
+                "startup_profile": container.get_startup_profile(),
                 "health_check_overhead_ms": round((time.time() - start_time) * 1000, 2)
             }
         }
@@ -1039,6 +1074,15 @@ async def health_check_error_patterns():
         }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(request: Request):
+    """Prometheus/OpenMetrics exposition for the whole API."""
+    from .infrastructure.observability.prometheus_metrics import render_metrics
+
+    body, content_type = render_metrics(request.headers.get("accept", ""))
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/metrics/performance")
 async def get_performance_metrics():
     """Get comprehensive performance metrics."""
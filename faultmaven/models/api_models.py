@@ -8,6 +8,7 @@ They handle:
 - Backward compatibility
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -100,6 +101,9 @@ class CaseSummary(BaseModel):
     is_stuck: bool
     is_terminal: bool
 
+    # Search results only: matching text with terms wrapped in <mark>
+    highlight: Optional[str] = None
+
     @classmethod
     def from_case(cls, case: Case) -> "CaseSummary":
         """Convert Case domain model to API summary."""
@@ -120,6 +124,16 @@ class CaseSummary(BaseModel):
         )
 
 
+@dataclass
+class CaseSummaryPage:
+    """One page of case summaries, newest update first."""
+
+    summaries: List[CaseSummary]
+    total_count: int
+    next_cursor: Optional[str] = None  # None on the last page
+    total_is_estimate: bool = False
+
+
 class CaseDetail(BaseModel):
     """Detailed case information for single case view."""
 
@@ -257,6 +271,14 @@ class CaseListResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Pass as cursor to fetch the next page; null on the last page"
+    )
+    total_is_estimate: bool = Field(
+        default=False,
+        description="total_count is an estimate (very large result sets)"
+    )
 
     @classmethod
     def from_cases(
@@ -20,12 +20,13 @@ Architecture:
 - Repository abstraction (no direct database imports)
 """
 
-from datetime import datetime, timezone, timedelta
+import json
+from datetime import date, datetime, timezone, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
 
 
 # ============================================================
@@ -2737,6 +2738,10 @@ class DocumentationData(BaseModel):
 # Core Case Model (Section 1)
 # ============================================================
 
+# Consecutive turns without progress after which a case is stuck
+STUCK_TURNS_WITHOUT_PROGRESS = 3
+
+
 class Case(BaseModel):
     """
     Root case entity.
@@ -3008,7 +3013,7 @@ class Case(BaseModel):
         Detect if investigation is blocked.
         Returns True if 3+ consecutive turns without progress.
         """
-        return self.turns_without_progress >= 3
+        return self.turns_without_progress >= STUCK_TURNS_WITHOUT_PROGRESS
 
     @property
     def is_terminal(self) -> bool:
@@ -3016,7 +3021,7 @@ class Case(BaseModel):
         Check if case is in terminal state.
         Terminal states: RESOLVED, CLOSED (no further transitions).
         """
-        return self.status in [CaseStatus.RESOLVED, CaseStatus.CLOSED]
+        return self.status.is_terminal
 
     @property
     def time_to_resolution(self) -> Optional[timedelta]:
@@ -3148,20 +3153,20 @@ class Case(BaseModel):
 
     @field_validator('status_history')
     @classmethod
-    def status_history_ordered(cls, v):
+    def status_history_ordered(cls, v, info: ValidationInfo):
         """Ensure status history is chronologically ordered"""
         if len(v) > 1:
-            for i in range(len(v) - 1):
+            for i in range(_unvalidated_start(info, 'status_history', len(v)), len(v) - 1):
                 if v[i].triggered_at > v[i+1].triggered_at:
                     raise ValueError("Status history must be chronologically ordered")
         return v
 
     @field_validator('turn_history')
     @classmethod
-    def turn_history_sequential(cls, v):
+    def turn_history_sequential(cls, v, info: ValidationInfo):
         """Ensure turn numbers are sequential"""
         if len(v) > 1:
-            for i in range(len(v) - 1):
+            for i in range(_unvalidated_start(info, 'turn_history', len(v)), len(v) - 1):
                 if v[i].turn_number + 1 != v[i+1].turn_number:
                     raise ValueError("Turn numbers must be sequential")
         return v
@@ -3272,3 +3277,87 @@ class Case(BaseModel):
             datetime: lambda v: v.isoformat() + ('Z' if v.tzinfo in (None, timezone.utc) else ''),
             timedelta: lambda v: v.total_seconds()
         }
+
+
+# ============================================================
+# Trusted Hydration
+# ============================================================
+# Cases loaded from storage were validated when they were written. Trusted
+# hydration still builds every nested model through pydantic-core (parsing
+# JSON text directly, without an intermediate dict), but the validators that
+# walk whole histories only check items not covered by the stored state.
+# API input keeps using Case(...) / Case.model_validate, which check
+# everything.
+
+TRUSTED_CONTEXT = {"trusted": True}
+
+
+def _unvalidated_start(info: ValidationInfo, field_name: str, length: int) -> int:
+    """Index of the first pair of history items that still has to be checked
+
+    0 for strict validation. Under TRUSTED_CONTEXT the whole history counts as
+    validated, unless ``validated_lengths[field_name]`` says only that many
+    leading items were (a tail was appended since).
+    """
+    context = info.context or {}
+    if not context.get("trusted"):
+        return 0
+    validated = context.get("validated_lengths", {}).get(field_name, length)
+    return max(validated - 1, 0)
+
+
+def hydrate_case(
+    data: Union[str, bytes, Dict[str, Any]],
+    validated_lengths: Optional[Dict[str, int]] = None
+) -> Case:
+    """Case from state this service stored (JSON text, or an already decoded dict)
+
+    Args:
+        data: Stored case
+        validated_lengths: Leading items of turn_history / status_history
+            known to be valid; omitted histories count as fully validated
+    """
+    context = TRUSTED_CONTEXT
+    if validated_lengths is not None:
+        context = {**TRUSTED_CONTEXT, "validated_lengths": validated_lengths}
+    if isinstance(data, (str, bytes)):
+        return Case.model_validate_json(data, context=context)
+    return Case.model_validate(data, context=context)
+
+
+def hydrate_case_columns(fields: Dict[str, Any], json_columns: Dict[str, Any]) -> Case:
+    """Case from database columns: plain values plus JSON(B) columns
+
+    JSON columns may be raw JSON text (drivers return JSONB as text without a
+    codec) or already decoded. Text is spliced into a single document so the
+    whole case is parsed once, by pydantic-core. None values are left out, so
+    the field defaults apply.
+    """
+    parts = [
+        f"{json.dumps(name)}:{value if isinstance(value, str) else encode_case_json(value)}"
+        for name, value in json_columns.items()
+        if value is not None
+    ]
+    parts.extend(
+        f"{json.dumps(name)}:{encode_case_json(value)}"
+        for name, value in fields.items()
+        if value is not None
+    )
+    return hydrate_case("{" + ",".join(parts) + "}")
+
+
+def encode_case_json(value: Any) -> str:
+    """JSON for stored case state (datetimes as ISO 8601, enums by value)"""
+    return json.dumps(value, default=_json_default)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,185 @@
+"""Case event log model.
+
+A turn changes a small part of a case: it appends a turn record and maybe
+evidence or uploaded files, updates a few hypotheses, replaces some of the
+embedded documents (progress, consulting, ...) and may change the status.
+Recording those changes as events lets a turn be persisted with one append
+instead of rewriting the whole case, whose size grows with every turn.
+
+- ``CaseChangeTracker`` captures the changeable parts of a case before a
+  turn and turns the differences after it into ``CaseEvent`` objects
+- ``replay_case_events`` rebuilds a case from a snapshot (``snapshot_case``)
+  plus the events recorded after it
+
+Event payloads are ``model_dump()`` output (datetimes and enums as Python
+objects); ``encode_case_json`` (from models.case) serializes them and
+snapshots for storage.
+Items already in the appended lists (evidence, files, solutions, messages,
+turn and status history) are treated as immutable: code that edits them in
+place must save the full case, which also takes a new snapshot.
+
+Usage:
+    tracker = CaseChangeTracker(case)
+    ...  # mutate case
+    events = tracker.events(case)
+
+    case = replay_case_events(snapshot, events_since_snapshot)
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, Iterable, List
+
+from faultmaven.models.case import Case, encode_case_json, hydrate_case
+
+
+class CaseEventType(str, Enum):
+    """What a case event records"""
+
+    TURN_PROCESSED = "turn_processed"
+    EVIDENCE_ADDED = "evidence_added"
+    FILE_UPLOADED = "file_uploaded"
+    SOLUTION_ADDED = "solution_added"
+    MESSAGE_ADDED = "message_added"
+    HYPOTHESIS_UPDATED = "hypothesis_updated"
+    FIELDS_UPDATED = "fields_updated"
+    STATUS_CHANGED = "status_changed"
+
+
+@dataclass
+class CaseEvent:
+    """One change to a case; ``payload`` depends on ``event_type``"""
+
+    event_type: CaseEventType
+    payload: Dict[str, Any]
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"event_type": self.event_type.value, "payload": self.payload, "created_at": self.created_at}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CaseEvent":
+        created_at = data.get("created_at") or datetime.now(timezone.utc)
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        return cls(CaseEventType(data["event_type"]), data["payload"], created_at)
+
+
+# Append-only list fields and the event recording one new item
+APPENDED_LISTS = {
+    "evidence": CaseEventType.EVIDENCE_ADDED,
+    "uploaded_files": CaseEventType.FILE_UPLOADED,
+    "solutions": CaseEventType.SOLUTION_ADDED,
+    "messages": CaseEventType.MESSAGE_ADDED,
+}
+_LIST_FOR_EVENT = {event_type: name for name, event_type in APPENDED_LISTS.items()}
+
+# Bounded fields replaced wholesale when they change
+TRACKED_FIELDS = (
+    "title",
+    "description",
+    "closure_reason",
+    "progress",
+    "path_selection",
+    "investigation_strategy",
+    "consulting",
+    "problem_verification",
+    "working_conclusion",
+    "root_cause_conclusion",
+    "degraded_mode",
+    "escalation_state",
+    "documentation",
+    "resolved_at",
+    "closed_at",
+)
+
+# Counters and timestamps carried by every TURN_PROCESSED event
+TURN_FIELDS = ("current_turn", "turns_without_progress", "message_count", "updated_at", "last_activity_at")
+
+
+class CaseChangeTracker:
+    """Remembers what a turn can change, to emit events for the differences.
+
+    Capturing and diffing cost depends on the bounded parts of the case
+    (embedded documents, hypotheses), not on the length of its history.
+    """
+
+    def __init__(self, case: Case):
+        self.case_id = case.case_id
+        self._lengths = {name: len(getattr(case, name)) for name in APPENDED_LISTS}
+        self._turns = len(case.turn_history)
+        self._transitions = len(case.status_history)
+        self._status = case.status
+        self._fields = case.model_dump(include=set(TRACKED_FIELDS))
+        self._hypotheses = {hid: hypothesis.model_dump() for hid, hypothesis in case.hypotheses.items()}
+
+    def events(self, case: Case) -> List[CaseEvent]:
+        """Events turning the captured case into ``case``, in replay order"""
+        events = []
+
+        fields = case.model_dump(include=set(TRACKED_FIELDS))
+        changed = {name: value for name, value in fields.items() if value != self._fields.get(name)}
+        if changed:
+            events.append(CaseEvent(CaseEventType.FIELDS_UPDATED, {"fields": changed}))
+
+        for name, event_type in APPENDED_LISTS.items():
+            for item in getattr(case, name)[self._lengths[name]:]:
+                events.append(CaseEvent(event_type, {"item": _dump_item(item)}))
+
+        for hid, hypothesis in case.hypotheses.items():
+            dumped = hypothesis.model_dump()
+            if dumped != self._hypotheses.get(hid):
+                events.append(CaseEvent(CaseEventType.HYPOTHESIS_UPDATED, {"hypothesis": dumped}))
+
+        new_transitions = case.status_history[self._transitions:]
+        if case.status != self._status or new_transitions:
+            events.append(CaseEvent(CaseEventType.STATUS_CHANGED, {
+                "from_status": self._status,
+                "to_status": case.status,
+                "transitions": [transition.model_dump() for transition in new_transitions],
+            }))
+
+        events.append(CaseEvent(CaseEventType.TURN_PROCESSED, {
+            "turns": [turn.model_dump() for turn in case.turn_history[self._turns:]],
+            **{name: getattr(case, name) for name in TURN_FIELDS},
+        }))
+        return events
+
+
+def snapshot_case(case: Case) -> Dict[str, Any]:
+    """Full case state that ``replay_case_events`` starts from"""
+    return case.model_dump()
+
+
+def replay_case_events(snapshot: Dict[str, Any], events: Iterable[CaseEvent]) -> Case:
+    """Apply events, oldest first, to a snapshot and validate the result once
+
+    The snapshot was validated when it was taken, so only history appended
+    by the events is checked again (trusted hydration). The snapshot dict is
+    modified in place.
+    """
+    state = snapshot
+    validated_lengths = {
+        name: len(state.get(name) or []) for name in ("turn_history", "status_history")
+    }
+    for event in events:
+        payload = event.payload
+        if event.event_type in _LIST_FOR_EVENT:
+            state.setdefault(_LIST_FOR_EVENT[event.event_type], []).append(payload["item"])
+        elif event.event_type == CaseEventType.HYPOTHESIS_UPDATED:
+            hypothesis = payload["hypothesis"]
+            state.setdefault("hypotheses", {})[hypothesis["hypothesis_id"]] = hypothesis
+        elif event.event_type == CaseEventType.FIELDS_UPDATED:
+            state.update(payload["fields"])
+        elif event.event_type == CaseEventType.STATUS_CHANGED:
+            state["status"] = payload["to_status"]
+            state.setdefault("status_history", []).extend(payload["transitions"])
+        elif event.event_type == CaseEventType.TURN_PROCESSED:
+            state.setdefault("turn_history", []).extend(payload["turns"])
+            state.update({name: payload[name] for name in TURN_FIELDS if name in payload})
+    return hydrate_case(state, validated_lengths)
+
+
+def _dump_item(item: Any) -> Any:
+    return item.model_dump() if hasattr(item, "model_dump") else item
@@ -1,6 +1,6 @@
 # File: faultmaven/models/interfaces.py
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List, ContextManager
+from typing import Any, Dict, Optional, List, ContextManager, Tuple
 from pydantic import BaseModel, Field
 
 # Tool interfaces
@@ -870,6 +870,70 @@ class ISessionStore(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_page(
+        self,
+        user_id: Optional[str] = None,
+        session_type: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """List session summaries, newest activity first.
+
+        Args:
+            user_id: Only sessions of this user (all users if None)
+            session_type: Only sessions of this type (all types if None)
+            limit: Maximum summaries to return
+            offset: Summaries to skip
+
+        Returns:
+            Tuple of (summaries, total matching sessions)
+        """
+        pass
+
+    async def touch(self, key: str, last_activity: str, ttl: Optional[int] = None, heartbeats: int = 0) -> bool:
+        """Record session activity without rewriting the session document.
+
+        Refreshes the session TTL, sets its activity timestamp and adds
+        ``heartbeats`` to its heartbeat counter. Stores that can update a
+        single field in place should override this; the default falls back
+        to a full get() and set().
+
+        Args:
+            key: Session identifier
+            last_activity: Activity timestamp (ISO format)
+            ttl: New TTL in seconds. If None, uses the store default.
+            heartbeats: Number of heartbeats this activity accounts for
+
+        Returns:
+            True if the session exists, False otherwise
+        """
+        session_data = await self.get(key)
+        if not session_data:
+            return False
+        session_data['last_activity'] = last_activity
+        session_data['heartbeats'] = session_data.get('heartbeats', 0) + heartbeats
+        await self.set(key, session_data, ttl)
+        return True
+
+    async def get_activity(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the activity recorded by touch().
+
+        Args:
+            key: Session identifier
+
+        Returns:
+            Dictionary with 'last_activity' (ISO format or None) and
+            'heartbeats', or None if no activity has been recorded
+        """
+        session_data = await self.get(key)
+        if not session_data:
+            return None
+        return {
+            'last_activity': session_data.get('last_activity'),
+            'heartbeats': session_data.get('heartbeats', 0),
+        }
+
 
 class IConfiguration(ABC):
     """Interface for centralized configuration management.
@@ -15,6 +15,7 @@ from .api_models import (
     CaseMessage,
     CaseSearchRequest,
     CaseSummary,
+    CaseSummaryPage,
     CaseParticipant,
 )
 from .api import CaseMessagesResponse
@@ -431,6 +432,25 @@ class ICaseService(ABC):
         """
         pass
     
+    @abstractmethod
+    async def list_user_case_page(
+        self,
+        user_id: str,
+        filters: Optional[CaseListFilter] = None,
+        cursor: Optional[str] = None
+    ) -> CaseSummaryPage:
+        """List one page of a user's cases with the total matching count.
+
+        Args:
+            user_id: User identifier
+            filters: Optional filter criteria (including limit and offset)
+            cursor: Keyset cursor from a previous page (takes precedence over offset)
+
+        Returns:
+            Page of case summaries with total count and next cursor
+        """
+        pass
+
     @abstractmethod
     async def search_cases(
         self, 
@@ -46,6 +46,26 @@ class IReportStore(ABC):
         """
         pass
 
+    async def save_reports(self, reports: List[CaseReport]) -> bool:
+        """
+        Save several reports (e.g. one generation round) in one operation.
+
+        The default implementation saves reports one by one; stores that
+        can batch their writes should override it.
+
+        Args:
+            reports: CaseReport objects with content
+
+        Returns:
+            True if all reports were saved successfully
+
+        Raises:
+            ServiceException: If storage operation fails
+        """
+        for report in reports:
+            await self.save_report(report)
+        return True
+
     @abstractmethod
     async def get_report(self, report_id: str) -> Optional[CaseReport]:
         """
@@ -11,7 +11,7 @@ Implemented by:
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 
 from pydantic import BaseModel, Field
@@ -297,6 +297,36 @@ class IOrganizationRepository(ABC):
         """
         pass
 
+    async def get_member(self, org_id: str, user_id: str) -> Optional[OrganizationMember]:
+        """Get a single organization member.
+
+        Args:
+            org_id: Organization identifier
+            user_id: User identifier
+
+        Returns:
+            Member if user belongs to the organization, None otherwise
+        """
+        members = await self.list_organization_members(org_id)
+        return next((m for m in members if m.user_id == user_id), None)
+
+    @abstractmethod
+    async def get_member_permissions(
+        self,
+        org_id: str,
+        user_id: str
+    ) -> Optional[Tuple[str, List[str]]]:
+        """Get user's role and every permission it grants in organization.
+
+        Args:
+            org_id: Organization identifier
+            user_id: User identifier
+
+        Returns:
+            (role ID, ['resource.action', ...]) if user is member, None otherwise
+        """
+        pass
+
 
 class ITeamRepository(ABC):
     """Interface for team data persistence operations."""
@@ -431,6 +461,19 @@ class ITeamRepository(ABC):
         """
         pass
 
+    async def get_member(self, team_id: str, user_id: str) -> Optional[TeamMember]:
+        """Get a single team member.
+
+        Args:
+            team_id: Team identifier
+            user_id: User identifier
+
+        Returns:
+            Member if user belongs to the team, None otherwise
+        """
+        members = await self.list_team_members(team_id)
+        return next((m for m in members if m.user_id == user_id), None)
+
 
 class IAuditRepository(ABC):
     """Interface for audit log persistence operations."""
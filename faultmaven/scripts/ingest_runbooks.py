@@ -25,7 +25,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 from faultmaven.utils.serialization import to_json_compatible
 
@@ -192,7 +192,7 @@ class RunbookIngestionPipeline:
         file_path: Path,
         validate: bool = True,
         dry_run: bool = False
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """Ingest a single runbook"""
         result = {
             "file": str(file_path),
@@ -247,9 +247,9 @@ class RunbookIngestionPipeline:
                     dt = datetime.fromisoformat(last_updated)
                     updated_at = to_json_compatible(dt)
                 except ValueError:
-                    updated_at = to_json_compatible(to_json_compatible(datetime.now(timezone.utc))
+                    updated_at = to_json_compatible(datetime.now(timezone.utc))
             else:
-                updated_at = to_json_compatible(to_json_compatible(datetime.now(timezone.utc))
+                updated_at = to_json_compatible(datetime.now(timezone.utc))
 
             created_at = updated_at  # Use same timestamp for both
 
@@ -268,7 +268,7 @@ class RunbookIngestionPipeline:
             file_key = str(file_path.relative_to(self.runbook_dir))
             self.ingestion_log[file_key] = {
                 "hash": self._calculate_file_hash(file_path),
-                "ingested_at": to_json_compatible(datetime.now(timezone.utc).isoformat(),
+                "ingested_at": to_json_compatible(datetime.now(timezone.utc)),
                 "document_id": document_id,
                 "title": title,
                 "technology": technology,
@@ -290,9 +290,15 @@ class RunbookIngestionPipeline:
         status_filter: str = "verified",
         force: bool = False,
         validate: bool = True,
-        dry_run: bool = False
+        dry_run: bool = False,
+        concurrency: Optional[int] = None
     ):
-        """Run the complete ingestion pipeline"""
+        """Run the complete ingestion pipeline
+
+        Runbooks are ingested concurrently (bounded by ``concurrency``, which
+        defaults to INGESTION_MAX_CONCURRENCY) so extraction, embedding and
+        ChromaDB writes for different runbooks overlap.
+        """
         console.print("\n[bold blue]FaultMaven Runbook Ingestion Pipeline[/bold blue]")
         console.print(f"Runbook directory: {self.runbook_dir}\n")
 
@@ -333,7 +339,6 @@ class RunbookIngestionPipeline:
         console.print(f"[yellow]Ingesting {len(runbooks_to_ingest)} runbooks...[/yellow]\n")
 
         # Ingest with progress tracking
-        results = []
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -343,15 +348,24 @@ class RunbookIngestionPipeline:
         ) as progress:
             task = progress.add_task("Ingesting runbooks...", total=len(runbooks_to_ingest))
 
-            for runbook_path in runbooks_to_ingest:
-                progress.update(task, description=f"Ingesting {runbook_path.name}...")
-                result = await self.ingest_runbook(
-                    runbook_path,
-                    validate=validate,
-                    dry_run=dry_run
-                )
-                results.append(result)
+            if concurrency is None:
+                concurrency = self.ingester.ingestion_max_concurrency if self.ingester else 4
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def _ingest_with_limit(runbook_path: Path) -> Dict[str, Any]:
+                async with semaphore:
+                    result = await self.ingest_runbook(
+                        runbook_path,
+                        validate=validate,
+                        dry_run=dry_run
+                    )
+                progress.update(task, description=f"Ingested {runbook_path.name}")
                 progress.advance(task)
+                return result
+
+            results = list(await asyncio.gather(
+                *(_ingest_with_limit(runbook_path) for runbook_path in runbooks_to_ingest)
+            ))
 
         # Save ingestion log
         if not dry_run:
@@ -432,6 +446,12 @@ async def main():
         action="store_true",
         help="Validate and report without actually ingesting"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Runbooks ingested concurrently (default: INGESTION_MAX_CONCURRENCY)"
+    )
 
     args = parser.parse_args()
 
@@ -449,7 +469,8 @@ async def main():
         status_filter=None if args.status == "all" else args.status,
         force=args.force,
         validate=not args.no_validate,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        concurrency=args.concurrency
     )
 
 
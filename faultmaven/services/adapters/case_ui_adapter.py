@@ -13,10 +13,23 @@ Architecture:
 - Pure transformer (no external dependencies beyond models)
 - Stateless functions
 - Zero business logic (just data transformation)
+
+The UI polls GET /cases/{id}/ui, so ``CaseUIProjectionCache`` memoizes
+responses per (case_id, case_version) and keeps the derived aggregates
+(latest evidence, evidence time range, description keywords) per case,
+folding in only the evidence appended since the last version. A repeat poll
+returns the cached response; a poll after a mutation costs the new evidence
+plus the (small) hypothesis set, not the whole case history.
 """
 
+import heapq
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from faultmaven.infrastructure.observability.prometheus_metrics import record_cache_lookup
+from faultmaven.utils.ttl_cache import TTLCache
 
 from faultmaven.models.case import Case, CaseStatus, HypothesisStatus, InvestigationPath
 from faultmaven.models.case_ui import (
@@ -43,11 +56,22 @@ from faultmaven.models.case_ui import (
 )
 
 
-def transform_case_for_ui(case: Case) -> CaseUIResponse:
+# Evidence / hypotheses shown in the INVESTIGATING view
+LATEST_EVIDENCE_COUNT = 5
+TOP_HYPOTHESES_COUNT = 5
+
+# Keywords looked up in the case description for problem verification
+COMMON_SERVICES = ['api', 'service', 'database', 'db', 'cache', 'auth', 'payment', 'checkout']
+USER_IMPACT_WORDS = ['users', 'customers', 'all']
+
+
+def transform_case_for_ui(case: Case, aggregates: Optional["CaseUIAggregates"] = None) -> CaseUIResponse:
     """Transform Case model into phase-adaptive UI response.
 
     Args:
         case: Internal Case domain model
+        aggregates: Derived values kept from earlier versions of the same case
+            (refreshed in place); computed from scratch when omitted
 
     Returns:
         Phase-specific UI response (Consulting, Investigating, or Resolved)
@@ -58,7 +82,10 @@ def transform_case_for_ui(case: Case) -> CaseUIResponse:
     if case.status == CaseStatus.CONSULTING:
         return _transform_consulting(case)
     elif case.status == CaseStatus.INVESTIGATING:
-        return _transform_investigating(case)
+        if aggregates is None:
+            aggregates = CaseUIAggregates()
+        aggregates.refresh(case)
+        return _transform_investigating(case, aggregates)
     elif case.status == CaseStatus.RESOLVED:
         return _transform_resolved(case)
     elif case.status == CaseStatus.CLOSED:
@@ -68,6 +95,162 @@ def transform_case_for_ui(case: Case) -> CaseUIResponse:
         raise ValueError(f"Unsupported case status for UI transformation: {case.status}")
 
 
+def case_version(case: Case) -> Tuple[Any, ...]:
+    """Changes whenever the UI view of the case can change
+
+    Every repository stamps ``updated_at`` on save; the counters also catch
+    appends made to an in-memory case before it is saved.
+    """
+    return (
+        case.updated_at,
+        case.status,
+        case.current_turn,
+        len(case.evidence),
+        len(case.hypotheses),
+        len(case.solutions),
+    )
+
+
+def project_case_for_ui(case: Case) -> CaseUIResponse:
+    """Memoized ``transform_case_for_ui`` (see ``CaseUIProjectionCache``)"""
+    return _projection_cache.project(case)
+
+
+# ============================================================
+# Derived Aggregates and Projection Cache
+# ============================================================
+
+@dataclass
+class CaseUIAggregates:
+    """Values derived from a case's history, updated incrementally.
+
+    Evidence is append-only, so ``refresh`` folds in only the items added
+    since the previous call; if the list was rewritten (shorter, or a
+    different item where the last seen one was) it starts over. Description
+    keywords are re-extracted only when the description changes. Hypotheses
+    are edited in place (likelihood, status) and are read from the case on
+    every transform instead.
+    """
+
+    evidence_seen: int = 0
+    last_evidence_id: Optional[str] = None
+    evidence_folded: int = 0
+    # (collected_at, -position, evidence), newest first
+    latest_evidence: List[Tuple[datetime, int, Any]] = field(default_factory=list)
+    timestamp_count: int = 0
+    first_collected_at: Optional[datetime] = None
+    last_collected_at: Optional[datetime] = None
+    description: Optional[str] = None
+    affected_services: List[str] = field(default_factory=list)
+    affected_users: Optional[str] = None
+
+    def refresh(self, case: Case) -> None:
+        evidence = case.evidence
+        if len(evidence) < self.evidence_seen or (
+            self.evidence_seen and evidence[self.evidence_seen - 1].evidence_id != self.last_evidence_id
+        ):
+            self._reset_evidence()
+        if len(evidence) > self.evidence_seen:
+            self._fold_evidence(evidence)
+        if case.description != self.description:
+            self._extract_keywords(case.description)
+
+    def _reset_evidence(self) -> None:
+        self.evidence_seen = 0
+        self.last_evidence_id = None
+        self.latest_evidence = []
+        self.timestamp_count = 0
+        self.first_collected_at = None
+        self.last_collected_at = None
+
+    def _fold_evidence(self, evidence: List[Any]) -> None:
+        new_items = []
+        for position in range(self.evidence_seen, len(evidence)):
+            item = evidence[position]
+            collected_at = getattr(item, 'collected_at', None)
+            new_items.append((collected_at, -position, item))
+            if collected_at:
+                self.timestamp_count += 1
+                if self.first_collected_at is None or collected_at < self.first_collected_at:
+                    self.first_collected_at = collected_at
+                if self.last_collected_at is None or collected_at > self.last_collected_at:
+                    self.last_collected_at = collected_at
+        # Ties on collected_at keep list order, as a stable reverse sort would
+        self.latest_evidence = heapq.nlargest(
+            LATEST_EVIDENCE_COUNT, self.latest_evidence + new_items, key=lambda entry: entry[:2]
+        )
+        self.evidence_folded += len(new_items)
+        self.evidence_seen = len(evidence)
+        self.last_evidence_id = evidence[-1].evidence_id
+
+    def _extract_keywords(self, description: Optional[str]) -> None:
+        self.description = description
+        self.affected_services = []
+        self.affected_users = None
+        if description:
+            text_lower = description.lower()
+            self.affected_services = [service for service in COMMON_SERVICES if service in text_lower]
+            if any(word in text_lower for word in USER_IMPACT_WORDS):
+                self.affected_users = "Multiple users affected"
+
+
+@dataclass
+class _Projection:
+    version: Tuple[Any, ...]
+    response: CaseUIResponse
+    aggregates: CaseUIAggregates
+
+
+class CaseUIProjectionCache:
+    """UI responses memoized per (case_id, case_version).
+
+    A poll for an unchanged case returns the cached response. After a
+    mutation the response is rebuilt from the case, reusing the case's
+    aggregates so only the new evidence is scanned. Entries are per process
+    and keyed by the version carried by the case itself, so they never need
+    explicit invalidation; least recently polled cases are evicted first.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 3600.0):
+        self._entries: TTLCache[_Projection] = TTLCache(maxsize=max_entries, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def project(self, case: Case) -> CaseUIResponse:
+        version = case_version(case)
+        with self._lock:
+            entry = self._entries.get(case.case_id)
+            if entry is not None and entry.version == version:
+                self._stats["hits"] += 1
+                record_cache_lookup("case_ui", True)
+                return entry.response
+
+            self._stats["misses"] += 1
+            record_cache_lookup("case_ui", False)
+            aggregates = entry.aggregates if entry is not None else CaseUIAggregates()
+            response = transform_case_for_ui(case, aggregates)
+            self._entries.set(case.case_id, _Projection(version, response, aggregates))
+            return response
+
+    def invalidate(self, case_id: str) -> None:
+        """Drop a case's projection and aggregates (e.g. after deleting it)"""
+        self._entries.pop(case_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+
+_projection_cache = CaseUIProjectionCache()
+
+
 # ============================================================
 # Helper Functions for Data Extraction
 # ============================================================
@@ -116,7 +299,7 @@ def _get_investigation_strategy_data(case: Case) -> Optional[InvestigationStrate
     )
 
 
-def _extract_problem_verification(case: Case) -> Optional[ProblemVerificationData]:
+def _extract_problem_verification(case: Case, aggregates: CaseUIAggregates) -> Optional[ProblemVerificationData]:
     """Extract problem verification data from case state."""
 
     # Get urgency and severity
@@ -128,35 +311,19 @@ def _extract_problem_verification(case: Case) -> Optional[ProblemVerificationDat
 
     # Extract temporal state from evidence timeline
     temporal_state = None
-    if case.evidence:
-        timestamps = [e.collected_at for e in case.evidence if hasattr(e, 'collected_at') and e.collected_at]
-        if timestamps:
-            sorted_times = sorted(timestamps)
-            temporal_state = TemporalStateData(
-                started_at=sorted_times[0],
-                last_occurrence_at=sorted_times[-1] if len(sorted_times) > 1 else None,
-                state="ongoing"  # Could be determined from evidence recency
-            )
+    if aggregates.timestamp_count:
+        temporal_state = TemporalStateData(
+            started_at=aggregates.first_collected_at,
+            last_occurrence_at=aggregates.last_collected_at if aggregates.timestamp_count > 1 else None,
+            state="ongoing"  # Could be determined from evidence recency
+        )
 
-    # Extract impact from case description (simple keyword extraction)
+    # Impact from case description (simple keyword extraction)
     impact = None
-    affected_services = []
-    affected_users = None
+    affected_services = list(aggregates.affected_services)
+    affected_users = aggregates.affected_users
     affected_regions = []
 
-    if case.description:
-        # Simple keyword extraction for services
-        common_services = ['api', 'service', 'database', 'db', 'cache', 'auth', 'payment', 'checkout']
-        text_lower = case.description.lower()
-
-        for service in common_services:
-            if service in text_lower:
-                affected_services.append(service)
-
-        # Check for user impact indicators
-        if any(word in text_lower for word in ['users', 'customers', 'all']):
-            affected_users = "Multiple users affected"
-
     if affected_services or affected_users:
         impact = ImpactData(
             affected_services=affected_services if affected_services else None,
@@ -217,7 +384,7 @@ def _transform_consulting(case: Case) -> CaseUIResponse_Consulting:
     )
 
 
-def _transform_investigating(case: Case) -> CaseUIResponse_Investigating:
+def _transform_investigating(case: Case, aggregates: CaseUIAggregates) -> CaseUIResponse_Investigating:
     """Transform case into INVESTIGATING phase UI response."""
 
     # Build progress summary
@@ -236,7 +403,7 @@ def _transform_investigating(case: Case) -> CaseUIResponse_Investigating:
             # Get hypothesis with highest likelihood
             best_hypothesis = max(active_hypotheses, key=lambda h: h.likelihood)
             working_conclusion = WorkingConclusionSummary(
-                summary=best_hypothesis.description,
+                summary=best_hypothesis.statement,
                 confidence=best_hypothesis.likelihood,
                 last_updated=case.updated_at  # Could track hypothesis update time separately
             )
@@ -244,16 +411,16 @@ def _transform_investigating(case: Case) -> CaseUIResponse_Investigating:
     # Build hypothesis summaries (top 5 by likelihood)
     hypothesis_summaries = []
     if case.hypotheses:
-        sorted_hypotheses = sorted(
+        sorted_hypotheses = heapq.nlargest(
+            TOP_HYPOTHESES_COUNT,
             case.hypotheses.values(),
-            key=lambda h: h.likelihood,
-            reverse=True
-        )[:5]
+            key=lambda h: h.likelihood
+        )
 
         for hyp in sorted_hypotheses:
             hypothesis_summaries.append(HypothesisSummary(
                 hypothesis_id=hyp.hypothesis_id,
-                text=hyp.description,
+                text=hyp.statement,
                 likelihood=hyp.likelihood,
                 status=hyp.status,
                 evidence_count=len(hyp.evidence_links)
@@ -261,21 +428,14 @@ def _transform_investigating(case: Case) -> CaseUIResponse_Investigating:
 
     # Build evidence summaries (last 5 evidence items)
     evidence_summaries = []
-    if case.evidence:
-        sorted_evidence = sorted(
-            case.evidence,
-            key=lambda e: e.collected_at,
-            reverse=True
-        )[:5]
-
-        for ev in sorted_evidence:
-            evidence_summaries.append(EvidenceSummary(
-                evidence_id=ev.evidence_id,
-                type=ev.evidence_type.value,
-                summary=ev.summary,
-                timestamp=ev.collected_at,
-                relevance_score=0.8  # Could compute from hypothesis links
-            ))
+    for _, _, ev in aggregates.latest_evidence:
+        evidence_summaries.append(EvidenceSummary(
+            evidence_id=ev.evidence_id,
+            type=ev.source_type.value,
+            summary=ev.summary,
+            timestamp=ev.collected_at,
+            relevance_score=0.8  # Could compute from hypothesis links
+        ))
 
     # Agent status message
     agent_status = f"Working on {case.progress.current_stage.value.replace('_', ' ')}"
@@ -292,7 +452,7 @@ def _transform_investigating(case: Case) -> CaseUIResponse_Investigating:
 
     # Extract investigation strategy and problem verification
     investigation_strategy_data = _get_investigation_strategy_data(case)
-    problem_verification_data = _extract_problem_verification(case)
+    problem_verification_data = _extract_problem_verification(case, aggregates)
 
     return CaseUIResponse_Investigating(
         case_id=case.case_id,
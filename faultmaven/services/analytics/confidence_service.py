@@ -29,19 +29,12 @@ from typing import Any, Dict, List, Optional, Tuple
 from threading import RLock
 import pickle
 import hashlib
+import importlib.util
 import numpy as np
 
-# Machine learning imports with fallbacks
-try:
-    from sklearn.linear_model import LogisticRegression
-    from sklearn.calibration import CalibratedClassifierCV
-    from sklearn.metrics import brier_score_loss, log_loss
-    from sklearn.model_selection import cross_val_score
-    ML_AVAILABLE = True
-except ImportError:
-    ML_AVAILABLE = False
-    LogisticRegression = None
-    CalibratedClassifierCV = None
+# Machine learning backend; scikit-learn itself is imported when the model is
+# first built, keeping it off the application import path
+ML_AVAILABLE = importlib.util.find_spec("sklearn") is not None
 
 from faultmaven.models.interfaces import IGlobalConfidenceService
 from faultmaven.models.microservice_contracts.core_contracts import (
@@ -172,6 +165,10 @@ class GlobalConfidenceService(IGlobalConfidenceService):
     def _initialize_default_model(self):
         """Initialize a basic default model for immediate use"""
         try:
+            from sklearn.linear_model import LogisticRegression
+            from sklearn.calibration import CalibratedClassifierCV
+            from sklearn.metrics import brier_score_loss, log_loss
+
             with self._model_lock:
                 # Create a simple logistic regression model
                 self._raw_model = LogisticRegression(
@@ -32,10 +32,11 @@ from faultmaven.models.api_models import (
     CaseParticipant,
 )
 from faultmaven.models.interfaces_case import ICaseService
-from faultmaven.infrastructure.persistence.case_repository import CaseRepository
+from faultmaven.infrastructure.persistence.case_repository import CaseRepository, CaseSummaryPage
 from faultmaven.models.interfaces_report import IReportStore
 from faultmaven.models.interfaces import ISessionStore
 from faultmaven.infrastructure.observability.tracing import trace
+from faultmaven.infrastructure.caching.response_cache import invalidate_responses
 from faultmaven.exceptions import ValidationException, ServiceException
 from faultmaven.models import parse_utc_timestamp
 from faultmaven.utils.serialization import to_json_compatible
@@ -257,6 +258,7 @@ class CaseService(BaseService, ICaseService):
 
             # Save updated case
             saved_case = await self.repository.save(case)
+            await invalidate_responses(f"case:{case_id}")
 
             self.logger.info(f"Updated case {case_id}")
             return saved_case is not None
@@ -315,6 +317,7 @@ class CaseService(BaseService, ICaseService):
             success = await self.repository.add_message(case_id, message_dict)
 
             if success:
+                await invalidate_responses(f"case:{case_id}")
                 self.logger.debug(f"Added message to case {case_id}")
 
             return success
@@ -403,6 +406,7 @@ class CaseService(BaseService, ICaseService):
 
             # Update last activity timestamp via repository
             await self.repository.update_activity_timestamp(case_id)
+            await invalidate_responses(f"case:{case_id}")
 
             # Update session store with case reference
             if self.session_store:
@@ -583,6 +587,7 @@ class CaseService(BaseService, ICaseService):
             success = await self.repository.delete(case_id)
 
             if success:
+                await invalidate_responses(f"case:{case_id}")
                 self.logger.info(f"Hard deleted case {case_id}")
 
                 # Clean up Case Working Memory (delete vector store collection)
@@ -613,51 +618,73 @@ class CaseService(BaseService, ICaseService):
             # The case might not exist or might already be deleted
             return True
 
-    @trace("case_service_list_user_cases")
-    async def list_user_cases(
+    @trace("case_service_list_user_case_page")
+    async def list_user_case_page(
         self,
         user_id: str,
-        filters: Optional[CaseListFilter] = None
-    ) -> List[CaseSummary]:
+        filters: Optional[CaseListFilter] = None,
+        cursor: Optional[str] = None
+    ) -> CaseSummaryPage:
         """
-        List cases for a user
+        List one page of a user's cases with the total matching count
+
+        All filters (status, include_empty, include_archived) and pagination
+        are applied by the repository's summary query, so pages are full and
+        the total is accurate.
 
         Args:
             user_id: User identifier
-            filters: Optional filter criteria (include_empty, include_archived, status, etc.)
+            filters: Optional filter criteria (include_empty, include_archived, status, limit, offset)
+            cursor: Keyset cursor from a previous page (takes precedence over offset)
 
         Returns:
-            List of user's cases (as CaseSummary objects)
+            CaseSummaryPage with summaries, total count and next cursor
+
+        Raises:
+            ValidationException: If user_id is empty or the cursor is invalid
         """
         if not user_id:
             raise ValidationException("User ID cannot be empty")
 
-        try:
-            # Get cases from repository
-            status_filter = filters.status if filters else None
-            cases_list, total = await self.repository.list(user_id=user_id, status=status_filter)
+        # Without filters, list everything (first page)
+        filters = filters or CaseListFilter(include_empty=True, include_archived=True)
 
-            # Apply additional filters in service layer (restored from old implementation)
-            if filters:
-                # Filter empty cases (current_turn == 0) unless include_empty=True
-                # Note: New model uses current_turn instead of message_count
-                if not filters.include_empty:
-                    cases_list = [c for c in cases_list if c.current_turn > 0]
+        try:
+            return await self.repository.list_summaries(
+                user_id=user_id,
+                organization_id=filters.organization_id,
+                status=filters.status,
+                include_empty=filters.include_empty,
+                include_archived=filters.include_archived,
+                limit=filters.limit,
+                offset=filters.offset,
+                cursor=cursor
+            )
 
-                # Filter archived cases unless include_archived=True
-                # Note: New model uses CLOSED status instead of ARCHIVED
-                if not filters.include_archived:
-                    cases_list = [c for c in cases_list if c.status != CaseStatus.CLOSED]
+        except ValueError as e:
+            raise ValidationException(str(e)) from e
+        except Exception as e:
+            self.logger.error(f"Failed to list cases for user {user_id}: {e}")
+            return CaseSummaryPage(summaries=[], total_count=0)
 
-            # Convert to CaseSummary
-            from faultmaven.models.api_models import CaseSummary
-            summaries = [CaseSummary.from_case(case) for case in cases_list]
+    @trace("case_service_list_user_cases")
+    async def list_user_cases(
+        self,
+        user_id: str,
+        filters: Optional[CaseListFilter] = None
+    ) -> List[CaseSummary]:
+        """
+        List cases for a user
 
-            return summaries
+        Args:
+            user_id: User identifier
+            filters: Optional filter criteria (include_empty, include_archived, status, etc.)
 
-        except Exception as e:
-            self.logger.error(f"Failed to list cases for user {user_id}: {e}")
-            return []
+        Returns:
+            List of user's cases (as CaseSummary objects)
+        """
+        page = await self.list_user_case_page(user_id, filters)
+        return page.summaries
 
     @trace("case_service_search_cases")
     async def search_cases(
@@ -676,18 +703,16 @@ class CaseService(BaseService, ICaseService):
             List of matching cases
         """
         try:
-            # Search using repository
-            cases_list, total = await self.repository.search(query=search_request.query)
-
-            # Filter by user if provided
-            if user_id:
-                cases_list = [c for c in cases_list if c.user_id == user_id]
-
-            # Convert to CaseSummary
-            from faultmaven.models.api_models import CaseSummary
-            summaries = [CaseSummary.from_case(case) for case in cases_list]
-
-            return summaries
+            # Filters are applied by the repository's search query, so the
+            # limit counts only cases the user may see
+            page = await self.repository.search_summaries(
+                query=search_request.query,
+                user_id=user_id or search_request.user_id,
+                organization_id=search_request.organization_id,
+                status=search_request.status,
+                limit=search_request.limit
+            )
+            return page.summaries
 
         except Exception as e:
             self.logger.error(f"Failed to search cases: {e}")
@@ -956,6 +981,7 @@ class CaseService(BaseService, ICaseService):
 
             # Save updated case with message
             await self.repository.save(case)
+            await invalidate_responses(f"case:{case_id}")
 
             self.logger.debug(f"Added user message to case {case_id}, message_count now {case.message_count}")
             return True
@@ -1082,10 +1108,12 @@ class CaseService(BaseService, ICaseService):
             raise ValidationException("User ID is required")
 
         try:
-            # Get all user cases and count them
-            # Note: This could be optimized with store-level counting
-            cases = await self.list_user_cases(user_id, filters)
-            count = len(cases) if cases else 0
+            # The page total counts every matching case; fetch a single row
+            count_filters = (filters or CaseListFilter(include_empty=True, include_archived=True)).model_copy(
+                update={"limit": 1, "offset": 0}
+            )
+            page = await self.list_user_case_page(user_id, count_filters)
+            count = page.total_count
 
             self.logger.debug(f"Counted {count} cases for user {user_id}")
             return count
@@ -1437,6 +1465,7 @@ class CaseService(BaseService, ICaseService):
         )
 
         if success:
+            await invalidate_responses(f"case:{case_id}")
             self.logger.info(
                 f"Case {case_id} shared with user {target_user_id} as {role} "
                 f"by {sharer_user_id}"
@@ -1492,6 +1521,7 @@ class CaseService(BaseService, ICaseService):
         )
 
         if success:
+            await invalidate_responses(f"case:{case_id}")
             self.logger.info(
                 f"Case {case_id} unshared from user {target_user_id} "
                 f"by {unsharer_user_id}"
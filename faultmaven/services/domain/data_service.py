@@ -22,10 +22,11 @@ Key Improvements:
 - Consistent sanitization
 """
 
+import asyncio
 import hashlib
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from faultmaven.services.base import BaseService
@@ -39,6 +40,7 @@ from faultmaven.models import (
 )
 from faultmaven.exceptions import ValidationException, ServiceException
 from faultmaven.utils.serialization import to_json_compatible
+from faultmaven.utils.upload_spool import SpooledUpload
 
 # Import enhanced components (if available)
 try:
@@ -180,12 +182,6 @@ class DataService(BaseService):
             ValueError: If input validation fails
             RuntimeError: If processing fails
         """
-        def _validate_ingest_inputs(content: str, session_id: str, file_name: Optional[str], file_size: Optional[int], data_type: Optional[str], context: Optional[Dict[str, Any]]) -> None:
-            if content is None or (isinstance(content, str) and not content.strip()):
-                raise ValidationException("Content cannot be empty")
-            if not session_id or not session_id.strip():
-                raise ValidationException("Session ID cannot be empty")
-        
         return await self.execute_operation(
             "ingest_data",
             self._execute_data_ingestion,
@@ -195,8 +191,16 @@ class DataService(BaseService):
             file_size,
             data_type,
             context,
-            validate_inputs=lambda c, s, f, fs, dt, ctx: _validate_ingest_inputs(c, s, f, fs, dt, ctx)
+            validate_inputs=self._validate_ingest_inputs
         )
+
+    @staticmethod
+    def _validate_ingest_inputs(content: str, session_id: str, *_args, **_kwargs) -> None:
+        """Validate ingest_data inputs (content, session_id, then the other ingest arguments)"""
+        if content is None or (isinstance(content, str) and not content.strip()):
+            raise ValidationException("Content cannot be empty")
+        if not session_id or not session_id.strip():
+            raise ValidationException("Session ID cannot be empty")
     
     async def _execute_data_ingestion(
         self,
@@ -205,12 +209,22 @@ class DataService(BaseService):
         file_name: Optional[str],
         file_size: Optional[int],
         data_type: Optional[str],
-        context: Optional[Dict[str, Any]]
+        context: Optional[Dict[str, Any]],
+        prepared: Optional[Tuple[str, DataType]] = None,
+        data_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Execute the core data ingestion logic"""
+        """Execute the core data ingestion logic
+
+        Args:
+            prepared: Optional (sanitized_content, data_type) computed ahead of
+                time by batch processing; skips per-item sanitization and
+                classification
+            data_id: Optional ID computed while the upload streamed in (when
+                ``content`` is only a window of it)
+        """
         # OPTIMIZATION #3: Compute hash FIRST (before any processing)
         # This enables early duplicate detection to skip expensive extraction
-        data_id = self._generate_data_id(content)
+        data_id = data_id or self._generate_data_id(content)
 
         # Check for duplicate BEFORE any processing
         if self._storage:
@@ -249,27 +263,13 @@ class DataService(BaseService):
             }
         )
 
-        # Sanitize content using interface
-        sanitized_content = self._sanitizer.sanitize(content)
-        
-        # Classify data type using interface (unless overridden) with tracing
-        with self._tracer.trace("data_classification"):
-            if data_type:
-                # Convert string to DataType enum if needed
-                from faultmaven.models import DataType
-                if isinstance(data_type, str):
-                    try:
-                        classified_data_type = DataType(data_type)
-                    except ValueError:
-                        # If invalid data_type provided, fall back to classification
-                        classification_result = self._classifier.classify(sanitized_content, file_name)
-                        classified_data_type = classification_result.data_type
-                else:
-                    classified_data_type = data_type
-            else:
-                classification_result = self._classifier.classify(sanitized_content, file_name)
-                classified_data_type = classification_result.data_type
-        
+        if prepared is not None:
+            sanitized_content, classified_data_type = prepared
+        else:
+            sanitized_content, classified_data_type = self._sanitize_and_classify(
+                content, file_name, data_type
+            )
+
         # Log classification metric
         self.log_metric(
             "data_classified",
@@ -385,6 +385,62 @@ class DataService(BaseService):
 
         return uploaded_data
 
+    async def ingest_spooled(
+        self,
+        upload: SpooledUpload,
+        session_id: str,
+        file_name: Optional[str] = None,
+        data_type: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Ingest an upload spooled to disk without loading it into memory
+
+        Deduplication uses the hash computed while the upload streamed in
+        (the same ID ``ingest_data`` gives UTF-8 content). Classification and
+        insight extraction see the upload's bounded head/tail window, which
+        is also what gets stored as ``content``; ``file_size`` is the full size.
+
+        Args:
+            upload: Upload spooled by ``spool_upload``; the caller keeps
+                ownership of the spool file
+            session_id: Session identifier
+            file_name: Optional original filename
+            data_type: Optional data type override
+            context: Optional additional context data
+
+        Returns:
+            Uploaded data dict, as returned by ``ingest_data``, with
+            ``content_truncated`` set when the content is a window
+        """
+        window = upload.window_text()
+
+        def _validate_spooled_inputs(*_args, **_kwargs) -> None:
+            if not window.strip():
+                raise ValidationException("Content cannot be empty")
+            if not session_id or not session_id.strip():
+                raise ValidationException("Session ID cannot be empty")
+
+        result = await self.execute_operation(
+            "ingest_data",
+            self._execute_data_ingestion,
+            window,
+            session_id,
+            file_name,
+            upload.size,
+            data_type,
+            context,
+            data_id=f"data_{upload.sha256[:16]}",
+            validate_inputs=_validate_spooled_inputs
+        )
+        return {**result, "content_truncated": upload.truncated}
+
+    async def iter_sanitized_text(self, upload: SpooledUpload) -> AsyncIterator[str]:
+        """The whole spooled upload as sanitized text, one bounded chunk at a time"""
+        async for text in upload.iter_text():
+            # Sanitization can be slow (Presidio HTTP calls); keep it off the event loop
+            yield await asyncio.to_thread(self._sanitizer.sanitize, text)
+
     async def ingest_data_enhanced(
         self,
         content: str,
@@ -752,65 +808,180 @@ class DataService(BaseService):
 
         return response
 
+    def _sanitize_and_classify(
+        self,
+        content: str,
+        file_name: Optional[str],
+        data_type: Optional[str] = None
+    ) -> Tuple[str, DataType]:
+        """Sanitize content and resolve its data type (override or classifier)"""
+        # Sanitize content using interface
+        sanitized_content = self._sanitizer.sanitize(content)
+        
+        # Classify data type using interface (unless overridden) with tracing
+        with self._tracer.trace("data_classification"):
+            if data_type:
+                # Convert string to DataType enum if needed
+                if isinstance(data_type, str):
+                    try:
+                        classified_data_type = DataType(data_type)
+                    except ValueError:
+                        # If invalid data_type provided, fall back to classification
+                        classification_result = self._classifier.classify(sanitized_content, file_name)
+                        classified_data_type = classification_result.data_type
+                else:
+                    classified_data_type = data_type
+            else:
+                classification_result = self._classifier.classify(sanitized_content, file_name)
+                classified_data_type = classification_result.data_type
+        
+        return sanitized_content, classified_data_type
+
     async def batch_process(
         self, 
         data_items: List[tuple[str, Optional[str]]], 
-        session_id: str
+        session_id: str,
+        max_concurrency: Optional[int] = None
     ) -> List[UploadedData]:
         """
         Process multiple data items in batch
 
+        Items are ingested concurrently (bounded by ``max_concurrency``); a
+        failing item is logged and skipped without failing the batch.
+
         Args:
             data_items: List of (content, filename) tuples
             session_id: Session identifier
+            max_concurrency: Optional cap on concurrently ingested items
+                (defaults to and is limited by settings.upload.batch_max_concurrency)
 
         Returns:
-            List of processed UploadedData
+            List of processed UploadedData, in input order
         """
         return await self.execute_operation(
             "batch_process",
             self._execute_batch_processing,
             data_items,
-            session_id
+            session_id,
+            max_concurrency
         )
     
     async def _execute_batch_processing(
         self,
         data_items: List[tuple[str, Optional[str]]], 
-        session_id: str
+        session_id: str,
+        max_concurrency: Optional[int] = None
     ) -> List[UploadedData]:
         """Execute the core batch processing logic"""
         if not data_items:
             return []
-        
+
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * len(data_items)
+        async for outcome in self.batch_process_stream(data_items, session_id, max_concurrency):
+            outcomes[outcome["index"]] = outcome
+
+        return [
+            outcome["result"] for outcome in outcomes
+            if outcome is not None and outcome["status"] == "completed"
+        ]
+
+    async def batch_process_stream(
+        self,
+        data_items: List[tuple[str, Optional[str]]],
+        session_id: str,
+        max_concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process multiple data items concurrently, yielding each as it finishes
+
+        Each item is validated, sanitized and classified (in a worker thread)
+        and ingested in its own task, with at most ``max_concurrency`` items
+        in progress and per-item failure isolation. Identical items are
+        sanitized and classified once.
+
+        Args:
+            data_items: List of (content, filename) tuples
+            session_id: Session identifier
+            max_concurrency: Optional cap on concurrently ingested items
+
+        Yields:
+            Per-item outcome dicts in completion order: ``index``,
+            ``file_name``, ``status`` ("completed" or "failed") and either
+            ``result`` or ``error``
+        """
+        if not data_items:
+            return
+
+        started = time.time()
+        concurrency = self._batch_concurrency(max_concurrency)
+
         # Log batch start event
         self.log_business_event(
             "batch_processing_started",
             "info",
             {
                 "session_id": session_id,
-                "batch_size": len(data_items)
+                "batch_size": len(data_items),
+                "max_concurrency": concurrency
             }
         )
 
-        results = []
-        for i, (content, filename) in enumerate(data_items):
-            try:
-                result = await self.ingest_data(
-                    content=content,
-                    session_id=session_id,
-                    file_name=filename,
+        semaphore = asyncio.Semaphore(concurrency)
+        # (content, filename) -> sanitize/classify task shared by identical items
+        preparing: Dict[Tuple[str, Optional[str]], asyncio.Future] = {}
+
+        async def ingest_prepared(content, session_id, filename, file_size, data_type, context):
+            key = (content, filename)
+            if key not in preparing:
+                preparing[key] = asyncio.ensure_future(
+                    asyncio.to_thread(self._sanitize_and_classify, content, filename)
                 )
-                results.append(result)
+            prepared = await asyncio.shield(preparing[key])
+            return await self._execute_data_ingestion(
+                content, session_id, filename, file_size, data_type, context, prepared=prepared
+            )
+
+        async def ingest_item(index: int) -> Dict[str, Any]:
+            content, filename = data_items[index]
+            outcome = {"index": index, "file_name": filename}
+            try:
+                async with semaphore:
+                    result = await self.execute_operation(
+                        "ingest_data",
+                        ingest_prepared,
+                        content,
+                        session_id,
+                        filename,
+                        None,
+                        None,
+                        None,
+                        validate_inputs=self._validate_ingest_inputs
+                    )
+                outcome.update(status="completed", result=result)
             except Exception as e:
                 # Log individual item failure but continue with batch
-                self.logger.error(f"Failed to process item {i+1} ({filename}): {e}")
-                # Continue with other items - don't fail entire batch
-        
+                self.logger.error(f"Failed to process item {index+1} ({filename}): {e}")
+                outcome.update(status="failed", error=str(e))
+            return outcome
+
+        succeeded = 0
+        tasks = [asyncio.create_task(ingest_item(i)) for i in range(len(data_items))]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                outcome = await next_done
+                if outcome["status"] == "completed":
+                    succeeded += 1
+                yield outcome
+        finally:
+            # Consumer stopped early (e.g. client disconnected) - stop the rest
+            for task in [*tasks, *preparing.values()]:
+                if not task.done():
+                    task.cancel()
+
         # Log batch completion metrics
         self.log_metric(
             "batch_processing_success_rate",
-            len(results) / len(data_items) * 100,
+            succeeded / len(data_items) * 100,
             "percent",
             {"session_id": session_id}
         )
@@ -820,13 +991,20 @@ class DataService(BaseService):
             "info",
             {
                 "session_id": session_id,
-                "successful_items": len(results),
+                "successful_items": succeeded,
                 "total_items": len(data_items),
-                "success_rate": len(results) / len(data_items)
+                "success_rate": succeeded / len(data_items),
+                "duration_ms": int((time.time() - started) * 1000)
             }
         )
 
-        return results
+    def _batch_concurrency(self, max_concurrency: Optional[int]) -> int:
+        """Resolve the batch concurrency cap (argument, at most the settings cap)"""
+        upload_settings = getattr(self._settings, "upload", None)
+        limit = getattr(upload_settings, "batch_max_concurrency", 4)
+        if max_concurrency is None:
+            return max(1, int(limit))
+        return max(1, min(int(max_concurrency), int(limit)))
 
     async def get_session_data(self, session_id: str) -> List[UploadedData]:
         """
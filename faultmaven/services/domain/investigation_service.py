@@ -21,6 +21,7 @@ from faultmaven.models.case import Case, CaseStatus
 from faultmaven.models.api_models import CaseQueryRequest, CaseQueryResponse
 from faultmaven.exceptions import NotFoundException, PermissionDeniedException, ServiceException
 from faultmaven.infrastructure.observability.tracing import trace
+from faultmaven.infrastructure.caching.response_cache import invalidate_responses
 
 
 class InvestigationService(BaseService):
@@ -151,6 +152,7 @@ class InvestigationService(BaseService):
 
             # Save case with agent message
             await self.repository.save(updated_case)
+            await invalidate_responses(f"case:{case_id}")
 
             response = CaseQueryResponse(
                 agent_response=agent_response_text,
@@ -295,6 +297,7 @@ class InvestigationService(BaseService):
 
             # Save
             updated_case = await self.repository.save(case)
+            await invalidate_responses(f"case:{case_id}")
 
             self.logger.info(
                 f"Transitioned case {case_id} to INVESTIGATING with description: "
@@ -357,6 +360,7 @@ class InvestigationService(BaseService):
 
             # Save
             updated_case = await self.repository.save(updated_case_data)
+            await invalidate_responses(f"case:{case_id}")
 
             self.logger.info(f"Closed case {case_id}, reason: {closure_reason}")
 
@@ -44,6 +44,8 @@ from faultmaven.models import KnowledgeBaseDocument, SearchResult
 from faultmaven.models.vector_metadata import VectorMetadata
 from faultmaven.exceptions import ValidationException, ServiceException
 from faultmaven.utils.serialization import to_json_compatible
+from faultmaven.infrastructure.observability.prometheus_metrics import record_cache_lookup
+from faultmaven.infrastructure.caching.response_cache import invalidate_responses
 
 # Import enhanced components if available
 try:
@@ -246,6 +248,7 @@ class KnowledgeService(BaseService):
             if self._vector_store:
                 await self._index_document_in_vector_store(document)
             
+            await invalidate_responses("knowledge")
             self.logger.info(f"Successfully ingested document {result_id}")
             return document
 
@@ -393,6 +396,7 @@ class KnowledgeService(BaseService):
             # Enhanced multi-level caching with optimization
             cache_key = self._generate_optimized_cache_key(sanitized_query, reasoning_type, context)
             cached_result = await self._check_optimized_cache(cache_key)
+            record_cache_lookup("knowledge_query", bool(cached_result))
             if cached_result:
                 self._metrics["cache_hits"] += 1
                 cache_time = (time.time() - search_start) * 1000
@@ -773,6 +777,7 @@ class KnowledgeService(BaseService):
                 if content and self._vector_store:
                     await self._index_document_in_vector_store(updated_document)
                 
+                await invalidate_responses("knowledge")
                 self.logger.info(f"Successfully updated document {document_id}")
                 return updated_document
                 
@@ -843,6 +848,7 @@ class KnowledgeService(BaseService):
                 if self._vector_store:
                     await self._remove_from_vector_store(document_id)
                 
+                await invalidate_responses("knowledge")
                 self.logger.info(f"Successfully deleted document {document_id} from store")
                 return {"success": True, "document_id": document_id}
                 
@@ -1116,6 +1122,7 @@ class KnowledgeService(BaseService):
                 # Do not fail the upload if indexing fails; it will be retried later
                 self.logger.error(f"Failed to index uploaded document {document_id}: {e}")
 
+            await invalidate_responses("knowledge")
             self.logger.info(f"Successfully stored document {document_id} in {'Redis' if self._redis else 'memory'} store")
 
             return {
@@ -1538,6 +1545,7 @@ class KnowledgeService(BaseService):
                 # Fallback to in-memory
                 self._documents_store[document_id] = document
             
+            await invalidate_responses("knowledge")
             self.logger.info(f"Successfully updated document {document_id} in store")
             
             return {
@@ -26,6 +26,7 @@ from faultmaven.models.interfaces_user import (
     AuditEventType,
     AuditCategory
 )
+from faultmaven.infrastructure.caching.permission_cache import PermissionResolver
 from faultmaven.infrastructure.observability.tracing import trace
 from faultmaven.exceptions import ValidationException, ServiceException
 
@@ -37,7 +38,8 @@ class OrganizationService(BaseService):
         self,
         organization_repository: IOrganizationRepository,
         audit_repository: Optional[Any] = None,
-        settings: Optional[Any] = None
+        settings: Optional[Any] = None,
+        permission_resolver: Optional[PermissionResolver] = None
     ):
         """
         Initialize the Organization Service.
@@ -46,11 +48,14 @@ class OrganizationService(BaseService):
             organization_repository: Repository for org persistence
             audit_repository: Optional audit repository for logging
             settings: Configuration settings for the service
+            permission_resolver: Optional cached permission resolver; without
+                it every check queries the repository
         """
         super().__init__("organization_service")
         self.repository = organization_repository
         self.audit_repository = audit_repository
         self._settings = settings
+        self.permission_resolver = permission_resolver
 
     @trace("org_service_create_organization")
     async def create_organization(
@@ -116,6 +121,7 @@ class OrganizationService(BaseService):
 
         # Add creator as owner
         await self.repository.add_member(org_id, creator_user_id, "role_org_owner")
+        await self._invalidate_permissions(org_id, creator_user_id)
 
         # Audit log
         if self.audit_repository:
@@ -168,7 +174,7 @@ class OrganizationService(BaseService):
             ValidationException: If user lacks permission
         """
         # Check permission
-        has_permission = await self.repository.user_has_permission(
+        has_permission = await self.user_has_permission(
             user_id, org_id, "organization.write"
         )
         if not has_permission:
@@ -219,13 +225,14 @@ class OrganizationService(BaseService):
             ValidationException: If user lacks permission
         """
         # Check permission (only owners can delete)
-        has_permission = await self.repository.user_has_permission(
+        has_permission = await self.user_has_permission(
             user_id, org_id, "organization.manage"
         )
         if not has_permission:
             raise ValidationException("User lacks permission to delete organization")
 
         success = await self.repository.delete_organization(org_id)
+        await self._invalidate_permissions(org_id)
 
         # Audit log
         if self.audit_repository and success:
@@ -264,7 +271,7 @@ class OrganizationService(BaseService):
             ValidationException: If user lacks permission or org is at capacity
         """
         # Check permission
-        has_permission = await self.repository.user_has_permission(
+        has_permission = await self.user_has_permission(
             added_by, org_id, "users.write"
         )
         if not has_permission:
@@ -282,6 +289,7 @@ class OrganizationService(BaseService):
             )
 
         success = await self.repository.add_member(org_id, user_id, role_id)
+        await self._invalidate_permissions(org_id, user_id)
 
         # Audit log
         if self.audit_repository and success:
@@ -319,7 +327,7 @@ class OrganizationService(BaseService):
             ValidationException: If user lacks permission or trying to remove last owner
         """
         # Check permission
-        has_permission = await self.repository.user_has_permission(
+        has_permission = await self.user_has_permission(
             removed_by, org_id, "users.manage"
         )
         if not has_permission:
@@ -332,6 +340,7 @@ class OrganizationService(BaseService):
             raise ValidationException("Cannot remove the last owner from organization")
 
         success = await self.repository.remove_member(org_id, user_id)
+        await self._invalidate_permissions(org_id, user_id)
 
         # Audit log
         if self.audit_repository and success:
@@ -368,13 +377,14 @@ class OrganizationService(BaseService):
             True if successful
         """
         # Check permission
-        has_permission = await self.repository.user_has_permission(
+        has_permission = await self.user_has_permission(
             updated_by, org_id, "users.manage"
         )
         if not has_permission:
             raise ValidationException("User lacks permission to update member roles")
 
         success = await self.repository.update_member_role(org_id, user_id, role_id)
+        await self._invalidate_permissions(org_id, user_id)
 
         # Audit log
         if self.audit_repository and success:
@@ -400,6 +410,11 @@ class OrganizationService(BaseService):
         """List all members of an organization."""
         return await self.repository.list_organization_members(org_id)
 
+    @trace("org_service_get_member")
+    async def get_member(self, org_id: str, user_id: str) -> Optional[OrganizationMember]:
+        """Get a single organization member."""
+        return await self.repository.get_member(org_id, user_id)
+
     @trace("org_service_get_member_role")
     async def get_member_role(self, org_id: str, user_id: str) -> Optional[str]:
         """Get user's role in organization."""
@@ -423,4 +438,11 @@ class OrganizationService(BaseService):
         Returns:
             True if user has permission
         """
+        if self.permission_resolver:
+            return await self.permission_resolver.has_permission(user_id, org_id, permission)
         return await self.repository.user_has_permission(user_id, org_id, permission)
+
+    async def _invalidate_permissions(self, org_id: str, user_id: Optional[str] = None) -> None:
+        """Drop cached permissions after a membership or role change"""
+        if self.permission_resolver:
+            await self.permission_resolver.invalidate_organization(org_id, user_id)
@@ -9,6 +9,7 @@ Generates professional documentation for resolved troubleshooting cases:
 Architecture Reference: docs/architecture/document-generation-and-closure-design.md
 """
 
+import asyncio
 import time
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone, timedelta
@@ -50,6 +51,7 @@ class ReportGenerationService(BaseService):
 
     MAX_REGENERATIONS = 5
     GENERATION_TIMEOUT_SECONDS = 30
+    MAX_CONCURRENT_GENERATIONS = 3
 
     def __init__(
         self,
@@ -57,7 +59,8 @@ class ReportGenerationService(BaseService):
         report_store: Optional[IReportStore] = None,
         runbook_kb: Optional[RunbookKnowledgeBase] = None,
         lock_manager: Optional[ReportLockManager] = None,
-        pii_redactor: Optional[Any] = None
+        pii_redactor: Optional[Any] = None,
+        max_concurrency: Optional[int] = None
     ):
         """
         Initialize report generation service.
@@ -68,6 +71,8 @@ class ReportGenerationService(BaseService):
             runbook_kb: Optional RunbookKB for auto-indexing runbooks
             lock_manager: Optional lock manager for concurrency control
             pii_redactor: Optional PII redactor for sanitization
+            max_concurrency: Max report types generated concurrently
+                (defaults to MAX_CONCURRENT_GENERATIONS)
         """
         super().__init__("report_generation_service")
         self.llm_router = llm_router
@@ -75,6 +80,7 @@ class ReportGenerationService(BaseService):
         self.runbook_kb = runbook_kb
         self.lock_manager = lock_manager
         self.pii_redactor = pii_redactor
+        self.max_concurrency = max(1, max_concurrency or self.MAX_CONCURRENT_GENERATIONS)
 
     @trace("generate_reports")
     async def generate_reports(
@@ -140,23 +146,24 @@ class ReportGenerationService(BaseService):
         Returns:
             ReportGenerationResponse with generated reports
         """
-        # Generate each report
-        reports = []
-        for report_type in report_types:
-            start_time = time.time()
-
-            try:
-                report = await self._generate_single_report(case, report_type)
-
-                # Persist report to storage
-                if self.report_store:
-                    await self.report_store.save_report(report)
-                    logger.info(
-                        f"Report persisted to storage",
-                        extra={"report_id": report.report_id, "case_id": case.case_id}
+        # Report types are independent: build the case context once and
+        # generate them concurrently (bounded by max_concurrency)
+        context = self._extract_case_context(case)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def generate(report_type: ReportType) -> Optional[CaseReport]:
+            async with semaphore:
+                start_time = time.time()
+                try:
+                    report = await self._generate_single_report(case, report_type, context)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to generate {report_type.value} report: {e}",
+                        extra={"case_id": case.case_id},
+                        exc_info=True
                     )
-
-                reports.append(report)
+                    # Continue with other reports even if one fails
+                    return None
 
                 generation_time = int((time.time() - start_time) * 1000)
                 logger.info(
@@ -167,18 +174,16 @@ class ReportGenerationService(BaseService):
                         "generation_time_ms": generation_time
                     }
                 )
+                return report
 
-                # Note: Runbook auto-indexing now happens in report_store.save_report()
-                # via RunbookKnowledgeBase integration
+        results = await asyncio.gather(*(generate(t) for t in report_types))
+        reports = [report for report in results if report is not None]
 
-            except Exception as e:
-                logger.error(
-                    f"Failed to generate {report_type.value} report: {e}",
-                    extra={"case_id": case.case_id},
-                    exc_info=True
-                )
-                # Continue with other reports even if one fails
-                continue
+        # Persist all generated reports in one batch
+        # Note: Runbook auto-indexing happens in the report store
+        # via RunbookKnowledgeBase integration
+        if self.report_store and reports:
+            reports = await self._persist_reports(case, reports)
 
         if not reports:
             raise ValidationException(
@@ -195,16 +200,61 @@ class ReportGenerationService(BaseService):
             remaining_regenerations=remaining
         )
 
+    async def _persist_reports(
+        self,
+        case: Case,
+        reports: List[CaseReport]
+    ) -> List[CaseReport]:
+        """
+        Persist generated reports, batched into a single store operation.
+
+        If the batch write fails, reports are saved individually so that one
+        bad report does not discard the others.
+
+        Returns:
+            Reports that were persisted successfully
+        """
+        try:
+            await self.report_store.save_reports(reports)
+            logger.info(
+                f"Reports persisted to storage",
+                extra={
+                    "report_ids": [r.report_id for r in reports],
+                    "case_id": case.case_id
+                }
+            )
+            return reports
+        except Exception as e:
+            logger.warning(
+                f"Batch report persistence failed, saving individually: {e}",
+                extra={"case_id": case.case_id}
+            )
+
+        persisted = []
+        for report in reports:
+            try:
+                await self.report_store.save_report(report)
+                persisted.append(report)
+            except Exception as e:
+                logger.error(
+                    f"Failed to persist {report.report_type.value} report: {e}",
+                    extra={"case_id": case.case_id, "report_id": report.report_id},
+                    exc_info=True
+                )
+        return persisted
+
     async def _generate_single_report(
         self,
         case: Case,
-        report_type: ReportType
+        report_type: ReportType,
+        context: Optional[Dict[str, Any]] = None
     ) -> CaseReport:
         """Generate a single report using LLM."""
         start_time = time.time()
 
-        # Extract case context
-        context = self._extract_case_context(case)
+        # Extract case context (shared across report types when provided)
+        if context is None:
+            context = self._extract_case_context(case)
 
         # Generate report content using LLM
         if report_type == ReportType.INCIDENT_REPORT:
@@ -20,6 +20,9 @@ Version: 2.0 (Spec-Compliant Refactor - 2025-10-23)
 Reference: docs/architecture/case-and-session-concepts.md
 """
 
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
@@ -31,6 +34,14 @@ from faultmaven.exceptions import ValidationException, ServiceException
 from faultmaven.utils.serialization import to_json_compatible
 
 
+@dataclass
+class _HeartbeatState:
+    """Last activity written for a session and heartbeats not yet written"""
+    written_at: float
+    last_activity: datetime
+    pending: int = 0
+
+
 class SessionService(BaseService):
     """Service for authentication session management (spec-compliant)
 
@@ -45,6 +56,8 @@ class SessionService(BaseService):
         max_sessions_per_user: int = 10,
         inactive_threshold_hours: int = 24,
         session_ttl_hours: int = 24,
+        heartbeat_coalesce_seconds: float = 10.0,
+        max_tracked_heartbeats: int = 10000,
     ):
         """Initialize Session Service
 
@@ -54,6 +67,9 @@ class SessionService(BaseService):
             max_sessions_per_user: Maximum concurrent sessions per user (multi-device)
             inactive_threshold_hours: Hours before marking session inactive
             session_ttl_hours: Session expiration TTL
+            heartbeat_coalesce_seconds: Heartbeats within this many seconds of
+                the last activity write are counted but not written
+            max_tracked_heartbeats: Sessions whose last heartbeat is remembered
         """
         super().__init__("session_service")
         self.session_store = session_store
@@ -70,6 +86,15 @@ class SessionService(BaseService):
             self.inactive_threshold = timedelta(hours=inactive_threshold_hours)
             self.session_ttl = timedelta(hours=session_ttl_hours)
 
+        if settings and hasattr(settings, 'session'):
+            heartbeat_coalesce_seconds = getattr(
+                settings.session, 'heartbeat_coalesce_seconds', heartbeat_coalesce_seconds
+            )
+        self.heartbeat_coalesce_seconds = heartbeat_coalesce_seconds
+        self.max_tracked_heartbeats = max_tracked_heartbeats
+        self._heartbeats: "OrderedDict[str, _HeartbeatState]" = OrderedDict()
+        self.heartbeat_counters = {"received": 0, "written": 0, "coalesced": 0}
+
         # Compatibility alias
         self.session_manager = self.session_store
 
@@ -294,6 +319,67 @@ class SessionService(BaseService):
 
         return True
 
+    @trace("session_service_record_heartbeat")
+    async def record_heartbeat(self, session_id: str) -> Optional[datetime]:
+        """Record a client heartbeat
+
+        Only the session's activity timestamp, heartbeat counter and TTL are
+        written, in one store call. Heartbeats arriving within
+        heartbeat_coalesce_seconds of the last write are not written; they are
+        counted and added to the session counter with the next write.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Last recorded activity time, or None if the session does not exist
+        """
+        if not self.session_store:
+            raise ServiceException("Session store not configured")
+
+        self.heartbeat_counters["received"] += 1
+        state = self._heartbeats.get(session_id)
+        now = time.monotonic()
+        if state is not None and now - state.written_at < self.heartbeat_coalesce_seconds:
+            state.pending += 1
+            self.heartbeat_counters["coalesced"] += 1
+            return state.last_activity
+
+        last_activity = datetime.now(timezone.utc)
+        pending = state.pending if state is not None else 0
+        touched = await self.session_store.touch(
+            session_id, to_json_compatible(last_activity), heartbeats=pending + 1
+        )
+        if not touched:
+            self._heartbeats.pop(session_id, None)
+            return None
+
+        self.heartbeat_counters["written"] += 1
+        self._heartbeats[session_id] = _HeartbeatState(now, last_activity)
+        self._heartbeats.move_to_end(session_id)
+        while len(self._heartbeats) > self.max_tracked_heartbeats:
+            self._heartbeats.popitem(last=False)
+        return last_activity
+
+    async def get_heartbeat_count(self, session_id: str) -> int:
+        """Heartbeats recorded for a session, including ones not yet written
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Number of heartbeats received for the session
+        """
+        count = 0
+        if self.session_store:
+            activity = await self.session_store.get_activity(session_id)
+            if activity:
+                count = int(activity.get("heartbeats", 0))
+        state = self._heartbeats.get(session_id)
+        if state is not None:
+            count += state.pending
+        return count
+
     @trace("session_service_delete_session")
     async def delete_session(self, session_id: str) -> bool:
         """Delete session (logout)
@@ -311,6 +397,7 @@ class SessionService(BaseService):
             return False
 
         success = await self.session_store.delete(session_id)
+        self._heartbeats.pop(session_id, None)
 
         if success:
             self.logger.info(f"Deleted session {session_id}")
@@ -367,6 +454,35 @@ class SessionService(BaseService):
 
         return all_sessions
 
+    @trace("session_service_list_session_page")
+    async def list_session_page(
+        self,
+        user_id: Optional[str] = None,
+        session_type: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """List session summaries, newest activity first
+
+        The session store returns the page and total in one call (indexed at
+        write time where the store supports it).
+
+        Args:
+            user_id: Optional user filter
+            session_type: Optional session type filter
+            limit: Maximum summaries to return
+            offset: Summaries to skip
+
+        Returns:
+            Tuple of (summaries, total matching sessions)
+        """
+        if not self.session_store:
+            return [], 0
+
+        return await self.session_store.list_page(
+            user_id=user_id, session_type=session_type, limit=limit, offset=offset
+        )
+
     # =========================================================================
     # Session Cleanup and Maintenance
     # =========================================================================
@@ -452,6 +568,7 @@ class SessionService(BaseService):
             "unique_users": len(sessions_by_user),
             "multi_device_users": len([u for u, sessions in sessions_by_user.items() if len(sessions) > 1]),
             "average_sessions_per_user": len(active_sessions) / len(sessions_by_user) if sessions_by_user else 0,
+            "heartbeats": dict(self.heartbeat_counters),
             "timestamp": to_json_compatible(now)
         }
 
@@ -25,6 +25,7 @@ from faultmaven.models.interfaces_user import (
     AuditEventType,
     AuditCategory
 )
+from faultmaven.infrastructure.caching.permission_cache import PermissionResolver
 from faultmaven.infrastructure.observability.tracing import trace
 from faultmaven.exceptions import ValidationException, ServiceException
 
@@ -37,7 +38,8 @@ class TeamService(BaseService):
         team_repository: ITeamRepository,
         organization_repository: IOrganizationRepository,
         audit_repository: Optional[Any] = None,
-        settings: Optional[Any] = None
+        settings: Optional[Any] = None,
+        permission_resolver: Optional[PermissionResolver] = None
     ):
         """
         Initialize the Team Service.
@@ -47,12 +49,16 @@ class TeamService(BaseService):
             organization_repository: Repository for org permission checks
             audit_repository: Optional audit repository for logging
             settings: Configuration settings for the service
+            permission_resolver: Optional cached permission resolver (shared
+                with OrganizationService); without it every check queries the
+                repositories
         """
         super().__init__("team_service")
         self.repository = team_repository
         self.org_repository = organization_repository
         self.audit_repository = audit_repository
         self._settings = settings
+        self.permission_resolver = permission_resolver
 
     @trace("team_service_create_team")
     async def create_team(
@@ -78,7 +84,7 @@ class TeamService(BaseService):
             ValidationException: If user lacks permission
         """
         # Check permission
-        has_permission = await self.org_repository.user_has_permission(
+        has_permission = await self._has_org_permission(
             creator_user_id, org_id, "teams.write"
         )
         if not has_permission:
@@ -102,6 +108,7 @@ class TeamService(BaseService):
 
         # Add creator as team lead
         await self.repository.add_member(team_id, creator_user_id, team_role="lead")
+        await self._invalidate_membership(team_id, creator_user_id)
 
         # Audit log
         if self.audit_repository:
@@ -154,7 +161,7 @@ class TeamService(BaseService):
             raise ValidationException(f"Team {team_id} not found")
 
         # Check permission
-        has_permission = await self.org_repository.user_has_permission(
+        has_permission = await self._has_org_permission(
             user_id, team.org_id, "teams.write"
         )
         if not has_permission:
@@ -191,13 +198,15 @@ class TeamService(BaseService):
             raise ValidationException(f"Team {team_id} not found")
 
         # Check permission
-        has_permission = await self.org_repository.user_has_permission(
+        has_permission = await self._has_org_permission(
             user_id, team.org_id, "teams.manage"
         )
         if not has_permission:
             raise ValidationException("User lacks permission to delete team")
 
-        return await self.repository.delete_team(team_id)
+        success = await self.repository.delete_team(team_id)
+        await self._invalidate_membership(team_id)
+        return success
 
     @trace("team_service_add_member")
     async def add_member(
@@ -228,13 +237,14 @@ class TeamService(BaseService):
             raise ValidationException(f"Team {team_id} not found")
 
         # Check permission
-        has_permission = await self.org_repository.user_has_permission(
+        has_permission = await self._has_org_permission(
             added_by, team.org_id, "teams.write"
         )
         if not has_permission:
             raise ValidationException("User lacks permission to add team members")
 
         success = await self.repository.add_member(team_id, user_id, team_role)
+        await self._invalidate_membership(team_id, user_id)
 
         # Audit log
         if self.audit_repository and success:
@@ -277,13 +287,14 @@ class TeamService(BaseService):
             raise ValidationException(f"Team {team_id} not found")
 
         # Check permission
-        has_permission = await self.org_repository.user_has_permission(
+        has_permission = await self._has_org_permission(
             removed_by, team.org_id, "teams.write"
         )
         if not has_permission:
             raise ValidationException("User lacks permission to remove team members")
 
         success = await self.repository.remove_member(team_id, user_id)
+        await self._invalidate_membership(team_id, user_id)
 
         # Audit log
         if self.audit_repository and success:
@@ -314,7 +325,24 @@ class TeamService(BaseService):
         """List all members of a team."""
         return await self.repository.list_team_members(team_id)
 
+    @trace("team_service_get_member")
+    async def get_member(self, team_id: str, user_id: str) -> Optional[TeamMember]:
+        """Get a single team member."""
+        return await self.repository.get_member(team_id, user_id)
+
     @trace("team_service_is_team_member")
     async def is_team_member(self, team_id: str, user_id: str) -> bool:
         """Check if user is member of team."""
+        if self.permission_resolver:
+            return await self.permission_resolver.is_team_member(user_id, team_id)
         return await self.repository.is_team_member(team_id, user_id)
+
+    async def _has_org_permission(self, user_id: str, org_id: str, permission: str) -> bool:
+        if self.permission_resolver:
+            return await self.permission_resolver.has_permission(user_id, org_id, permission)
+        return await self.org_repository.user_has_permission(user_id, org_id, permission)
+
+    async def _invalidate_membership(self, team_id: str, user_id: Optional[str] = None) -> None:
+        """Drop cached team membership after a membership change"""
+        if self.permission_resolver:
+            await self.permission_resolver.invalidate_team(team_id, user_id)
@@ -23,6 +23,7 @@ from faultmaven.models.api import (
 from faultmaven.services.preprocessing.classifier import DataClassifier
 from faultmaven.services.preprocessing.extractors.logs_extractor import LogsAndErrorsExtractor
 from faultmaven.infrastructure.security.redaction import DataSanitizer
+from faultmaven.infrastructure.observability.prometheus_metrics import record_preprocessing
 
 logger = logging.getLogger(__name__)
 
@@ -255,6 +256,12 @@ class PreprocessingService:
             f"Preprocessing complete: {len(content)} bytes -> {len(sanitized)} chars "
             f"in {processing_time:.1f}ms (LLM calls: {llm_calls})"
         )
+        record_preprocessing(
+            getattr(classification.data_type, "value", str(classification.data_type)),
+            strategy,
+            len(content),
+            processing_time / 1000,
+        )
 
         return PreprocessedData(
             content=sanitized,
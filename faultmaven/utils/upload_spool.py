@@ -0,0 +1,171 @@
+"""Spool an upload to a temporary file without holding it in memory.
+
+Reads the upload in fixed-size chunks, writes them to a temp file, and
+enforces the size limit and computes the SHA-256 while streaming. A bounded
+head and tail of the stream are kept in memory: classifiers and extractors
+look at that window instead of the whole upload, so peak memory depends on
+the chunk and window sizes, not on the upload size.
+
+Usage:
+    from faultmaven.utils.upload_spool import spool_upload
+
+    upload = await spool_upload(file.read, max_bytes=10 * 1024 * 1024)
+    try:
+        data_type = classify(upload.window_text())
+        async for text in upload.iter_text():
+            index(text)
+    finally:
+        upload.cleanup()
+"""
+
+import asyncio
+import codecs
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from faultmaven.exceptions import ValidationException
+
+CHUNK_BYTES = 1024 * 1024
+WINDOW_BYTES = 256 * 1024
+TRUNCATION_MARKER = "\n...\n"
+
+
+class UploadTooLarge(ValidationException):
+    """Raised while spooling as soon as an upload exceeds the size limit"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(
+            f"Upload too large (max: {max_bytes / (1024 * 1024):g}MB)",
+            details={"max_bytes": max_bytes},
+        )
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class SpooledUpload:
+    """An upload on disk, with its size, hash and first/last bytes in memory
+
+    ``head`` is the first half of the window; ``tail`` is the last half of
+    the bytes that did not fit in ``head`` (empty for small uploads).
+    """
+
+    path: str
+    size: int
+    sha256: str
+    head: bytes
+    tail: bytes
+
+    @property
+    def truncated(self) -> bool:
+        """True when the window does not cover the whole upload"""
+        return self.size > len(self.head) + len(self.tail)
+
+    def window_text(self) -> str:
+        """The upload as text if it fits in the window, otherwise head and tail
+
+        Head and tail are cut at line boundaries and joined by a marker line.
+        """
+        if not self.truncated:
+            return (self.head + self.tail).decode("utf-8", errors="ignore")
+        head = self.head[:self.head.rfind(b"\n") + 1] or self.head
+        tail = self.tail[self.tail.find(b"\n") + 1:] or self.tail
+        return (
+            head.decode("utf-8", errors="ignore").rstrip("\n")
+            + TRUNCATION_MARKER
+            + tail.decode("utf-8", errors="ignore")
+        )
+
+    async def iter_text(self, chunk_bytes: int = CHUNK_BYTES) -> AsyncIterator[str]:
+        """The whole upload as text, in chunks that end on a line boundary
+
+        Each chunk is at most twice ``chunk_bytes`` (the read plus the
+        partial line carried over from the previous read); a line longer than
+        ``chunk_bytes`` is split. File reads run in a worker thread.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        pending = ""
+        with open(self.path, "rb") as spool:
+            while True:
+                data = await asyncio.to_thread(spool.read, chunk_bytes)
+                text = pending + decoder.decode(data, final=not data)
+                if not data:
+                    if text:
+                        yield text
+                    return
+                cut = text.rfind("\n") + 1
+                if cut == 0 and len(text) >= chunk_bytes:
+                    cut = len(text)
+                pending = text[cut:]
+                if cut:
+                    yield text[:cut]
+
+    def cleanup(self) -> None:
+        """Delete the spool file (safe to call more than once)"""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+async def spool_upload(
+    read: Callable[[int], Awaitable[bytes]],
+    max_bytes: int,
+    directory: Optional[str] = None,
+    chunk_bytes: int = CHUNK_BYTES,
+    window_bytes: int = WINDOW_BYTES,
+) -> SpooledUpload:
+    """Copy an upload to a temp file chunk by chunk
+
+    Args:
+        read: Async ``read(size)`` of the upload (e.g. ``UploadFile.read``),
+            returning b"" at the end
+        max_bytes: Size limit, enforced as the upload streams in
+        directory: Where to create the spool file (created if missing;
+            system temp dir by default)
+        chunk_bytes: Bytes read and written per step
+        window_bytes: Bytes kept in memory for head + tail
+
+    Raises:
+        UploadTooLarge: As soon as more than ``max_bytes`` have been read
+            (the partial spool file is removed)
+    """
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    head_limit = window_bytes // 2
+    tail_limit = window_bytes - head_limit
+    digest = hashlib.sha256()
+    size = 0
+    head = b""
+    tail = b""
+    fd, path = tempfile.mkstemp(prefix="upload-", suffix=".spool", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            while True:
+                chunk = await read(chunk_bytes)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                digest.update(chunk)
+                if len(head) < head_limit:
+                    take = head_limit - len(head)
+                    head += chunk[:take]
+                    chunk_rest = chunk[take:]
+                else:
+                    chunk_rest = chunk
+                if len(chunk_rest) >= tail_limit:
+                    tail = chunk_rest[-tail_limit:]
+                elif chunk_rest:
+                    tail = (tail + chunk_rest)[-tail_limit:]
+                await asyncio.to_thread(spool.write, chunk)
+    except BaseException:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        raise
+    return SpooledUpload(path=path, size=size, sha256=digest.hexdigest(), head=head, tail=tail)
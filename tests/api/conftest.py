@@ -851,6 +851,37 @@ if PYTEST_AVAILABLE and FASTAPI_AVAILABLE:
                         return True
                     return False
                 
+                async def mock_record_heartbeat(session_id, *args, **kwargs):
+                    session = test_sessions.get(session_id)
+                    if session:
+                        await _record_session_heartbeat_operation(session_id)
+                        return session.last_activity
+                    return None
+
+                async def mock_get_heartbeat_count(session_id, *args, **kwargs):
+                    session = test_sessions.get(session_id)
+                    if not session:
+                        return 0
+                    return len([h for h in session.case_history if h.get("action") == "heartbeat"])
+
+                async def mock_list_session_page(user_id=None, session_type=None, limit=50, offset=0, *args, **kwargs):
+                    sessions = await mock_list_sessions(user_id=user_id)
+                    if session_type is not None and session_type != "troubleshooting":
+                        sessions = []
+                    summaries = [
+                        {
+                            "session_id": session.session_id,
+                            "user_id": session.user_id,
+                            "created_at": session.created_at.isoformat(),
+                            "last_activity": session.last_activity.isoformat(),
+                            "session_type": "troubleshooting",
+                            "data_uploads_count": len(session.data_uploads),
+                            "case_history_count": len(session.case_history),
+                        }
+                        for session in sorted(sessions, key=lambda s: s.last_activity, reverse=True)
+                    ]
+                    return summaries[offset:offset + limit], len(summaries)
+
                 async def mock_cleanup_session_data(session_id, *args, **kwargs):
                     session = test_sessions.get(session_id)
                     if session:
@@ -960,6 +991,9 @@ if PYTEST_AVAILABLE and FASTAPI_AVAILABLE:
                 mock_service.list_sessions = mock_list_sessions
                 mock_service.delete_session = mock_delete_session
                 mock_service.update_last_activity = mock_update_last_activity
+                mock_service.record_heartbeat = mock_record_heartbeat
+                mock_service.get_heartbeat_count = mock_get_heartbeat_count
+                mock_service.list_session_page = mock_list_session_page
                 mock_service.cleanup_session_data = mock_cleanup_session_data
                 mock_service.record_query_operation = mock_record_query_operation
                 mock_service.record_data_upload_operation = mock_record_data_upload_operation
@@ -0,0 +1,122 @@
+"""
+Tests for the shared request body cache and session -> user caching.
+
+Validates that:
+- the body is read from the client at most once per request and its JSON
+  parsed once, however many middlewares inspect it
+- multipart and oversized bodies are never read or parsed by middleware
+- LoggingMiddleware caches session -> user lookups
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from faultmaven.api.middleware import request_body
+from faultmaven.api.middleware.logging import LoggingMiddleware
+from faultmaven.api.middleware.request_body import RequestBody
+from faultmaven.infrastructure.logging.coordinator import request_context
+from faultmaven.utils.ttl_cache import TTLCache
+
+
+class InspectingMiddleware(BaseHTTPMiddleware):
+    """Reads the session_id field the way the real middlewares do"""
+
+    seen = []
+
+    async def dispatch(self, request: Request, call_next):
+        self.seen.append(await RequestBody(request).field("session_id"))
+        return await call_next(request)
+
+
+@pytest.fixture
+def client():
+    InspectingMiddleware.seen = []
+    app = FastAPI()
+    app.add_middleware(InspectingMiddleware)
+    app.add_middleware(InspectingMiddleware)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        body = await request.body()
+        return {"size": len(body), "session_id": await RequestBody(request).field("session_id")}
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        form = await request.form()
+        return {"filename": form["file"].filename}
+
+    return TestClient(app)
+
+
+def test_body_read_and_parsed_once_across_middlewares(client):
+    with patch.object(request_body.json, "loads", wraps=request_body.json.loads) as loads:
+        response = client.post("/echo", json={"session_id": "s-1", "payload": "x" * 100})
+
+    assert response.status_code == 200
+    assert response.json()["session_id"] == "s-1"
+    assert response.json()["size"] > 100  # endpoint still receives the full body
+    assert InspectingMiddleware.seen == ["s-1", "s-1"]
+    assert loads.call_count == 1
+
+
+def test_multipart_upload_not_read_by_middleware(client):
+    with patch.object(RequestBody, "body", side_effect=AssertionError("body read")):
+        response = client.post("/upload", files={"file": ("app.log", b"ERROR boom\n" * 1000)})
+
+    assert response.status_code == 200
+    assert response.json()["filename"] == "app.log"
+    assert InspectingMiddleware.seen == [None, None]
+
+
+def test_large_json_body_not_parsed(client, monkeypatch):
+    monkeypatch.setattr(request_body, "MAX_JSON_BYTES", 50)
+
+    response = client.post("/echo", json={"session_id": "s-2", "payload": "x" * 100})
+
+    assert response.status_code == 200
+    assert InspectingMiddleware.seen == [None, None]
+    assert response.json()["size"] > 100
+
+
+def test_session_user_lookup_cached():
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware)
+
+    @app.get("/whoami")
+    async def whoami():
+        return {"user_id": request_context.get().user_id}
+
+    session_service = AsyncMock()
+    session_service.get_session.return_value = Mock(user_id="user-1")
+    container = Mock(_initialized=True, _initializing=False)
+    container.get_session_service.return_value = session_service
+
+    from faultmaven.container import DIContainer
+    with patch.object(DIContainer, "__new__", return_value=container):
+        client = TestClient(app)
+        for _ in range(3):
+            response = client.get("/whoami", headers={"X-Session-ID": "session-1"})
+            assert response.json()["user_id"] == "user-1"
+
+    assert session_service.get_session.await_count == 1
+
+
+def test_ttl_cache_expiry_and_lru_eviction(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("faultmaven.utils.ttl_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=2, ttl_seconds=10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a becomes most recent
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now[0] += 11
+    assert cache.get("a") is None
+    assert len(cache) == 1
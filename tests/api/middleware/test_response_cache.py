@@ -0,0 +1,217 @@
+"""Test module for the shared, Redis-backed response cache.
+
+Tests cover:
+- Cache hits that never reach the endpoint
+- ETag / Last-Modified validators and 304 answers to If-None-Match
+- Per-user keys and invalidation through resource version bumps
+- Negotiated compression of large bodies
+- Passing through non-cacheable requests and responses
+"""
+
+import gzip
+
+import fakeredis.aioredis
+import httpx
+import pytest
+from fastapi import FastAPI, Response
+
+from faultmaven.api.middleware.response_cache import ResponseCacheMiddleware
+from faultmaven.infrastructure.caching import response_cache
+from faultmaven.infrastructure.caching.response_cache import (
+    ResponseCacheStore,
+    invalidate_responses,
+    negotiate_encoding,
+)
+
+ROUTES = {
+    "/cases/{case_id}": "case:{case_id}",
+    "/jobs/{job_id}": "job:{job_id}",
+}
+
+TOKENS = {"token-alice": "alice", "token-bob": "bob"}
+
+
+async def resolve_user(token):
+    return TOKENS.get(token)
+
+
+def auth(token="token-alice", **headers):
+    return {"Authorization": f"Bearer {token}", **headers}
+
+
+@pytest.fixture
+def store():
+    store = ResponseCacheStore(fakeredis.aioredis.FakeRedis(), ttl_seconds=60, compress_min_bytes=512)
+    response_cache.configure_response_cache(store)
+    yield store
+    response_cache.configure_response_cache(None)
+
+
+@pytest.fixture
+def app(store):
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.get("/cases/health")
+    async def health():
+        app.state.calls += 1
+        return {"status": "ok"}
+
+    @app.get("/cases/{case_id}")
+    async def get_case(case_id: str, size: int = 10):
+        app.state.calls += 1
+        return {"case_id": case_id, "calls": app.state.calls, "padding": "x" * size}
+
+    @app.get("/jobs/{job_id}")
+    async def get_job(job_id: str, response: Response):
+        app.state.calls += 1
+        response.headers["Retry-After"] = "5"
+        response.headers["X-Request-ID"] = f"req-{app.state.calls}"
+        return {"job_id": job_id}
+
+    @app.get("/cases/{case_id}/missing")
+    async def missing(case_id: str):
+        app.state.calls += 1
+        return Response(status_code=404)
+
+    app.add_middleware(ResponseCacheMiddleware, routes=ROUTES, resolve_user=resolve_user)
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def test_second_request_is_served_from_cache(app, client):
+    first = await client.get("/cases/c1", headers=auth())
+    second = await client.get("/cases/c1", headers=auth())
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    assert app.state.calls == 1
+    assert first.headers["etag"] == second.headers["etag"]
+    assert "last-modified" in second.headers
+
+
+async def test_if_none_match_returns_304_without_rendering(app, client):
+    first = await client.get("/cases/c1", headers=auth())
+
+    revalidated = await client.get("/cases/c1", headers=auth(**{"If-None-Match": first.headers["etag"]}))
+
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == first.headers["etag"]
+    assert app.state.calls == 1
+
+    stale = await client.get("/cases/c1", headers=auth(**{"If-None-Match": 'W/"other"'}))
+    assert stale.status_code == 200
+    assert app.state.calls == 1
+
+
+async def test_entries_are_per_user(app, client):
+    await client.get("/cases/c1", headers=auth("token-alice"))
+    response = await client.get("/cases/c1", headers=auth("token-bob"))
+
+    assert response.headers["x-cache"] == "MISS"
+    assert app.state.calls == 2
+
+
+async def test_version_bump_invalidates_entries(app, client):
+    first = await client.get("/cases/c1", headers=auth())
+    await invalidate_responses("case:c1")
+
+    second = await client.get("/cases/c1", headers=auth())
+    revalidated = await client.get("/cases/c1", headers=auth(**{"If-None-Match": first.headers["etag"]}))
+
+    assert second.headers["x-cache"] == "MISS"
+    assert second.json()["calls"] == 2
+    assert revalidated.status_code == 200  # body changed, so the old ETag no longer matches
+    assert app.state.calls == 2
+
+
+async def test_other_resources_stay_cached(app, client):
+    await client.get("/cases/c1", headers=auth())
+    await invalidate_responses("case:c2")
+
+    response = await client.get("/cases/c1", headers=auth())
+
+    assert response.headers["x-cache"] == "HIT"
+
+
+async def test_large_bodies_use_negotiated_encoding(app, client):
+    first = await client.get("/cases/c1?size=5000", headers=auth(**{"Accept-Encoding": "gzip"}))
+    second = await client.get("/cases/c1?size=5000", headers=auth(**{"Accept-Encoding": "gzip"}))
+    plain = await client.get("/cases/c1?size=5000", headers=auth(**{"Accept-Encoding": "identity"}))
+
+    for response in (first, second):
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < 5000
+    assert "content-encoding" not in plain.headers
+    assert second.json() == first.json() == plain.json()
+    assert app.state.calls == 1
+
+
+async def test_only_representation_headers_are_replayed(client):
+    await client.get("/jobs/j1", headers=auth())
+    hit = await client.get("/jobs/j1", headers=auth())
+
+    assert hit.headers["x-cache"] == "HIT"
+    assert hit.headers["retry-after"] == "5"
+    assert "x-request-id" not in hit.headers
+
+
+async def test_entries_are_per_origin(app, client):
+    await client.get("/cases/c1", headers=auth(Origin="http://localhost:3000"))
+    same = await client.get("/cases/c1", headers=auth(Origin="http://localhost:3000"))
+    other = await client.get("/cases/c1", headers=auth(Origin="https://faultmaven.ai"))
+
+    assert same.headers["x-cache"] == "HIT"
+    assert other.headers["x-cache"] == "MISS"
+    assert "Origin" in same.headers["vary"]
+
+
+async def test_non_cacheable_requests_pass_through(app, client):
+    await client.get("/cases/health", headers=auth())
+    await client.get("/cases/health", headers=auth())
+    await client.get("/cases/c1/missing", headers=auth())
+    missing = await client.get("/cases/c1/missing", headers=auth())
+
+    assert missing.status_code == 404
+    assert "x-cache" not in missing.headers
+    assert app.state.calls == 4
+
+
+async def test_redis_failure_falls_back_to_rendering(app, client, store):
+    class BrokenRedis:
+        def pipeline(self, *args, **kwargs):
+            raise ConnectionError("redis down")
+
+    store.redis = BrokenRedis()
+
+    response = await client.get("/cases/c1", headers=auth())
+
+    assert response.status_code == 200
+    assert app.state.calls == 1
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("") == "identity"
+    assert negotiate_encoding("gzip;q=0, identity") == "identity"
+    assert negotiate_encoding("deflate, gzip;q=0.5") == "gzip"
+    assert negotiate_encoding("br, gzip") in ("br", "gzip")
+
+
+async def test_stored_gzip_variant_round_trips(store):
+    key = store.entry_key("alice", "/cases/{case_id}", "/cases/c1")
+    body = b"y" * 2048
+    meta = await store.store(key, 200, [("content-type", "application/json")], body, version=0)
+
+    encoded, encoding = await store.load_body(key, meta, "gzip")
+
+    assert encoding == "gzip"
+    assert gzip.decompress(encoded) == body
@@ -0,0 +1,84 @@
+"""
+Tests for the upload size limit middleware.
+
+Validates that:
+- multipart uploads over the limit get a 413 before the endpoint parses them,
+  whether the body has a Content-Length or is sent chunked
+- uploads within the limit and non-multipart requests pass through
+"""
+
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from faultmaven.api.middleware.upload_limit import MULTIPART_OVERHEAD_BYTES, UploadSizeLimitMiddleware
+
+MAX_BYTES = 1024
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_bytes=MAX_BYTES)
+    app.state.parsed = []
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        app.state.parsed.append(file.filename)
+        return {"size": len(await file.read())}
+
+    @app.post("/echo")
+    async def echo(payload: dict):
+        return payload
+
+    return app
+
+
+def multipart(size: int):
+    boundary = "limit-test"
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="app.log"\r\n'
+        "Content-Type: text/plain\r\n\r\n"
+    ).encode() + b"x" * size + f"\r\n--{boundary}--\r\n".encode()
+    return body, {"content-type": f"multipart/form-data; boundary={boundary}"}
+
+
+def test_upload_within_limit_passes(app):
+    body, headers = multipart(MAX_BYTES)
+
+    response = TestClient(app).post("/upload", content=body, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"size": MAX_BYTES}
+
+
+def test_oversized_content_length_is_rejected_before_parsing(app):
+    body, headers = multipart(MAX_BYTES + MULTIPART_OVERHEAD_BYTES + 1)
+
+    response = TestClient(app).post("/upload", content=body, headers=headers)
+
+    assert response.status_code == 413
+    assert "Upload too large" in response.json()["detail"]
+    assert app.state.parsed == []
+
+
+def test_oversized_chunked_body_is_cut_off(app):
+    body, headers = multipart(MAX_BYTES + MULTIPART_OVERHEAD_BYTES + 1)
+
+    def chunks():
+        for start in range(0, len(body), 8192):
+            yield body[start:start + 8192]
+
+    response = TestClient(app).post("/upload", content=chunks(), headers=headers)
+
+    assert response.status_code == 413
+    assert app.state.parsed == []
+
+
+def test_non_multipart_requests_are_not_limited(app):
+    payload = {"text": "x" * (MAX_BYTES + MULTIPART_OVERHEAD_BYTES + 1)}
+
+    response = TestClient(app).post("/echo", json=payload)
+
+    assert response.status_code == 200
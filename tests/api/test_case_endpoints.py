@@ -39,6 +39,7 @@ from faultmaven.models.case import (
 )
 from faultmaven.models.api import Case, CaseResponse, ErrorResponse, ErrorDetail
 from faultmaven.models.interfaces_case import ICaseService
+from faultmaven.models.api_models import CaseSummaryPage
 from faultmaven.exceptions import ValidationException, ServiceException
 
 
@@ -59,6 +60,7 @@ class MockCaseService:
         self.archive_case = AsyncMock(return_value=False)
         self.hard_delete_case = AsyncMock(return_value=True)
         self.list_user_cases = AsyncMock(return_value=[])
+        self.list_user_case_page = AsyncMock(return_value=CaseSummaryPage(summaries=[], total_count=0))
         self.count_user_cases = AsyncMock(return_value=0)
         self.search_cases = AsyncMock(return_value=[])
         self.get_case_analytics = AsyncMock(return_value={})
@@ -320,7 +322,7 @@ class TestCaseRetrieval:
         """Test successful case listing"""
         mock_get_user_id.return_value = "user-456"
         mock_get_case_service.return_value = mock_case_service
-        mock_case_service.list_user_cases.return_value = [sample_case_summary]
+        mock_case_service.list_user_case_page.return_value = CaseSummaryPage(summaries=[sample_case_summary], total_count=1)
         
         response = client.get("/api/v1/cases/")
         
@@ -331,7 +333,7 @@ class TestCaseRetrieval:
         assert response_data[0]["case_id"] == "case-123"
         assert response_data[0]["title"] == "Test API Case"
         
-        mock_case_service.list_user_cases.assert_called_once()
+        mock_case_service.list_user_case_page.assert_called_once()
     
     @patch('faultmaven.api.v1.dependencies.get_case_service')
     @patch('faultmaven.api.v1.dependencies.get_user_id')
@@ -339,7 +341,7 @@ class TestCaseRetrieval:
         """Test case listing excludes deleted/archived/empty by default"""
         mock_get_user_id.return_value = "user-456"
         mock_get_case_service.return_value = mock_case_service
-        mock_case_service.list_user_cases.return_value = []
+        mock_case_service.list_user_case_page.return_value = CaseSummaryPage(summaries=[], total_count=0)
         mock_case_service.count_user_cases.return_value = 0
         
         response = client.get("/api/v1/cases/")
@@ -349,7 +351,7 @@ class TestCaseRetrieval:
         assert "Link" in response.headers  # Even if empty
         
         # Verify default filters exclude non-active cases
-        call_args = mock_case_service.list_user_cases.call_args
+        call_args = mock_case_service.list_user_case_page.call_args
         user_id, filters = call_args[0]
         assert user_id == "user-456"
         assert filters.include_empty is False  # Default excludes empty
@@ -362,7 +364,7 @@ class TestCaseRetrieval:
         """Test case listing with include flags"""
         mock_get_user_id.return_value = "user-456"
         mock_get_case_service.return_value = mock_case_service
-        mock_case_service.list_user_cases.return_value = []
+        mock_case_service.list_user_case_page.return_value = CaseSummaryPage(summaries=[], total_count=0)
         mock_case_service.count_user_cases.return_value = 0
         
         response = client.get(
@@ -377,7 +379,7 @@ class TestCaseRetrieval:
         assert response.status_code == status.HTTP_200_OK
         
         # Verify include flags are passed through
-        call_args = mock_case_service.list_user_cases.call_args
+        call_args = mock_case_service.list_user_case_page.call_args
         user_id, filters = call_args[0]
         assert filters.include_empty is True
         assert filters.include_archived is True
@@ -402,7 +404,7 @@ class TestCaseRetrieval:
         """Test case listing with service error"""
         mock_get_user_id.return_value = "user-456"
         mock_get_case_service.return_value = mock_case_service
-        mock_case_service.list_user_cases.side_effect = Exception("Database error")
+        mock_case_service.list_user_case_page.side_effect = Exception("Database error")
         
         response = client.get("/api/v1/cases/")
         
@@ -891,14 +893,14 @@ class TestAuthentication:
         """Test endpoint behavior without authentication"""
         mock_get_user_id.return_value = None  # No authenticated user
         mock_get_case_service.return_value = mock_case_service
-        mock_case_service.list_user_cases.return_value = []
+        mock_case_service.list_user_case_page.return_value = CaseSummaryPage(summaries=[], total_count=0)
         
         response = client.get("/api/v1/cases/")
         
         assert response.status_code == status.HTTP_200_OK
         
         # Verify service was called with anonymous user
-        mock_case_service.list_user_cases.assert_called_once_with("anonymous", ANY)
+        mock_case_service.list_user_case_page.assert_called_once_with("anonymous", ANY, cursor=None)
     
     @patch('faultmaven.api.v1.dependencies.get_case_service')
     @patch('faultmaven.api.v1.dependencies.get_user_id')
@@ -963,7 +965,7 @@ class TestErrorHandling:
         """Test handling of concurrent requests"""
         mock_get_user_id.return_value = "user-456"
         mock_get_case_service.return_value = mock_case_service
-        mock_case_service.list_user_cases.return_value = []
+        mock_case_service.list_user_case_page.return_value = CaseSummaryPage(summaries=[], total_count=0)
         
         import threading
         import time
@@ -1013,7 +1015,7 @@ def test_all_endpoints_basic_functionality(mock_get_user_id, mock_get_case_servi
     mock_case_service.update_case.return_value = True
     mock_case_service.share_case.return_value = True
     mock_case_service.archive_case.return_value = True
-    mock_case_service.list_user_cases.return_value = []
+    mock_case_service.list_user_case_page.return_value = CaseSummaryPage(summaries=[], total_count=0)
     mock_case_service.search_cases.return_value = []
     mock_case_service.get_case_conversation_context.return_value = "context"
     
@@ -24,6 +24,7 @@ from faultmaven.main import app
 from faultmaven.container import container
 from faultmaven.models.case import Case as CaseEntity, CaseStatus, CasePriority
 from faultmaven.models.api import Case, CaseResponse, CaseSummary
+from faultmaven.models.api_models import CaseSummaryPage
 
 
 @pytest.fixture
@@ -39,6 +40,7 @@ def mock_case_service():
     """Mock case service for controlled testing"""
     mock = AsyncMock()
     mock.list_user_cases = AsyncMock(return_value=[])
+    mock.list_user_case_page = AsyncMock(return_value=CaseSummaryPage(summaries=[], total_count=0))
     mock.count_user_cases = AsyncMock(return_value=0)
     mock.get_case = AsyncMock(return_value=None)
     mock.create_case = AsyncMock()
@@ -101,7 +103,7 @@ class TestContractCompliance:
         GET /api/v1/cases with data → 200 + CaseSummary[] + pagination headers
         """
         mock, sample_case = mock_case_service
-        mock.list_user_cases.return_value = [sample_case]
+        mock.list_user_case_page.return_value = CaseSummaryPage(summaries=[sample_case], total_count=1)
         mock.count_user_cases.return_value = 1
         
         async def mock_get_case_service():
@@ -368,7 +370,7 @@ class TestContractCompliance:
         CRITICAL: No data is success condition, not error condition
         """
         mock, _ = mock_case_service
-        mock.list_user_cases.return_value = []  # No cases
+        mock.list_user_case_page.return_value = CaseSummaryPage(summaries=[], total_count=0)  # No cases
         mock.count_user_cases.return_value = 0
         
         async def mock_get_case_service():
@@ -448,7 +450,7 @@ class TestContractCompliance:
         CRITICAL: Frontend expects direct array parsing
         """
         mock, sample_case = mock_case_service
-        mock.list_user_cases.return_value = [sample_case]
+        mock.list_user_case_page.return_value = CaseSummaryPage(summaries=[sample_case], total_count=1)
         mock.count_user_cases.return_value = 1
         
         async def mock_get_case_service():
@@ -0,0 +1,46 @@
+"""Data Batch Endpoint Tests
+
+Tests the batch processing route's handling of ``max_concurrency``:
+- Values that are not positive integers are rejected with a 400
+- Valid values are passed on to DataService
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import HTTPException
+
+from faultmaven.api.v1.routes.data import batch_process_session_data
+
+
+ITEMS = [{"content": "ERROR line", "filename": "app.log"}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", ["lots", 0, -3, 2.5, True, [4]])
+async def test_invalid_max_concurrency_is_rejected(max_concurrency):
+    data_service = Mock()
+    data_service.batch_process = AsyncMock(return_value=[])
+
+    with pytest.raises(HTTPException) as exc_info:
+        await batch_process_session_data(
+            "session-1", {"items": ITEMS, "max_concurrency": max_concurrency}, stream=False, data_service=data_service
+        )
+
+    assert exc_info.value.status_code == 400
+    data_service.batch_process.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_valid_max_concurrency_is_passed_to_service():
+    data_service = Mock()
+    data_service.batch_process = AsyncMock(return_value=[{"file_name": "app.log"}])
+
+    response = await batch_process_session_data(
+        "session-1", {"items": ITEMS, "max_concurrency": 64}, stream=False, data_service=data_service
+    )
+
+    data_service.batch_process.assert_awaited_once_with(
+        [("ERROR line", "app.log")], "session-1", max_concurrency=64
+    )
+    assert response["processed_count"] == 1
@@ -59,6 +59,7 @@ from faultmaven.services.preprocessing.classifier import DataClassifier  # Updat
 from faultmaven.core.processing.log_analyzer import LogProcessor
 from faultmaven.infrastructure.llm.router import LLMRouter
 from faultmaven.models import AgentState, DataType, SessionContext
+from faultmaven.models.api_models import CaseSummaryPage
 from faultmaven.infrastructure.security.redaction import DataSanitizer
 # SessionManager has been replaced by SessionService
 # from faultmaven.session_management import SessionManager
@@ -459,6 +460,7 @@ def mock_case_service():
     service.resume_case_in_session = AsyncMock(return_value=False)
     service.archive_case = AsyncMock(return_value=False)
     service.list_user_cases = AsyncMock(return_value=[])
+    service.list_user_case_page = AsyncMock(return_value=CaseSummaryPage(summaries=[], total_count=0))
     service.search_cases = AsyncMock(return_value=[])
     service.get_case_analytics = AsyncMock(return_value={})
     service.cleanup_expired_cases = AsyncMock(return_value=0)
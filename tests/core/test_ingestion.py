@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 
 from faultmaven.core.knowledge.ingestion import KnowledgeIngester
+from faultmaven.infrastructure.embedding_service import EmbeddingService
 from faultmaven.models import KnowledgeBaseDocument
 
 pytestmark = pytest.mark.asyncio
@@ -26,6 +27,9 @@ def ingester():
         ingester_instance.embedding_model.encode.return_value = np.array(
             [[0.1, 0.2, 0.3]]
         )
+        ingester_instance.embedding_service = EmbeddingService(
+            ingester_instance.embedding_model, max_wait_ms=0
+        )
         return ingester_instance
 
 
@@ -152,7 +156,7 @@ async def test_process_and_store_database_failure(ingester):
     """
     Test that database failures during storage are handled gracefully.
     """
-    ingester.collection.add.side_effect = Exception("Database connection failed")
+    ingester.collection.upsert.side_effect = Exception("Database connection failed")
 
     document = KnowledgeBaseDocument(
         document_id="test-id",
@@ -163,7 +167,7 @@ async def test_process_and_store_database_failure(ingester):
         updated_at=datetime.utcnow().isoformat() + "Z",
     )
 
-    with pytest.raises(AttributeError, match="'str' object has no attribute 'isoformat'"):
+    with pytest.raises(Exception, match="Database connection failed"):
         await ingester._process_and_store(document)
 
 
@@ -186,6 +190,94 @@ async def test_process_and_store_embedding_failure(ingester):
         await ingester._process_and_store(document)
 
 
+async def test_process_and_store_batches_encode_calls(ingester):
+    """
+    Test that chunks are embedded in batches no larger than the service's max batch size.
+    """
+    ingester.embedding_service = EmbeddingService(
+        ingester.embedding_model, max_batch_size=2, max_wait_ms=0
+    )
+    ingester.collection.get.return_value = {"ids": [], "metadatas": []}
+    ingester.embedding_model.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[0.1, 0.2, 0.3]] * len(texts)
+    )
+
+    document = KnowledgeBaseDocument(
+        document_id="test-id",
+        title="Test Document",
+        content=" ".join(f"Sentence number {i}." for i in range(300)),
+        document_type="guide",
+        created_at=datetime.utcnow().isoformat() + "Z",
+        updated_at=datetime.utcnow().isoformat() + "Z",
+    )
+    chunks = ingester._split_content(document.content)
+
+    await ingester._process_and_store(document)
+
+    batch_sizes = [len(call.args[0]) for call in ingester.embedding_model.encode.call_args_list]
+    assert sum(batch_sizes) == len(chunks)
+    assert max(batch_sizes) <= 2
+    upserted = ingester.collection.upsert.call_args.kwargs
+    assert len(upserted["ids"]) == len(chunks)
+    assert all("content_hash" in metadata for metadata in upserted["metadatas"])
+
+
+async def test_process_and_store_skips_unchanged_chunks(ingester):
+    """
+    Test that re-ingesting unchanged chunks does not re-embed them and that
+    chunks no longer present are deleted.
+    """
+    document = KnowledgeBaseDocument(
+        document_id="test-id",
+        title="Renamed Document",
+        content="Test content",
+        document_type="guide",
+        created_at=datetime.utcnow().isoformat() + "Z",
+        updated_at=datetime.utcnow().isoformat() + "Z",
+    )
+    ingester.collection.get.return_value = {
+        "ids": ["test-id_chunk_0", "test-id_chunk_1"],
+        "metadatas": [
+            {"content_hash": ingester._hash_chunk("Test content")},
+            {"content_hash": "stale"},
+        ],
+    }
+
+    await ingester._process_and_store(document)
+
+    ingester.embedding_model.encode.assert_not_called()
+    ingester.collection.upsert.assert_not_called()
+    ingester.collection.update.assert_called_once()
+    assert ingester.collection.update.call_args.kwargs["metadatas"][0]["title"] == "Renamed Document"
+    ingester.collection.delete.assert_called_once_with(ids=["test-id_chunk_1"])
+
+
+async def test_ingest_documents_isolates_failures(ingester):
+    """
+    Test that bulk ingestion reports per-document results in input order.
+    """
+
+    async def fake_ingest(file_path, title, **kwargs):
+        if file_path == "bad.txt":
+            raise ValueError("Could not extract text")
+        return kwargs.get("document_id", title)
+
+    ingester.ingest_document = AsyncMock(side_effect=fake_ingest)
+
+    results = await ingester.ingest_documents(
+        [
+            {"file_path": "a.txt", "title": "A", "document_id": "doc-a"},
+            {"file_path": "bad.txt", "title": "Bad", "document_id": "doc-bad"},
+            {"file_path": "b.txt", "title": "B", "document_id": "doc-b"},
+        ],
+        max_concurrency=2,
+    )
+
+    assert [r["document_id"] for r in results] == ["doc-a", "doc-bad", "doc-b"]
+    assert [r["success"] for r in results] == [True, False, True]
+    assert "Could not extract text" in results[1]["error"]
+
+
 async def test_split_content_empty(ingester):
     """
     Test splitting empty content.
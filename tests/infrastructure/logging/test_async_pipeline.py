@@ -0,0 +1,126 @@
+"""
+Test module for faultmaven.infrastructure.logging.async_pipeline
+"""
+
+import io
+import logging
+import time
+
+import pytest
+
+from faultmaven.infrastructure.logging.async_pipeline import (
+    AsyncLogPipeline,
+    LogSampler,
+    parse_logger_values,
+)
+
+
+def make_record(name="faultmaven.test", level=logging.INFO, msg="message %s", args=("x",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+@pytest.fixture
+def stream_handler():
+    stream = CountingStream()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    return handler, stream
+
+
+def test_records_written_in_batches(stream_handler):
+    handler, stream = stream_handler
+    pipeline = AsyncLogPipeline([handler], batch_size=50)
+
+    # Queue before starting the writer so the records form full batches
+    for i in range(100):
+        pipeline.enqueue(make_record(args=(i,)))
+    pipeline.start()
+    pipeline.stop()
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0] == "INFO message 0"
+    assert len(lines) == 100
+    assert stream.flushes == 2
+    assert pipeline.get_stats()["written"] == 100
+
+
+def test_message_resolved_at_enqueue(stream_handler):
+    handler, stream = stream_handler
+    pipeline = AsyncLogPipeline([handler])
+    args = ["before"]
+    record = make_record(args=(args,))
+
+    pipeline.enqueue(record)
+    args[0] = "after"
+    pipeline.start()
+    pipeline.stop()
+
+    assert "before" in stream.getvalue()
+    assert record.args == (args,)  # caller's record untouched
+
+
+def test_full_queue_drops_low_priority_and_keeps_errors(stream_handler):
+    handler, stream = stream_handler
+    pipeline = AsyncLogPipeline([handler], queue_size=2)
+
+    pipeline.enqueue(make_record(msg="info 1", args=None))
+    pipeline.enqueue(make_record(msg="info 2", args=None))
+    pipeline.enqueue(make_record(msg="info 3", args=None))
+    pipeline.enqueue(make_record(level=logging.ERROR, msg="error", args=None))
+    pipeline.start()
+    pipeline.stop()
+
+    output = stream.getvalue()
+    assert "info 3" not in output
+    assert "info 1" not in output  # evicted to make room for the error
+    assert "ERROR error" in output
+    assert pipeline.get_stats()["dropped"] == {"INFO": 2}
+    assert "dropped 2 records" in output
+
+
+def test_sampling_and_rate_limits_only_below_warning():
+    sampler = LogSampler(
+        sample_rates={"faultmaven.api": 0.0},
+        rate_limits=parse_logger_values("faultmaven.services=5/s"),
+    )
+
+    assert not sampler.allow(make_record(name="faultmaven.api.middleware.logging"))
+    assert sampler.allow(make_record(name="faultmaven.api.middleware.logging", level=logging.WARNING))
+    assert sampler.allow(make_record(name="faultmaven.core"))
+
+    allowed = sum(sampler.allow(make_record(name="faultmaven.services.case")) for _ in range(20))
+    assert allowed == 5
+    assert sampler.sampled_out == 1
+    assert sampler.rate_limited == 15
+
+
+def test_writer_does_not_block_enqueue(stream_handler):
+    handler, _ = stream_handler
+    pipeline = AsyncLogPipeline([handler], queue_size=10)
+    pipeline.start()
+    try:
+        start = time.perf_counter()
+        for i in range(1000):
+            pipeline.enqueue(make_record(args=(i,)))
+        assert time.perf_counter() - start < 1.0
+        wait_for(lambda: pipeline.get_stats()["queue_depth"] == 0)
+    finally:
+        pipeline.stop()
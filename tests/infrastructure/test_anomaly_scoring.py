@@ -0,0 +1,205 @@
+"""
+Test module for micro-batched anomaly scoring
+
+Covers AnomalyDetectionSystem.score_batch, background training with an
+atomic model swap, retraining triggers, and
+faultmaven.infrastructure.protection.anomaly_scoring.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from faultmaven.infrastructure.protection.anomaly_detector import (
+    FEATURE_NAMES,
+    SKLEARN_AVAILABLE,
+    AnomalyDetectionSystem,
+    ModelFeedback,
+)
+from faultmaven.infrastructure.protection.anomaly_scoring import AnomalyScoringQueue
+from faultmaven.models.behavioral import BehaviorVector
+
+requires_sklearn = pytest.mark.skipif(not SKLEARN_AVAILABLE, reason="scikit-learn not installed")
+
+
+def make_vector(**features):
+    values = {
+        "response_time": 200.0, "payload_size": 500.0, "avg_interval": 5.0, "interval_stddev": 2.0,
+        "request_frequency": 3.0, "error_rate": 0.0, "endpoint_diversity": 0.5,
+    }
+    values.update(features)
+    return BehaviorVector(
+        features=values,
+        feature_names=list(values),
+        extraction_timestamp=datetime.now(timezone.utc),
+        window_size=60,
+        confidence=0.8,
+    )
+
+
+def training_data(count=200, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        {"features": {
+            "response_time": float(rng.normal(200, 20)), "payload_size": float(rng.normal(500, 50)),
+            "avg_interval": float(rng.normal(5, 0.5)), "interval_stddev": float(rng.normal(2, 0.2)),
+            "request_frequency": float(rng.normal(3, 0.3)), "error_rate": 0.0,
+            "endpoint_diversity": float(rng.normal(0.5, 0.05)),
+        }}
+        for _ in range(count)
+    ]
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def detector(tmp_path):
+    return AnomalyDetectionSystem(model_path=str(tmp_path), enable_online_learning=True)
+
+
+def test_score_batch_returns_one_result_per_vector(detector):
+    vectors = [make_vector(), make_vector(request_frequency=50.0, error_rate=0.9)]
+
+    results = detector.score_batch(vectors, ["s1", "s2"])
+
+    assert [r.session_id for r in results] == ["s1", "s2"]
+    assert all(r.detection_method == "ensemble" for r in results)
+    assert results[1].overall_score > results[0].overall_score
+    assert detector.model_metrics["total_predictions"] == 2
+    assert len(detector.training_buffer) == 2
+
+
+async def test_detect_anomalies_matches_batch_scoring(detector):
+    vector = make_vector(error_rate=0.5)
+
+    single = await detector.detect_anomalies(vector)
+    batched = detector.score_batch([vector])[0]
+
+    assert single.overall_score == pytest.approx(batched.overall_score)
+
+
+@requires_sklearn
+async def test_training_swaps_in_a_new_model_set(detector):
+    untrained = detector.models
+
+    await detector.train_models(training_data())
+
+    assert detector.models is not untrained
+    assert untrained.isolation_forest is None
+    assert detector.isolation_forest is not None
+    assert set(detector.adaptive_thresholds) == set(FEATURE_NAMES)
+
+    normal, outlier = detector.score_batch([make_vector(), make_vector(response_time=5000.0, payload_size=1e6)])
+    assert outlier.overall_score > normal.overall_score
+
+
+@requires_sklearn
+async def test_trained_models_are_reloaded(detector, tmp_path):
+    await detector.train_models(training_data())
+
+    reloaded = AnomalyDetectionSystem(model_path=str(tmp_path))
+
+    assert reloaded.isolation_forest is not None
+    assert reloaded.last_training == detector.last_training
+
+
+@requires_sklearn
+async def test_online_learning_retrains_in_background(detector):
+    detector.score_batch([make_vector(response_time=float(i)) for i in range(detector.min_training_samples)])
+
+    await detector.update_online(ModelFeedback("p1", "false_positive", 0.7))
+    task = detector._retrain_task
+
+    assert task is not None and not task.done()
+    await asyncio.wait_for(task, timeout=30)
+    assert detector.isolation_forest is not None
+    assert detector.last_training is not None
+
+
+def test_queue_scores_pending_vectors_in_batches(detector):
+    queue = AnomalyScoringQueue(detector, batch_size=2)
+    for i in range(5):
+        queue.submit(f"s{i}", make_vector())
+
+    assert queue.verdict("s0") is None
+    queue.drain()
+
+    assert queue.batches == 3
+    assert queue.scored == 5
+    assert queue.verdict("s4").session_id == "s4"
+
+
+def test_queue_keeps_only_the_latest_vector_per_session(detector):
+    queue = AnomalyScoringQueue(detector)
+    queue.submit("s1", make_vector())
+    queue.submit("s1", make_vector(error_rate=0.9))
+
+    queue.drain()
+
+    assert queue.scored == 1
+    assert queue.verdict("s1").overall_score > 0
+
+
+def test_queue_does_not_rescore_an_unchanged_vector(detector):
+    queue = AnomalyScoringQueue(detector)
+    vector = make_vector()
+    queue.submit("s1", vector)
+    queue.drain()
+
+    queue.submit("s1", vector)
+    queue.drain()
+
+    assert queue.scored == 1
+
+
+def test_queue_drops_new_sessions_when_full(detector):
+    queue = AnomalyScoringQueue(detector, max_pending=2)
+
+    assert queue.submit("s1", make_vector())
+    assert queue.submit("s2", make_vector())
+    assert not queue.submit("s3", make_vector())
+    assert queue.submit("s1", make_vector())
+    assert queue.get_stats()["dropped"] == 1
+
+
+def test_expired_verdicts_are_ignored_and_pruned(detector):
+    queue = AnomalyScoringQueue(detector, verdict_ttl=0.0)
+    queue.submit("s1", make_vector())
+    queue.drain()
+    time.sleep(0.01)
+
+    assert queue.verdict("s1") is None
+    assert queue.prune() == 1
+
+
+def test_worker_thread_scores_without_explicit_drain(detector):
+    queue = AnomalyScoringQueue(detector, max_delay=0.01)
+    queue.start()
+    try:
+        queue.submit("s1", make_vector())
+        wait_for(lambda: queue.verdict("s1") is not None)
+    finally:
+        queue.stop()
+
+    assert not queue.get_stats()["running"]
+
+
+async def test_low_accuracy_retrain_still_waits_for_interval(detector):
+    detector.training_buffer.extend({"features": [0.0] * len(FEATURE_NAMES)} for _ in range(detector.min_training_samples))
+    detector.model_metrics["model_accuracy"] = 0.0
+
+    # Feedback labelled as false positives keeps accuracy low; that alone must not retrain back to back
+    detector.last_training = datetime.now(timezone.utc)
+    assert not await detector._should_retrain()
+
+    detector.last_training = datetime.now(timezone.utc) - detector.retrain_interval
+    assert await detector._should_retrain()
@@ -0,0 +1,275 @@
+"""Test module for the case event log (CaseChangeTracker, EventSourcedCaseRepository)
+
+Tests verify:
+- Replaying a turn's events on the earlier snapshot gives the updated case
+- MilestoneEngine turns are appended as events, with a full save and new
+  snapshot every snapshot_interval turns
+- Cases without a snapshot are saved in full on their first turn and loaded
+  from the wrapped repository until then
+- Messages and activity written through to the wrapped repository show in
+  get() without a full save
+- Repositories without an event log still get a full save per turn
+- The PostgreSQL event store updates the rows and columns the turn touched
+  (what listing and search read) in the append's transaction
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from faultmaven.core.investigation.milestone_engine import MilestoneEngine
+from faultmaven.infrastructure.persistence.case_event_store import (
+    EventSourcedCaseRepository,
+    InMemoryCaseEventStore,
+    PostgreSQLCaseEventStore,
+)
+from faultmaven.infrastructure.persistence.case_repository import InMemoryCaseRepository
+from faultmaven.infrastructure.persistence.postgresql_hybrid_case_repository import (
+    PostgreSQLHybridCaseRepository,
+)
+from faultmaven.models.case import (
+    Case,
+    CaseStatus,
+    ConsultingData,
+    Evidence,
+    EvidenceCategory,
+    EvidenceForm,
+    EvidenceSourceType,
+    Hypothesis,
+    HypothesisCategory,
+    HypothesisGenerationMode,
+    HypothesisStatus,
+)
+from faultmaven.models.case_events import (
+    CaseChangeTracker,
+    CaseEventType,
+    replay_case_events,
+    snapshot_case,
+)
+
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_case() -> Case:
+    return Case(
+        user_id="user-123",
+        organization_id="org-1",
+        title="Checkout errors",
+        description="Payment API returns 500 for all customers",
+        status=CaseStatus.INVESTIGATING,
+        consulting=ConsultingData(
+            proposed_problem_statement="Payment API returns 500",
+            problem_statement_confirmed=True,
+            decided_to_investigate=True,
+        ),
+        created_at=T0,
+        updated_at=T0,
+        last_activity_at=T0,
+    )
+
+
+def make_evidence(summary: str) -> Evidence:
+    return Evidence(
+        category=EvidenceCategory.SYMPTOM_EVIDENCE,
+        primary_purpose="symptom_verified",
+        summary=summary,
+        preprocessed_content="Extracted error lines",
+        content_size_bytes=1024,
+        preprocessing_method="crime_scene_extraction",
+        source_type=EvidenceSourceType.LOG_FILE,
+        form=EvidenceForm.DOCUMENT,
+        collected_by="user-123",
+        collected_at_turn=1,
+    )
+
+
+def make_hypothesis(statement: str) -> Hypothesis:
+    return Hypothesis(
+        statement=statement,
+        category=HypothesisCategory.CODE,
+        status=HypothesisStatus.ACTIVE,
+        generated_at_turn=1,
+        generation_mode=HypothesisGenerationMode.OPPORTUNISTIC,
+        rationale="Observed in logs",
+    )
+
+
+class ScriptedLLM:
+    """Alternates replies that do and do not complete milestones"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt, **kwargs):
+        self.calls += 1
+        return ["Checking the symptom now.", "Still looking.", "Found the root cause: pool exhaustion."][self.calls % 3]
+
+
+class CountingRepository(InMemoryCaseRepository):
+
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    async def save(self, case):
+        self.saves += 1
+        return await super().save(case)
+
+
+@pytest.mark.unit
+class TestCaseEvents:
+
+    def test_replay_reproduces_turn_changes(self):
+        case = make_case()
+        hypothesis = make_hypothesis("Connection pool exhausted")
+        case.hypotheses[hypothesis.hypothesis_id] = hypothesis
+        snapshot = snapshot_case(case)
+        tracker = CaseChangeTracker(case)
+
+        case.evidence.append(make_evidence("Timeouts in payment logs"))
+        case.hypotheses[hypothesis.hypothesis_id].likelihood = 0.9
+        case.progress.symptom_verified = True
+        case.current_turn += 1
+        case.updated_at = T0 + timedelta(minutes=5)
+        events = tracker.events(case)
+
+        assert [event.event_type for event in events] == [
+            CaseEventType.FIELDS_UPDATED,
+            CaseEventType.EVIDENCE_ADDED,
+            CaseEventType.HYPOTHESIS_UPDATED,
+            CaseEventType.TURN_PROCESSED,
+        ]
+        assert set(events[0].payload["fields"]) == {"progress"}
+        assert replay_case_events(snapshot, events).model_dump() == case.model_dump()
+
+    def test_status_change_is_recorded(self):
+        case = make_case()
+        snapshot = snapshot_case(case)
+        tracker = CaseChangeTracker(case)
+
+        resolved = Case.model_validate({
+            **case.model_dump(),
+            "status": CaseStatus.RESOLVED,
+            "resolved_at": T0 + timedelta(hours=1),
+            "closed_at": T0 + timedelta(hours=1),
+            "closure_reason": "resolved",
+            "updated_at": T0 + timedelta(hours=1),
+        })
+        events = tracker.events(resolved)
+
+        status_event = next(event for event in events if event.event_type == CaseEventType.STATUS_CHANGED)
+        assert status_event.payload["from_status"] == CaseStatus.INVESTIGATING
+        assert status_event.payload["to_status"] == CaseStatus.RESOLVED
+        assert replay_case_events(snapshot, events).model_dump() == resolved.model_dump()
+
+
+@pytest.mark.unit
+class TestEventSourcedCaseRepository:
+
+    @pytest.mark.asyncio
+    async def test_turns_are_appended_and_compacted(self):
+        base = CountingRepository()
+        store = InMemoryCaseEventStore()
+        repository = EventSourcedCaseRepository(base, store, snapshot_interval=5)
+        case = make_case()
+        await repository.save(case)
+        engine = MilestoneEngine(ScriptedLLM(), repository)
+
+        for turn in range(7):
+            case = (await engine.process_turn(case, f"message {turn}"))["case_updated"]
+
+        assert base.saves == 2  # Creation and the compaction at turn 5
+        loaded = await repository.get(case.case_id)
+        assert loaded is not case
+        assert loaded.model_dump() == case.model_dump()
+        assert [turn.turn_number for turn in loaded.turn_history] == list(range(1, 8))
+        _, tail = await store.load(case.case_id)
+        assert sum(event.event_type == CaseEventType.TURN_PROCESSED for event in tail) == 2
+
+    @pytest.mark.asyncio
+    async def test_case_without_snapshot_is_saved_on_first_turn(self):
+        base = CountingRepository()
+        case = make_case()
+        await base.save(case)  # Created before the event log was enabled
+        repository = EventSourcedCaseRepository(base, InMemoryCaseEventStore(), snapshot_interval=5)
+
+        assert await repository.get(case.case_id) is case  # From the wrapped repository
+        await MilestoneEngine(ScriptedLLM(), repository).process_turn(case, "hello")
+
+        assert base.saves == 2
+        assert (await repository.get(case.case_id)).model_dump() == case.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_events_and_snapshot(self):
+        store = InMemoryCaseEventStore()
+        repository = EventSourcedCaseRepository(InMemoryCaseRepository(), store)
+        case = make_case()
+        await repository.save(case)
+
+        assert await repository.delete(case.case_id)
+
+        assert await store.load(case.case_id) is None
+        assert await repository.get(case.case_id) is None
+
+    @pytest.mark.asyncio
+    async def test_writes_through_to_base_show_in_get(self):
+        base = CountingRepository()
+        repository = EventSourcedCaseRepository(base, InMemoryCaseEventStore(), snapshot_interval=50)
+        case = make_case()
+        await repository.save(case)
+
+        assert await repository.update_activity_timestamp(case.case_id)
+        assert (await repository.get(case.case_id)).last_activity_at > T0
+
+        assert await repository.add_message(case.case_id, {"message_id": "msg_1", "content": "hello"})
+        loaded = await repository.get(case.case_id)
+        assert [message["message_id"] for message in loaded.messages] == ["msg_1"]
+        assert loaded.message_count == 1
+        assert base.saves == 1  # Recorded as events, not full saves
+
+    @pytest.mark.asyncio
+    async def test_repository_without_event_log_gets_full_save(self):
+        repository = CountingRepository()
+        case = make_case()
+
+        await MilestoneEngine(ScriptedLLM(), repository).process_turn(case, "hello")
+
+        assert repository.saves == 1
+        assert await repository.get(case.case_id) is case
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_postgresql_append_updates_touched_rows():
+    case = make_case()
+    case.evidence.append(make_evidence("Earlier evidence"))
+    tracker = CaseChangeTracker(case)
+    case.title = "Checkout errors in EU"
+    case.evidence.append(make_evidence("Connection pool exhausted"))
+    hypothesis = make_hypothesis("Pool too small")
+    case.hypotheses[hypothesis.hypothesis_id] = hypothesis
+    db = MagicMock()
+    db.execute = AsyncMock()
+    db.commit = AsyncMock()
+    rows = {
+        name: AsyncMock()
+        for name in ("_upsert_evidence", "_upsert_hypotheses", "_upsert_solutions", "_upsert_uploaded_files")
+    }
+
+    with patch.multiple(PostgreSQLHybridCaseRepository, **rows):
+        await PostgreSQLCaseEventStore(db).append(case, tracker.events(case))
+
+    sql = str(db.execute.await_args.args[0])
+    params = db.execute.await_args.args[1]
+    assert "INSERT INTO case_events" in sql
+    assert "title = :title" in sql and "consulting" not in sql
+    assert params["title"] == "Checkout errors in EU"
+    rows["_upsert_evidence"].assert_awaited_once_with(case.case_id, case.evidence[-1:], prune=False)
+    rows["_upsert_hypotheses"].assert_awaited_once_with(
+        case.case_id, {hypothesis.hypothesis_id: hypothesis}, prune=False
+    )
+    rows["_upsert_solutions"].assert_not_awaited()
+    rows["_upsert_uploaded_files"].assert_not_awaited()
+    db.commit.assert_awaited_once()
@@ -0,0 +1,228 @@
+"""Test module for indexed case search (CaseSearchIndex, search_summaries).
+
+Tests verify:
+- Every query term must match; title matches outrank description and
+  evidence matches, and stemming matches word forms
+- Typos fall back to trigram similarity on the title
+- The index follows saves, edits and deletes
+- Searches restricted to candidate cases match the unrestricted search
+- In-memory search_summaries filters before limiting, counts every match
+  and highlights the matched terms
+- The hybrid repository searches the stored search_vector in one query and
+  loads full cases in one batched query
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faultmaven.infrastructure.persistence.case_repository import InMemoryCaseRepository
+from faultmaven.infrastructure.persistence.case_search_index import CaseSearchIndex
+from faultmaven.infrastructure.persistence.postgresql_hybrid_case_repository import (
+    PostgreSQLHybridCaseRepository,
+)
+from faultmaven.models.case import (
+    Case,
+    CaseStatus,
+    Evidence,
+    EvidenceCategory,
+    EvidenceForm,
+    EvidenceSourceType,
+)
+
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_evidence(summary: str) -> Evidence:
+    return Evidence(
+        category=EvidenceCategory.SYMPTOM_EVIDENCE,
+        primary_purpose="symptom_verified",
+        summary=summary,
+        preprocessed_content="Extracted error lines",
+        content_size_bytes=1024,
+        preprocessing_method="crime_scene_extraction",
+        source_type=EvidenceSourceType.LOG_FILE,
+        form=EvidenceForm.DOCUMENT,
+        collected_by="user_001",
+        collected_at_turn=1,
+    )
+
+
+def make_case(index: int, title: str, description: str = "", evidence=(), user_id: str = "user_001") -> Case:
+    return Case(
+        case_id=f"case_{index:012d}",
+        user_id=user_id,
+        organization_id="org_001",
+        title=title,
+        description=description,
+        evidence=[make_evidence(summary) for summary in evidence],
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME + timedelta(minutes=index),
+        last_activity_at=BASE_TIME + timedelta(minutes=index),
+    )
+
+
+CASES = [
+    make_case(1, "Checkout timeouts", "Payment API slow during peak"),
+    make_case(2, "Login failures", "Users report connection timeout on login"),
+    make_case(3, "Disk pressure", "Nodes evicting pods", evidence=["Kubelet logs show timeouts"]),
+    make_case(4, "Checkout timeouts in EU", user_id="user_002"),
+    make_case(5, "Cache misses", "Redis latency spike"),
+]
+
+
+@pytest.fixture
+def index():
+    index = CaseSearchIndex()
+    for case in CASES:
+        index.add(case)
+    return index
+
+
+@pytest.mark.unit
+class TestCaseSearchIndex:
+
+    def test_title_matches_rank_first(self, index):
+        matches = index.search("timeout")
+
+        assert set(matches) == {"case_000000000001", "case_000000000002", "case_000000000003", "case_000000000004"}
+        assert matches["case_000000000001"] > matches["case_000000000002"] > matches["case_000000000003"]
+
+    def test_every_term_must_match(self, index):
+        assert set(index.search("checkout timeouts EU")) == {"case_000000000004"}
+        assert set(index.search("login timeout")) == {"case_000000000002"}
+
+    def test_typo_falls_back_to_title_similarity(self, index):
+        assert set(index.search("chekout timeots")) == {"case_000000000001", "case_000000000004"}
+        assert index.search("zzzz") == {}
+
+    def test_index_follows_edits_and_deletes(self, index):
+        edited = make_case(5, "Cache evictions", "Redis memory limit reached")
+        index.add(edited)
+        index.remove("case_000000000001")
+
+        assert index.search("latency") == {}
+        assert set(index.search("eviction")) == {"case_000000000005"}
+        assert "case_000000000001" not in index.search("timeout")
+        assert len(index) == 4
+
+    def test_search_within_candidates(self, index):
+        within = {"case_000000000002", "case_000000000004", "case_000000000005"}
+
+        assert set(index.search("timeout", within)) == {"case_000000000002", "case_000000000004"}
+        assert index.search("timeout", within) == {
+            case_id: rank for case_id, rank in index.search("timeout").items() if case_id in within
+        }
+        assert set(index.search("chekout", {"case_000000000001"})) == {"case_000000000001"}
+
+    def test_highlight_marks_matched_terms(self, index):
+        assert index.highlight("case_000000000003", "timeout") == "Kubelet logs show <mark>timeouts</mark>"
+        assert index.highlight("case_000000000001", "chekout") == "Checkout timeouts"
+
+
+@pytest.fixture
+def repo():
+    repo = InMemoryCaseRepository()
+    for case in CASES:
+        repo._cases[case.case_id] = case
+        repo._index(case)
+    return repo
+
+
+@pytest.mark.unit
+class TestInMemorySearch:
+
+    @pytest.mark.asyncio
+    async def test_search_summaries_filters_and_highlights(self, repo):
+        page = await repo.search_summaries("timeouts", user_id="user_001", limit=2)
+
+        assert [s.case_id for s in page.summaries] == ["case_000000000001", "case_000000000002"]
+        assert page.total_count == 3
+        assert page.summaries[0].highlight == "Checkout <mark>timeouts</mark>"
+        assert page.summaries[1].highlight == "Users report connection <mark>timeout</mark> on login"
+
+    @pytest.mark.asyncio
+    async def test_save_and_delete_update_results(self):
+        repo = InMemoryCaseRepository()
+        case = make_case(1, "Checkout timeouts")
+        await repo.save(case)
+        assert (await repo.search("checkout"))[1] == 1
+
+        case.title = "Payment errors"
+        await repo.save(case)
+        assert (await repo.search("checkout"))[1] == 0
+        assert (await repo.search("payment"))[0] == [case]
+
+        await repo.delete(case.case_id)
+        assert (await repo.search("payment"))[1] == 0
+
+    @pytest.mark.asyncio
+    async def test_status_filter(self, repo):
+        investigating = make_case(6, "Checkout timeouts again").model_copy(
+            update={"status": CaseStatus.INVESTIGATING}
+        )
+        repo._cases[investigating.case_id] = investigating
+        repo._index(investigating)
+
+        page = await repo.search_summaries("checkout", status=CaseStatus.INVESTIGATING)
+
+        assert [s.case_id for s in page.summaries] == ["case_000000000006"]
+
+
+def search_row(index: int, rank: float, highlight: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        case_id=f"case_{index:012d}", user_id="user_001", org_id="org_001", title=f"Case {index}",
+        status="consulting", created_at=BASE_TIME, updated_at=BASE_TIME, last_activity_at=BASE_TIME,
+        current_turn=1, turns_without_progress=0, milestones_completed=0,
+        rank=rank, total_count=12, highlight=highlight,
+    )
+
+
+@pytest.mark.unit
+class TestHybridSearch:
+
+    @pytest.mark.asyncio
+    async def test_search_summaries_is_one_indexed_query(self):
+        db = MagicMock()
+        result = MagicMock()
+        result.fetchall.return_value = [search_row(2, 0.9, "<mark>timeout</mark> on login"), search_row(1, 0.4, "x")]
+        db.execute = AsyncMock(return_value=result)
+        repo = PostgreSQLHybridCaseRepository(db)
+
+        page = await repo.search_summaries("timeout", user_id="user_001", status=CaseStatus.CONSULTING, limit=2)
+
+        assert db.execute.await_count == 1
+        sql = str(db.execute.call_args.args[0])
+        params = db.execute.call_args.args[1]
+        assert "c.search_vector @@ websearch_to_tsquery('english', :query)" in sql
+        assert "c.title % :query" in sql
+        assert "to_tsvector" not in sql
+        assert "JOIN" not in sql
+        assert "c.user_id = :user_id" in sql and "c.status = :status" in sql
+        assert params["limit"] == 2
+
+        assert [s.case_id for s in page.summaries] == ["case_000000000002", "case_000000000001"]
+        assert page.summaries[0].highlight == "<mark>timeout</mark> on login"
+        assert page.total_count == 12
+
+    @pytest.mark.asyncio
+    async def test_search_loads_hits_in_one_batch(self):
+        db = MagicMock()
+        search_result = MagicMock()
+        search_result.fetchall.return_value = [search_row(2, 0.9, ""), search_row(1, 0.4, "")]
+        db.execute = AsyncMock(return_value=search_result)
+        repo = PostgreSQLHybridCaseRepository(db)
+        repo.get = AsyncMock()
+        repo._load_cases = AsyncMock(return_value=[make_case(1, "Case 1"), make_case(2, "Case 2")])
+
+        cases, total = await repo.search("timeout")
+
+        repo.get.assert_not_awaited()
+        where_sql, params = repo._load_cases.await_args.args
+        assert where_sql == "c.case_id = ANY(:case_ids)"
+        assert params["case_ids"] == ["case_000000000002", "case_000000000001"]
+        assert [c.case_id for c in cases] == ["case_000000000002", "case_000000000001"]
+        assert total == 12
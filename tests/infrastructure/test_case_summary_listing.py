@@ -0,0 +1,178 @@
+"""Test module for projection-only case listing (list_summaries).
+
+Tests verify:
+- Filters are applied before pagination, so pages are full
+- total_count covers every matching case, not just the page
+- Keyset cursors walk all cases exactly once
+- The hybrid repository reads only the cases table, filters in SQL and
+  estimates totals above its count cap
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faultmaven.infrastructure.persistence.case_repository import (
+    InMemoryCaseRepository,
+    decode_case_cursor,
+    encode_case_cursor,
+)
+from faultmaven.infrastructure.persistence.postgresql_hybrid_case_repository import (
+    PostgreSQLHybridCaseRepository,
+)
+from faultmaven.models.case import Case, CaseStatus
+
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_case(index: int, user_id: str = "user_001", current_turn: int = 1,
+              status: CaseStatus = CaseStatus.CONSULTING) -> Case:
+    case = Case(
+        case_id=f"case_{index:012d}",
+        user_id=user_id,
+        organization_id="org_001",
+        title=f"Case {index}",
+        description="",
+        status=status,
+        current_turn=current_turn,
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME + timedelta(minutes=index),
+        last_activity_at=BASE_TIME + timedelta(minutes=index),
+        closed_at=BASE_TIME + timedelta(minutes=index) if status == CaseStatus.CLOSED else None,
+        closure_reason="abandoned" if status == CaseStatus.CLOSED else None,
+    )
+    return case
+
+
+@pytest.fixture
+def repo():
+    repo = InMemoryCaseRepository()
+    for i in range(10):
+        # Every third case is empty, case 9 is closed, case 4 belongs to someone else
+        case = make_case(
+            i,
+            user_id="user_002" if i == 4 else "user_001",
+            current_turn=0 if i % 3 == 0 else 1,
+            status=CaseStatus.CLOSED if i == 9 else CaseStatus.CONSULTING,
+        )
+        # Stored directly: save() would overwrite updated_at
+        repo._cases[case.case_id] = case
+        repo._index(case)
+    return repo
+
+
+@pytest.mark.unit
+class TestListSummaries:
+
+    @pytest.mark.asyncio
+    async def test_filters_apply_before_pagination(self, repo):
+        page = await repo.list_summaries(
+            user_id="user_001", include_empty=False, include_archived=False, limit=3
+        )
+
+        # Non-empty, open cases of user_001: 8, 7, 5, 2, 1
+        assert [s.case_id for s in page.summaries] == [
+            "case_000000000008", "case_000000000007", "case_000000000005"
+        ]
+        assert page.total_count == 5
+        assert page.next_cursor is not None
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_every_case_once(self, repo):
+        seen = []
+        cursor = None
+        while True:
+            page = await repo.list_summaries(user_id="user_001", limit=4, cursor=cursor)
+            seen.extend(s.case_id for s in page.summaries)
+            assert page.total_count == 9
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert len(seen) == 9
+        assert len(set(seen)) == 9
+        assert seen == sorted(seen, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_offset_pagination_still_supported(self, repo):
+        page = await repo.list_summaries(user_id="user_001", limit=4, offset=8)
+
+        assert [s.case_id for s in page.summaries] == ["case_000000000000"]
+        assert page.next_cursor is None
+
+    def test_cursor_round_trip_and_validation(self):
+        cursor = encode_case_cursor(BASE_TIME, "case_000000000001")
+
+        assert decode_case_cursor(cursor) == (BASE_TIME, "case_000000000001")
+        with pytest.raises(ValueError):
+            decode_case_cursor("not-a-cursor")
+
+
+def summary_row(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        case_id=f"case_{index:012d}", user_id="user_001", org_id=None, title=f"Case {index}",
+        status="investigating", created_at=BASE_TIME, updated_at=BASE_TIME + timedelta(minutes=index),
+        last_activity_at=None, current_turn=2, turns_without_progress=3, milestones_completed=4,
+    )
+
+
+def hybrid_repo(rows, count, plan_rows=None):
+    db = MagicMock()
+    page_result = MagicMock()
+    page_result.fetchall.return_value = rows
+    count_result = MagicMock()
+    count_result.scalar.return_value = count
+    plan_result = MagicMock()
+    plan_result.scalar.return_value = [{"Plan": {"Plan Rows": plan_rows}}]
+    db.execute = AsyncMock(side_effect=[page_result, count_result, plan_result])
+    return PostgreSQLHybridCaseRepository(db), db
+
+
+@pytest.mark.unit
+class TestHybridListSummaries:
+
+    @pytest.mark.asyncio
+    async def test_projection_query_filters_in_sql(self):
+        repo, db = hybrid_repo([summary_row(3), summary_row(2), summary_row(1)], count=7)
+        cursor = encode_case_cursor(BASE_TIME, "case_000000000009")
+
+        page = await repo.list_summaries(
+            user_id="user_001", include_empty=False, include_archived=False, limit=2, cursor=cursor
+        )
+
+        page_sql = str(db.execute.call_args_list[0].args[0])
+        page_params = db.execute.call_args_list[0].args[1]
+        assert "JOIN" not in page_sql
+        assert "current_turn > 0" in page_sql
+        assert "status <> 'closed'" in page_sql
+        assert "(updated_at, case_id) < (:cursor_updated_at, :cursor_case_id)" in page_sql
+        assert page_params["limit"] == 3
+        assert page_params["cursor_case_id"] == "case_000000000009"
+
+        # The total ignores the cursor
+        assert "cursor" not in str(db.execute.call_args_list[1].args[0])
+
+        assert [s.case_id for s in page.summaries] == ["case_000000000003", "case_000000000002"]
+        assert page.total_count == 7
+        assert not page.total_is_estimate
+        assert decode_case_cursor(page.next_cursor)[1] == "case_000000000002"
+
+        summary = page.summaries[0]
+        assert summary.milestones_completed == 4
+        assert summary.is_stuck
+        assert summary.last_activity_at == summary.updated_at
+
+    @pytest.mark.asyncio
+    async def test_total_is_estimated_above_count_cap(self):
+        cap = PostgreSQLHybridCaseRepository.SUMMARY_COUNT_CAP
+        repo, db = hybrid_repo([summary_row(1)], count=cap + 1, plan_rows=250000)
+
+        page = await repo.list_summaries(user_id="user_001", limit=10)
+
+        assert page.total_count == 250000
+        assert page.total_is_estimate
+        assert page.next_cursor is None
+        assert "EXPLAIN" in str(db.execute.call_args_list[2].args[0])
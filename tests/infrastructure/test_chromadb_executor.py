@@ -0,0 +1,103 @@
+"""Test module for the non-blocking ChromaDB access layer.
+
+Tests cover:
+- Blocking client calls run off the event loop thread
+- Collection handle caching (bounded, least recently used dropped first)
+  and invalidation on failure
+- Multi-query search result splitting
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from faultmaven.infrastructure.persistence.chromadb_executor import ChromaDBExecutor
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.get_or_create_collection.return_value = MagicMock(name="collection")
+    return client
+
+
+@pytest.mark.asyncio
+async def test_calls_run_off_event_loop_thread(client):
+    executor = ChromaDBExecutor(client)
+    loop_thread = threading.get_ident()
+
+    call_thread = await executor.run(threading.get_ident)
+
+    assert call_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_collection_handles_are_cached(client):
+    executor = ChromaDBExecutor(client)
+
+    for _ in range(3):
+        await executor.run_with_collection("case_abc", lambda c: c.count())
+
+    client.get_or_create_collection.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_collection_cache_keeps_most_recently_used(client):
+    executor = ChromaDBExecutor(client, max_collections=2)
+
+    for name in ("case_a", "case_b", "case_a", "case_c"):
+        await executor.get_or_create_collection(name)
+    await executor.get_or_create_collection("case_a")
+    await executor.get_or_create_collection("case_b")
+
+    names = [call.kwargs["name"] for call in client.get_or_create_collection.call_args_list]
+    assert names == ["case_a", "case_b", "case_c", "case_b"]
+
+
+@pytest.mark.asyncio
+async def test_failed_operation_invalidates_cached_handle(client):
+    executor = ChromaDBExecutor(client)
+    collection = client.get_or_create_collection.return_value
+    collection.count.side_effect = [RuntimeError("Collection does not exist"), 7]
+
+    with pytest.raises(RuntimeError):
+        await executor.run_with_collection("case_abc", lambda c: c.count())
+    count = await executor.run_with_collection("case_abc", lambda c: c.count())
+
+    assert count == 7
+    assert client.get_or_create_collection.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_collection_drops_cached_handle(client):
+    executor = ChromaDBExecutor(client)
+    await executor.get_or_create_collection("case_abc")
+
+    await executor.delete_collection("case_abc")
+    await executor.get_or_create_collection("case_abc")
+
+    client.delete_collection.assert_called_once_with(name="case_abc")
+    assert client.get_or_create_collection.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_multi_query_issues_single_query_call(client):
+    executor = ChromaDBExecutor(client)
+    collection = client.get_or_create_collection.return_value
+    collection.query.return_value = {
+        "ids": [["a1", "a2"], []],
+        "documents": [["doc a1", "doc a2"], []],
+        "metadatas": [[{"filename": "app.log"}, None], []],
+        "distances": [[0.1, 0.4], []],
+    }
+
+    results = await executor.query("case_abc", ["errors?", "timeouts?"], n_results=2)
+    per_query = executor.split_query_results(results, 2)
+
+    collection.query.assert_called_once()
+    assert collection.query.call_args.kwargs["query_texts"] == ["errors?", "timeouts?"]
+    assert [hit["id"] for hit in per_query[0]] == ["a1", "a2"]
+    assert per_query[0][0]["score"] == pytest.approx(0.9)
+    assert per_query[0][1]["metadata"] == {}
+    assert per_query[1] == []
@@ -0,0 +1,122 @@
+"""Test module for the shared embedding service.
+
+Tests cover:
+- Coalescing of concurrent encode requests into micro-batches
+- Maximum batch size enforcement
+- LRU cache hits for repeated texts (async and sync paths)
+- Error propagation to waiting callers
+- Cancelling one caller leaves callers waiting for the same text unaffected
+- Closing the service flushes queued requests and waits for the flush
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from faultmaven.infrastructure.embedding_service import EmbeddingService
+
+
+class FakeModel:
+    """Deterministic stand-in for a SentenceTransformer"""
+
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+
+    def encode(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return np.array([[float(len(text)), 1.0] for text in texts])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced():
+    model = FakeModel()
+    service = EmbeddingService(model, max_batch_size=16, max_wait_ms=20)
+
+    results = await asyncio.gather(*(service.encode_one(f"text {i}") for i in range(10)))
+
+    assert len(model.calls) == 1
+    assert len(model.calls[0]) == 10
+    assert results[3][0] == float(len("text 3"))
+
+
+@pytest.mark.asyncio
+async def test_batches_respect_max_batch_size():
+    model = FakeModel()
+    service = EmbeddingService(model, max_batch_size=4, max_wait_ms=20)
+
+    vectors = await service.encode([f"chunk {i}" for i in range(10)])
+
+    assert len(vectors) == 10
+    assert [len(call) for call in model.calls] == [4, 4, 2]
+
+
+@pytest.mark.asyncio
+async def test_repeated_texts_are_not_reencoded():
+    model = FakeModel()
+    service = EmbeddingService(model, max_wait_ms=0)
+
+    first = await service.encode(["same prompt", "same prompt", "other"])
+    second = await service.encode_one("same prompt")
+    third = service.encode_sync(["other"])
+
+    assert sum(len(call) for call in model.calls) == 2
+    assert np.array_equal(first[0], second)
+    assert np.array_equal(first[2], third[0])
+    assert service.get_stats()["cache_hits"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_oldest_entries():
+    model = FakeModel()
+    service = EmbeddingService(model, max_wait_ms=0, cache_size=2)
+
+    await service.encode(["a", "b", "c"])
+    await service.encode_one("a")
+
+    assert model.calls[-1] == ["a"]
+    assert service.get_stats()["cache_entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_model_failure_propagates_to_callers():
+    service = EmbeddingService(FakeModel(fail=True), max_wait_ms=0)
+
+    with pytest.raises(RuntimeError, match="model crashed"):
+        await service.encode_one("boom")
+
+    assert service.get_stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request():
+    model = FakeModel()
+    service = EmbeddingService(model, max_batch_size=16, max_wait_ms=20)
+
+    cancelled = asyncio.create_task(service.encode_one("shared text"))
+    waiting = asyncio.create_task(service.encode_one("shared text"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    vector = await waiting
+
+    assert list(vector) == [11.0, 1.0]
+    assert cancelled.cancelled()
+    assert len(model.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_requests():
+    model = FakeModel()
+    service = EmbeddingService(model, max_batch_size=16, max_wait_ms=10_000)
+
+    caller = asyncio.create_task(service.encode_one("queued text"))
+    await asyncio.sleep(0)
+    await service.close()
+
+    assert caller.done()
+    assert list(await caller) == [11.0, 1.0]
+    assert service._flush_tasks == set()
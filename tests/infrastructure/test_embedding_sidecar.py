@@ -0,0 +1,134 @@
+"""Test module for the embedding sidecar.
+
+Tests cover:
+- Round trip of encode requests from the worker-side client to the sidecar
+- Coalescing of requests from several workers into shared model batches
+- Error reporting and reconnection after a sidecar restart
+- Sidecar selection in ModelCache
+"""
+
+import asyncio
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from faultmaven.infrastructure.embedding_sidecar import EmbeddingSidecarServer, RemoteEmbeddingModel
+from faultmaven.infrastructure.model_cache import ModelCache
+
+
+class FakeModel:
+    """Deterministic stand-in for a SentenceTransformer"""
+
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+
+    def encode(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return np.array([[float(len(text)), 1.0, 2.0] for text in texts])
+
+
+@pytest.fixture
+def socket_path():
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, "embeddings.sock")
+
+
+@pytest.mark.asyncio
+async def test_remote_encode_round_trip(socket_path):
+    server = EmbeddingSidecarServer(FakeModel(), socket_path)
+    await server.start()
+    client = RemoteEmbeddingModel(socket_path, timeout=5)
+    try:
+        matrix = await asyncio.to_thread(client.encode, ["a", "abcd"])
+        single = await asyncio.to_thread(client.encode, "abc")
+        empty = await asyncio.to_thread(client.encode, [])
+    finally:
+        client.close()
+        await server.close()
+
+    assert matrix.dtype == np.float32
+    np.testing.assert_array_equal(matrix, [[1.0, 1.0, 2.0], [4.0, 1.0, 2.0]])
+    np.testing.assert_array_equal(single, [3.0, 1.0, 2.0])
+    assert empty.shape[0] == 0
+    assert not os.path.exists(socket_path)
+
+
+@pytest.mark.asyncio
+async def test_workers_share_model_batches(socket_path):
+    model = FakeModel()
+    server = EmbeddingSidecarServer(model, socket_path, max_batch_size=64, max_wait_ms=50)
+    await server.start()
+    clients = [RemoteEmbeddingModel(socket_path, timeout=5) for _ in range(4)]
+    try:
+        await asyncio.gather(*(
+            asyncio.to_thread(client.encode, [f"worker {i} text"]) for i, client in enumerate(clients)
+        ))
+    finally:
+        for client in clients:
+            client.close()
+        await server.close()
+
+    assert sum(len(batch) for batch in model.calls) == 4
+    assert len(model.calls) < 4
+
+
+@pytest.mark.asyncio
+async def test_model_error_reported_to_client(socket_path):
+    server = EmbeddingSidecarServer(FakeModel(fail=True), socket_path)
+    await server.start()
+    client = RemoteEmbeddingModel(socket_path, timeout=5)
+    try:
+        with pytest.raises(RuntimeError, match="model crashed"):
+            await asyncio.to_thread(client.encode, ["text"])
+    finally:
+        client.close()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_client_reconnects_after_sidecar_restart(socket_path):
+    server = EmbeddingSidecarServer(FakeModel(), socket_path)
+    await server.start()
+    client = RemoteEmbeddingModel(socket_path, timeout=5)
+    try:
+        await asyncio.to_thread(client.encode, ["before"])
+        await server.close()
+
+        server = EmbeddingSidecarServer(FakeModel(), socket_path)
+        await server.start()
+        matrix = await asyncio.to_thread(client.encode, ["after"])
+    finally:
+        client.close()
+        await server.close()
+
+    np.testing.assert_array_equal(matrix, [[5.0, 1.0, 2.0]])
+
+
+def test_model_cache_uses_sidecar_client():
+    cache = ModelCache()
+    cache.clear_cache()
+    knowledge = SimpleNamespace(
+        embedding_model_mode="sidecar",
+        embedding_sidecar_socket="/tmp/test-embeddings.sock",
+        embedding_sidecar_timeout_seconds=1.0,
+        embedding_batch_size=8,
+        embedding_max_wait_ms=1.0,
+        embedding_cache_size=10,
+    )
+    try:
+        with patch.object(ModelCache, "_knowledge_settings", return_value=knowledge):
+            model = cache.get_bge_m3_model()
+            service = cache.get_bge_m3_embedding_service()
+
+        assert isinstance(model, RemoteEmbeddingModel)
+        assert model.socket_path == "/tmp/test-embeddings.sock"
+        assert service.model is model
+    finally:
+        cache.clear_cache()
@@ -0,0 +1,193 @@
+"""Test module for the indexed InMemoryCaseRepository (CaseListingIndex).
+
+Tests verify:
+- list() and list_summaries() return what a full scan and sort returns, for
+  every filter combination, with offsets and keyset cursors
+- Indexes follow saves (status, user changes), deletes, new messages and
+  expiry cleanup
+- Indexes hold snapshots: editing a stored case in place changes listings
+  only once it is saved
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from faultmaven.infrastructure.persistence.case_listing_index import CaseListingIndex
+from faultmaven.infrastructure.persistence.case_repository import (
+    InMemoryCaseRepository,
+    paginate_case_summaries,
+)
+from faultmaven.models.case import Case, CaseStatus
+
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+USERS = ["user_001", "user_002", "user_003"]
+ORGS = ["org_001", "org_002"]
+
+
+def make_case(index: int, user_id: str = "user_001", organization_id: str = "org_001",
+              status: CaseStatus = CaseStatus.CONSULTING, current_turn: int = 1,
+              updated_minutes: int = None, activity_minutes: int = None) -> Case:
+    updated_at = BASE_TIME + timedelta(minutes=index if updated_minutes is None else updated_minutes)
+    closed = status == CaseStatus.CLOSED
+    return Case(
+        case_id=f"case_{index:012d}",
+        user_id=user_id,
+        organization_id=organization_id,
+        title=f"Case {index}",
+        status=status,
+        current_turn=current_turn,
+        created_at=BASE_TIME,
+        updated_at=updated_at,
+        last_activity_at=BASE_TIME + timedelta(minutes=index if activity_minutes is None else activity_minutes),
+        closed_at=updated_at if closed else None,
+        closure_reason="abandoned" if closed else None,
+    )
+
+
+def store(repo: InMemoryCaseRepository, case: Case) -> None:
+    """Store without save(), which would overwrite updated_at"""
+    repo._cases[case.case_id] = case
+    repo._index(case)
+
+
+@pytest.fixture
+def random_repo():
+    rng = random.Random(7)
+    repo = InMemoryCaseRepository()
+    for i in range(300):
+        store(repo, make_case(
+            i,
+            user_id=rng.choice(USERS),
+            organization_id=rng.choice(ORGS),
+            status=rng.choice([CaseStatus.CONSULTING, CaseStatus.CONSULTING, CaseStatus.CLOSED]),
+            current_turn=rng.choice([0, 1, 5]),
+            # Ties on purpose: case_id breaks them
+            updated_minutes=rng.randrange(100),
+            activity_minutes=rng.randrange(100),
+        ))
+    return repo
+
+
+@pytest.mark.unit
+class TestIndexedListing:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("user_id", [None, "user_002"])
+    @pytest.mark.parametrize("organization_id", [None, "org_001"])
+    @pytest.mark.parametrize("status", [None, CaseStatus.CLOSED])
+    async def test_list_matches_full_scan(self, random_repo, user_id, organization_id, status):
+        cases, total = await random_repo.list(user_id, organization_id, status, limit=15, offset=10)
+
+        expected = [
+            c for c in random_repo._cases.values()
+            if (not user_id or c.user_id == user_id)
+            and (not organization_id or c.organization_id == organization_id)
+            and (not status or c.status == status)
+        ]
+        expected.sort(key=lambda c: (c.last_activity_at, c.case_id), reverse=True)
+        assert [c.case_id for c in cases] == [c.case_id for c in expected[10:25]]
+        assert total == len(expected)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"user_id": "user_001", "include_empty": False},
+        {"organization_id": "org_002", "include_archived": False},
+        {"user_id": "user_003", "organization_id": "org_001", "status": CaseStatus.CONSULTING},
+        {"status": CaseStatus.CLOSED},
+    ])
+    async def test_summary_pages_match_full_scan(self, random_repo, filters):
+        scan_filters = {k: v for k, v in filters.items() if k in ("include_empty", "include_archived")}
+        candidates = [
+            c for c in random_repo._cases.values()
+            if all(getattr(c, k) == v for k, v in filters.items() if k in ("user_id", "organization_id", "status"))
+        ]
+
+        cursor, expected_cursor = None, None
+        while True:
+            page = await random_repo.list_summaries(**filters, limit=20, cursor=cursor)
+            expected = paginate_case_summaries(candidates, **scan_filters, limit=20, cursor=expected_cursor)
+
+            assert [s.case_id for s in page.summaries] == [s.case_id for s in expected.summaries]
+            assert page.total_count == expected.total_count
+            assert page.next_cursor == expected.next_cursor
+            if page.next_cursor is None:
+                break
+            cursor = expected_cursor = page.next_cursor
+
+        offset_page = await random_repo.list_summaries(**filters, limit=20, offset=7)
+        expected = paginate_case_summaries(candidates, **scan_filters, limit=20, offset=7)
+        assert [s.case_id for s in offset_page.summaries] == [s.case_id for s in expected.summaries]
+
+
+@pytest.mark.unit
+class TestIndexMaintenance:
+
+    @pytest.mark.asyncio
+    async def test_saves_and_deletes_update_indexes(self):
+        repo = InMemoryCaseRepository()
+        first, second = make_case(1), make_case(2)
+        await repo.save(first)
+        await repo.save(second)
+
+        first.user_id = "user_002"
+        await repo.save(first)
+
+        assert [c.case_id for c in (await repo.list(user_id="user_001"))[0]] == [second.case_id]
+        assert (await repo.list_summaries(user_id="user_002")).total_count == 1
+        assert (await repo.list_summaries()).summaries[0].case_id == first.case_id  # Saved last
+
+        await repo.delete(first.case_id)
+        assert (await repo.list(user_id="user_002")) == ([], 0)
+        assert len(repo._listing_index) == 1
+
+    @pytest.mark.asyncio
+    async def test_unsaved_edits_do_not_change_listings(self):
+        repo = InMemoryCaseRepository()
+        case = make_case(1)
+        store(repo, case)
+
+        case.current_turn = 0
+        assert (await repo.list_summaries(include_empty=False)).total_count == 1
+
+        await repo.save(case)
+        assert (await repo.list_summaries(include_empty=False)).total_count == 0
+
+    @pytest.mark.asyncio
+    async def test_new_message_moves_case_to_front(self):
+        repo = InMemoryCaseRepository()
+        for i in range(3):
+            store(repo, make_case(i))
+
+        await repo.add_message("case_000000000000", {"role": "user", "content": "still broken"})
+
+        cases, _ = await repo.list()
+        assert cases[0].case_id == "case_000000000000"
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_expired_closed_cases(self):
+        repo = InMemoryCaseRepository()
+        store(repo, make_case(1, status=CaseStatus.CLOSED))
+        store(repo, make_case(2))
+
+        assert await repo.cleanup_expired(max_age_days=1) == 1
+
+        assert list(repo._cases) == ["case_000000000002"]
+        assert repo._listing_index.status_case_ids(CaseStatus.CLOSED) == []
+
+
+@pytest.mark.unit
+def test_newest_first_crosses_chunk_boundaries():
+    index = CaseListingIndex()
+    count = 2 * CaseListingIndex.SCAN_CHUNK + 10
+    for i in range(count):
+        index.add(make_case(i))
+    expected = [f"case_{i:012d}" for i in reversed(range(count))]
+
+    assert [entry.case_id for entry in index.newest_first("updated_at")] == expected
+
+    before = index.get(expected[299]).key("updated_at")
+    assert [entry.case_id for entry in index.newest_first("updated_at", before=before)] == expected[300:]
@@ -0,0 +1,113 @@
+"""Test module for the pre-aggregated metric store.
+
+Tests cover:
+- Quantile sketch accuracy and merging
+- Time bucket windows and retention
+- MetricsCollector summaries served from the store
+"""
+
+import random
+
+import pytest
+
+from faultmaven.infrastructure.observability.metric_store import (
+    MetricAggregate,
+    QuantileSketch,
+    TimeBucketedMetricStore,
+)
+from faultmaven.infrastructure.observability.metrics_collector import MetricsCollector
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(3, 1.2) for _ in range(20000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        expected = exact_quantile(values, q)
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+
+
+def test_sketch_merge_matches_single_sketch():
+    rng = random.Random(5)
+    values = [rng.uniform(-50, 500) for _ in range(5000)] + [0.0] * 50
+    combined = QuantileSketch()
+    parts = [QuantileSketch(), QuantileSketch()]
+    for i, value in enumerate(values):
+        combined.add(value)
+        parts[i % 2].add(value)
+
+    parts[0].merge(parts[1])
+
+    assert parts[0].count == combined.count
+    for q in (0.01, 0.25, 0.5, 0.99):
+        assert parts[0].quantile(q) == combined.quantile(q)
+
+
+def test_aggregate_summary_statistics():
+    aggregate = MetricAggregate()
+    for value in (10.0, 20.0, 30.0, 40.0):
+        aggregate.add(value)
+
+    stats = aggregate.summary()
+
+    assert stats["count"] == 4
+    assert stats["avg"] == 25.0
+    assert (stats["min"], stats["max"]) == (10.0, 40.0)
+    assert stats["std_dev"] == pytest.approx(12.9099, rel=1e-4)
+    assert stats["p99"] <= 40.0
+
+
+def test_store_window_covers_recent_buckets_only():
+    store = TimeBucketedMetricStore(bucket_seconds=10, retention_seconds=600)
+    now = 100_000.0
+    store.record("knowledge_service", "search_time", 500.0, timestamp=now - 300)
+    for offset in range(0, 50, 5):
+        store.record("knowledge_service", "search_time", 50.0, timestamp=now - offset)
+    store.record("knowledge_service", "relevance_scoring", 5.0, timestamp=now)
+
+    recent = store.summarize("knowledge_service", window_seconds=60, now=now)
+    wide = store.summarize("knowledge_service", window_seconds=600, now=now)
+
+    assert recent["search_time"].count == 10
+    assert recent["search_time"].maximum == 50.0
+    assert wide["search_time"].count == 11
+    assert set(recent) == {"search_time", "relevance_scoring"}
+    assert store.summarize("planning_service", 60, now=now) == {}
+
+
+def test_store_drops_expired_buckets():
+    store = TimeBucketedMetricStore(bucket_seconds=10, retention_seconds=100)
+    for t in range(0, 1000, 10):
+        store.record("svc", "op", 1.0, timestamp=float(t))
+
+    assert store.stats()["buckets"] <= 10
+    # Samples older than the retention period are ignored
+    store.record("svc", "op", 1.0, timestamp=0.0)
+    assert store.aggregate("svc", "op", window_seconds=1000, now=999.0).count == 10
+
+
+@pytest.mark.asyncio
+async def test_collector_summary_from_store():
+    collector = MetricsCollector()
+    for value in range(1, 101):
+        collector.record_metric("knowledge_service", "search_time", float(value))
+    collector.record_metric("knowledge_service", "custom_operation", 5.0)
+
+    summary = await collector.get_service_performance_summary("knowledge_service", 5)
+    statistics = collector.get_operation_statistics("knowledge_service", 5)
+
+    search = summary["operation_statistics"]["search_time"]
+    assert search["count"] == 100
+    assert search["avg"] == pytest.approx(50.5)
+    assert search["p95"] == pytest.approx(95, rel=0.02)
+    assert summary["total_operations"] == 101
+    assert statistics["search_time"]["count"] == 100
+    assert "custom_operation" in statistics
@@ -0,0 +1,253 @@
+"""Test module for cached RBAC permission resolution (PermissionResolver)
+
+Tests verify:
+- A membership is loaded once and later checks are answered from cache
+- 'resource.manage' grants every action on the resource; non-members are
+  cached too
+- A second process (resolver) shares entries through Redis
+- Member and role changes bump the scope version so stale entries are ignored
+- Bulk filtering resolves each organization once
+- Redis failures fall back to the repository
+- OrganizationService and TeamService check and invalidate through the resolver
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+import fakeredis.aioredis
+
+from faultmaven.infrastructure.caching.permission_cache import Membership, PermissionResolver
+from faultmaven.models.interfaces_user import Team, TeamMember
+from faultmaven.services.domain.organization_service import OrganizationService
+from faultmaven.services.domain.team_service import TeamService
+
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+ROLE_PERMISSIONS = {
+    "role_org_owner": ["organization.manage", "users.manage", "teams.manage", "cases.manage"],
+    "role_org_member": ["cases.read", "cases.write", "teams.read", "organization.read"],
+    "role_org_viewer": ["cases.read", "organization.read"],
+}
+
+
+class FakeOrganizationRepository:
+    """Role assignments in memory; counts permission loads"""
+
+    def __init__(self, roles):
+        self.roles = dict(roles)  # (org_id, user_id) -> role_id
+        self.loads = 0
+
+    async def get_member_permissions(self, org_id, user_id):
+        self.loads += 1
+        role_id = self.roles.get((org_id, user_id))
+        if role_id is None:
+            return None
+        return role_id, ROLE_PERMISSIONS[role_id]
+
+
+class FakeTeamRepository:
+
+    def __init__(self, members):
+        self.members = dict(members)  # (team_id, user_id) -> team_role
+        self.loads = 0
+
+    async def get_member(self, team_id, user_id):
+        self.loads += 1
+        if (team_id, user_id) not in self.members:
+            return None
+        return TeamMember(user_id=user_id, team_id=team_id, team_role=self.members[(team_id, user_id)], joined_at=NOW)
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.aioredis.FakeRedis()
+
+
+@pytest.fixture
+def org_repository():
+    return FakeOrganizationRepository({
+        ("org-1", "alice"): "role_org_owner",
+        ("org-1", "bob"): "role_org_member",
+        ("org-2", "bob"): "role_org_viewer",
+    })
+
+
+@pytest.fixture
+def team_repository():
+    return FakeTeamRepository({("team-1", "bob"): "lead"})
+
+
+@pytest.fixture
+def resolver(org_repository, team_repository, redis_client):
+    return PermissionResolver(org_repository, team_repository, redis_client)
+
+
+@pytest.mark.unit
+class TestPermissionResolver:
+
+    def test_manage_grants_every_action(self):
+        membership = Membership("org:org-1", "alice", "role_org_owner", frozenset(["cases.manage"]))
+
+        assert membership.allows("cases.write")
+        assert membership.allows("cases.delete")
+        assert not membership.allows("users.read")
+
+    @pytest.mark.asyncio
+    async def test_membership_is_loaded_once(self, resolver, org_repository):
+        assert await resolver.has_permission("bob", "org-1", "cases.write")
+        assert await resolver.has_permission("bob", "org-1", "organization.read")
+        assert not await resolver.has_permission("bob", "org-1", "users.write")
+
+        assert org_repository.loads == 1
+        stats = resolver.get_stats()
+        assert (stats["lookups"], stats["local_hits"], stats["loads"]) == (3, 2, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["avg_lookup_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_non_members_are_cached(self, resolver, org_repository):
+        assert await resolver.organization_membership("carol", "org-1") is None
+        assert not await resolver.has_permission("carol", "org-1", "cases.read")
+
+        assert org_repository.loads == 1
+
+    @pytest.mark.asyncio
+    async def test_processes_share_entries_through_redis(self, resolver, org_repository, team_repository, redis_client):
+        await resolver.has_permission("bob", "org-1", "cases.write")
+        await resolver.has_permission("carol", "org-1", "cases.write")
+
+        other_process = PermissionResolver(org_repository, team_repository, redis_client)
+        membership = await other_process.organization_membership("bob", "org-1")
+
+        assert membership.role_id == "role_org_member"
+        assert await other_process.organization_membership("carol", "org-1") is None
+        assert org_repository.loads == 2
+        assert other_process.get_stats()["redis_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_role_change_invalidates_every_process(self, resolver, org_repository, team_repository, redis_client):
+        other_process = PermissionResolver(org_repository, team_repository, redis_client, local_ttl_seconds=0)
+        assert not await resolver.has_permission("bob", "org-1", "users.manage")
+        assert not await other_process.has_permission("bob", "org-1", "users.manage")
+
+        org_repository.roles[("org-1", "bob")] = "role_org_owner"
+        await resolver.invalidate_organization("org-1", "bob")
+
+        assert await resolver.has_permission("bob", "org-1", "users.manage")
+        assert await other_process.has_permission("bob", "org-1", "users.manage")
+
+    @pytest.mark.asyncio
+    async def test_entry_from_before_invalidation_is_ignored(self, resolver, org_repository, redis_client):
+        # A load that read the old role but stored it after the change
+        version = 0
+        stale = Membership("org:org-1", "bob", "role_org_member", frozenset(ROLE_PERMISSIONS["role_org_member"]))
+        await resolver.invalidate_organization("org-1", "bob")
+        await resolver._store_shared("org:org-1", "bob", stale, version)
+
+        entry, current_version = await resolver._lookup_shared("org:org-1", "bob")
+
+        assert entry is None
+        assert current_version == 1
+
+    @pytest.mark.asyncio
+    async def test_filter_permitted_resolves_each_org_once(self, resolver, org_repository):
+        documents = [
+            SimpleNamespace(doc_id=f"doc-{i}", org_id=org_id, owner_user_id=owner)
+            for i, (org_id, owner) in enumerate([
+                ("org-1", "alice"), ("org-2", "alice"), ("org-3", "alice"), ("org-1", "bob"),
+                ("org-3", "bob"), (None, "bob"), (None, "alice"),
+            ])
+        ]
+
+        writable = await resolver.filter_permitted("bob", documents, "cases.write")
+        readable = await resolver.filter_permitted(
+            "bob", documents, "cases.read", owner_of=lambda doc: doc.owner_user_id
+        )
+
+        assert [doc.doc_id for doc in writable] == ["doc-0", "doc-3"]
+        assert [doc.doc_id for doc in readable] == ["doc-0", "doc-1", "doc-3", "doc-4", "doc-5"]
+        assert org_repository.loads == 3
+
+    @pytest.mark.asyncio
+    async def test_team_membership(self, resolver, team_repository):
+        assert await resolver.is_team_member("bob", "team-1")
+        assert not await resolver.is_team_member("alice", "team-1")
+        assert (await resolver.team_membership("bob", "team-1")).role_id == "lead"
+
+        team_repository.members[("team-1", "alice")] = "member"
+        await resolver.invalidate_team("team-1", "alice")
+
+        assert await resolver.is_team_member("alice", "team-1")
+        assert team_repository.loads == 3
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_fall_back_to_repository(self, org_repository, team_repository):
+        broken = AsyncMock()
+        broken.mget.side_effect = ConnectionError("redis down")
+        broken.incr.side_effect = ConnectionError("redis down")
+        resolver = PermissionResolver(org_repository, team_repository, broken)
+
+        assert await resolver.has_permission("alice", "org-1", "organization.write")
+        await resolver.invalidate_organization("org-1", "alice")
+
+        broken.set.assert_not_called()
+        assert resolver.get_stats()["redis_errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_works_without_redis(self, org_repository, team_repository):
+        resolver = PermissionResolver(org_repository, team_repository)
+
+        assert await resolver.has_permission("alice", "org-1", "teams.write")
+        assert await resolver.has_permission("alice", "org-1", "teams.write")
+        assert org_repository.loads == 1
+
+
+@pytest.mark.unit
+class TestServicesUseResolver:
+
+    @pytest.mark.asyncio
+    async def test_organization_role_change_is_visible_immediately(self, resolver, org_repository):
+        repository = AsyncMock()
+        repository.update_member_role.return_value = True
+
+        async def update_role(org_id, user_id, role_id):
+            org_repository.roles[(org_id, user_id)] = role_id
+            return True
+        repository.update_member_role.side_effect = update_role
+        service = OrganizationService(organization_repository=repository, permission_resolver=resolver)
+
+        assert not await service.user_has_permission("bob", "org-1", "users.manage")
+        await service.update_member_role("org-1", "bob", "role_org_owner", updated_by="alice")
+
+        assert await service.user_has_permission("bob", "org-1", "users.manage")
+        repository.user_has_permission.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_team_member_changes_invalidate(self, resolver, team_repository):
+        repository = AsyncMock()
+        repository.get_team.return_value = Team(
+            team_id="team-1", org_id="org-1", name="SRE", created_at=NOW, updated_at=NOW
+        )
+
+        async def remove_member(team_id, user_id):
+            del team_repository.members[(team_id, user_id)]
+            return True
+        repository.remove_member.side_effect = remove_member
+        org_repository = AsyncMock()
+        service = TeamService(
+            team_repository=repository,
+            organization_repository=org_repository,
+            permission_resolver=resolver,
+        )
+
+        assert await service.is_team_member("team-1", "bob")
+        await service.remove_member("team-1", "bob", removed_by="alice")
+
+        assert not await service.is_team_member("team-1", "bob")
+        org_repository.user_has_permission.assert_not_called()
+        repository.is_team_member.assert_not_called()
@@ -0,0 +1,108 @@
+"""Test module for the app-level Prometheus metrics.
+
+Tests cover:
+- HTTP metrics labelled by route template, not raw path
+- Cache hit/miss counters and LLM token counters
+- Connection pool gauges read at scrape time
+- Text and OpenMetrics exposition
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from faultmaven.api.middleware.prometheus import PrometheusMiddleware
+from faultmaven.infrastructure.observability import prometheus_metrics
+from faultmaven.infrastructure.observability.prometheus_metrics import (
+    record_cache_lookup,
+    record_llm_request,
+    register_redis_pool,
+    render_metrics,
+)
+
+pytestmark = pytest.mark.skipif(
+    not prometheus_metrics.PROMETHEUS_AVAILABLE, reason="prometheus-client not installed"
+)
+
+from prometheus_client import REGISTRY  # noqa: E402
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/api/v1/items/{item_id}")
+    async def get_item(item_id: str):
+        return {"id": item_id}
+
+    return TestClient(app)
+
+
+def test_http_requests_labelled_by_route_template(client):
+    route = "/api/v1/items/{item_id}"
+    before = sample("faultmaven_http_requests_total", method="GET", route=route, status="200")
+
+    for item_id in ("a", "b", "c"):
+        assert client.get(f"/api/v1/items/{item_id}").status_code == 200
+
+    assert sample("faultmaven_http_requests_total", method="GET", route=route, status="200") == before + 3
+    assert sample("faultmaven_http_request_duration_seconds_count", method="GET", route=route) >= 3
+    assert sample("faultmaven_http_requests_total", method="GET", route="/api/v1/items/a", status="200") == 0
+    assert sample("faultmaven_http_requests_in_progress", method="GET") == 0
+
+
+def test_unmatched_paths_share_one_label(client):
+    before = sample("faultmaven_http_requests_total", method="GET", route="unmatched", status="404")
+
+    client.get("/no/such/path/1")
+    client.get("/no/such/path/2")
+
+    assert sample("faultmaven_http_requests_total", method="GET", route="unmatched", status="404") == before + 2
+
+
+def test_cache_and_llm_counters():
+    hits = sample("faultmaven_cache_requests_total", cache="test_cache", result="hit")
+    misses = sample("faultmaven_cache_requests_total", cache="test_cache", result="miss")
+    tokens = sample("faultmaven_llm_tokens_total", provider="test_provider", model="m")
+
+    record_cache_lookup("test_cache", True)
+    record_cache_lookup("test_cache", True)
+    record_cache_lookup("test_cache", False)
+    record_llm_request("test_provider", "m", "success", 0.5, tokens=120)
+
+    assert sample("faultmaven_cache_requests_total", cache="test_cache", result="hit") == hits + 2
+    assert sample("faultmaven_cache_requests_total", cache="test_cache", result="miss") == misses + 1
+    assert sample("faultmaven_llm_tokens_total", provider="test_provider", model="m") == tokens + 120
+    assert sample("faultmaven_llm_requests_total", provider="test_provider", model="m", status="success") >= 1
+
+
+def test_redis_pool_gauges_read_at_scrape_time():
+    class Pool:
+        max_connections = 50
+        _in_use_connections = {1, 2}
+        _available_connections = [3]
+
+    class Client:
+        connection_pool = Pool()
+
+    client = Client()
+    register_redis_pool("test_pool", client)
+
+    assert sample("faultmaven_redis_pool_connections", pool="test_pool", state="in_use") == 2
+    assert sample("faultmaven_redis_pool_connections", pool="test_pool", state="idle") == 1
+    assert sample("faultmaven_redis_pool_connections", pool="test_pool", state="capacity") == 50
+
+
+def test_render_metrics_formats():
+    body, content_type = render_metrics()
+    assert content_type.startswith("text/plain")
+    assert b"faultmaven_http_requests_total" in body
+
+    body, content_type = render_metrics("application/openmetrics-text; version=1.0.0")
+    assert content_type.startswith("application/openmetrics-text")
+    assert body.rstrip().endswith(b"# EOF")
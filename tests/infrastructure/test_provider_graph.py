@@ -0,0 +1,180 @@
+"""Provider Graph Tests
+
+Tests the DI container's provider graph:
+- Dependency waves and concurrent warm-up of blocking providers
+- Lazy resolution of a provider and its dependencies
+- Async warm-up hooks and failure reporting
+- Failed builds retried on later resolves, with backoff
+- Startup profile contents
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from faultmaven.infrastructure.provider_graph import ProviderGraph
+
+
+class Components:
+    """Attribute holder standing in for the container"""
+
+
+def make_graph(delay=0.0):
+    components = Components()
+    built = []
+    lock = threading.Lock()
+
+    def builder(name, value=None):
+        def build():
+            time.sleep(delay)
+            with lock:
+                built.append(name)
+            setattr(components, name, value if value is not None else name)
+        return build
+
+    graph = ProviderGraph()
+    graph.register("settings_store", builder("settings_store"), layer="infrastructure")
+    graph.register("vector_store", builder("vector_store"), blocking=True, layer="infrastructure")
+    graph.register("redis_client", builder("redis_client"), blocking=True, layer="infrastructure")
+    graph.register(
+        "case_service", builder("case_service"),
+        depends_on=["vector_store", "redis_client"],
+    )
+    graph.register(
+        "analytics", builder("analytics"),
+        depends_on=["case_service"], eager=False,
+    )
+    return graph, components, built
+
+
+def test_waves_follow_dependencies():
+    graph, _, _ = make_graph()
+
+    assert graph.waves() == [
+        ["redis_client", "settings_store", "vector_store"],
+        ["case_service"],
+    ]
+    assert graph.waves(["analytics"])[-1] == ["analytics"]
+
+
+def test_dependency_cycle_rejected():
+    graph = ProviderGraph()
+    graph.register("a", lambda: None, depends_on=["b"])
+    graph.register("b", lambda: None, depends_on=["a"])
+
+    with pytest.raises(ValueError, match="cycle"):
+        graph.waves()
+
+
+@pytest.mark.asyncio
+async def test_blocking_providers_built_concurrently():
+    graph, _, built = make_graph(delay=0.1)
+
+    start = time.perf_counter()
+    await graph.warm()
+    elapsed = time.perf_counter() - start
+
+    assert set(built) == {"settings_store", "vector_store", "redis_client", "case_service"}
+    # Sequential construction would take ~0.4s; the two blocking stores overlap
+    assert elapsed < 0.35
+    assert not graph.is_built("analytics")
+
+
+def test_resolve_builds_dependencies_once():
+    graph, components, built = make_graph()
+
+    graph.resolve("analytics")
+    graph.resolve("analytics")
+
+    assert built.count("case_service") == 1
+    assert built[-1] == "analytics"
+    assert components.analytics == "analytics"
+    assert graph.provider_for("analytics") == "analytics"
+
+
+@pytest.mark.asyncio
+async def test_warmup_runs_after_build():
+    components = Components()
+    graph = ProviderGraph()
+
+    async def validate():
+        await asyncio.sleep(0)
+        components.redis_client = None
+
+    graph.register(
+        "redis_client", lambda: setattr(components, "redis_client", "client"),
+        warmup=validate,
+    )
+    graph.register("auth", lambda: setattr(components, "auth", components.redis_client),
+                   depends_on=["redis_client"])
+
+    await graph.warm()
+
+    assert components.auth is None
+
+
+@pytest.mark.asyncio
+async def test_failure_recorded_and_raised():
+    graph = ProviderGraph()
+
+    def broken():
+        raise RuntimeError("cannot connect")
+
+    graph.register("ok", lambda: None)
+    graph.register("broken", broken, blocking=True)
+
+    with pytest.raises(RuntimeError, match="cannot connect"):
+        await graph.warm()
+
+    profile = {entry["component"]: entry for entry in graph.profile()}
+    assert profile["broken"]["status"] == "failed"
+    assert profile["broken"]["error"] == "cannot connect"
+    assert profile["ok"]["status"] == "ok"
+
+
+def test_failed_provider_is_retried_after_backoff():
+    graph = ProviderGraph(retry_backoff=0.05)
+    attempts = []
+
+    def flaky():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise ConnectionError("redis not ready")
+
+    graph.register("redis_client", flaky, eager=False)
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            graph.resolve("redis_client")
+    assert len(attempts) == 1  # Second call within the backoff re-raised
+    assert not graph.is_built("redis_client")
+    assert isinstance(graph.error("redis_client"), ConnectionError)
+
+    time.sleep(0.06)
+    with pytest.raises(ConnectionError):
+        graph.resolve("redis_client")
+    time.sleep(0.11)  # Backoff doubled
+    graph.resolve("redis_client")
+
+    assert len(attempts) == 3
+    assert graph.is_built("redis_client")
+    assert graph.error("redis_client") is None
+
+
+@pytest.mark.asyncio
+async def test_profile_marks_lazy_providers():
+    graph, _, _ = make_graph()
+
+    await graph.warm()
+    graph.resolve("analytics")
+
+    profile = {entry["component"]: entry for entry in graph.profile()}
+    assert profile["case_service"]["wave"] == 1
+    assert profile["analytics"]["lazy"] is True
+    assert "analytics" in graph.format_profile()
+
+    graph.reset()
+    assert graph.profile() == []
+    assert not graph.is_built("case_service")
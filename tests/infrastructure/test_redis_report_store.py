@@ -45,6 +45,7 @@ class MockRedisClient:
         # Mock methods
         self.hset = AsyncMock(return_value=True)
         self.hget = AsyncMock(return_value=None)
+        self.hmget = AsyncMock(return_value=[None])
         self.hgetall = AsyncMock(return_value={})
         self.hdel = AsyncMock(return_value=1)
         self.delete = AsyncMock(return_value=1)
@@ -198,6 +199,38 @@ async def test_save_report_marks_previous_as_not_current(report_store, sample_re
     assert pipeline.hset.called
 
 
+@pytest.mark.asyncio
+async def test_save_reports_batches_writes(
+    report_store, sample_report, sample_runbook, mock_redis_client, mock_vector_store, mock_runbook_kb
+):
+    """Test that a batch save uses one content write and one pipeline"""
+    # Arrange
+    mock_redis_client.hmget.return_value = [b"old-incident", None]
+
+    # Act
+    result = await report_store.save_reports([sample_report, sample_runbook])
+
+    # Assert
+    assert result is True
+    mock_vector_store.add_documents.assert_awaited_once()
+    assert len(mock_vector_store.add_documents.call_args.args[0]) == 2
+    mock_redis_client.pipeline.assert_called_once()
+    mock_redis_client.pipeline_instance.execute.assert_awaited_once()
+    mock_redis_client.pipeline_instance.hset.assert_any_call(
+        "report:old-incident:metadata", "is_current", "false"
+    )
+    mock_runbook_kb.index_runbook.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_save_reports_wraps_errors(report_store, sample_report, mock_vector_store):
+    """Test that batch save failures surface as ServiceException"""
+    mock_vector_store.add_documents.side_effect = Exception("ChromaDB unavailable")
+
+    with pytest.raises(ServiceException, match="Report storage failed"):
+        await report_store.save_reports([sample_report])
+
+
 @pytest.mark.asyncio
 async def test_save_runbook_auto_indexes_in_kb(report_store, sample_runbook, mock_runbook_kb):
     """Test that saving runbook automatically indexes it in RunbookKB"""
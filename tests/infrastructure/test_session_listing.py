@@ -0,0 +1,239 @@
+"""Test module for indexed session listing (list_page)
+
+Tests verify against fakeredis (which runs the Lua scripts):
+- Sessions are indexed by user and type when written
+- A page filtered by type and sorted by last activity comes back with the
+  correct total in a single call
+- Heartbeats (touch) re-sort sessions; deletes and type changes unindex them
+- Expired sessions are dropped from the index and the total, a bounded
+  batch at a time, when an index is listed or gains a new session
+- Activity recorded by touch shows in get() and survives later writes of
+  the session document
+- Scripts are passed the index keys they write, also when another process
+  indexed the session
+- The in-memory store returns the same pages
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+
+import fakeredis.aioredis
+
+from faultmaven.infrastructure.persistence.inmemory_session_store import InMemorySessionStore
+from faultmaven.infrastructure.persistence.redis_session_store import RedisSessionStore
+from faultmaven.utils.serialization import to_json_compatible
+
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def session_data(index: int, user_id: str = "user-1", session_type: str = None) -> dict:
+    data = {
+        "session_id": f"s{index:03d}",
+        "user_id": user_id,
+        "created_at": to_json_compatible(BASE_TIME),
+        "last_activity": to_json_compatible(BASE_TIME + timedelta(minutes=index)),
+        "data_uploads": ["upload"] * index,
+        "case_history": [],
+        "metadata": {"session_type": session_type} if session_type else {},
+    }
+    return data
+
+
+@pytest.fixture
+def redis_client():
+    client = fakeredis.aioredis.FakeRedis()
+    with patch("faultmaven.infrastructure.persistence.redis_session_store.create_redis_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+async def redis_store(redis_client):
+    return RedisSessionStore()
+
+
+async def populate(store):
+    for i in range(6):
+        await store.set(f"s{i:03d}", session_data(i, session_type="review" if i % 2 else None))
+    await store.set("s100", session_data(100, user_id="user-2"))
+
+
+@pytest.mark.unit
+class TestRedisListPage:
+
+    @pytest.mark.asyncio
+    async def test_page_is_filtered_sorted_and_counted(self, redis_store, redis_client):
+        await populate(redis_store)
+
+        summaries, total = await redis_store.list_page(user_id="user-1", session_type="review", limit=2)
+
+        assert total == 3
+        assert [s["session_id"] for s in summaries] == ["s005", "s003"]
+        assert summaries[0]["session_type"] == "review"
+        assert summaries[0]["data_uploads_count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_default_type_and_all_users(self, redis_store):
+        await populate(redis_store)
+
+        troubleshooting, total = await redis_store.list_page(session_type="troubleshooting", limit=10)
+        everything, everything_total = await redis_store.list_page(limit=3, offset=1)
+
+        assert total == 4
+        assert [s["session_id"] for s in troubleshooting] == ["s100", "s004", "s002", "s000"]
+        assert everything_total == 7
+        assert [s["session_id"] for s in everything] == ["s005", "s004", "s003"]
+
+    @pytest.mark.asyncio
+    async def test_list_page_is_one_round_trip(self, redis_store, redis_client):
+        await populate(redis_store)
+
+        with patch.object(redis_client, "execute_command", wraps=redis_client.execute_command) as execute:
+            await redis_store.list_page(user_id="user-1", limit=50)
+
+        assert [call.args[0] for call in execute.call_args_list] == ["EVAL"]
+
+    @pytest.mark.asyncio
+    async def test_touch_moves_session_to_front(self, redis_store):
+        await populate(redis_store)
+
+        await redis_store.touch("s000", to_json_compatible(BASE_TIME + timedelta(days=1)), heartbeats=2)
+        summaries, _ = await redis_store.list_page(user_id="user-1", limit=1)
+
+        assert summaries[0]["session_id"] == "s000"
+        assert summaries[0]["heartbeats"] == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_and_type_change_unindex(self, redis_store):
+        await populate(redis_store)
+
+        await redis_store.delete("s005")
+        await redis_store.set("s003", session_data(3))
+
+        review, review_total = await redis_store.list_page(user_id="user-1", session_type="review")
+        _, user_total = await redis_store.list_page(user_id="user-1")
+        assert [s["session_id"] for s in review] == ["s001"]
+        assert review_total == 1
+        assert user_total == 5
+
+    @pytest.mark.asyncio
+    async def test_expired_sessions_leave_the_total(self, redis_store, redis_client):
+        await populate(redis_store)
+        await redis_client.delete("session:s004")  # Expired session document
+
+        summaries, total = await redis_store.list_page(user_id="user-1")
+
+        assert total == 5
+        assert "s004" not in [s["session_id"] for s in summaries]
+
+    @pytest.mark.asyncio
+    async def test_listing_prunes_a_bounded_batch(self, redis_store, redis_client):
+        await populate(redis_store)
+        redis_store.prune_batch_size = 2
+        for i in range(4):
+            await redis_client.delete(f"session:s{i:03d}")  # Expired by TTL, never deleted
+
+        _, first_total = await redis_store.list_page(user_id="user-1")
+        _, second_total = await redis_store.list_page(user_id="user-1")
+
+        assert first_total == 4
+        assert second_total == 2
+
+    @pytest.mark.asyncio
+    async def test_new_session_prunes_expired_members(self, redis_store, redis_client):
+        await populate(redis_store)
+        for i in range(4):
+            await redis_client.delete(f"session:s{i:03d}")
+
+        await redis_store.set("s200", session_data(200))
+
+        assert await redis_client.zcard("session_index:all") == 4
+        assert await redis_client.zcard("session_index:all:type:troubleshooting") == 3
+        assert await redis_client.zcard("session_index:user:user-1") == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_summary_is_rebuilt(self, redis_store, redis_client):
+        await populate(redis_store)
+        await redis_client.delete("session_summary:s005")  # Expired before its session
+
+        summaries, total = await redis_store.list_page(user_id="user-1", limit=1)
+
+        assert total == 6
+        assert summaries[0]["session_id"] == "s005"
+        assert summaries[0]["session_type"] == "review"
+        assert await redis_client.exists("session_summary:s005")
+
+
+@pytest.mark.unit
+class TestRecordedActivity:
+
+    @pytest.mark.asyncio
+    async def test_get_returns_touched_activity(self, redis_store):
+        await populate(redis_store)
+        touched = to_json_compatible(BASE_TIME + timedelta(days=1))
+
+        await redis_store.touch("s000", touched)
+
+        assert (await redis_store.get("s000"))["last_activity"] == touched
+        assert (await redis_store.get("s004"))["last_activity"] == session_data(4)["last_activity"]
+
+    @pytest.mark.asyncio
+    async def test_writing_stale_document_keeps_touched_activity(self, redis_store):
+        await populate(redis_store)
+        touched = to_json_compatible(BASE_TIME + timedelta(days=1))
+        await redis_store.touch("s000", touched)
+
+        await redis_store.set("s000", session_data(0))
+
+        summaries, _ = await redis_store.list_page(user_id="user-1", limit=1)
+        assert summaries[0]["session_id"] == "s000"
+        assert summaries[0]["last_activity"] == touched
+        assert (await redis_store.get("s000"))["last_activity"] == touched
+
+    @pytest.mark.asyncio
+    async def test_other_process_passes_index_keys(self, redis_store, redis_client):
+        await populate(redis_store)
+        other = RedisSessionStore()  # Has not seen the session's user or type
+
+        calls = []
+        evaluate = redis_client.eval
+
+        async def recording_eval(*args):
+            calls.append(args)
+            return await evaluate(*args)
+
+        with patch.object(redis_client, "eval", recording_eval):
+            await other.touch("s001", to_json_compatible(BASE_TIME + timedelta(days=1)))
+
+        first, second = calls
+        assert first[1] == 2
+        assert second[2:2 + second[1]] == (
+            "session:s001", "session_summary:s001",
+            "session_index:all", "session_index:all:type:review",
+            "session_index:user:user-1", "session_index:user:user-1:type:review",
+        )
+        review, _ = await redis_store.list_page(session_type="review", limit=1)
+        assert review[0]["session_id"] == "s001"
+
+        await other.delete("s001")
+        _, total = await redis_store.list_page(session_type="review")
+        assert total == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_inmemory_store_pages_match_redis(redis_store):
+    memory_store = InMemorySessionStore()
+    await populate(redis_store)
+    await populate(memory_store)
+
+    for kwargs in ({"user_id": "user-1", "session_type": "review", "limit": 2}, {"limit": 3, "offset": 2}):
+        redis_page, redis_total = await redis_store.list_page(**kwargs)
+        memory_page, memory_total = await memory_store.list_page(**kwargs)
+        assert redis_total == memory_total
+        assert [s["session_id"] for s in redis_page] == [s["session_id"] for s in memory_page]
@@ -0,0 +1,99 @@
+"""Test module for compiled trace targeting and sampling.
+
+Tests cover:
+- Targeting rules compiled once per settings instance
+- User/session/operation targeting against the request context
+- Head-based sampling and always-on tracing for errors
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from faultmaven.infrastructure.logging.coordinator import RequestContext, request_context
+from faultmaven.infrastructure.observability import tracing
+from faultmaven.infrastructure.observability.tracing import (
+    TraceConfig,
+    _should_trace_operation,
+    get_trace_config,
+    trace,
+)
+
+
+def make_settings(**overrides):
+    values = dict(
+        opik_track_disable=False,
+        opik_track_users="",
+        opik_track_sessions="",
+        opik_track_operations="",
+        opik_sample_rate=1.0,
+        opik_sample_errors=True,
+        opik_use_local=False,
+        opik_local_host="",
+        opik_local_url="",
+    )
+    values.update(overrides)
+    return SimpleNamespace(observability=SimpleNamespace(**values))
+
+
+@pytest.fixture(autouse=True)
+def clean_context():
+    token = request_context.set(None)
+    yield
+    request_context.reset(token)
+
+
+def test_config_compiled_once_per_settings_instance():
+    settings = make_settings(opik_track_operations=" a, b ,,")
+    config = get_trace_config(settings)
+
+    assert config.operations == frozenset({"a", "b"})
+    assert get_trace_config(settings) is config
+    assert get_trace_config(make_settings()) is not config
+
+
+def test_targeting_rules():
+    assert not _should_trace_operation("op", make_settings(opik_track_disable=True))
+    assert not _should_trace_operation("other", make_settings(opik_track_operations="op"))
+    assert _should_trace_operation("op", make_settings(opik_track_operations="op"))
+
+    by_user = make_settings(opik_track_users="alice, bob")
+    assert not _should_trace_operation("op", by_user)  # no request context
+    request_context.set(RequestContext(user_id="bob", session_id="s1"))
+    assert _should_trace_operation("op", by_user)
+    assert not _should_trace_operation("op", make_settings(opik_track_sessions="s2"))
+
+
+def test_sampling_is_decided_per_request():
+    config = TraceConfig(sample_rate=0.5)
+    request_context.set(RequestContext(correlation_id="request-1"))
+    decisions = {config.sampled() for _ in range(20)}
+    assert len(decisions) == 1
+
+    assert TraceConfig(sample_rate=1.0).sampled()
+    assert not TraceConfig(sample_rate=0.0).sampled()
+
+
+async def test_unsampled_errors_are_still_traced(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(tracing, "_record_metrics", lambda name, duration, status: recorded.append(status))
+    settings = make_settings(opik_sample_rate=0.0)
+
+    @trace("sampled_op", settings=settings)
+    async def operation(fail):
+        if fail:
+            raise ValueError("boom")
+        return "ok"
+
+    assert await operation(False) == "ok"
+    with pytest.raises(ValueError):
+        await operation(True)
+    assert recorded == ["success_no_trace", "error"]
+
+    @trace("sampled_op", settings=make_settings(opik_sample_rate=0.0, opik_sample_errors=False))
+    def sync_operation():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        sync_operation()
+    assert recorded[-1] == "error_no_trace"
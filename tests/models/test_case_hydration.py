@@ -0,0 +1,142 @@
+"""Test module for trusted Case hydration (hydrate_case, hydrate_case_columns)
+
+Tests verify:
+- Stored cases round-trip through JSON text and database columns
+- Trusted hydration does not re-check stored history ordering, while
+  Case.model_validate (API input) still rejects it
+- With validated_lengths only the appended tail of a history is checked
+- Repository rows are hydrated on the trusted path
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from faultmaven.infrastructure.persistence.case_repository import PostgreSQLCaseRepository
+from faultmaven.models.case import (
+    Case,
+    CaseStatus,
+    ConsultingData,
+    TurnOutcome,
+    TurnProgress,
+    encode_case_json,
+    hydrate_case,
+    hydrate_case_columns,
+)
+
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_case(turns: int = 3) -> Case:
+    return Case(
+        user_id="user-123",
+        organization_id="org-1",
+        title="Checkout errors",
+        description="Payment API returns 500 for all customers",
+        status=CaseStatus.INVESTIGATING,
+        consulting=ConsultingData(
+            proposed_problem_statement="Payment API returns 500",
+            problem_statement_confirmed=True,
+            decided_to_investigate=True,
+        ),
+        current_turn=turns,
+        turn_history=[
+            TurnProgress(turn_number=n, timestamp=T0 + timedelta(minutes=n), progress_made=True,
+                         outcome=TurnOutcome.MILESTONE_COMPLETED)
+            for n in range(1, turns + 1)
+        ],
+        created_at=T0,
+        updated_at=T0,
+        last_activity_at=T0,
+    )
+
+
+def stored_state(case: Case, turn_numbers) -> dict:
+    """Stored state with turn_history renumbered (bypassing validation)"""
+    state = case.model_dump()
+    for turn, number in zip(state["turn_history"], turn_numbers):
+        turn["turn_number"] = number
+    return state
+
+
+@pytest.mark.unit
+class TestTrustedHydration:
+
+    def test_json_text_round_trip(self):
+        case = make_case()
+
+        loaded = hydrate_case(encode_case_json(case.model_dump()))
+
+        assert loaded.model_dump() == case.model_dump()
+
+    def test_stored_history_is_not_rechecked(self):
+        state = stored_state(make_case(), [1, 3, 2])
+
+        with pytest.raises(ValidationError, match="sequential"):
+            Case.model_validate(state)
+        assert [t.turn_number for t in hydrate_case(state).turn_history] == [1, 3, 2]
+
+    def test_appended_tail_is_checked(self):
+        state = stored_state(make_case(turns=4), [1, 2, 3, 5])
+
+        with pytest.raises(ValidationError, match="sequential"):
+            hydrate_case(state, validated_lengths={"turn_history": 3})
+        assert len(hydrate_case(state, validated_lengths={"turn_history": 4}).turn_history) == 4
+
+    def test_nested_models_are_still_typed(self):
+        state = make_case().model_dump()
+        state["turn_history"][0]["turn_number"] = "not a number"
+
+        with pytest.raises(ValidationError):
+            hydrate_case(state)
+
+    def test_columns_accept_text_and_decoded_values(self):
+        case = make_case()
+        dump = case.model_dump()
+
+        loaded = hydrate_case_columns(
+            fields={
+                "case_id": case.case_id,
+                "user_id": case.user_id,
+                "organization_id": case.organization_id,
+                "title": case.title,
+                "description": case.description,
+                "status": case.status.value,
+                "current_turn": case.current_turn,
+                "created_at": case.created_at,
+                "updated_at": case.updated_at,
+                "last_activity_at": case.last_activity_at,
+                "closed_at": None,
+            },
+            json_columns={
+                "turn_history": encode_case_json(dump["turn_history"]),
+                "consulting": dump["consulting"],
+                "path_selection": None,
+            },
+        )
+
+        assert loaded.model_dump() == dump
+
+
+@pytest.mark.unit
+def test_repository_row_is_hydrated():
+    case = make_case()
+    dump = case.model_dump()
+    json_columns = (
+        "progress", "status_history", "turn_history", "uploaded_files", "evidence", "hypotheses",
+        "solutions", "consulting", "documentation", "path_selection", "problem_verification",
+        "working_conclusion", "root_cause_conclusion", "degraded_mode", "escalation_state", "messages",
+    )
+    row = SimpleNamespace(**{
+        **dump,
+        "status": case.status.value,
+        "investigation_strategy": case.investigation_strategy.value,
+        **{name: None if dump[name] is None else encode_case_json(dump[name]) for name in json_columns},
+    })
+
+    loaded = PostgreSQLCaseRepository(db_session=None)._row_to_case(row)
+
+    assert loaded.model_dump() == dump
@@ -0,0 +1,134 @@
+"""
+Cold-start probe for the startup benchmark.
+
+Runs in a fresh interpreter (see test_startup_benchmark.py): imports
+faultmaven.main, swaps external services for local stand-ins, runs the
+application lifespan and polls /health until it answers 200. Prints one
+JSON line prefixed with RESULT_PREFIX:
+
+    import_seconds         time to import faultmaven.main
+    lifespan_seconds       lifespan startup (DI container, model preload, ...)
+    first_health_seconds   probe start -> first successful /health
+    first_health_unix      wall-clock time of that response
+    rss_mb                 resident set size after startup
+    startup_profile        per-component DI container build times
+
+Stand-ins: fakeredis for every Redis client, in-memory session/case/vector
+stores, a stub LLM provider, no ChromaDB, no knowledge ingester and no
+embedding model download.
+
+Usage: python tests/performance/startup_probe.py
+"""
+
+import json
+import os
+import sys
+import time
+
+PROBE_START = time.perf_counter()
+
+RESULT_PREFIX = "STARTUP_BENCHMARK "
+HEALTH_TIMEOUT_SECONDS = 60
+
+STAND_IN_ENVIRONMENT = {
+    "SESSION_STORAGE_TYPE": "inmemory",
+    "VECTOR_STORAGE_TYPE": "inmemory",
+    "CASE_STORAGE_TYPE": "inmemory",
+    "USER_STORAGE_TYPE": "inmemory",
+    "SKIP_SERVICE_CHECKS": "false",
+    "OPIK_ENABLED": "false",
+    "OPIK_TRACK_DISABLE": "true",
+    "CHAT_PROVIDER": "fireworks",
+}
+
+
+def install_stand_ins():
+    """Replace network-backed components with local stand-ins"""
+    import fakeredis.aioredis
+
+    from faultmaven.infrastructure import model_cache as model_cache_module
+    from faultmaven.infrastructure import redis_client
+    from faultmaven.infrastructure.llm import router
+    from faultmaven.infrastructure.persistence import case_vector_store, user_kb_vector_store
+    from faultmaven.infrastructure.persistence.inmemory_vector_store import InMemoryVectorStore
+    from faultmaven.core.knowledge import ingestion
+    from faultmaven.models.interfaces import ILLMProvider
+
+    shared_redis = fakeredis.aioredis.FakeRedis(decode_responses=False)
+
+    class StubLLMProvider(ILLMProvider):
+        async def generate(self, prompt: str, **kwargs) -> str:
+            return "stub response"
+
+    redis_client.RedisClientFactory.create_client = staticmethod(lambda *args, **kwargs: shared_redis)
+    router.LLMRouter = StubLLMProvider
+    case_vector_store.CaseVectorStore = InMemoryVectorStore
+    user_kb_vector_store.UserKBVectorStore = InMemoryVectorStore
+    ingestion.KnowledgeIngester = lambda settings=None: None
+    model_cache_module.model_cache.get_bge_m3_embedding_service = lambda: None
+
+
+def resident_set_mb() -> float:
+    """Current RSS in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_probe() -> dict:
+    for name, value in STAND_IN_ENVIRONMENT.items():
+        os.environ.setdefault(name, value)
+
+    import_start = time.perf_counter()
+    from faultmaven.main import app
+    import_seconds = time.perf_counter() - import_start
+
+    install_stand_ins()
+
+    from fastapi.testclient import TestClient
+
+    lifespan_start = time.perf_counter()
+    with TestClient(app) as client:
+        lifespan_seconds = time.perf_counter() - lifespan_start
+
+        deadline = time.perf_counter() + HEALTH_TIMEOUT_SECONDS
+        status_code = None
+        while time.perf_counter() < deadline:
+            status_code = client.get("/health").status_code
+            if status_code == 200:
+                break
+            time.sleep(0.05)
+        first_health_seconds = time.perf_counter() - PROBE_START
+        first_health_unix = time.time()
+
+        if status_code != 200:
+            raise RuntimeError(f"/health did not return 200 (last status {status_code})")
+
+        from faultmaven.container import container
+        startup_profile = container.get_startup_profile()
+
+    return {
+        "import_seconds": round(import_seconds, 4),
+        "lifespan_seconds": round(lifespan_seconds, 4),
+        "first_health_seconds": round(first_health_seconds, 4),
+        "first_health_unix": first_health_unix,
+        "rss_mb": round(resident_set_mb(), 1),
+        "startup_profile": startup_profile,
+    }
+
+
+if __name__ == "__main__":
+    try:
+        result = run_probe()
+    except Exception as e:
+        result = {"error": f"{type(e).__name__}: {e}"}
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+    sys.exit(0 if "error" not in result else 1)
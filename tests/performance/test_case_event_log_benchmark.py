@@ -0,0 +1,117 @@
+"""
+Benchmark for per-turn case persistence.
+
+Runs 500 MilestoneEngine turns on one case and times how the turn is
+persisted, with a repository whose save() serializes the whole case (as
+writing the full aggregate to the database does):
+
+- full save: every turn calls save()
+- event log: EventSourcedCaseRepository appends the turn's events and saves
+  (and snapshots) the full case every 50 turns
+
+Checks that event-log persistence latency stays flat from turn 1 to turn 500
+while full-save latency grows with the case history.
+"""
+
+import json
+import os
+import statistics
+import time
+
+import pytest
+
+from faultmaven.core.investigation.milestone_engine import MilestoneEngine
+from faultmaven.infrastructure.persistence.case_event_store import (
+    EventSourcedCaseRepository,
+    InMemoryCaseEventStore,
+)
+from faultmaven.infrastructure.persistence.case_repository import InMemoryCaseRepository
+from faultmaven.models.case import Case, CaseStatus, ConsultingData
+from faultmaven.models.case_events import encode_case_json, snapshot_case
+
+
+TURNS = 500
+WINDOW = 50
+REPLY = "Reviewing the connection pool metrics and recent deploys. " * 20
+
+
+def performance_tests_enabled() -> bool:
+    """Performance tests are opt-in: set RUN_PERFORMANCE_TESTS=true"""
+    return os.getenv("RUN_PERFORMANCE_TESTS", "false").lower() == "true"
+
+
+class SerializingCaseRepository(InMemoryCaseRepository):
+    """save() writes the full case as JSON, like a database row rewrite"""
+
+    def __init__(self):
+        super().__init__()
+        self.rows = {}
+
+    async def save(self, case):
+        self.rows[case.case_id] = encode_case_json(snapshot_case(case))
+        return await super().save(case)
+
+
+class ReplyLLM:
+    async def generate(self, prompt, **kwargs):
+        return REPLY
+
+
+class TimedEngine(MilestoneEngine):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies = []
+
+    async def _persist_turn(self, case, tracker):
+        started = time.perf_counter()
+        await super()._persist_turn(case, tracker)
+        self.latencies.append(time.perf_counter() - started)
+
+
+def make_case() -> Case:
+    return Case(
+        user_id="user-123",
+        organization_id="org-1",
+        title="Checkout errors",
+        description="Payment API returns 500 for all customers",
+        status=CaseStatus.INVESTIGATING,
+        consulting=ConsultingData(
+            proposed_problem_statement="Payment API returns 500",
+            problem_statement_confirmed=True,
+            decided_to_investigate=True,
+        ),
+    )
+
+
+async def run_turns(repository) -> dict:
+    case = make_case()
+    await repository.save(case)
+    engine = TimedEngine(ReplyLLM(), repository, trace_enabled=False)
+    for turn in range(TURNS):
+        case = (await engine.process_turn(case, f"Turn {turn}: here is what I see in the dashboards"))["case_updated"]
+
+    first = statistics.median(engine.latencies[:WINDOW]) * 1000
+    last = statistics.median(engine.latencies[-WINDOW:]) * 1000
+    return {
+        "first_50_median_ms": round(first, 3),
+        "last_50_median_ms": round(last, 3),
+        "growth": round(last / first, 2),
+        "max_ms": round(max(engine.latencies) * 1000, 3),
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not performance_tests_enabled(), reason="set RUN_PERFORMANCE_TESTS=true to run")
+@pytest.mark.asyncio
+async def test_event_log_persistence_latency_is_constant():
+    full_save = await run_turns(SerializingCaseRepository())
+    event_log = await run_turns(
+        EventSourcedCaseRepository(SerializingCaseRepository(), InMemoryCaseEventStore(), snapshot_interval=50)
+    )
+
+    print(json.dumps({"full_save": full_save, "event_log": event_log}, indent=2))
+
+    assert event_log["growth"] < 2
+    assert full_save["growth"] > 5
+    assert event_log["last_50_median_ms"] < full_save["last_50_median_ms"] / 5
@@ -0,0 +1,168 @@
+"""
+Benchmark for loading stored cases into the Case model.
+
+Builds cases of 100 to 2000 turns (a turn record, an evidence item and a
+message per turn), stores them as database columns of JSON text and times
+turning a row back into a Case:
+
+- per-item: json.loads per column, a model constructor per item and a fully
+  validated Case (how PostgreSQLCaseRepository loaded rows before)
+- trusted: PostgreSQLCaseRepository._row_to_case, i.e. hydrate_case_columns
+
+Checks that trusted hydration is faster at every size and still returns an
+identical case.
+"""
+
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from faultmaven.infrastructure.persistence.case_repository import PostgreSQLCaseRepository
+from faultmaven.models.case import (
+    Case,
+    CaseStatus,
+    CaseStatusTransition,
+    ConsultingData,
+    DocumentationData,
+    Evidence,
+    EvidenceCategory,
+    EvidenceForm,
+    EvidenceSourceType,
+    InvestigationProgress,
+    TurnOutcome,
+    TurnProgress,
+    encode_case_json,
+)
+
+
+SIZES = (100, 500, 1000, 2000)
+REPEATS = 7
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+JSON_COLUMNS = (
+    "progress", "status_history", "turn_history", "uploaded_files", "evidence", "hypotheses",
+    "solutions", "consulting", "documentation", "path_selection", "problem_verification",
+    "working_conclusion", "root_cause_conclusion", "degraded_mode", "escalation_state", "messages",
+)
+
+
+def performance_tests_enabled() -> bool:
+    """Performance tests are opt-in: set RUN_PERFORMANCE_TESTS=true"""
+    return os.getenv("RUN_PERFORMANCE_TESTS", "false").lower() == "true"
+
+
+def make_row(turns: int) -> SimpleNamespace:
+    case = Case(
+        user_id="user-123",
+        organization_id="org-1",
+        title="Checkout errors",
+        description="Payment API returns 500 for all customers",
+        status=CaseStatus.INVESTIGATING,
+        consulting=ConsultingData(
+            proposed_problem_statement="Payment API returns 500",
+            problem_statement_confirmed=True,
+            decided_to_investigate=True,
+        ),
+        current_turn=turns,
+        turn_history=[
+            TurnProgress(
+                turn_number=n,
+                timestamp=T0 + timedelta(minutes=n),
+                progress_made=n % 2 == 0,
+                outcome=TurnOutcome.MILESTONE_COMPLETED,
+                user_message_summary=f"Turn {n}: latency graphs attached",
+            )
+            for n in range(1, turns + 1)
+        ],
+        evidence=[
+            Evidence(
+                category=EvidenceCategory.SYMPTOM_EVIDENCE,
+                primary_purpose="symptom_verified",
+                summary=f"Timeouts in payment logs {n}",
+                preprocessed_content="Extracted error lines " * 10,
+                content_size_bytes=1024,
+                preprocessing_method="crime_scene_extraction",
+                source_type=EvidenceSourceType.LOG_FILE,
+                form=EvidenceForm.DOCUMENT,
+                collected_by="user-123",
+                collected_at_turn=n,
+            )
+            for n in range(1, turns + 1)
+        ],
+        messages=[{"role": "assistant", "content": f"Reply {n}"} for n in range(turns)],
+        message_count=turns,
+        created_at=T0,
+        updated_at=T0,
+        last_activity_at=T0,
+    )
+    dump = case.model_dump()
+    return SimpleNamespace(**{
+        **dump,
+        "status": case.status.value,
+        "investigation_strategy": case.investigation_strategy.value,
+        **{name: None if dump[name] is None else encode_case_json(dump[name]) for name in JSON_COLUMNS},
+    })
+
+
+def per_item_row_to_case(row) -> Case:
+    """Row loading before trusted hydration (columns used by make_row)"""
+    return Case(
+        case_id=row.case_id,
+        user_id=row.user_id,
+        organization_id=row.organization_id,
+        title=row.title,
+        description=row.description,
+        status=CaseStatus(row.status),
+        status_history=[CaseStatusTransition(**t) for t in json.loads(row.status_history)],
+        progress=InvestigationProgress(**json.loads(row.progress)),
+        current_turn=row.current_turn,
+        turns_without_progress=row.turns_without_progress,
+        turn_history=[TurnProgress(**t) for t in json.loads(row.turn_history)],
+        investigation_strategy=row.investigation_strategy,
+        consulting=ConsultingData(**json.loads(row.consulting)),
+        evidence=[Evidence(**e) for e in json.loads(row.evidence)],
+        documentation=DocumentationData(**json.loads(row.documentation)),
+        messages=json.loads(row.messages),
+        message_count=row.message_count,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        last_activity_at=row.last_activity_at,
+    )
+
+
+def median_ms(load, row) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        load(row)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not performance_tests_enabled(), reason="set RUN_PERFORMANCE_TESTS=true to run")
+def test_trusted_hydration_load_time_by_case_size():
+    repository = PostgreSQLCaseRepository(db_session=None)
+    results = {}
+    for turns in SIZES:
+        row = make_row(turns)
+        assert repository._row_to_case(row).model_dump() == per_item_row_to_case(row).model_dump()
+
+        per_item = median_ms(per_item_row_to_case, row)
+        trusted = median_ms(repository._row_to_case, row)
+        results[turns] = {
+            "row_kb": round(sum(len(getattr(row, name) or "") for name in JSON_COLUMNS) / 1024),
+            "per_item_ms": round(per_item, 2),
+            "trusted_ms": round(trusted, 2),
+            "speedup": round(per_item / trusted, 2),
+        }
+
+    print(json.dumps(results, indent=2))
+
+    for result in results.values():
+        assert result["trusted_ms"] < result["per_item_ms"]
+    assert results[SIZES[-1]]["speedup"] > 1.2
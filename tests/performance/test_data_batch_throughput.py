@@ -0,0 +1,128 @@
+"""
+Benchmark for concurrent DataService batch ingestion.
+
+Runs DataService.batch_process over a synthetic batch of mixed data types
+(logs, stack traces, metrics CSV, JSON/YAML config) with a processor that
+simulates I/O-bound insight extraction, and checks that throughput scales
+with the configured batch concurrency.
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from faultmaven.models import DataType
+from faultmaven.services.domain.data_service import DataService
+
+
+PROCESSING_LATENCY_SECONDS = 0.02
+BATCH_SIZE = 48
+
+
+def performance_tests_enabled() -> bool:
+    """Performance tests are opt-in: set RUN_PERFORMANCE_TESTS=true"""
+    return os.getenv("RUN_PERFORMANCE_TESTS", "false").lower() == "true"
+
+
+def synthetic_batch(size: int, seed: int = 7):
+    """Build (content, filename, data_type) items cycling through data types"""
+    rng = random.Random(seed)
+    generators = [
+        (
+            "app-{i}.log",
+            DataType.LOGS_AND_ERRORS,
+            lambda i: "\n".join(
+                f"2025-01-01T00:00:{s:02d}Z ERROR db pool exhausted req={rng.randint(1, 10**6)}"
+                for s in range(40)
+            ),
+        ),
+        (
+            "trace-{i}.txt",
+            DataType.LOGS_AND_ERRORS,
+            lambda i: "Traceback (most recent call last):\n" + "\n".join(
+                f'  File "service_{i}.py", line {n}, in handler' for n in range(30)
+            ) + "\nTimeoutError: upstream timed out",
+        ),
+        (
+            "metrics-{i}.csv",
+            DataType.METRICS_AND_PERFORMANCE,
+            lambda i: "timestamp,cpu,latency_ms\n" + "\n".join(
+                f"{t},{rng.random():.3f},{rng.randint(5, 900)}" for t in range(60)
+            ),
+        ),
+        (
+            "config-{i}.json",
+            DataType.STRUCTURED_CONFIG,
+            lambda i: json.dumps({"service": f"svc-{i}", "replicas": rng.randint(1, 9),
+                                  "pool": {"max": 20, "timeout_s": 30}}),
+        ),
+    ]
+    items = []
+    for i in range(size):
+        filename, data_type, make_content = generators[i % len(generators)]
+        items.append((make_content(i), filename.format(i=i), data_type))
+    return items
+
+
+def build_service(concurrency: int, type_by_name):
+    """DataService with fast in-process dependencies and a latency-bound processor"""
+
+    class IOBoundProcessor:
+        async def process(self, content, data_type):
+            await asyncio.sleep(PROCESSING_LATENCY_SECONDS)
+            return SimpleNamespace(insights={"error_count": content.count("ERROR")})
+
+    classifier = Mock()
+    classifier.classify.side_effect = lambda content, filename: SimpleNamespace(
+        data_type=type_by_name[filename]
+    )
+    sanitizer = Mock()
+    sanitizer.sanitize.side_effect = lambda text: text
+    tracer = Mock()
+    tracer.trace.return_value.__enter__ = Mock(return_value=None)
+    tracer.trace.return_value.__exit__ = Mock(return_value=False)
+
+    return DataService(
+        data_classifier=classifier,
+        log_processor=IOBoundProcessor(),
+        sanitizer=sanitizer,
+        tracer=tracer,
+        settings=SimpleNamespace(upload=SimpleNamespace(batch_max_concurrency=concurrency)),
+    )
+
+
+async def measure_throughput(concurrency: int) -> float:
+    """Items per second for one batch at the given concurrency"""
+    batch = synthetic_batch(BATCH_SIZE)
+    service = build_service(concurrency, {name: data_type for _, name, data_type in batch})
+    items = [(content, name) for content, name, _ in batch]
+
+    start = time.perf_counter()
+    results = await service.batch_process(items, "perf-session")
+    elapsed = time.perf_counter() - start
+
+    assert len(results) == BATCH_SIZE
+    return BATCH_SIZE / elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_batch_throughput_scales_with_concurrency():
+    """Throughput should grow roughly linearly until the batch is saturated"""
+    if not performance_tests_enabled():
+        pytest.skip("Performance tests disabled - set RUN_PERFORMANCE_TESTS=true to enable")
+
+    throughput = {c: await measure_throughput(c) for c in (1, 4, 8)}
+    print(
+        "\nBatch ingestion throughput (items/s): "
+        + ", ".join(f"concurrency={c}: {t:.1f}" for c, t in throughput.items())
+    )
+
+    assert throughput[4] > throughput[1] * 2.5
+    assert throughput[8] > throughput[4] * 1.5
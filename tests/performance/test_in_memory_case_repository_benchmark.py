@@ -0,0 +1,113 @@
+"""
+Benchmark for the indexed InMemoryCaseRepository.
+
+Fills repositories with 1,000, 10,000 and 100,000 cases while keeping the
+result sizes fixed (20 cases per user, 50 cases per service name in titles)
+and times:
+
+- list_summaries for one user, and the first page of all cases
+- list for one user
+- search_summaries for a service name, across all users and for one user
+- a full scan (filter + sort + paginate every stored case, as the
+  repository listed before its indexes) for reference
+
+Checks that the indexed operations stay roughly flat from 1k to 100k cases
+(sublinear) while the full scan grows with the number of cases.
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from faultmaven.infrastructure.persistence.case_repository import (
+    InMemoryCaseRepository,
+    paginate_case_summaries,
+)
+from faultmaven.models.case import Case
+
+
+SIZES = (1_000, 10_000, 100_000)
+CASES_PER_USER = 20
+CASES_PER_SERVICE = 50
+REPEATS = 50
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def performance_tests_enabled() -> bool:
+    """Performance tests are opt-in: set RUN_PERFORMANCE_TESTS=true"""
+    return os.getenv("RUN_PERFORMANCE_TESTS", "false").lower() == "true"
+
+
+def build_repository(size: int) -> InMemoryCaseRepository:
+    repo = InMemoryCaseRepository()
+    services = size // CASES_PER_SERVICE
+    for i in range(size):
+        case = Case(
+            case_id=f"case_{i:012x}",
+            user_id=f"user_{i % (size // CASES_PER_USER)}",
+            organization_id=f"org_{i % 10}",
+            title=f"svc{i % services} latency incident",
+            description="Requests time out under load",
+            current_turn=i % 4,
+            created_at=BASE_TIME,
+            updated_at=BASE_TIME + timedelta(seconds=i),
+            last_activity_at=BASE_TIME + timedelta(seconds=i),
+        )
+        # Stored directly: save() would give every case the same updated_at
+        repo._cases[case.case_id] = case
+        repo._index(case)
+    return repo
+
+
+def median_ms(operation) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def measure(repo: InMemoryCaseRepository) -> dict:
+    run = asyncio.new_event_loop().run_until_complete
+    user, service = "user_7", "svc7"
+
+    def full_scan():
+        cases = [c for c in repo._cases.values() if c.user_id == user]
+        return paginate_case_summaries(cases, limit=20)
+
+    return {
+        "list_summaries_user": median_ms(lambda: run(repo.list_summaries(user_id=user, include_empty=False))),
+        "list_summaries_first_page": median_ms(lambda: run(repo.list_summaries(limit=50))),
+        "list_user": median_ms(lambda: run(repo.list(user_id=user))),
+        "search": median_ms(lambda: run(repo.search_summaries(f"{service} latency"))),
+        "search_user": median_ms(lambda: run(repo.search_summaries("latency", user_id=user))),
+        "full_scan_reference": median_ms(full_scan),
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not performance_tests_enabled(), reason="set RUN_PERFORMANCE_TESTS=true to run")
+def test_list_and_search_stay_sublinear():
+    results = {}
+    for size in SIZES:
+        repo = build_repository(size)
+        assert (asyncio.new_event_loop().run_until_complete(repo.search_summaries("svc7"))).total_count == CASES_PER_SERVICE
+        results[size] = {name: round(ms, 4) for name, ms in measure(repo).items()}
+
+    growth = {
+        name: round(results[SIZES[-1]][name] / results[SIZES[0]][name], 1)
+        for name in results[SIZES[0]]
+    }
+    print(json.dumps({"median_ms": results, "growth_1k_to_100k": growth}, indent=2))
+
+    # 100x the cases: indexed operations stay within a small factor, the scan grows ~linearly
+    for name, factor in growth.items():
+        if name != "full_scan_reference":
+            assert factor < 5, f"{name} grew {factor}x"
+    assert growth["full_scan_reference"] > 30
@@ -0,0 +1,99 @@
+"""
+Benchmark for indexed session listing.
+
+Stores 10k sessions for one user in fakeredis (the local Redis stand-in) and
+lists a page filtered by session type two ways:
+
+- per-session: load every session document to filter by type, then load the
+  page again to render it (what GET /sessions used to do, 2N+1 round trips)
+- indexed: RedisSessionStore.list_page(), one scripted call
+
+and checks the indexed page matches and takes a single round trip.
+"""
+
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+
+import fakeredis.aioredis
+
+from faultmaven.infrastructure.persistence.redis_session_store import RedisSessionStore
+from faultmaven.infrastructure.persistence.session_index import paginate_session_summaries, summarize_session
+
+
+SESSIONS_PER_USER = 10_000
+PAGE_SIZE = 50
+
+
+def performance_tests_enabled() -> bool:
+    """Performance tests are opt-in: set RUN_PERFORMANCE_TESTS=true"""
+    return os.getenv("RUN_PERFORMANCE_TESTS", "false").lower() == "true"
+
+
+def session_data(index: int) -> dict:
+    return {
+        "session_id": f"session-{index:05d}",
+        "user_id": "user-1",
+        "created_at": "2025-01-01T00:00:00Z",
+        "last_activity": f"2025-01-{1 + index // 1440 % 28:02d}T{index // 60 % 24:02d}:{index % 60:02d}:00Z",
+        "data_uploads": [],
+        "case_history": [],
+        "metadata": {"session_type": "review" if index % 4 == 0 else "troubleshooting"},
+    }
+
+
+async def list_per_session(store: RedisSessionStore, session_ids, session_type: str):
+    """The old listing: one GET per session to filter, one per page entry to render"""
+    matching = []
+    for session_id in session_ids:
+        data = await store.get(session_id)
+        if data and summarize_session(data)["session_type"] == session_type:
+            matching.append(summarize_session(data))
+    page, total = paginate_session_summaries(matching, limit=PAGE_SIZE)
+    for summary in page:
+        await store.get(summary["session_id"])
+    return page, total
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not performance_tests_enabled(), reason="set RUN_PERFORMANCE_TESTS=true to run")
+@pytest.mark.asyncio
+async def test_indexed_listing_vs_per_session_gets():
+    client = fakeredis.aioredis.FakeRedis()
+    with patch("faultmaven.infrastructure.persistence.redis_session_store.create_redis_client", return_value=client):
+        store = RedisSessionStore()
+        store.default_ttl = 10 ** 9  # Keep the fixed 2025 timestamps out of the stale check
+
+        for index in range(SESSIONS_PER_USER):
+            await store.set(f"session-{index:05d}", session_data(index))
+        session_ids = [f"session-{index:05d}" for index in range(SESSIONS_PER_USER)]
+
+        with patch.object(client, "execute_command", wraps=client.execute_command) as execute:
+            started = time.perf_counter()
+            old_page, old_total = await list_per_session(store, session_ids, "review")
+            per_session_seconds = time.perf_counter() - started
+            per_session_round_trips = execute.call_count
+
+            execute.reset_mock()
+            started = time.perf_counter()
+            page, total = await store.list_page(user_id="user-1", session_type="review", limit=PAGE_SIZE)
+            indexed_seconds = time.perf_counter() - started
+            indexed_round_trips = execute.call_count
+
+    print(json.dumps({
+        "sessions": SESSIONS_PER_USER,
+        "per_session": {"round_trips": per_session_round_trips, "seconds": round(per_session_seconds, 4)},
+        "indexed": {"round_trips": indexed_round_trips, "seconds": round(indexed_seconds, 4)},
+    }, indent=2))
+
+    assert total == old_total == SESSIONS_PER_USER // 4
+    assert [s["session_id"] for s in page] == [s["session_id"] for s in old_page]
+    # get() reads the session document and the activity recorded by touch()
+    assert per_session_round_trips == 2 * (SESSIONS_PER_USER + PAGE_SIZE)
+    assert indexed_round_trips == 1
+    assert indexed_seconds < per_session_seconds
@@ -0,0 +1,195 @@
+"""
+Import-time and cold-start benchmark.
+
+Measures, each in a fresh interpreter:
+- `python -X importtime -c "import faultmaven.main"`: total import time of
+  faultmaven.main and the modules with the largest self time
+- Cold start: process launch to the first successful /health with the
+  FastAPI app and DI container running against local stand-ins
+  (see startup_probe.py)
+- RSS after startup
+
+Results are written as JSON to STARTUP_BENCHMARK_OUTPUT (when set) so runs
+can be compared across commits, and the run fails when a threshold is
+exceeded:
+
+    STARTUP_MAX_IMPORT_SECONDS        (default 3.0)
+    STARTUP_MAX_FIRST_HEALTH_SECONDS  (default 15.0)
+    STARTUP_MAX_RSS_MB                (default 1024)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PROBE = Path(__file__).with_name("startup_probe.py")
+RESULT_PREFIX = "STARTUP_BENCHMARK "
+SLOWEST_IMPORTS = 15
+SUBPROCESS_TIMEOUT_SECONDS = 300
+
+THRESHOLDS = {
+    "import_seconds": ("STARTUP_MAX_IMPORT_SECONDS", 3.0),
+    "cold_start_seconds": ("STARTUP_MAX_FIRST_HEALTH_SECONDS", 15.0),
+    "rss_mb": ("STARTUP_MAX_RSS_MB", 1024.0),
+}
+
+
+def performance_tests_enabled() -> bool:
+    """Performance tests are opt-in: set RUN_PERFORMANCE_TESTS=true"""
+    return os.getenv("RUN_PERFORMANCE_TESTS", "false").lower() == "true"
+
+
+def subprocess_env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    env.setdefault("PYTHONDONTWRITEBYTECODE", "1")
+    return env
+
+
+def parse_importtime(stderr: str, module: str = "faultmaven.main") -> dict:
+    """Extract the module's cumulative import time and the slowest modules
+
+    -X importtime lines look like
+        import time:  self [us] | cumulative | imported package
+        import time:       412 |       9120 |   faultmaven.models
+        import time:      1000 |      90000 | faultmaven.main
+    with nesting shown by indentation of the package name.
+    """
+    total_us = None
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        package = parts[2].strip()
+        if package == module:
+            total_us = int(parts[1])
+        modules.append((package, int(parts[0])))
+
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return {
+        "import_seconds": round(total_us / 1e6, 4) if total_us is not None else None,
+        "slowest_imports": [
+            {"module": package, "self_ms": round(us / 1000, 1)}
+            for package, us in modules[:SLOWEST_IMPORTS]
+        ],
+    }
+
+
+def measure_import_time() -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import faultmaven.main"],
+        cwd=PROJECT_ROOT, env=subprocess_env(), capture_output=True, text=True,
+        timeout=SUBPROCESS_TIMEOUT_SECONDS,
+    )
+    result = parse_importtime(completed.stderr)
+    if completed.returncode != 0:
+        result["error"] = completed.stderr.strip().splitlines()[-1]
+    return result
+
+
+def measure_cold_start() -> dict:
+    launched = time.time()
+    completed = subprocess.run(
+        [sys.executable, str(PROBE)],
+        cwd=PROJECT_ROOT, env=subprocess_env(), capture_output=True, text=True,
+        timeout=SUBPROCESS_TIMEOUT_SECONDS,
+    )
+    lines = [line for line in completed.stdout.splitlines() if line.startswith(RESULT_PREFIX)]
+    if not lines:
+        tail = (completed.stderr or completed.stdout).strip().splitlines()[-1:]
+        return {"error": f"startup probe produced no result (exit {completed.returncode}): {tail}"}
+
+    probe = json.loads(lines[-1][len(RESULT_PREFIX):])
+    if "first_health_unix" in probe:
+        probe["cold_start_seconds"] = round(probe.pop("first_health_unix") - launched, 4)
+    return probe
+
+
+def run_benchmark() -> dict:
+    imports = measure_import_time()
+    cold_start = measure_cold_start()
+    return {
+        "python": sys.version.split()[0],
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "commit": git_commit(),
+        "import_seconds": imports.get("import_seconds"),
+        "slowest_imports": imports.get("slowest_imports", []),
+        "cold_start_seconds": cold_start.get("cold_start_seconds"),
+        "lifespan_seconds": cold_start.get("lifespan_seconds"),
+        "rss_mb": cold_start.get("rss_mb"),
+        "startup_profile": cold_start.get("startup_profile", []),
+        "errors": {
+            stage: result["error"]
+            for stage, result in (("import", imports), ("cold_start", cold_start))
+            if "error" in result
+        },
+        "thresholds": {
+            metric: float(os.getenv(env_var, default))
+            for metric, (env_var, default) in THRESHOLDS.items()
+        },
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def threshold_violations(results: dict) -> list:
+    violations = []
+    for metric, limit in results["thresholds"].items():
+        value = results.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{metric}={value} exceeds {limit}")
+    return violations
+
+
+@pytest.mark.performance
+def test_startup_within_thresholds():
+    """Import time, time to first /health and RSS stay within budget"""
+    if not performance_tests_enabled():
+        pytest.skip("Performance tests disabled - set RUN_PERFORMANCE_TESTS=true to enable")
+
+    results = run_benchmark()
+    report = json.dumps(results, indent=2)
+    print(f"\nStartup benchmark:\n{report}")
+
+    output = os.getenv("STARTUP_BENCHMARK_OUTPUT")
+    if output:
+        Path(output).write_text(report + "\n")
+
+    assert not results["errors"], f"Startup benchmark failed: {results['errors']}"
+    violations = threshold_violations(results)
+    assert not violations, "Startup regression: " + "; ".join(violations)
+
+
+def test_parse_importtime():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 | _io",
+        "import time:       300 |       2500 |   faultmaven.models",
+        "import time:      1000 |      90000 | faultmaven.main",
+        "import time:       700 |      40000 | fastapi",
+    ])
+
+    parsed = parse_importtime(stderr)
+
+    assert parsed["import_seconds"] == 0.09
+    assert [entry["module"] for entry in parsed["slowest_imports"]] == [
+        "faultmaven.main", "fastapi", "faultmaven.models", "_io",
+    ]
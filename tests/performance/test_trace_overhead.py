@@ -0,0 +1,91 @@
+"""
+Microbenchmark of the @trace decorator's per-call overhead.
+
+Compares a traced no-op function with the bare function for the main
+configurations (tracing disabled, not targeted, sampled out, fully traced)
+and fails when the added cost per call exceeds TRACE_MAX_OVERHEAD_US
+(default 10 microseconds).
+"""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from faultmaven.infrastructure.observability.tracing import trace
+
+
+ITERATIONS = 50000
+CONFIGURATIONS = {
+    "disabled": {"opik_track_disable": True},
+    "not_targeted": {"opik_track_operations": "some_other_operation"},
+    "sampled_out": {"opik_sample_rate": 0.0},
+    "traced": {},
+}
+
+
+def performance_tests_enabled() -> bool:
+    """Performance tests are opt-in: set RUN_PERFORMANCE_TESTS=true"""
+    return os.getenv("RUN_PERFORMANCE_TESTS", "false").lower() == "true"
+
+
+def make_settings(**overrides):
+    values = dict(
+        opik_track_disable=False,
+        opik_track_users="",
+        opik_track_sessions="",
+        opik_track_operations="",
+        opik_sample_rate=1.0,
+        opik_sample_errors=True,
+        opik_use_local=False,
+        opik_local_host="",
+        opik_local_url="",
+    )
+    values.update(overrides)
+    return SimpleNamespace(observability=SimpleNamespace(**values))
+
+
+def per_call_seconds(func, iterations=ITERATIONS):
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+
+def per_call_seconds_async(func, iterations=ITERATIONS):
+    async def run():
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await func()
+        return (time.perf_counter() - start) / iterations
+
+    return min(asyncio.run(run()) for _ in range(3))
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not performance_tests_enabled(), reason="Performance tests disabled")
+@pytest.mark.parametrize("configuration", list(CONFIGURATIONS))
+def test_trace_decorator_overhead(configuration):
+    max_overhead_us = float(os.getenv("TRACE_MAX_OVERHEAD_US", "10"))
+    settings = make_settings(**CONFIGURATIONS[configuration])
+
+    def bare():
+        return None
+
+    async def bare_async():
+        return None
+
+    traced = trace("benchmark_operation", settings=settings)(bare)
+    traced_async = trace("benchmark_operation", settings=settings)(bare_async)
+
+    sync_overhead_us = (per_call_seconds(traced) - per_call_seconds(bare)) * 1e6
+    async_overhead_us = (per_call_seconds_async(traced_async) - per_call_seconds_async(bare_async)) * 1e6
+    print(f"\n@trace overhead ({configuration}): sync {sync_overhead_us:.2f}us, async {async_overhead_us:.2f}us per call")
+
+    assert sync_overhead_us < max_overhead_us
+    assert async_overhead_us < max_overhead_us
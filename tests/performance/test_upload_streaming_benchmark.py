@@ -0,0 +1,140 @@
+"""
+Benchmark for streaming upload ingestion.
+
+Streams a synthetic log (1 GB by default, UPLOAD_BENCHMARK_MB to change) through
+the case upload path - spool_upload, DataService.ingest_spooled, then the
+sanitized chunks the vectorization task reads - and measures peak Python heap
+with tracemalloc. The same path is run for a 16 MB upload, and the old
+read-everything path (file.read() + decode + ingest_data) for 16 MB only, as it
+would need several GB for the large upload.
+
+Checks that peak memory of the streaming path does not grow with upload size.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from faultmaven.models import DataType
+from faultmaven.services.domain.data_service import DataService
+from faultmaven.utils.upload_spool import spool_upload
+
+
+SMALL_UPLOAD_MB = 16
+LARGE_UPLOAD_MB = int(os.getenv("UPLOAD_BENCHMARK_MB", "1024"))
+LINE = "2025-01-01T00:00:00.000Z ERROR [pool-{n}] connection refused host=db-{n}.internal retry=3\n"
+
+
+def performance_tests_enabled() -> bool:
+    """Performance tests are opt-in: set RUN_PERFORMANCE_TESTS=true"""
+    return os.getenv("RUN_PERFORMANCE_TESTS", "false").lower() == "true"
+
+
+def synthetic_log_reader(size_mb: int):
+    """Async read(size) over a generated log, without holding it in memory"""
+    remaining = size_mb * 1024 * 1024
+    counter = 0
+
+    async def read(size: int) -> bytes:
+        nonlocal remaining, counter
+        if remaining <= 0:
+            return b""
+        lines = []
+        produced = 0
+        while produced < min(size, remaining):
+            line = LINE.format(n=counter % 97)
+            lines.append(line)
+            produced += len(line)
+            counter += 1
+        chunk = "".join(lines).encode()[:min(size, remaining)]
+        remaining -= len(chunk)
+        return chunk
+    return read
+
+
+class CountingProcessor:
+    async def process(self, content, data_type):
+        return SimpleNamespace(insights={"error_count": content.count("ERROR")})
+
+
+class LogClassifier:
+    def classify(self, content, filename):
+        return SimpleNamespace(data_type=DataType.LOGS_AND_ERRORS)
+
+
+class HostSanitizer:
+    """Length-preserving stand-in (not a Mock: mocks keep every argument)"""
+
+    def sanitize(self, text):
+        return text.replace(".internal", ".[masked]")
+
+
+def build_service() -> DataService:
+    tracer = Mock()
+    tracer.trace.return_value.__enter__ = Mock(return_value=None)
+    tracer.trace.return_value.__exit__ = Mock(return_value=False)
+    return DataService(
+        data_classifier=LogClassifier(),
+        log_processor=CountingProcessor(),
+        sanitizer=HostSanitizer(),
+        tracer=tracer,
+    )
+
+
+async def streaming_ingest(size_mb: int, spool_dir: str) -> dict:
+    service = build_service()
+    tracemalloc.start()
+    started = time.perf_counter()
+    upload = await spool_upload(synthetic_log_reader(size_mb), max_bytes=(size_mb + 1) * 1024 * 1024, directory=spool_dir)
+    try:
+        result = await service.ingest_spooled(upload, "perf-session", file_name="bundle.log")
+        vectorized = 0
+        async for text in service.iter_sanitized_text(upload):
+            vectorized += len(text)
+    finally:
+        upload.cleanup()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert result["file_size"] == size_mb * 1024 * 1024
+    assert vectorized == size_mb * 1024 * 1024
+    return {"upload_mb": size_mb, "peak_mb": round(peak / 2**20, 1), "seconds": round(elapsed, 2)}
+
+
+async def in_memory_ingest(size_mb: int) -> dict:
+    """The old path: read the whole upload, decode it, ingest the string"""
+    service = build_service()
+    read = synthetic_log_reader(size_mb)
+    tracemalloc.start()
+    started = time.perf_counter()
+    chunks = []
+    while chunk := await read(1024 * 1024):
+        chunks.append(chunk)
+    content = b"".join(chunks)
+    del chunks
+    result = await service.ingest_data(content.decode("utf-8", errors="ignore"), "perf-session", file_name="bundle.log")
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert result["file_size"] == size_mb * 1024 * 1024
+    return {"upload_mb": size_mb, "peak_mb": round(peak / 2**20, 1), "seconds": round(elapsed, 2)}
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(not performance_tests_enabled(), reason="set RUN_PERFORMANCE_TESTS=true to run")
+@pytest.mark.asyncio
+async def test_streaming_ingest_memory_is_independent_of_upload_size(tmp_path):
+    small = await streaming_ingest(SMALL_UPLOAD_MB, str(tmp_path))
+    large = await streaming_ingest(LARGE_UPLOAD_MB, str(tmp_path))
+    old_small = await in_memory_ingest(SMALL_UPLOAD_MB)
+
+    print(json.dumps({"streaming": [small, large], "in_memory": [old_small]}, indent=2))
+
+    assert large["peak_mb"] < 16
+    assert large["peak_mb"] < small["peak_mb"] * 1.5 + 1
+    assert old_small["peak_mb"] > SMALL_UPLOAD_MB * 2
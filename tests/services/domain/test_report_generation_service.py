@@ -0,0 +1,195 @@
+"""
+Unit tests for ReportGenerationService.
+
+Tests concurrent multi-report generation, shared case context and batched
+persistence, plus the lock manager's blocking wait for lock release
+(every waiter woken, each BLPOP capped below the socket timeout).
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import fakeredis.aioredis
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from faultmaven.services.domain.report_generation_service import ReportGenerationService
+from faultmaven.infrastructure.concurrency import ReportLockManager
+from faultmaven.models.report import ReportType
+from faultmaven.models.case import CaseStatus
+
+
+ALL_TYPES = [ReportType.INCIDENT_REPORT, ReportType.RUNBOOK, ReportType.POST_MORTEM]
+
+
+@pytest.fixture
+def sample_case():
+    """Create a resolved case with the attributes report generation reads."""
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        case_id="case_abc123def456",
+        title="Database Connection Pool Exhaustion",
+        description="PostgreSQL connections timing out",
+        status=CaseStatus.RESOLVED,
+        created_at=now,
+        updated_at=now,
+        message_count=12,
+        tags=["postgresql"],
+        domain="database",
+        resolution_time_hours=2.5,
+        report_generation_count=0,
+        max_report_regenerations=5,
+    )
+
+
+@pytest.fixture
+def report_store():
+    """Create mock report store."""
+    store = Mock()
+    store.save_reports = AsyncMock(return_value=True)
+    store.save_report = AsyncMock(return_value=True)
+    return store
+
+
+def slow_llm(service, delay=0.05):
+    """Patch _call_llm with a fixed-latency fake that tracks concurrency."""
+    state = {"active": 0, "peak": 0}
+
+    async def call_llm(prompt, max_tokens=2000):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(delay)
+        state["active"] -= 1
+        return service._generate_template_fallback(prompt)
+
+    service._call_llm = call_llm
+    return state
+
+
+@pytest.mark.asyncio
+async def test_report_types_generated_concurrently(sample_case, report_store):
+    service = ReportGenerationService(llm_router=None, report_store=report_store)
+    state = slow_llm(service)
+    service._extract_case_context = Mock(wraps=service._extract_case_context)
+
+    response = await service._generate_reports_locked(sample_case, ALL_TYPES)
+
+    assert [r.report_type for r in response.reports] == ALL_TYPES
+    assert state["peak"] == 3
+    service._extract_case_context.assert_called_once_with(sample_case)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_is_respected(sample_case, report_store):
+    service = ReportGenerationService(
+        llm_router=None, report_store=report_store, max_concurrency=1
+    )
+    state = slow_llm(service, delay=0.01)
+
+    await service._generate_reports_locked(sample_case, ALL_TYPES)
+
+    assert state["peak"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reports_persisted_in_one_batch(sample_case, report_store):
+    service = ReportGenerationService(llm_router=None, report_store=report_store)
+
+    response = await service._generate_reports_locked(sample_case, ALL_TYPES)
+
+    report_store.save_reports.assert_awaited_once()
+    assert report_store.save_reports.call_args.args[0] == response.reports
+    report_store.save_report.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_falls_back_to_individual_saves(sample_case, report_store):
+    report_store.save_reports.side_effect = Exception("pipeline failed")
+    report_store.save_report.side_effect = [True, Exception("write failed"), True]
+    service = ReportGenerationService(llm_router=None, report_store=report_store)
+
+    response = await service._generate_reports_locked(sample_case, ALL_TYPES)
+
+    assert [r.report_type for r in response.reports] == [
+        ReportType.INCIDENT_REPORT, ReportType.POST_MORTEM
+    ]
+
+
+@pytest.mark.asyncio
+async def test_lock_waiter_wakes_on_release():
+    redis_client = fakeredis.aioredis.FakeRedis()
+    # A slow poll interval would dominate the wait if the waiter polled
+    manager = ReportLockManager(redis_client, poll_interval_seconds=10)
+
+    assert await manager.acquire_lock("case-1")
+    waiter = asyncio.create_task(manager.acquire_lock("case-1", wait_timeout=5))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    await manager.release_lock("case-1")
+    acquired = await asyncio.wait_for(waiter, timeout=1)
+
+    assert acquired
+    assert await manager.is_locked("case-1")
+
+
+@pytest.mark.asyncio
+async def test_lock_wait_times_out():
+    redis_client = fakeredis.aioredis.FakeRedis()
+    manager = ReportLockManager(redis_client)
+
+    assert await manager.acquire_lock("case-1")
+
+    assert not await manager.acquire_lock("case-1", wait_timeout=0.2)
+
+
+@pytest.mark.asyncio
+async def test_lock_release_wakes_every_waiter():
+    redis_client = fakeredis.aioredis.FakeRedis()
+    manager = ReportLockManager(redis_client, poll_interval_seconds=10)
+    signals = []
+    blpop = redis_client.blpop
+
+    async def recording_blpop(keys, timeout):
+        result = await blpop(keys, timeout=timeout)
+        signals.append(result)
+        return result
+    redis_client.blpop = recording_blpop
+
+    assert await manager.acquire_lock("case-1")
+    waiters = [
+        asyncio.create_task(manager.acquire_lock("case-1", wait_timeout=3))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.05)
+
+    await manager.release_lock("case-1")
+    await asyncio.sleep(0.1)
+
+    # All three were woken by the one release; one of them won the lock
+    assert len([s for s in signals if s is not None]) == 3
+    assert sum(w.done() for w in waiters) == 1
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_long_lock_wait_loops_over_short_blocking_calls(monkeypatch):
+    redis_client = fakeredis.aioredis.FakeRedis()
+    manager = ReportLockManager(redis_client)
+    monkeypatch.setattr(ReportLockManager, "MAX_BLOCK_SECONDS", 0.1)
+    timeouts = []
+    blpop = redis_client.blpop
+
+    async def recording_blpop(keys, timeout):
+        timeouts.append(timeout)
+        return await blpop(keys, timeout=timeout)
+    redis_client.blpop = recording_blpop
+
+    assert await manager.acquire_lock("case-1")
+    assert not await manager.acquire_lock("case-1", wait_timeout=0.5)
+
+    assert len(timeouts) >= 3
+    assert max(timeouts) <= 0.1
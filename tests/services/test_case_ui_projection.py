@@ -0,0 +1,190 @@
+"""Test module for memoized case UI projections (case_ui_adapter)
+
+Tests verify:
+- An unchanged case is served from the projection cache
+- A saved mutation (new updated_at or appended evidence) rebuilds the view
+- Aggregates fold in only newly appended evidence and match a full rebuild
+- Rewritten evidence lists and changed descriptions are recomputed
+- INVESTIGATING views list hypotheses by likelihood and the latest evidence
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from faultmaven.models.case import (
+    Case,
+    CaseStatus,
+    ConsultingData,
+    Evidence,
+    EvidenceCategory,
+    EvidenceForm,
+    EvidenceSourceType,
+    Hypothesis,
+    HypothesisCategory,
+    HypothesisGenerationMode,
+    HypothesisStatus,
+)
+from faultmaven.services.adapters.case_ui_adapter import (
+    CaseUIAggregates,
+    CaseUIProjectionCache,
+    transform_case_for_ui,
+)
+
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_evidence(minute: int, summary: str = "Error logs") -> Evidence:
+    return Evidence(
+        category=EvidenceCategory.SYMPTOM_EVIDENCE,
+        primary_purpose="symptom_verified",
+        summary=f"{summary} {minute}",
+        preprocessed_content="Extracted error lines",
+        content_size_bytes=1024,
+        preprocessing_method="crime_scene_extraction",
+        source_type=EvidenceSourceType.LOG_FILE,
+        form=EvidenceForm.DOCUMENT,
+        collected_at=T0 + timedelta(minutes=minute),
+        collected_by="user-123",
+        collected_at_turn=1,
+    )
+
+
+def make_hypothesis(statement: str, likelihood: float, status=HypothesisStatus.ACTIVE) -> Hypothesis:
+    return Hypothesis(
+        statement=statement,
+        category=HypothesisCategory.CODE,
+        status=status,
+        likelihood=likelihood,
+        generated_at_turn=1,
+        generation_mode=HypothesisGenerationMode.OPPORTUNISTIC,
+        rationale="Observed in logs",
+    )
+
+
+def make_case(evidence_minutes=(), hypotheses=()) -> Case:
+    case = Case(
+        case_id="case_0123456789ab",
+        user_id="user-123",
+        organization_id="org-1",
+        title="Checkout errors",
+        description="Payment API returns 500 for all customers",
+        status=CaseStatus.INVESTIGATING,
+        consulting=ConsultingData(
+            proposed_problem_statement="Payment API returns 500",
+            problem_statement_confirmed=True,
+            decided_to_investigate=True,
+        ),
+        created_at=T0,
+        updated_at=T0,
+        last_activity_at=T0,
+    )
+    case.evidence.extend(make_evidence(minute) for minute in evidence_minutes)
+    for hypothesis in hypotheses:
+        case.hypotheses[hypothesis.hypothesis_id] = hypothesis
+    return case
+
+
+def save(case: Case, minutes: int) -> None:
+    """What a repository save does: stamp updated_at"""
+    case.updated_at = T0 + timedelta(minutes=minutes)
+
+
+@pytest.mark.unit
+class TestCaseUIProjectionCache:
+
+    def test_unchanged_case_is_served_from_cache(self):
+        cache = CaseUIProjectionCache()
+        case = make_case(evidence_minutes=[1, 2])
+
+        first = cache.project(case)
+        second = cache.project(case)
+
+        assert second is first
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_saved_mutation_rebuilds_view(self):
+        cache = CaseUIProjectionCache()
+        case = make_case(hypotheses=[make_hypothesis("Pool exhausted", 0.4)])
+        cache.project(case)
+
+        next(iter(case.hypotheses.values())).likelihood = 0.9
+        save(case, 10)
+        response = cache.project(case)
+
+        assert response.working_conclusion.confidence == 0.9
+        assert cache.get_stats()["misses"] == 2
+
+    def test_only_new_evidence_is_folded_in(self):
+        cache = CaseUIProjectionCache()
+        case = make_case(evidence_minutes=range(100))
+        cache.project(case)
+        aggregates = cache._entries.get(case.case_id).aggregates
+
+        case.evidence.extend([make_evidence(200), make_evidence(150)])
+        save(case, 300)
+        response = cache.project(case)
+
+        assert aggregates.evidence_folded == 102
+        assert [ev.summary for ev in response.latest_evidence] == [
+            "Error logs 200", "Error logs 150", "Error logs 99", "Error logs 98", "Error logs 97",
+        ]
+        assert response.problem_verification.temporal_state.started_at == T0
+        assert response.problem_verification.temporal_state.last_occurrence_at == T0 + timedelta(minutes=200)
+
+    def test_incremental_view_matches_full_rebuild(self):
+        cache = CaseUIProjectionCache()
+        case = make_case(
+            evidence_minutes=[5, 3, 5, 1],
+            hypotheses=[
+                make_hypothesis("Pool exhausted", 0.7),
+                make_hypothesis("Bad deploy", 0.9, HypothesisStatus.REFUTED),
+                make_hypothesis("DNS", 0.3),
+            ],
+        )
+        cache.project(case)
+        case.evidence.extend([make_evidence(5), make_evidence(0)])
+        save(case, 10)
+
+        assert cache.project(case) == transform_case_for_ui(case)
+
+    def test_rewritten_evidence_is_recomputed(self):
+        cache = CaseUIProjectionCache()
+        case = make_case(evidence_minutes=[1, 2, 3])
+        cache.project(case)
+
+        case.evidence = [make_evidence(7), make_evidence(8), make_evidence(9, "Metrics")]
+        save(case, 10)
+        response = cache.project(case)
+
+        assert [ev.summary for ev in response.latest_evidence] == ["Metrics 9", "Error logs 8", "Error logs 7"]
+        assert response.problem_verification.temporal_state.started_at == T0 + timedelta(minutes=7)
+
+    def test_description_keywords_follow_description(self):
+        aggregates = CaseUIAggregates()
+        case = make_case()
+        aggregates.refresh(case)
+        assert aggregates.affected_services == ["api", "payment"]
+        assert aggregates.affected_users == "Multiple users affected"
+
+        case.description = "Cache latency spike"
+        aggregates.refresh(case)
+
+        assert aggregates.affected_services == ["cache"]
+        assert aggregates.affected_users is None
+
+
+@pytest.mark.unit
+def test_investigating_view_orders_hypotheses_and_evidence():
+    hypotheses = [make_hypothesis(f"Cause {i}", i / 10) for i in range(1, 8)]
+    case = make_case(evidence_minutes=[3, 1, 2], hypotheses=hypotheses)
+
+    response = transform_case_for_ui(case)
+
+    assert [h.text for h in response.active_hypotheses] == ["Cause 7", "Cause 6", "Cause 5", "Cause 4", "Cause 3"]
+    assert response.working_conclusion.summary == "Cause 7"
+    assert [ev.summary for ev in response.latest_evidence] == ["Error logs 3", "Error logs 2", "Error logs 1"]
+    assert response.latest_evidence[0].type == "log_file"
+    assert response.problem_verification.user_impact == "2 service(s) affected - Multiple users affected"
@@ -0,0 +1,236 @@
+"""Data Service Batch Processing Tests
+
+Tests DataService.batch_process / batch_process_stream:
+- Bounded concurrency across batch items, never above the configured cap
+- Per-item failure isolation
+- Input-order results and completion-order streaming
+- Per-item validation and sanitization/classification, run in parallel
+  and shared by identical items
+
+Tests DataService.ingest_spooled:
+- Classification and extraction see the bounded window, not the whole upload
+- The streamed hash gives the same data ID (and deduplication) as ingest_data
+"""
+
+import asyncio
+import io
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from faultmaven.exceptions import ValidationException
+from faultmaven.models import DataType
+from faultmaven.services.domain.data_service import DataService
+from faultmaven.utils.upload_spool import spool_upload
+
+
+class LatencyProcessor:
+    """Log processor stand-in with fixed latency and concurrency tracking"""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def process(self, content, data_type):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return SimpleNamespace(insights={"error_count": 0}, anomalies_detected=[])
+        finally:
+            self.active -= 1
+
+
+def make_service(processor, concurrency=4):
+    classifier = Mock()
+    classifier.classify.return_value = SimpleNamespace(data_type=DataType.LOGS_AND_ERRORS)
+    sanitizer = Mock()
+    sanitizer.sanitize.side_effect = lambda text: text
+    tracer = Mock()
+    tracer.trace.return_value.__enter__ = Mock(return_value=None)
+    tracer.trace.return_value.__exit__ = Mock(return_value=False)
+    settings = SimpleNamespace(upload=SimpleNamespace(batch_max_concurrency=concurrency))
+    return DataService(
+        data_classifier=classifier,
+        log_processor=processor,
+        sanitizer=sanitizer,
+        tracer=tracer,
+        settings=settings,
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_items_concurrently_up_to_cap():
+    processor = LatencyProcessor()
+    service = make_service(processor, concurrency=3)
+    items = [(f"ERROR line {i}", f"app-{i}.log") for i in range(9)]
+
+    results = await service.batch_process(items, "session-1")
+
+    assert [r["file_name"] for r in results] == [f"app-{i}.log" for i in range(9)]
+    assert processor.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_requested_concurrency_is_capped_by_settings():
+    processor = LatencyProcessor()
+    service = make_service(processor, concurrency=2)
+    items = [(f"ERROR line {i}", f"app-{i}.log") for i in range(8)]
+
+    await service.batch_process(items, "session-1", max_concurrency=1000)
+
+    assert processor.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_items_do_not_fail_batch():
+    service = make_service(LatencyProcessor())
+
+    def classify(content, file_name):
+        if content == "bad one":
+            raise RuntimeError("classifier crashed")
+        return SimpleNamespace(data_type=DataType.LOGS_AND_ERRORS)
+    service._classifier.classify.side_effect = classify
+    items = [("ok one", "a.log"), ("bad one", "bad.log"), ("   ", "empty.log"), ("ok two", "b.log")]
+
+    results = await service.batch_process(items, "session-1")
+
+    assert [r["file_name"] for r in results] == ["a.log", "b.log"]
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_items_as_they_finish():
+    service = make_service(LatencyProcessor(delay=0))
+    items = [("first", "a.log"), ("", "bad.log"), ("second", "b.log")]
+
+    outcomes = [o async for o in service.batch_process_stream(items, "session-1")]
+
+    assert sorted(o["index"] for o in outcomes) == [0, 1, 2]
+    failed = [o for o in outcomes if o["status"] == "failed"]
+    assert [o["file_name"] for o in failed] == ["bad.log"]
+    assert "empty" in failed[0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_batch_prepares_duplicate_items_once():
+    service = make_service(LatencyProcessor(delay=0))
+    items = [("same content", "a.log")] * 3 + [("other content", "b.log")]
+
+    await service.batch_process(items, "session-1")
+
+    assert service._sanitizer.sanitize.call_count == 2
+    assert service._classifier.classify.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_prepares_items_in_parallel():
+    service = make_service(LatencyProcessor(delay=0), concurrency=3)
+    lock = threading.Lock()
+    active = peak = 0
+
+    def sanitize(text):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return text
+    service._sanitizer.sanitize.side_effect = sanitize
+    items = [(f"ERROR line {i}", f"app-{i}.log") for i in range(6)]
+
+    results = await service.batch_process(items, "session-1")
+
+    assert len(results) == 6
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_items_are_validated_like_ingest_data():
+    service = make_service(LatencyProcessor(delay=0))
+    items = [("first", "a.log"), ("second", "b.log")]
+
+    outcomes = [o async for o in service.batch_process_stream(items, "  ")]
+
+    assert [o["status"] for o in outcomes] == ["failed", "failed"]
+    assert all("Session ID" in o["error"] for o in outcomes)
+    service._sanitizer.sanitize.assert_not_called()
+
+
+class InMemoryStorage:
+
+    def __init__(self):
+        self.items = {}
+
+    async def get(self, key):
+        return self.items.get(key)
+
+    async def store(self, key, data):
+        self.items[key] = data
+
+
+async def spool_bytes(data: bytes, tmp_path, **kwargs):
+    stream = io.BytesIO(data)
+
+    async def read(size):
+        return stream.read(size)
+    return await spool_upload(read, max_bytes=len(data), directory=str(tmp_path), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_spooled_upload_is_processed_from_its_window(tmp_path):
+    processor = LatencyProcessor(delay=0)
+    processor.process = Mock(wraps=processor.process)
+    service = make_service(processor)
+    data = b"".join(f"INFO line {i}\n".encode() for i in range(5000)) + b"ERROR crashed\n"
+    upload = await spool_bytes(data, tmp_path, window_bytes=1024)
+
+    result = await service.ingest_spooled(upload, "session-1", file_name="app.log")
+
+    processed = processor.process.call_args.args[0]
+    assert len(processed) < 1100
+    assert processed.endswith("ERROR crashed\n")
+    assert result["file_size"] == len(data)
+    assert result["content"] == processed
+    assert result["content_truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_spooled_and_in_memory_ingestion_share_data_id(tmp_path):
+    service = make_service(LatencyProcessor(delay=0))
+    service._storage = InMemoryStorage()
+    content = "ERROR connection refused\nWARN retrying\n"
+
+    first = await service.ingest_data(content, "session-1", file_name="a.log")
+    upload = await spool_bytes(content.encode(), tmp_path)
+    second = await service.ingest_spooled(upload, "session-1", file_name="b.log")
+
+    assert second["data_id"] == first["data_id"]
+    assert second["status"] == "duplicate"
+    assert second["content_truncated"] is False
+
+
+@pytest.mark.asyncio
+async def test_empty_spooled_upload_is_rejected(tmp_path):
+    service = make_service(LatencyProcessor(delay=0))
+    upload = await spool_bytes(b"  \n", tmp_path)
+
+    with pytest.raises(ValidationException):
+        await service.ingest_spooled(upload, "session-1")
+
+
+@pytest.mark.asyncio
+async def test_sanitized_text_covers_whole_upload(tmp_path):
+    service = make_service(LatencyProcessor(delay=0))
+    service._sanitizer.sanitize.side_effect = lambda text: text.replace("secret", "***")
+    data = b"".join(f"token=secret line {i}\n".encode() for i in range(3000))
+    upload = await spool_bytes(data, tmp_path)
+
+    chunks = [text async for text in service.iter_sanitized_text(upload)]
+
+    assert "".join(chunks) == data.decode().replace("secret", "***")
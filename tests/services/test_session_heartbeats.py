@@ -0,0 +1,131 @@
+"""Test module for write-light session heartbeats
+
+Tests verify:
+- A heartbeat writes only activity and TTL through the store's touch()
+- Heartbeats inside the coalescing window are counted, not written
+- Coalesced heartbeats reach the stored counter with the next write
+- The Redis store touches a session in a single EVAL round trip
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from faultmaven.infrastructure.persistence.inmemory_session_store import InMemorySessionStore
+from faultmaven.infrastructure.persistence.redis_session_store import RedisSessionStore, TOUCH_SCRIPT
+from faultmaven.services.domain.session_service import SessionService
+
+
+@pytest.fixture
+async def store():
+    store = InMemorySessionStore()
+    await store.set("session-1", {"session_id": "session-1", "created_at": "2025-01-01T00:00:00Z"})
+    return store
+
+
+@pytest.mark.unit
+class TestRecordHeartbeat:
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_touches_activity_only(self, store):
+        service = SessionService(session_store=store, heartbeat_coalesce_seconds=0)
+
+        last_activity = await service.record_heartbeat("session-1")
+        await service.record_heartbeat("session-1")
+
+        assert last_activity is not None
+        assert service.heartbeat_counters == {"received": 2, "written": 2, "coalesced": 0}
+        assert await service.get_heartbeat_count("session-1") == 2
+        session_data = await store.get("session-1")
+        assert "case_history" not in session_data
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_within_window_are_coalesced(self, store):
+        service = SessionService(session_store=store, heartbeat_coalesce_seconds=60)
+        store.touch = AsyncMock(wraps=store.touch)
+
+        first = await service.record_heartbeat("session-1")
+        second = await service.record_heartbeat("session-1")
+        third = await service.record_heartbeat("session-1")
+
+        assert first == second == third
+        assert store.touch.await_count == 1
+        assert service.heartbeat_counters == {"received": 3, "written": 1, "coalesced": 2}
+        # Pending heartbeats are included in the count before they are written
+        assert await service.get_heartbeat_count("session-1") == 3
+
+    @pytest.mark.asyncio
+    async def test_coalesced_heartbeats_are_written_with_next_touch(self, store):
+        service = SessionService(session_store=store, heartbeat_coalesce_seconds=60)
+        await service.record_heartbeat("session-1")
+        await service.record_heartbeat("session-1")
+
+        # Window elapsed
+        service._heartbeats["session-1"].written_at -= 61
+        await service.record_heartbeat("session-1")
+
+        activity = await store.get_activity("session-1")
+        assert activity["heartbeats"] == 3
+        assert await service.get_heartbeat_count("session-1") == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_session_is_not_remembered(self, store):
+        service = SessionService(session_store=store)
+
+        assert await service.record_heartbeat("missing") is None
+        assert "missing" not in service._heartbeats
+
+    @pytest.mark.asyncio
+    async def test_tracked_sessions_are_bounded(self, store):
+        service = SessionService(session_store=store, max_tracked_heartbeats=1)
+        await store.set("session-2", {"session_id": "session-2", "created_at": "2025-01-01T00:00:00Z"})
+
+        await service.record_heartbeat("session-1")
+        await service.record_heartbeat("session-2")
+
+        assert list(service._heartbeats) == ["session-2"]
+
+
+@pytest.mark.unit
+class TestRedisTouch:
+
+    @pytest.fixture
+    def redis_client(self):
+        with patch('faultmaven.infrastructure.persistence.redis_session_store.create_redis_client') as factory:
+            client = AsyncMock()
+            factory.return_value = client
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_touch_is_one_eval(self, redis_client):
+        redis_client.eval.return_value = 1
+        store = RedisSessionStore()
+
+        touched = await store.touch("abc", "2025-01-01T00:00:00Z", heartbeats=3)
+
+        assert touched is True
+        redis_client.eval.assert_awaited_once()
+        script, num_keys, session_key, summary_key, _, _, last_activity, ttl, heartbeats = (
+            redis_client.eval.await_args.args[:9]
+        )
+        assert (script, num_keys, session_key, summary_key) == (TOUCH_SCRIPT, 2, "session:abc", "session_summary:abc")
+        assert (last_activity, ttl, heartbeats) == ("2025-01-01T00:00:00Z", 1800, 3)
+        redis_client.set.assert_not_called()
+        redis_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_touch_missing_session(self, redis_client):
+        redis_client.eval.return_value = 0
+        store = RedisSessionStore()
+
+        assert await store.touch("abc", "2025-01-01T00:00:00Z") is False
+
+    @pytest.mark.asyncio
+    async def test_get_activity_decodes_hash(self, redis_client):
+        redis_client.hgetall.return_value = {b"last_activity": b"2025-01-01T00:00:00Z", b"heartbeats": b"7"}
+        store = RedisSessionStore()
+
+        activity = await store.get_activity("abc")
+
+        redis_client.hgetall.assert_awaited_once_with("session_summary:abc")
+        assert activity == {"last_activity": "2025-01-01T00:00:00Z", "heartbeats": 7}
@@ -0,0 +1,103 @@
+"""Tests for spool_upload / SpooledUpload
+
+Tests verify:
+- Uploads are copied to disk with their size and SHA-256
+- Only a bounded head/tail window is kept in memory
+- The size limit is enforced while streaming and the partial spool removed
+- iter_text returns the whole upload in line-aligned chunks
+"""
+
+import hashlib
+import io
+import os
+
+import pytest
+
+from faultmaven.utils.upload_spool import TRUNCATION_MARKER, UploadTooLarge, spool_upload
+
+
+def reader(data: bytes):
+    stream = io.BytesIO(data)
+
+    async def read(size: int) -> bytes:
+        return stream.read(size)
+    return read
+
+
+def log_lines(count: int) -> bytes:
+    return b"".join(f"2025-01-01T00:00:00Z INFO request {i} ok\n".encode() for i in range(count))
+
+
+@pytest.mark.asyncio
+async def test_small_upload_fits_in_window(tmp_path):
+    data = b"ERROR disk full\nINFO retrying\n"
+
+    upload = await spool_upload(reader(data), max_bytes=1024, directory=str(tmp_path), chunk_bytes=8)
+
+    assert upload.size == len(data)
+    assert upload.sha256 == hashlib.sha256(data).hexdigest()
+    assert not upload.truncated
+    assert upload.window_text() == data.decode()
+    with open(upload.path, "rb") as spool:
+        assert spool.read() == data
+
+
+@pytest.mark.asyncio
+async def test_large_upload_keeps_head_and_tail_window(tmp_path):
+    data = log_lines(2000) + b"FATAL out of memory\n"
+
+    upload = await spool_upload(
+        reader(data), max_bytes=len(data), directory=str(tmp_path), chunk_bytes=4096, window_bytes=2048
+    )
+
+    assert upload.truncated
+    assert len(upload.head) + len(upload.tail) == 2048
+    window = upload.window_text()
+    assert window.startswith("2025-01-01T00:00:00Z INFO request 0 ok\n")
+    assert TRUNCATION_MARKER in window
+    assert window.endswith("FATAL out of memory\n")
+    # Head and tail are cut at line boundaries
+    head, tail = window.split(TRUNCATION_MARKER)
+    assert all(line.endswith(" ok") for line in head.split("\n"))
+    assert tail.startswith("2025-01-01T00:00:00Z INFO request")
+
+
+@pytest.mark.asyncio
+async def test_size_limit_is_enforced_while_streaming(tmp_path):
+    reads = []
+    data = b"x" * 10_000
+    read = reader(data)
+
+    async def counting_read(size):
+        reads.append(size)
+        return await read(size)
+
+    with pytest.raises(UploadTooLarge) as exc_info:
+        await spool_upload(counting_read, max_bytes=2500, directory=str(tmp_path), chunk_bytes=1000)
+
+    assert len(reads) == 3  # Stopped at the first chunk past the limit
+    assert exc_info.value.max_bytes == 2500
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_iter_text_returns_whole_upload_in_line_chunks(tmp_path):
+    data = log_lines(500) + "naïve unicode line without newline".encode()
+    upload = await spool_upload(reader(data), max_bytes=len(data), directory=str(tmp_path))
+
+    chunks = [text async for text in upload.iter_text(chunk_bytes=1000)]
+
+    assert "".join(chunks) == data.decode()
+    assert len(chunks) > 1
+    assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+    assert all(len(chunk) <= 2000 for chunk in chunks[:-1])
+
+
+@pytest.mark.asyncio
+async def test_cleanup_removes_spool_file(tmp_path):
+    upload = await spool_upload(reader(b"data\n"), max_bytes=100, directory=str(tmp_path / "spool"))
+
+    upload.cleanup()
+    upload.cleanup()
+
+    assert os.listdir(tmp_path / "spool") == []